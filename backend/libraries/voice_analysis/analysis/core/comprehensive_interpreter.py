@@ -8,9 +8,10 @@ import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import asyncio
-from openai import OpenAI  # OpenAI 1.51.0
 import os
 from ..utils.api_connectors import MultiLLMConnector
+from ..utils.llm_client_pool import get_llm_client_pool
+from ..utils.response_cache import get_llm_response_cache
 from ..utils.interface_validator import global_migrator
 
 logger = logging.getLogger(__name__)
@@ -19,16 +20,14 @@ class ComprehensiveInterpreter:
     """AI 기반 종합 해석기"""
 
     def __init__(self, api_key: Optional[str] = None, gemini_api_key: Optional[str] = None):
-        # 기존 OpenAI 전용 클라이언트 (호환성 유지)
+        # 기존 OpenAI 전용 경로 (호환성 유지, 클라이언트는 프로세스 공유 풀에서 사용)
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
-        # OpenAI 1.51.0 동기 클라이언트 사용
-        self.client = OpenAI(
-            api_key=self.api_key,
-            timeout=30.0,  # 30초 타임아웃 추가
-            max_retries=3  # 최대 3회 재시도
-        ) if self.api_key else None
+        self.pool = get_llm_client_pool()
         self.model = "gpt-4o"
 
+        # 같은 지표 값의 해석 요청 시 LLM 호출을 생략하는 응답 캐시 (None이면 비활성화)
+        self.response_cache = get_llm_response_cache()
+
         # 새로운 MultiLLM 커넥터 (Gemini 2.0 1순위, OpenAI 2순위, XAI 3순위)
         try:
             self.multi_llm = MultiLLMConnector(
@@ -101,6 +100,9 @@ class ComprehensiveInterpreter:
         """
         종합 해석 수행 (Gemini 우선, OpenAI fallback)
 
+        같은 프롬프트(정규화 모드에서는 지표 값이 유효 자릿수까지 같은 경우)의
+        LLM 해석 결과는 응답 캐시에서 반환한다.
+
         Args:
             analysis_results: 모든 분석 결과를 포함한 딕셔너리
                 - voice_analysis: 음성 분석 결과
@@ -113,6 +115,51 @@ class ComprehensiveInterpreter:
         Returns:
             종합 해석 결과
         """
+        if self.response_cache is None or not (self.use_multi_llm or self.api_key):
+            return await self._interpret_uncached(analysis_results, force_openai)
+
+        # 사용 경로(MultiLLM/OpenAI 전용, 강제 모델)가 다르면 다른 키
+        route = 'openai' if force_openai or not self.use_multi_llm else 'multi_llm'
+        cache_key = self.response_cache.make_key(
+            'comprehensive_interpretation', f"{route}:{self.model}",
+            self.interpretation_prompt, self._build_prompt(analysis_results), 0.3
+        )
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("종합 해석 캐시 적중 - LLM 호출 생략")
+            now = datetime.now().isoformat()
+            cached['timestamp'] = now
+            if isinstance(cached.get('analysis'), dict):
+                cached['analysis']['timestamp'] = now
+            cached['cached'] = True
+            return cached
+
+        result = await self._interpret_uncached(analysis_results, force_openai)
+
+        # 응답을 완전히 파싱한 LLM 해석만 캐시 (규칙 기반 폴백, 파싱 실패 기본값 제외)
+        if self._is_cacheable(result):
+            tokens = result.get('usage', {}).get('total_tokens', 0) or 0
+            self.response_cache.set(cache_key, result, tokens=tokens)
+        result['cached'] = False
+        return result
+
+    @staticmethod
+    def _is_cacheable(result: Dict[str, Any]) -> bool:
+        """LLM 응답을 JSON으로 완전히 파싱한 성공 결과인지 여부"""
+        analysis = result.get('analysis')
+        return (
+            result.get('status') == 'success'
+            and isinstance(analysis, dict)
+            and not analysis.get('parse_error')
+        )
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """응답 캐시 적중/미스와 절약 토큰 수"""
+        return self.response_cache.get_stats() if self.response_cache is not None else {}
+
+    async def _interpret_uncached(self, analysis_results: Dict[str, Any],
+                                  force_openai: bool = False) -> Dict[str, Any]:
+        """캐시 없이 종합 해석 수행 (MultiLLM -> OpenAI 전용 -> 규칙 기반)"""
 
         # MultiLLM 커넥터 사용 가능한 경우
         if self.use_multi_llm and self.multi_llm:
@@ -161,7 +208,8 @@ class ComprehensiveInterpreter:
                         'analysis': interpretation,
                         'timestamp': datetime.now().isoformat(),
                         'provider': provider,
-                        'fallback_used': fallback_used
+                        'fallback_used': fallback_used,
+                        'usage': result.get('usage', {})
                     }
 
             except Exception as e:
@@ -171,7 +219,7 @@ class ComprehensiveInterpreter:
         # 기존 OpenAI 전용 로직 (호환성 유지)
         try:
             # API 키가 없으면 규칙 기반 해석
-            if not self.client:
+            if not self.api_key:
                 logger.info("API 키 없음, 규칙 기반 해석 사용")
                 return self._rule_based_interpretation(analysis_results)
 
@@ -180,11 +228,11 @@ class ComprehensiveInterpreter:
             # GPT-4o를 사용한 종합 해석
             prompt = self._build_prompt(analysis_results)
 
-            # 동기 클라이언트를 비동기로 실행
-            import asyncio
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.chat.completions.create(
+            # 공유 비동기 클라이언트 (요청당 30초, 최대 3회 재시도)
+            client = self.pool.openai_client(self.api_key).with_options(timeout=30.0, max_retries=3)
+            response = await self.pool.call(
+                'openai',
+                lambda: client.chat.completions.create(
                     model=self.model,
                     messages=[
                         {"role": "system", "content": self.interpretation_prompt},
@@ -192,7 +240,8 @@ class ComprehensiveInterpreter:
                     ],
                     temperature=0.3,
                     max_tokens=2000
-                )
+                ),
+                timeout=30.0 * 4
             )
 
             # 응답 파싱
@@ -207,7 +256,8 @@ class ComprehensiveInterpreter:
                 'analysis': result,
                 'timestamp': datetime.now().isoformat(),
                 'provider': 'openai',
-                'fallback_used': False
+                'fallback_used': False,
+                'usage': {'total_tokens': getattr(response.usage, 'total_tokens', 0)}
             }
 
         except Exception as e:
@@ -6,10 +6,12 @@ SincNet 통합 분석 모듈
 import numpy as np
 import torch
 import logging
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Union
 import librosa
 from pathlib import Path
 
+from ..utils.decoded_audio import DecodedAudio, as_decoded_audio
+
 logger = logging.getLogger(__name__)
 
 class SincNetAnalyzer:
@@ -20,14 +22,20 @@ class SincNetAnalyzer:
         self.models = {}
         self.sample_rate = 16000
         
-        # 모델 매니저 사용
+        # 실제 추론기 (레지스트리의 모델을 공유하므로 인스턴스당 한 번만 생성)
+        self._original_analyzer = None
+        
+        # 모델 매니저 및 추론 모델 레지스트리 사용
         try:
             from ..sincnet.model_manager import get_model_manager
+            from ..sincnet.model_registry import get_model_registry
             self.model_manager = get_model_manager()
+            self.model_registry = get_model_registry()
             logger.info("SincNet 모델 매니저 초기화")
         except Exception as e:
             logger.warning(f"모델 매니저 초기화 실패, 로컬 경로 사용: {e}")
             self.model_manager = None
+            self.model_registry = None
             # 폴백: 로컬 경로
             base_path = Path(__file__).parent.parent / 'sincnet' / 'models'
             self.dep_model_path = base_path / 'dep_model_10500_raw.pkl'
@@ -41,31 +49,20 @@ class SincNetAnalyzer:
         try:
             models_loaded = []
             
-            if self.model_manager:
-                # Firebase Storage에서 모델 로드
-                logger.info("Firebase Storage에서 모델 로드 시작")
-                
-                # 우울증 모델
-                dep_model = self.model_manager.load_model('depression')
-                if dep_model:
-                    self.models['depression'] = dep_model
-                    models_loaded.append('depression')
-                    logger.info("우울증 모델 로드 성공")
-                else:
-                    logger.warning("우울증 모델 로드 실패")
+            if self.model_registry:
+                # Firebase Storage 체크포인트로 추론 모델 사전 구성 (프로세스당 1회)
+                logger.info("SincNet 추론 모델 레지스트리 워밍 시작")
                 
-                # 불면증 모델
-                insom_model = self.model_manager.load_model('insomnia')
-                if insom_model:
-                    self.models['insomnia'] = insom_model
-                    models_loaded.append('insomnia')
-                    logger.info("불면증 모델 로드 성공")
-                else:
-                    logger.warning("불면증 모델 로드 실패")
+                for model_type, ready in self.model_registry.warm().items():
+                    if ready:
+                        self.models[model_type] = self.model_registry.get(model_type)
+                        models_loaded.append(model_type)
+                        logger.info(f"{model_type} 모델 준비 완료")
+                    else:
+                        logger.warning(f"{model_type} 모델 로드 실패")
                     
-                # 모델 정보 로깅
-                model_info = self.model_manager.get_model_info()
-                logger.info(f"모델 정보: {model_info}")
+                # 모델 상태 로깅
+                logger.info(f"모델 상태: {self.model_registry.health()}")
                 
             else:
                 # 로컬 파일에서 로드 (폴백)
@@ -91,22 +88,29 @@ class SincNetAnalyzer:
             logger.error(f"모델 로드 실패: {e}")
             self.model = None
     
-    def analyze(self, audio_path: str) -> Dict[str, Any]:
+    def analyze(
+        self,
+        audio_path: Union[str, DecodedAudio, np.ndarray],
+        sample_rate: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         오디오 파일 분석
         
         Args:
-            audio_path: 오디오 파일 경로
+            audio_path: 오디오 파일 경로, 디코딩된 오디오 버퍼 또는 PCM 배열
+            sample_rate: audio_path가 배열일 때의 샘플레이트
             
         Returns:
             우울증 및 불면증 분석 결과
         """
         
         try:
-            # OriginalSincNetAnalyzer 사용
+            if isinstance(audio_path, np.ndarray):
+                audio_path = as_decoded_audio(audio_path, sample_rate)
+            
+            # OriginalSincNetAnalyzer 사용 (레지스트리 모델 재사용, 요청당 재구성 없음)
             try:
-                from ..sincnet.original_sincnet_analyzer import OriginalSincNetAnalyzer
-                real_analyzer = OriginalSincNetAnalyzer()
+                real_analyzer = self._get_original_analyzer()
                 
                 # 실제 모델로 분석
                 result = real_analyzer.analyze_audio(audio_path)
@@ -169,11 +173,33 @@ class SincNetAnalyzer:
                 'insomnia_probability': 0.5
             }
     
-    def _preprocess_audio(self, audio_path: str) -> np.ndarray:
+    def _get_original_analyzer(self):
+        """OriginalSincNetAnalyzer 반환 (최초 호출 시에만 생성)"""
+        if self._original_analyzer is None:
+            from ..sincnet.original_sincnet_analyzer import OriginalSincNetAnalyzer
+            self._original_analyzer = OriginalSincNetAnalyzer(registry=self.model_registry)
+        return self._original_analyzer
+    
+    def health(self) -> Dict[str, Any]:
+        """SincNet 모델 준비 상태"""
+        if self.model_registry is None:
+            return {'warm': False, 'models': {}, 'error': 'model registry not available'}
+        return self.model_registry.health()
+    
+    def reload_models(self, model_type: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Storage의 새 체크포인트로 모델 재로드 (모델별 성공/교체 여부)"""
+        if self.model_registry is None:
+            return {}
+        return self.model_registry.reload(model_type)
+    
+    def _preprocess_audio(self, audio_path: Union[str, DecodedAudio]) -> np.ndarray:
         """오디오 전처리"""
         
-        # 오디오 로드
-        y, sr = librosa.load(audio_path, sr=self.sample_rate)
+        # 오디오 로드 (디코딩된 버퍼면 재사용)
+        if isinstance(audio_path, DecodedAudio):
+            y = audio_path.resample(self.sample_rate)
+        else:
+            y, sr = librosa.load(audio_path, sr=self.sample_rate)
         
         # 정규화
         y = y / (np.max(np.abs(y)) + 1e-10)
@@ -231,16 +257,8 @@ class SincNetAnalyzer:
         except Exception as e:
             logger.error(f"실제 모델 추론 실패: {e}")
         
-        # 폴백: OriginalSincNetAnalyzer 직접 사용
+        # 폴백: 특징 기반 추론은 지원하지 않으므로 기본값 반환
         try:
-            from ..sincnet.original_sincnet_analyzer import OriginalSincNetAnalyzer
-            real_analyzer = OriginalSincNetAnalyzer()
-            
-            # 오디오 파일 경로를 직접 전달
-            # features 딕셔너리에서 파일 경로를 찾거나 임시 파일 사용
-            import tempfile
-            import soundfile as sf
-            
             # 간단한 기본값 반환
             return {
                 'depression': 0.4,
@@ -7,21 +7,26 @@ import json
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
-import asyncio
-from openai import OpenAI  # OpenAI 1.35.0
 import os
 import numpy as np
 
+from ..utils.llm_client_pool import get_llm_client_pool
+from ..utils.response_cache import get_llm_response_cache
+
 logger = logging.getLogger(__name__)
 
 class TextAnalyzer:
     """GPT-4o 기반 텍스트 분석기 (OpenAI 전용)"""
 
     def __init__(self, api_key: Optional[str] = None):
-        # OpenAI 클라이언트 초기화
+        # OpenAI 설정 (클라이언트는 프로세스 공유 풀에서 사용)
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
-        self.client = OpenAI(api_key=self.api_key) if self.api_key else None
+        self.pool = get_llm_client_pool()
         self.model = "gpt-4o"
+        self.temperature = 0.3
+
+        # 같은 전사 재처리 시 LLM 호출을 생략하는 응답 캐시 (None이면 비활성화)
+        self.response_cache = get_llm_response_cache()
 
         # 시니어 정신건강 분석 프롬프트
         self.analysis_prompt = """
@@ -69,7 +74,7 @@ class TextAnalyzer:
             분석 결과 딕셔너리
         """
 
-        if not self.client:
+        if not self.api_key:
             logger.error("OpenAI API 키가 설정되지 않음")
             return self._get_default_response()
 
@@ -78,23 +83,45 @@ class TextAnalyzer:
 
             # 컨텍스트 정보 추가
             full_prompt = self.analysis_prompt
+            profile_str = ""
             if context:
-                context_str = f"\n추가 정보:\n"
-                context_str += f"- 나이: {context.get('age', '미상')}\n"
-                context_str += f"- 성별: {context.get('gender', '미상')}\n"
-                context_str += f"- 분석 시간: {context.get('timestamp', datetime.now().isoformat())}\n"
-                full_prompt = context_str + "\n" + full_prompt
-
-            # GPT-4o 분석 요청 (동기 클라이언트를 비동기로 실행)
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.chat.completions.create(
+                profile_str = f"\n추가 정보:\n"
+                profile_str += f"- 나이: {context.get('age', '미상')}\n"
+                profile_str += f"- 성별: {context.get('gender', '미상')}\n"
+                time_str = f"- 분석 시간: {context.get('timestamp', datetime.now().isoformat())}\n"
+                full_prompt = profile_str + time_str + "\n" + full_prompt
+
+            user_prompt = f"다음 대화 내용을 분석해주세요:\n\n{text}"
+
+            # 응답 캐시 조회 (분석 시간은 결과에 영향이 없으므로 키에서 제외)
+            cache_key = None
+            if self.response_cache is not None:
+                cache_key = self.response_cache.make_key(
+                    'text_analysis', self.model, profile_str + "\n" + self.analysis_prompt,
+                    user_prompt, self.temperature
+                )
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    logger.info("텍스트 분석 캐시 적중 - LLM 호출 생략")
+                    return {
+                        'status': 'success',
+                        'analysis': cached,
+                        'timestamp': datetime.now().isoformat(),
+                        'model': self.model,
+                        'cached': True
+                    }
+
+            # GPT-4o 분석 요청 (공유 비동기 클라이언트)
+            client = self.pool.openai_client(self.api_key)
+            response = await self.pool.call(
+                'openai',
+                lambda: client.chat.completions.create(
                     model=self.model,
                     messages=[
                         {"role": "system", "content": full_prompt},
-                        {"role": "user", "content": f"다음 대화 내용을 분석해주세요:\n\n{text}"}
+                        {"role": "user", "content": user_prompt}
                     ],
-                    temperature=0.3,
+                    temperature=self.temperature,
                     response_format={"type": "json_object"}
                 )
             )
@@ -106,11 +133,17 @@ class TextAnalyzer:
             result['linguistic_features'] = self._analyze_linguistic_features(text)
             result['emotion_analysis'] = await self._analyze_emotions(text)
 
+            # 감정 분석까지 성공한 결과만 캐시
+            if cache_key is not None and None not in result['emotion_analysis'].values():
+                tokens = getattr(getattr(response, 'usage', None), 'total_tokens', 0) or 0
+                self.response_cache.set(cache_key, result, tokens=tokens)
+
             return {
                 'status': 'success',
                 'analysis': result,
                 'timestamp': datetime.now().isoformat(),
-                'model': self.model
+                'model': self.model,
+                'cached': False
             }
 
         except Exception as e:
@@ -121,6 +154,10 @@ class TextAnalyzer:
                 'analysis': self._get_default_response()
             }
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """응답 캐시 적중/미스와 절약 토큰 수"""
+        return self.response_cache.get_stats() if self.response_cache is not None else {}
+
     def _analyze_linguistic_features(self, text: str) -> Dict[str, Any]:
         """언어적 특징 분석"""
 
@@ -154,7 +191,7 @@ class TextAnalyzer:
     async def _analyze_emotions(self, text: str) -> Dict[str, float]:
         """감정 분석"""
 
-        if not self.client:
+        if not self.api_key:
             return self._get_default_emotions()
 
         try:
@@ -170,10 +207,10 @@ class TextAnalyzer:
             JSON 형식으로 응답하세요.
             """
 
-            # 동기 클라이언트를 비동기로 실행
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.chat.completions.create(
+            client = self.pool.openai_client(self.api_key)
+            response = await self.pool.call(
+                'openai',
+                lambda: client.chat.completions.create(
                     model="gpt-4o-mini",  # 빠른 응답을 위해 mini 모델 사용
                     messages=[
                         {"role": "system", "content": emotion_prompt},
@@ -7,8 +7,10 @@ import numpy as np
 import warnings
 import librosa
 import logging
-from typing import Dict, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple, Any, Union
+from dataclasses import dataclass, field
+
+from ..utils.decoded_audio import DecodedAudio, as_decoded_audio
 
 # Suppress librosa deprecation warnings
 warnings.filterwarnings('ignore', message='.*__audioread_load.*')
@@ -32,63 +34,118 @@ class VoiceFeatures:
     tremor_amplitude: Optional[float] = None
     tremor_frequency: Optional[float] = None
 
+@dataclass
+class FeatureContext:
+    """신호 단위 공유 중간 결과 (STFT, 멜 투영, VAD 구간을 한 번만 계산)"""
+    magnitude: np.ndarray          # |STFT| (hop_length 간격)
+    coarse_magnitude: np.ndarray   # magnitude의 decimation 간격 뷰 (피치/MFCC/스펙트럴 특징용)
+    mel_db: np.ndarray             # coarse_magnitude의 로그 멜 파워
+    intervals: np.ndarray          # 음성 활동 구간 (샘플 단위)
+    derived: Dict[str, Any] = field(default_factory=dict)
+    
+    def memo(self, key: str, compute: Callable[[], Any]) -> Any:
+        """같은 신호에서 여러 번 쓰이는 값(명료도 등)은 한 번만 계산"""
+        if key not in self.derived:
+            self.derived[key] = compute()
+        return self.derived[key]
+    
+    def intermediates(self) -> Dict[str, np.ndarray]:
+        """디버깅용 중간 배열"""
+        return {
+            'magnitude': self.magnitude,
+            'coarse_magnitude': self.coarse_magnitude,
+            'mel_db': self.mel_db,
+            'vad_intervals': self.intervals
+        }
+
 class VoiceAnalyzer:
     """Librosa 기반 음성 분석기 (대용량 파일 지원)"""
     
-    def __init__(self, sample_rate: int = 16000):
+    def __init__(self, sample_rate: int = 16000, return_intermediates: bool = False):
+        """
+        Args:
+            sample_rate: 분석 샘플레이트
+            return_intermediates: 결과에 STFT/멜/VAD 중간 배열 포함 여부 (디버깅용)
+        """
         self.sample_rate = sample_rate
         self.frame_length = 2048
         self.hop_length = 512
+        # 피치/MFCC/스펙트럴 특징은 hop_length * 4 간격 프레임 사용
+        self.feature_decimation = 4
+        self.vad_top_db = 20
+        self.return_intermediates = return_intermediates
+        self._mel_basis: Dict[int, np.ndarray] = {}
         # 파일 크기별 처리 전략 (실제 통화 녹음 고려)
         self.quick_threshold_mb = 1      # 1MB 이하: 전체 분석 (1분 이하)
         self.medium_threshold_mb = 3     # 1-3MB: 간소화 분석 (1-3분)
         self.large_threshold_mb = 10     # 3MB 이상: 청킹 분석 (3분 이상)
+        # 원본 파일이 없는 버퍼(추출된 구간 등)는 길이로 판단
+        self.quick_threshold_sec = 60
+        self.medium_threshold_sec = 180
         
-    def analyze(self, audio_path: str) -> Dict[str, Any]:
+    def analyze(
+        self,
+        audio: Union[str, DecodedAudio, np.ndarray],
+        sample_rate: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
-        음성 파일 분석 (파일 크기에 따른 적응형 처리)
+        음성 분석 (파일 크기에 따른 적응형 처리)
         
         Args:
-            audio_path: 오디오 파일 경로
+            audio: 오디오 파일 경로, 디코딩된 오디오 버퍼 또는 PCM 배열
+            sample_rate: audio가 배열일 때의 샘플레이트
             
         Returns:
             분석된 음성 특징 딕셔너리
         """
-        from pathlib import Path
-        
-        # 파일 크기 확인
-        file_size_mb = Path(audio_path).stat().st_size / (1024 * 1024)
+        try:
+            decoded = as_decoded_audio(audio, sample_rate)
+        except Exception as e:
+            logger.error(f"오디오 디코딩 실패: {e}")
+            return {'status': 'error', 'error': str(e)}
         
-        logger.info(f"음성 분석 시작: {file_size_mb:.1f}MB 파일")
+        file_size_mb = decoded.file_size_mb
+        if file_size_mb is not None:
+            logger.info(f"음성 분석 시작: {file_size_mb:.1f}MB 파일")
+            is_quick = file_size_mb <= self.quick_threshold_mb
+            is_medium = file_size_mb <= self.medium_threshold_mb
+        else:
+            logger.info(f"음성 분석 시작: {decoded.duration:.1f}초 버퍼")
+            is_quick = decoded.duration <= self.quick_threshold_sec
+            is_medium = decoded.duration <= self.medium_threshold_sec
         
         # 파일 크기별 처리 전략
-        if file_size_mb <= self.quick_threshold_mb:
+        if is_quick:
             # 1분 이하: 전체 분석
             logger.info("Quick 모드: 전체 분석 수행")
-            return self._analyze_small_file(audio_path, file_size_mb)
-        elif file_size_mb <= self.medium_threshold_mb:
+            return self._analyze_small_file(decoded, file_size_mb)
+        elif is_medium:
             # 1-3분: 간소화 분석
             logger.info("Medium 모드: 최적화된 분석 수행")
-            return self._analyze_medium_file(audio_path, file_size_mb)
+            return self._analyze_medium_file(decoded, file_size_mb)
         else:
             # 3분 이상: 청킹 방식
-            logger.info(f"Large 모드: 청킹 방식 사용 ({file_size_mb:.1f}MB)")
-            return self._analyze_large_file(audio_path, file_size_mb)
+            logger.info(f"Large 모드: 청킹 방식 사용 ({decoded.duration:.1f}초)")
+            return self._analyze_large_file(decoded, file_size_mb)
     
-    def _analyze_small_file(self, audio_path: str, file_size_mb: float) -> Dict[str, Any]:
+    def _analyze_small_file(self, audio: DecodedAudio, file_size_mb: Optional[float]) -> Dict[str, Any]:
         """작은 파일 분석 (1분 이하) - 전체 분석"""
         try:
-            # 오디오 로드
-            y, sr = librosa.load(audio_path, sr=self.sample_rate)
+            # 디코딩된 버퍼의 분석용 샘플레이트 뷰
+            sr = self.sample_rate
+            y = audio.resample(sr)
+            
+            # 스펙트로그램/VAD는 한 번만 계산해 모든 특징이 공유
+            context = self._build_feature_context(y, sr)
             
             # 음성 특징 추출
-            features = self._extract_features(y, sr)
+            features = self._extract_features(y, sr, context)
             
             # 시니어 특화 분석
-            senior_features = self._analyze_senior_specific(y, sr)
+            senior_features = self._analyze_senior_specific(y, sr, context)
             features.update(senior_features)
             
-            return {
+            result = {
                 'status': 'success',
                 'features': features,
                 'sample_rate': sr,
@@ -96,6 +153,10 @@ class VoiceAnalyzer:
                 'analysis_method': 'full',
                 'file_size_mb': file_size_mb
             }
+            if self.return_intermediates:
+                result['intermediates'] = context.intermediates()
+            
+            return result
             
         except Exception as e:
             logger.error(f"음성 분석 실패: {e}")
@@ -104,15 +165,15 @@ class VoiceAnalyzer:
                 'error': str(e)
             }
     
-    def _analyze_medium_file(self, audio_path: str, file_size_mb: float) -> Dict[str, Any]:
+    def _analyze_medium_file(self, audio: DecodedAudio, file_size_mb: Optional[float]) -> Dict[str, Any]:
         """중간 크기 파일 분석 (1-3분) - 최적화된 분석"""
         try:
-            # 파일 길이만 먼저 확인
-            duration = librosa.get_duration(path=audio_path)
-            logger.info(f"Medium 파일 분석: {duration:.1f}초, {file_size_mb:.1f}MB")
+            duration = audio.duration
+            logger.info(f"Medium 파일 분석: {duration:.1f}초")
             
-            # 다운샘플링으로 빠른 로드 (16kHz -> 8kHz)
-            y, sr = librosa.load(audio_path, sr=8000)
+            # 다운샘플링 뷰로 빠르게 분석 (16kHz -> 8kHz)
+            sr = 8000
+            y = audio.resample(sr)
             
             # 빠른 피치 추출 (더 큰 홉 길이)
             hop_length = self.hop_length * 8  # 더 큰 홉으로 빠르게
@@ -182,15 +243,40 @@ class VoiceAnalyzer:
             logger.error(f"중간 파일 분석 실패: {e}")
             return {'status': 'error', 'error': str(e)}
     
-    def _extract_features(self, y: np.ndarray, sr: int) -> Dict[str, Any]:
-        """기본 음성 특징 추출 (최적화된 버전)"""
+    def _build_feature_context(self, y: np.ndarray, sr: int) -> FeatureContext:
+        """
+        신호 단위 공유 중간 결과 계산
         
-        # 피치 추출 (최적화: 더 적은 프레임으로 빠르게)
-        # piptrack 대신 더 빠른 방법 사용
-        hop_length = self.hop_length * 4  # 더 큰 홉 길이로 빠르게
+        STFT는 hop_length 간격으로 한 번만 수행한다. hop_length * 4 간격 프레임은
+        같은 center 패딩 기준의 매 4번째 프레임과 동일하므로 슬라이스 뷰로 얻는다.
+        """
+        magnitude = np.abs(librosa.stft(y, n_fft=self.frame_length, hop_length=self.hop_length))
+        coarse_magnitude = magnitude[:, ::self.feature_decimation]
+        mel_db = librosa.power_to_db(self._get_mel_basis(sr) @ coarse_magnitude ** 2)
+        intervals = librosa.effects.split(y, top_db=self.vad_top_db)
+        
+        return FeatureContext(
+            magnitude=magnitude,
+            coarse_magnitude=coarse_magnitude,
+            mel_db=mel_db,
+            intervals=intervals
+        )
+    
+    def _get_mel_basis(self, sr: int) -> np.ndarray:
+        """샘플레이트별 멜 필터뱅크 (librosa.feature.melspectrogram 기본값과 동일)"""
+        if sr not in self._mel_basis:
+            self._mel_basis[sr] = librosa.filters.mel(sr=sr, n_fft=self.frame_length)
+        return self._mel_basis[sr]
+    
+    def _extract_features(self, y: np.ndarray, sr: int,
+                          context: Optional[FeatureContext] = None) -> Dict[str, Any]:
+        """기본 음성 특징 추출 (공유 스펙트로그램 기반)"""
+        if context is None:
+            context = self._build_feature_context(y, sr)
+        
+        # 피치 추출 (최적화: 더 큰 홉 간격 프레임으로 빠르게)
         pitches, magnitudes = librosa.piptrack(
-            y=y, sr=sr, 
-            hop_length=hop_length,
+            S=context.coarse_magnitude, sr=sr,
             fmin=50,  # 최소 주파수 제한
             fmax=400  # 최대 주파수 제한 (음성 범위)
         )
@@ -214,34 +300,35 @@ class VoiceAnalyzer:
         energy_mean = np.mean(energy)
         energy_std = np.std(energy)
         
-        # MFCC 추출 (최적화: 더 적은 계수)
+        # MFCC 추출 (최적화: 더 적은 계수, 공유 멜 스펙트로그램 사용)
         mfccs = librosa.feature.mfcc(
-            y=y, sr=sr, 
-            n_mfcc=8,  # 13에서 8로 줄임
-            hop_length=hop_length  # 동일한 홉 길이 사용
+            S=context.mel_db,
+            n_mfcc=8  # 13에서 8로 줄임
         )
         mfcc_mean = np.mean(mfccs, axis=1)
         mfcc_std = np.std(mfccs, axis=1)
         
-        # 스펙트럴 특징 (최적화: 동일한 홉 길이)
+        # 스펙트럴 특징 (피치와 동일한 프레임)
         spectral_centroids = librosa.feature.spectral_centroid(
-            y=y, sr=sr, hop_length=hop_length
+            S=context.coarse_magnitude, sr=sr
         )[0]
         spectral_rolloff = librosa.feature.spectral_rolloff(
-            y=y, sr=sr, hop_length=hop_length
+            S=context.coarse_magnitude, sr=sr
         )[0]
         
         # Zero Crossing Rate (음성 품질 지표)
         zcr = librosa.feature.zero_crossing_rate(y)[0]
         
         # 발화 속도 계산 (청크에서도 필요)
-        speaking_rate = self._calculate_speaking_rate(y, sr)
+        speaking_rate = self._calculate_speaking_rate(y, sr, context.intervals)
         
         # 휴지 비율 계산 (청크에서도 필요)
-        pause_ratio = self._calculate_pause_ratio(y, sr)
+        pause_ratio = self._calculate_pause_ratio(y, sr, context.intervals)
         
-        # 음성 명료도 (청크에서도 필요)
-        voice_clarity = self._analyze_voice_clarity(y, sr)
+        # 음성 명료도 (청크에서도 필요, 시니어 특화 분석과 공유)
+        voice_clarity = context.memo(
+            'voice_clarity', lambda: self._analyze_voice_clarity(y, sr, context.magnitude)
+        )
         
         return {
             'pitch_mean': float(pitch_mean),
@@ -258,20 +345,25 @@ class VoiceAnalyzer:
             'voice_quality': float(voice_clarity)
         }
     
-    def _analyze_senior_specific(self, y: np.ndarray, sr: int) -> Dict[str, Any]:
+    def _analyze_senior_specific(self, y: np.ndarray, sr: int,
+                                 context: Optional[FeatureContext] = None) -> Dict[str, Any]:
         """시니어 특화 음성 분석"""
+        if context is None:
+            context = self._build_feature_context(y, sr)
         
         # 음성 떨림 (tremor) 분석
         tremor_features = self._analyze_tremor(y, sr)
         
         # 발화 속도 분석
-        speaking_rate = self._calculate_speaking_rate(y, sr)
+        speaking_rate = self._calculate_speaking_rate(y, sr, context.intervals)
         
         # 휴지(pause) 비율 계산
-        pause_ratio = self._calculate_pause_ratio(y, sr)
+        pause_ratio = self._calculate_pause_ratio(y, sr, context.intervals)
         
         # 음성 명료도 분석
-        clarity_score = self._analyze_voice_clarity(y, sr)
+        clarity_score = context.memo(
+            'voice_clarity', lambda: self._analyze_voice_clarity(y, sr, context.magnitude)
+        )
         
         return {
             'tremor_amplitude': tremor_features.get('amplitude', 0),
@@ -288,16 +380,11 @@ class VoiceAnalyzer:
             frame_length = int(0.025 * sr)  # 25ms
             hop_length = int(0.010 * sr)    # 10ms
             
-            energy = []
-            for i in range(0, len(y) - frame_length, hop_length):
-                frame = y[i:i + frame_length]
-                energy.append(np.sum(frame ** 2))
-            
-            energy = np.array(energy)
+            energy = self._frame_energy(y, frame_length, hop_length)
             
-            # 에너지 변동 분석 (3-8Hz 범위의 떨림 검출)
-            fft_energy = np.fft.fft(energy)
-            freqs = np.fft.fftfreq(len(energy), d=hop_length/sr)
+            # 에너지 변동 분석 (3-8Hz 범위의 떨림 검출, 실수 신호이므로 양의 주파수만)
+            fft_energy = np.fft.rfft(energy)
+            freqs = np.fft.rfftfreq(len(energy), d=hop_length/sr)
             
             # 3-8Hz 범위의 주파수 성분 추출
             tremor_range = (freqs >= 3) & (freqs <= 8)
@@ -317,11 +404,20 @@ class VoiceAnalyzer:
             # 떨림 분석 실패 시 기본값 반환 (완전 실패보다 나음)
             return {'frequency': 0.0, 'amplitude': 0.0}
     
-    def _calculate_speaking_rate(self, y: np.ndarray, sr: int) -> float:
+    @staticmethod
+    def _frame_energy(y: np.ndarray, frame_length: int, hop_length: int) -> np.ndarray:
+        """프레임별 에너지 (제곱합 누적합의 차로 계산, 프레임 루프 없음)"""
+        starts = np.arange(0, len(y) - frame_length, hop_length)
+        cumulative = np.concatenate(([0.0], np.cumsum(np.square(y, dtype=np.float64))))
+        return cumulative[starts + frame_length] - cumulative[starts]
+    
+    def _calculate_speaking_rate(self, y: np.ndarray, sr: int,
+                                 intervals: Optional[np.ndarray] = None) -> float:
         """발화 속도 계산"""
         try:
-            # 음성 활동 구간 검출
-            intervals = librosa.effects.split(y, top_db=20)
+            # 음성 활동 구간 검출 (공유 컨텍스트가 있으면 재사용)
+            if intervals is None:
+                intervals = librosa.effects.split(y, top_db=self.vad_top_db)
             
             # 음절 수 추정 (한국어 기준)
             syllable_count = 0
@@ -338,11 +434,13 @@ class VoiceAnalyzer:
             logger.warning(f"발화 속도 계산 실패: {e}")
             return 0.0  # 실패 시 0 반환
     
-    def _calculate_pause_ratio(self, y: np.ndarray, sr: int) -> float:
+    def _calculate_pause_ratio(self, y: np.ndarray, sr: int,
+                               intervals: Optional[np.ndarray] = None) -> float:
         """휴지 비율 계산"""
         try:
-            # 음성 활동 구간 검출
-            intervals = librosa.effects.split(y, top_db=20)
+            # 음성 활동 구간 검출 (공유 컨텍스트가 있으면 재사용)
+            if intervals is None:
+                intervals = librosa.effects.split(y, top_db=self.vad_top_db)
             
             # 총 음성 시간 계산
             speech_time = sum((end - start) for start, end in intervals) / sr
@@ -356,11 +454,12 @@ class VoiceAnalyzer:
             logger.warning(f"휴지 비율 계산 실패: {e}")
             return 0.0  # 실패 시 0 반환
     
-    def _analyze_voice_clarity(self, y: np.ndarray, sr: int) -> float:
+    def _analyze_voice_clarity(self, y: np.ndarray, sr: int,
+                               magnitude: Optional[np.ndarray] = None) -> float:
         """음성 명료도 분석"""
         try:
             # 스펙트럴 엔트로피 (낮을수록 명료)
-            spectral_entropy = self._calculate_spectral_entropy(y, sr)
+            spectral_entropy = self._calculate_spectral_entropy(y, sr, magnitude)
             
             # Harmonics-to-Noise Ratio (HNR)
             hnr = self._calculate_hnr(y, sr)
@@ -374,12 +473,13 @@ class VoiceAnalyzer:
             logger.warning(f"명료도 분석 실패: {e}")
             return 0.5  # 실패 시 중간값 반환
     
-    def _calculate_spectral_entropy(self, y: np.ndarray, sr: int) -> float:
+    def _calculate_spectral_entropy(self, y: np.ndarray, sr: int,
+                                    magnitude: Optional[np.ndarray] = None) -> float:
         """스펙트럴 엔트로피 계산"""
         try:
-            # STFT
-            D = librosa.stft(y)
-            magnitude = np.abs(D)
+            # STFT (공유 스펙트로그램이 있으면 재사용)
+            if magnitude is None:
+                magnitude = np.abs(librosa.stft(y, n_fft=self.frame_length, hop_length=self.hop_length))
             
             # 정규화
             magnitude_norm = magnitude / np.sum(magnitude, axis=0, keepdims=True)
@@ -392,61 +492,50 @@ class VoiceAnalyzer:
             logger.warning(f"스펙트럴 엔트로피 계산 실패: {e}")
             return 0.5  # 실패 시 중간값 반환
     
-    def _analyze_large_file(self, audio_path: str, file_size_mb: float) -> Dict[str, Any]:
+    def _analyze_large_file(self, audio: DecodedAudio, file_size_mb: Optional[float]) -> Dict[str, Any]:
         """
         대용량 파일 분석 (개선된 청킹 방식)
         
         Args:
-            audio_path: 오디오 파일 경로
-            file_size_mb: 파일 크기 (MB)
+            audio: 디코딩된 오디오 버퍼
+            file_size_mb: 파일 크기 (MB, 원본 파일이 없으면 None)
             
         Returns:
             분석 결과
         """
         import gc
-        from concurrent.futures import ThreadPoolExecutor, as_completed
         
         try:
+            # 원본 파일이 없으면 16kHz 16-bit 기준으로 크기 추정
+            size_mb = file_size_mb if file_size_mb is not None else audio.duration * 32000 / (1024 * 1024)
+            
             # 파일 크기에 따른 적응형 청크 설정 (메모리 최적화)
-            if file_size_mb < 5:
+            if size_mb < 5:
                 chunk_duration = 10.0  # 10초 청크 (작은 파일)
-            elif file_size_mb < 10:
+            elif size_mb < 10:
                 chunk_duration = 5.0   # 5초 청크 (중간 파일)
             else:
                 chunk_duration = 3.0   # 3초 청크 (큰 파일, 메모리 절약)
             
             overlap = 0.5  # 오버랩 최소화 (2초 -> 0.5초)
             
-            # 파일 정보 가져오기
-            info = librosa.get_duration(path=audio_path)
-            total_duration = info
+            total_duration = audio.duration
+            
+            logger.info(f"대용량 파일 분석 시작: {total_duration:.1f}초, {size_mb:.1f}MB")
             
-            logger.info(f"대용량 파일 분석 시작: {total_duration:.1f}초, {file_size_mb:.1f}MB")
+            # 디코딩은 요청당 한 번만 수행하고 청크는 버퍼 슬라이스로 처리
+            sr = self.sample_rate
+            y = audio.resample(sr)
             
             # 청크별 특징 저장
             chunk_features = []
             current_offset = 0
 
             while current_offset < total_duration:
-                # 청크 로드
+                # 청크 슬라이스 (복사 없음)
                 duration = min(chunk_duration, total_duration - current_offset)
-                try:
-                    # ffmpeg를 백엔드로 명시적 지정
-                    import audioread
-                    with audioread.audio_open(audio_path) as f:
-                        # librosa 로드 (ffmpeg 사용)
-                        y_chunk, sr = librosa.load(
-                            audio_path,
-                            sr=self.sample_rate,
-                            offset=current_offset,
-                            duration=duration,
-                            mono=True,  # 모노로 강제 변환 (메모리 절약)
-                            res_type='kaiser_fast'  # 빠른 리샘플링
-                        )
-                except Exception as e:
-                    logger.warning(f"청크 로드 실패 (offset={current_offset}): {e}")
-                    current_offset += chunk_duration
-                    continue
+                start = int(current_offset * sr)
+                y_chunk = y[start:start + int(duration * sr)]
 
                 # 청크 분석
                 if len(y_chunk) > 0:
@@ -540,9 +629,8 @@ class VoiceAnalyzer:
     def _calculate_hnr(self, y: np.ndarray, sr: int) -> float:
         """Harmonics-to-Noise Ratio 계산"""
         try:
-            # 자기상관 함수
-            autocorr = np.correlate(y, y, mode='full')
-            autocorr = autocorr[len(autocorr)//2:]
+            # 자기상관 함수 (피크 탐색 범위인 50Hz 주기까지만 계산)
+            autocorr = self._lag_autocorrelation(y, int(sr/50))
             
             # 첫 번째 피크 찾기
             peak_idx = np.argmax(autocorr[int(sr/500):int(sr/50)]) + int(sr/500)
@@ -559,4 +647,48 @@ class VoiceAnalyzer:
                     return 10.0  # 기본 HNR 값
         except Exception as e:
             logger.warning(f"HNR 계산 실패: {e}")
-            return 10.0  # 실패 시 기본값 반환
\ No newline at end of file
+            return 10.0  # 실패 시 기본값 반환
+    
+    @staticmethod
+    def _lag_autocorrelation(y: np.ndarray, max_lag: int,
+                             block_size: int = 4096,
+                             blocks_per_batch: int = 64) -> np.ndarray:
+        """
+        0~max_lag 지연의 자기상관 (np.correlate(y, y, 'full')의 뒤쪽 절반과 동일)
+        
+        신호를 짧은 블록으로 나눠 각 블록과 max_lag만큼 연장된 구간의 상호상관을
+        FFT로 구한 뒤 합산한다. 전체 길이 n에 대해 O(n log block_size)이며
+        메모리는 블록 배치 크기로 제한된다.
+        
+        Args:
+            y: 오디오 신호
+            max_lag: 최대 지연 (샘플)
+            block_size: 블록 길이 (샘플)
+            blocks_per_batch: 한 번에 FFT할 블록 수
+        """
+        n = len(y)
+        if n == 0:
+            return np.zeros(0)
+        max_lag = min(max_lag, n - 1)
+        
+        n_blocks = -(-n // block_size)
+        padded = np.zeros(n_blocks * block_size + max_lag)
+        padded[:n] = y
+        
+        # 순환 상관이 지연 0~max_lag 범위에서 겹치지 않는 FFT 길이
+        span = block_size + max_lag
+        n_fft = 1 << (span - 1).bit_length()
+        
+        blocks = padded[:n_blocks * block_size].reshape(n_blocks, block_size)
+        extended = np.lib.stride_tricks.sliding_window_view(padded, span)[::block_size]
+        
+        autocorr = np.zeros(max_lag + 1)
+        for start in range(0, n_blocks, blocks_per_batch):
+            stop = start + blocks_per_batch
+            spectrum = (
+                np.conj(np.fft.rfft(blocks[start:stop], n_fft, axis=1))
+                * np.fft.rfft(extended[start:stop], n_fft, axis=1)
+            )
+            autocorr += np.fft.irfft(spectrum, n_fft, axis=1)[:, :max_lag + 1].sum(axis=0)
+        
+        return autocorr
@@ -8,7 +8,7 @@ import torch.nn as nn
 import torch.nn.functional as F
 import numpy as np
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 import json
 import librosa
@@ -46,23 +46,44 @@ class SincConv1d(nn.Module):
         self.lower_freq = nn.Parameter(torch.Tensor(hz[:-1]).view(-1, 1))
         self.band_freq = nn.Parameter(torch.Tensor(np.diff(hz)).view(-1, 1))
         
-        # Hamming window
+        # Hamming window (모듈과 함께 디바이스 이동, state_dict에는 저장하지 않음)
         n = np.linspace(0, kernel_size, kernel_size)
         window = 0.54 - 0.46 * np.cos(2 * np.pi * n / kernel_size)
-        self.window = torch.Tensor(window).view(1, -1)
+        self.register_buffer('window', torch.Tensor(window).view(1, -1), persistent=False)
+        
+        # 시간 축 (매 호출마다 생성하지 않도록 버퍼로 보관)
+        time_axis = torch.linspace(0, kernel_size - 1, kernel_size).view(1, -1) - (kernel_size - 1) / 2
+        self.register_buffer('time_axis', time_axis, persistent=False)
+        
+        # 추론용 고정 필터 뱅크 (freeze() 호출 시 생성)
+        self.register_buffer('frozen_filters', None, persistent=False)
         
     def forward(self, x):
         """Forward pass"""
-        # Sinc 필터 생성
-        filters = self._create_sinc_filters()
+        # Sinc 필터 생성 (고정된 경우 재사용)
+        if self.frozen_filters is not None:
+            filters = self.frozen_filters
+        else:
+            filters = self._create_sinc_filters()
         
         # Convolution
         return F.conv1d(x, filters, stride=1, padding=self.kernel_size//2)
     
+    def freeze(self):
+        """추론 모드: 필터 뱅크를 한 번만 계산해 버퍼로 고정"""
+        with torch.no_grad():
+            self.frozen_filters = self._create_sinc_filters().detach().clone()
+        return self
+    
+    def unfreeze(self):
+        """학습 모드: 매 forward마다 필터 재계산"""
+        self.frozen_filters = None
+        return self
+    
     def _create_sinc_filters(self):
         """Sinc 필터 생성"""
         # 시간 축
-        n = torch.linspace(0, self.kernel_size - 1, self.kernel_size).view(1, -1) - (self.kernel_size - 1) / 2
+        n = self.time_axis
         
         # 주파수를 라디안으로 변환
         f_lower = self.lower_freq / self.sample_rate * 2 * np.pi
@@ -168,6 +189,7 @@ class SincNetAnalyzer:
         self.model = self._load_model()
         self.model.to(self.device)
         self.model.eval()
+        self.model.sinc_conv1.freeze()
         
         logger.info(f"SincNet {model_type} 모델 초기화 완료")
     
@@ -191,19 +213,32 @@ class SincNetAnalyzer:
         
         return model
     
-    def analyze(self, audio_path: str) -> Dict[str, Any]:
+    def analyze(
+        self,
+        audio_path: Union[str, np.ndarray],
+        sample_rate: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         오디오 분석
         
         Args:
-            audio_path: 오디오 파일 경로
+            audio_path: 오디오 파일 경로 또는 PCM 배열
+            sample_rate: audio_path가 배열일 때의 샘플레이트
             
         Returns:
             분석 결과
         """
         try:
-            # 오디오 로드
-            audio, sr = librosa.load(audio_path, sr=self.config.sample_rate)
+            if isinstance(audio_path, np.ndarray):
+                # 이미 메모리에 있는 배열은 필요할 때만 리샘플링
+                audio = audio_path
+                if sample_rate and sample_rate != self.config.sample_rate:
+                    audio = librosa.resample(
+                        audio, orig_sr=sample_rate, target_sr=self.config.sample_rate
+                    )
+            else:
+                # 오디오 로드
+                audio, sr = librosa.load(audio_path, sr=self.config.sample_rate)
             
             # 전처리
             audio = self._preprocess_audio(audio)
@@ -396,8 +431,9 @@ class SincNetAnalyzer:
         optimizer = torch.optim.Adam(self.model.parameters(), lr=learning_rate)
         criterion = nn.CrossEntropyLoss()
         
-        # 학습 모드
+        # 학습 모드 (필터 대역을 다시 학습하므로 고정 해제)
         self.model.train()
+        self.model.sinc_conv1.unfreeze()
         
         history = {
             'train_loss': [],
@@ -430,6 +466,10 @@ class SincNetAnalyzer:
         # 모델 저장
         self._save_model(history)
         
+        # 추론 모드 복귀
+        self.model.eval()
+        self.model.sinc_conv1.freeze()
+        
         return history
     
     def _prepare_dataloader(
@@ -477,8 +517,12 @@ class DualSincNetAnalyzer:
         Returns:
             {'depression': float, 'insomnia': float}
         """
-        depression_result = self.depression_analyzer.analyze(audio_path)
-        insomnia_result = self.insomnia_analyzer.analyze(audio_path)
+        # 한 번만 디코딩하여 두 분석기가 공유
+        sample_rate = self.depression_analyzer.config.sample_rate
+        audio, _ = librosa.load(audio_path, sr=sample_rate)
+        
+        depression_result = self.depression_analyzer.analyze(audio, sample_rate)
+        insomnia_result = self.insomnia_analyzer.analyze(audio, sample_rate)
         
         return {
             'depression': depression_result.get('probability', 0.5),
@@ -5,9 +5,12 @@
 from .main_pipeline import SeniorMentalHealthPipeline
 from .speaker_identifier import SpeakerIdentifier
 from .report_generator import ReportGenerator
+from .stage_graph import StageGraph, PipelineStage
 
 __all__ = [
     'SeniorMentalHealthPipeline',
     'SpeakerIdentifier',
-    'ReportGenerator'
+    'ReportGenerator',
+    'StageGraph',
+    'PipelineStage'
 ]
\ No newline at end of file
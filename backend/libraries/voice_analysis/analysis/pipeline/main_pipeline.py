@@ -4,8 +4,12 @@
 """
 
 import asyncio
+import functools
 import json
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from pathlib import Path
@@ -21,9 +25,14 @@ from ..core import (
 from ..core.comprehensive_interpreter import ComprehensiveInterpreter
 from ..utils.api_connectors import GoogleCloudSpeechConnector
 from ..utils.firestore_connector import FirestoreConnector
+from ..utils.llm_client_pool import get_llm_client_pool
+from ..utils.decoded_audio import DecodedAudio, AudioSegmentView
 from .speaker_identifier import SpeakerIdentifier
 from .report_generator import ReportGenerator
+from .stage_graph import StageGraph, PipelineStage
+from .worker_pool import CpuWorkerPool, SharedAudio
 from ..timeseries.trend_analyzer import TrendAnalyzer
+from ..timeseries.trend_state import SeniorTrendState
 from ..mental_health.optimized_weight_calculator import (
     OptimizedWeightCalculator,
     DataQuality,
@@ -111,9 +120,6 @@ class SeniorMentalHealthPipeline:
 
         # Google Cloud STT (고정)
         try:
-            import os
-            from pathlib import Path
-
             # Cloud Run에서는 기본 서비스 계정 사용
             if os.getenv('K_SERVICE'):  # Cloud Run 환경 체크
                 self.stt_connector = GoogleCloudSpeechConnector(
@@ -158,7 +164,113 @@ class SeniorMentalHealthPipeline:
         
         # 결과 캐시
         self.cache = {}
-        
+
+        # CPU 집약 단계용 공유 실행기 (요청마다 새로 만들지 않음)
+        self.config.setdefault('max_workers', 4)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.config['max_workers'],
+            thread_name_prefix='pipeline'
+        )
+
+        # 음성/SincNet/지표/리포트용 프로세스 풀 (0이면 비활성화, 스레드 실행기 사용)
+        self.config.setdefault(
+            'process_workers', int(os.getenv('PIPELINE_PROCESS_WORKERS', '0'))
+        )
+        self.worker_pool = None
+        if self.config['process_workers'] > 0:
+            try:
+                self.worker_pool = CpuWorkerPool(
+                    max_workers=self.config['process_workers'],
+                    warm_sincnet=self.config.get('use_sincnet', True)
+                )
+                self.worker_pool.warm()
+                logger.info(f"분석 프로세스 풀 활성화: {self.config['process_workers']}개 워커")
+            except Exception as e:
+                logger.warning(f"프로세스 풀 초기화 실패, 스레드 실행기 사용: {e}")
+                self.worker_pool = None
+
+        # 저장된 증분 추세 상태를 무시하고 과거 기록으로 재구성할지 여부 (보정용)
+        self.config.setdefault(
+            'rebuild_trend_state', os.getenv('TREND_STATE_REBUILD', 'false').lower() in ('1', 'true', 'yes')
+        )
+
+        # Phase 2~9 단계 그래프
+        self.stage_graph = self._build_stage_graph()
+
+    def reload_sincnet_models(self, model_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        SincNet 모델 재로드 (Storage에 새 체크포인트가 올라온 뒤 호출)
+
+        부모 프로세스에서 체크포인트를 받아 재로드한 뒤, 실제로 교체된 모델이 있고
+        프로세스 풀이 있으면 워커를 교체해 새 워커가 같은 체크포인트로 모델을 구성하게 한다.
+        """
+        reloaded = self.sincnet_analyzer.reload_models(model_type)
+        workers_recycled = False
+        if self.worker_pool and any(status['swapped'] for status in reloaded.values()):
+            self.worker_pool.recycle()
+            workers_recycled = True
+        return {
+            'success': bool(reloaded) and all(status['success'] for status in reloaded.values()),
+            'reloaded': reloaded,
+            'workers_recycled': workers_recycled
+        }
+
+    def close(self):
+        """공유 실행기 및 프로세스 풀 종료"""
+        self.executor.shutdown(wait=False)
+        if self.worker_pool:
+            self.worker_pool.shutdown()
+
+    async def aclose(self):
+        """서비스 종료 시 현재 루프의 LLM 클라이언트 연결을 정리한 뒤 실행기 종료"""
+        await get_llm_client_pool().aclose()
+        self.close()
+
+    async def _run_cpu(self, component: str, method: str, *args, **kwargs) -> Any:
+        """
+        CPU 집약 컴포넌트 메서드 실행 (프로세스 풀이 있으면 워커, 없으면 공유 스레드 실행기)
+
+        Args:
+            component: 'indicator' 또는 'report'
+            method: 메서드 이름
+        """
+        if self.worker_pool:
+            return await self.worker_pool.call(component, method, *args, **kwargs)
+
+        target = {
+            'indicator': self.indicator_calculator,
+            'report': self.report_generator
+        }[component]
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            functools.partial(getattr(target, method), *args, **kwargs)
+        )
+
+    def _build_stage_graph(self) -> StageGraph:
+        """분석 단계 의존성 그래프 구성 (입력 키 -> 출력 키)"""
+        return StageGraph([
+            PipelineStage('voice', self._stage_voice,
+                          ('senior_audio', 'shared_audio'), 'voice_analysis'),
+            PipelineStage('text', self._stage_text,
+                          ('transcription', 'user_info'), 'text_analysis'),
+            PipelineStage('sincnet', self._stage_sincnet,
+                          ('senior_audio', 'shared_audio'), 'sincnet_analysis'),
+            PipelineStage('history', self._stage_history,
+                          ('user_id', 'history'), 'history_records'),
+            PipelineStage('indicators', self._stage_indicators,
+                          ('voice_analysis', 'text_analysis', 'sincnet_analysis',
+                           'audio_path', 'user_info'), 'indicator_result'),
+            PipelineStage('trend', self._stage_trend,
+                          ('indicator_result', 'history_records', 'analysis_id', 'start_time'),
+                          'trend_analysis'),
+            PipelineStage('interpretation', self._stage_interpretation,
+                          ('voice_analysis', 'text_analysis', 'indicator_result',
+                           'trend_analysis'), 'comprehensive_interpretation'),
+            PipelineStage('report', self._stage_report,
+                          ('indicator_result', 'trend_analysis', 'user_info'), 'report')
+        ])
+
     async def analyze(
         self,
         audio_path: str,
@@ -186,12 +298,24 @@ class SeniorMentalHealthPipeline:
             'audio_path': audio_path
         }
         
+        stage_timings = {}  # 단계별 실행 시간 (ms)
+
         try:
+            # Phase 0: 오디오 디코딩 (요청당 1회, 이후 모든 단계가 공유)
+            loop = asyncio.get_event_loop()
+            stage_started = time.perf_counter()
+            decoded_audio = await loop.run_in_executor(
+                self.executor, DecodedAudio.from_file, audio_path
+            )
+            stage_timings['decode'] = (time.perf_counter() - stage_started) * 1000
+
             # Phase 1: STT 및 화자 식별 (먼저 수행)
             logger.info("Phase 1: 음성-텍스트 변환 및 화자 식별")
-            stt_result = await self._perform_stt(audio_path)
-            
-            senior_audio_path = audio_path  # 기본값은 원본 파일
+            stage_started = time.perf_counter()
+            stt_result = await self._perform_stt(audio_path, decoded_audio)
+            stage_timings['stt'] = (time.perf_counter() - stage_started) * 1000
+
+            senior_audio = decoded_audio  # 기본값은 원본 버퍼
             
             if stt_result['status'] == 'success':
                 # Google Cloud Speech의 화자 통계 활용
@@ -236,13 +360,15 @@ class SeniorMentalHealthPipeline:
                 extraction_result = self._extract_senior_audio_segments(
                     audio_path,
                     stt_result['segments'],
-                    speaker_result
+                    speaker_result,
+                    decoded_audio
                 )
-                senior_audio_path = extraction_result['audio_path']
+                # 추출된 시니어 음성 구간 뷰 (결과 dict에는 저장하지 않음)
+                senior_audio = extraction_result.pop('audio', decoded_audio)
                 result['senior_audio_extraction'] = extraction_result
                 
                 if extraction_result['status'] == 'success':
-                    logger.info(f"시니어 음성 추출 성공: {senior_audio_path}")
+                    logger.info(f"시니어 음성 추출 성공: {senior_audio.duration:.2f}초")
                 else:
                     logger.warning(f"시니어 음성 추출 문제: {extraction_result['message']}")
                 
@@ -259,235 +385,46 @@ class SeniorMentalHealthPipeline:
                 }
                 logger.warning("STT 실패, 원본 파일로 음성 분석 진행")
             
-            # Phase 2: 음성 분석 (시니어 음성으로)
-            logger.info("Phase 2: 음성 특징 추출 시작")
-            voice_features = await self._analyze_voice(senior_audio_path)
-            logger.info(f"Phase 2 완료: 음성 분석 상태 = {voice_features.get('status', 'unknown')}")
-            if voice_features.get('status') == 'error':
-                logger.error(f"음성 분석 오류: {voice_features.get('error')}")
-            result['voice_analysis'] = voice_features
-            
-            # Phase 3: 텍스트 분석
-            if result.get('transcription'):
-                logger.info("Phase 3: 텍스트 분석")
-                # 분석에 사용될 텍스트 확인
-                text_for_analysis = result['transcription']
-                logger.info(f"텍스트 분석 입력: {len(text_for_analysis)}자")
-                logger.info(f"분석 텍스트 미리보기: {text_for_analysis[:300]}...")
-                
-                text_analysis = await self.text_analyzer.analyze(
-                    text_for_analysis,
-                    context=user_info
-                )
-                result['text_analysis'] = text_analysis
-            else:
-                result['text_analysis'] = None
-            
-            # Phase 4: SincNet 분석 (시니어 음성으로)
-            if self.config.get('use_sincnet', False):
-                logger.info("Phase 4: SincNet 딥러닝 분석 (시니어 음성)")
-                try:
-                    # CPU 집약적인 동기 함수를 별도 스레드에서 실행
-                    import asyncio
-                    from concurrent.futures import ThreadPoolExecutor
-                    
-                    loop = asyncio.get_event_loop()
-                    with ThreadPoolExecutor(max_workers=1) as executor:
-                        sincnet_result = await loop.run_in_executor(
-                            executor,
-                            self.sincnet_analyzer.analyze,
-                            senior_audio_path
-                        )
-                    logger.info(f"Phase 4 완료: SincNet 분석 상태 = {sincnet_result.get('status', 'unknown')}")
-                    result['sincnet_analysis'] = sincnet_result
-                except Exception as e:
-                    logger.error(f"SincNet 분석 실패: {e}")
-                    result['sincnet_analysis'] = {'status': 'error', 'error': str(e)}
-            else:
-                result['sincnet_analysis'] = None
-            
-            # Phase 5: 5대 지표 계산 (적응형 가중치 적용)
-            logger.info("Phase 5: 정신건강 지표 계산")
+            # Phase 2~9: 단계 그래프 실행
+            # (음성/텍스트/SincNet 분석과 과거 기록 조회는 서로 독립적이므로 동시에 실행)
+            # 프로세스 풀 사용 시 시니어 음성을 공유 메모리에 한 번만 올림 (pickle 복사 없음)
+            shared_audio = SharedAudio(senior_audio) if self.worker_pool else None
+            context = {
+                'senior_audio': senior_audio,
+                'shared_audio': shared_audio,
+                'transcription': result.get('transcription'),
+                'audio_path': audio_path,
+                'user_id': user_id,
+                'user_info': user_info,
+                'history': history,
+                # 추세 상태 중복 반영 방지 키 (통화 ID, 없으면 파일명)
+                'analysis_id': (user_info or {}).get('call_id') or Path(audio_path).stem,
+                'start_time': start_time
+            }
             try:
-                # 적응형 가중치 계산
-                adaptive_weights = None
-                confidence_scores = None
+                stage_timings.update(await self.stage_graph.run(context))
+            finally:
+                if shared_audio:
+                    shared_audio.close()
 
-                if self.weight_calculator and self.config.get('use_adaptive_weights', True):
-                    logger.info("Phase 5-1: 데이터 품질 평가 및 적응형 가중치 계산")
-
-                    # 데이터 품질 평가
-                    data_quality = DataQuality.from_analysis_results(
-                        voice_analysis=voice_features,
-                        text_analysis=result.get('text_analysis'),
-                        audio_path=audio_path
-                    )
-
-                    # 적응형 가중치 계산
-                    adaptive_weights = self.weight_calculator.calculate_adaptive_weights(
-                        data_quality=data_quality,
-                        user_profile=user_info
-                    )
-
-                    # 신뢰도 계산
-                    confidence_scores = self.weight_calculator.calculate_confidence(
-                        weights=adaptive_weights,
-                        data_quality=data_quality
-                    )
-
-                    result['data_quality'] = {
-                        'voice_quality': data_quality.voice_quality,
-                        'text_quality': data_quality.text_quality,
-                        'deep_quality': data_quality.deep_quality,
-                        'audio_duration': data_quality.audio_duration,
-                        'text_length': data_quality.text_length
-                    }
-
-                    result['adaptive_weights'] = {
-                        indicator.value: {
-                            'voice': weight.voice,
-                            'text': weight.text,
-                            'deep': weight.deep
-                        }
-                        for indicator, weight in adaptive_weights.items()
-                    }
-
-                    result['confidence_scores'] = {
-                        indicator.value: score
-                        for indicator, score in confidence_scores.items()
-                    }
-
-                    logger.info(f"적응형 가중치 적용: {result['adaptive_weights']}")
+            voice_features = context['voice_analysis']
+            result['voice_analysis'] = voice_features
+            result['text_analysis'] = context['text_analysis']
+            result['sincnet_analysis'] = context['sincnet_analysis']
 
-                # CPU 집약적인 동기 함수를 별도 스레드에서 실행
-                import asyncio
-                from concurrent.futures import ThreadPoolExecutor
+            indicator_result = context['indicator_result']
+            indicators = indicator_result['indicators']
+            risk_assessment = indicator_result['risk_assessment']
+            for key in ('data_quality', 'adaptive_weights', 'confidence_scores'):
+                if key in indicator_result:
+                    result[key] = indicator_result[key]
+            result['indicators'] = indicators.to_dict() if indicators else None
+            result['risk_assessment'] = risk_assessment
 
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    indicators = await loop.run_in_executor(
-                        executor,
-                        lambda: self.indicator_calculator.calculate(
-                            voice_features=voice_features.get('features'),
-                            text_analysis=result.get('text_analysis'),
-                            sincnet_results=result.get('sincnet_analysis'),
-                            adaptive_weights=adaptive_weights  # 적응형 가중치 전달
-                        )
-                    )
-                logger.info("Phase 5 완료: 정신건강 지표 계산 성공")
-                result['indicators'] = indicators.to_dict()
-                
-                # Phase 6: 위험도 평가
-                logger.info("Phase 6: 위험도 평가")
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    risk_assessment = await loop.run_in_executor(
-                        executor,
-                        self.indicator_calculator.calculate_risk_scores,
-                        indicators
-                    )
-                logger.info("Phase 6 완료: 위험도 평가 성공")
-                result['risk_assessment'] = risk_assessment
-            except Exception as e:
-                logger.error(f"지표 계산/위험도 평가 실패: {e}")
-                import traceback
-                logger.error(f"Traceback: {traceback.format_exc()}")
-                result['indicators'] = None
-                result['risk_assessment'] = None
-            
-            # Phase 7: 시계열 분석
-            logger.info("Phase 7: 시계열 추세 분석")
-            if user_id and self.firestore_connector:
-                # GCP 운영 환경: Firestore에서 과거 기록 조회
-                logger.info("Firestore에서 과거 분석 기록 조회")
-                firestore_history = self.firestore_connector.get_user_analysis_history(user_id, days_back=30)
-                
-                if len(firestore_history) >= 2:  # 최소 2개 이상의 기록 필요
-                    # 현재 결과 추가
-                    current_record = {
-                        'analysis_timestamp': start_time.isoformat(),
-                        'indicators': indicators.to_dict() if indicators else None
-                    }
-                    firestore_history.append(current_record)
-                    
-                    # 동기 함수를 별도 스레드에서 실행
-                    import asyncio
-                    from concurrent.futures import ThreadPoolExecutor
-                    
-                    loop = asyncio.get_event_loop()
-                    with ThreadPoolExecutor(max_workers=1) as executor:
-                        trend_result = await loop.run_in_executor(
-                            executor,
-                            self.trend_analyzer.analyze_trends,
-                            firestore_history
-                        )
-                    logger.info("Phase 7 완료: 시계열 분석 성공")
-                    result['trend_analysis'] = trend_result
-                else:
-                    logger.info("시계열 분석을 위한 충분한 과거 기록이 없습니다")
-                    result['trend_analysis'] = None
-                    
-            elif history and len(history) > 0:
-                # 로컬 테스트 환경: 전달받은 history 사용
-                logger.info("로컬 테스트: 전달받은 history로 시계열 분석")
-                # 현재 결과를 기록에 추가
-                history.append({
-                    'analysis_timestamp': start_time.isoformat(),
-                    'indicators': indicators.to_dict() if indicators else None
-                })
-                
-                # 동기 함수를 별도 스레드에서 실행
-                import asyncio
-                from concurrent.futures import ThreadPoolExecutor
-                
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    trend_result = await loop.run_in_executor(
-                        executor,
-                        self.trend_analyzer.analyze_trends,
-                        history
-                    )
-                logger.info("Phase 7 완료: 시계열 분석 성공 (로컬)")
-                result['trend_analysis'] = trend_result
-            else:
-                logger.info("시계열 분석을 위한 데이터가 없습니다")
-                result['trend_analysis'] = None
-            
-            # Phase 8: AI 종합 해석
-            logger.info("Phase 8: AI 종합 해석")
-            comprehensive_analysis = {
-                'voice_analysis': voice_features.get('features'),
-                'text_analysis': result.get('text_analysis'),
-                'indicators': indicators.to_dict(),
-                'clinical_validation': risk_assessment,
-                'trend_analysis': result.get('trend_analysis')
-            }
-            
-            # AI 종합 해석 수행
-            interpretation = await self.comprehensive_interpreter.interpret(comprehensive_analysis)
+            result['trend_analysis'] = context['trend_analysis']
+            interpretation = context['comprehensive_interpretation']
             result['comprehensive_interpretation'] = interpretation
-            
-            # Phase 9: 리포트 생성
-            logger.info("Phase 9: 종합 리포트 생성")
-            try:
-                # 동기 함수를 별도 스레드에서 실행
-                import asyncio
-                from concurrent.futures import ThreadPoolExecutor
-                
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    report = await loop.run_in_executor(
-                        executor,
-                        self.report_generator.generate,
-                        indicators,
-                        risk_assessment,
-                        result.get('trend_analysis'),
-                        user_info
-                    )
-                logger.info("Phase 9 완료: 리포트 생성 성공")
-                result['report'] = report
-            except Exception as e:
-                logger.error(f"리포트 생성 실패: {e}")
-                result['report'] = None
+            result['report'] = context['report']
             
             # Phase 10: 새로운 스키마 형식으로 변환
             logger.info("Phase 10: 개선된 스키마 형식으로 변환")
@@ -505,6 +442,7 @@ class SeniorMentalHealthPipeline:
             # 처리 시간 계산
             processing_time = (datetime.now() - start_time).total_seconds()
             result['metadata']['processing']['totalTime'] = processing_time * 1000  # ms로 변환
+            result['metadata']['processing']['stageTimings'] = stage_timings
             result['status'] = 'completed'
             
             # GCP 운영 환경: 분석 결과를 Firestore에 저장
@@ -516,6 +454,16 @@ class SeniorMentalHealthPipeline:
                     audio_path=audio_path
                 )
                 result['saved_to_firestore'] = save_success
+
+                # 결과 저장 후에만 추세 상태 반영 (저장 실패/재시도 시 중복 반영 방지)
+                if save_success and result.get('indicators'):
+                    await loop.run_in_executor(
+                        self.executor,
+                        self._commit_trend_state,
+                        user_id,
+                        context,
+                        result['indicators']
+                    )
             
             logger.info(f"분석 완료: {processing_time:.2f}초 소요")
             
@@ -525,48 +473,345 @@ class SeniorMentalHealthPipeline:
             result['status'] = 'error'
             result['error'] = str(e)
             result['traceback'] = traceback.format_exc()
-        finally:
-            # 임시 파일 정리
-            if ('senior_audio_path' in locals() and 
-                senior_audio_path != audio_path and 
-                result.get('senior_audio_extraction', {}).get('temp_file_created', False)):
-                try:
-                    import os
-                    if os.path.exists(senior_audio_path):
-                        os.unlink(senior_audio_path)
-                        logger.info(f"임시 파일 삭제: {senior_audio_path}")
-                except Exception as cleanup_error:
-                    logger.warning(f"임시 파일 삭제 실패: {cleanup_error}")
         
         return result
     
-    async def _analyze_voice(self, audio_path: str) -> Dict[str, Any]:
+    async def _stage_voice(
+        self,
+        senior_audio: DecodedAudio,
+        shared_audio: Optional[SharedAudio]
+    ) -> Dict[str, Any]:
+        """Phase 2: 음성 분석 (시니어 음성으로)"""
+        logger.info("Phase 2: 음성 특징 추출 시작")
+        voice_features = await self._analyze_voice(senior_audio, shared_audio)
+        logger.info(f"Phase 2 완료: 음성 분석 상태 = {voice_features.get('status', 'unknown')}")
+        if voice_features.get('status') == 'error':
+            logger.error(f"음성 분석 오류: {voice_features.get('error')}")
+        return voice_features
+
+    async def _stage_text(
+        self,
+        transcription: Optional[str],
+        user_info: Optional[Dict]
+    ) -> Optional[Dict[str, Any]]:
+        """Phase 3: 텍스트 분석"""
+        if not transcription:
+            return None
+
+        logger.info("Phase 3: 텍스트 분석")
+        logger.info(f"텍스트 분석 입력: {len(transcription)}자")
+        logger.info(f"분석 텍스트 미리보기: {transcription[:300]}...")
+
+        return await self.text_analyzer.analyze(transcription, context=user_info)
+
+    async def _stage_sincnet(
+        self,
+        senior_audio: DecodedAudio,
+        shared_audio: Optional[SharedAudio]
+    ) -> Optional[Dict[str, Any]]:
+        """Phase 4: SincNet 분석 (시니어 음성으로)"""
+        if not self.config.get('use_sincnet', False):
+            return None
+
+        logger.info("Phase 4: SincNet 딥러닝 분석 (시니어 음성)")
+        try:
+            # CPU 집약적인 동기 함수를 워커 프로세스 또는 공유 실행기에서 실행
+            if self.worker_pool and shared_audio:
+                sincnet_result = await self.worker_pool.analyze_audio('sincnet', shared_audio)
+            else:
+                loop = asyncio.get_event_loop()
+                sincnet_result = await loop.run_in_executor(
+                    self.executor,
+                    self.sincnet_analyzer.analyze,
+                    senior_audio
+                )
+            logger.info(f"Phase 4 완료: SincNet 분석 상태 = {sincnet_result.get('status', 'unknown')}")
+            return sincnet_result
+        except Exception as e:
+            logger.error(f"SincNet 분석 실패: {e}")
+            return {'status': 'error', 'error': str(e)}
+
+    async def _stage_history(
+        self,
+        user_id: Optional[str],
+        history: Optional[List[Dict]]
+    ) -> Tuple[str, Optional[SeniorTrendState]]:
+        """Phase 7 사전 조회: 증분 추세 상태 (출처, 상태)"""
+        loop = asyncio.get_event_loop()
+
+        if user_id and self.firestore_connector:
+            # GCP 운영 환경: 저장된 상태만 조회 (분석 단계와 동시에 수행)
+            state = None
+            if not self.config.get('rebuild_trend_state'):
+                stored = await loop.run_in_executor(
+                    self.executor,
+                    lambda: self.firestore_connector.get_trend_state(user_id)
+                )
+                state = SeniorTrendState.from_dict(stored)
+
+            if state is None:
+                # 상태가 없거나 형식이 바뀐 경우 과거 기록으로 재구성
+                logger.info("Firestore 과거 분석 기록으로 추세 상태 재구성")
+                firestore_history = await loop.run_in_executor(
+                    self.executor,
+                    lambda: self.firestore_connector.get_user_analysis_history(user_id, days_back=30)
+                )
+                state = SeniorTrendState.rebuild(user_id, firestore_history or [])
+            return 'firestore', state
+
+        # 로컬 테스트 환경: 전달받은 history 전체로 상태 구성 (기간 제한 없음)
+        if not history:
+            return 'local', None
+        state = await loop.run_in_executor(
+            self.executor,
+            functools.partial(SeniorTrendState.rebuild, 'local', history, window_days=None)
+        )
+        return 'local', state
+
+    async def _stage_indicators(
+        self,
+        voice_analysis: Dict[str, Any],
+        text_analysis: Optional[Dict[str, Any]],
+        sincnet_analysis: Optional[Dict[str, Any]],
+        audio_path: str,
+        user_info: Optional[Dict]
+    ) -> Dict[str, Any]:
+        """Phase 5~6: 5대 지표 계산 (적응형 가중치 적용) 및 위험도 평가"""
+        logger.info("Phase 5: 정신건강 지표 계산")
+        stage_result = {'indicators': None, 'risk_assessment': None}
+
+        try:
+            # 적응형 가중치 계산
+            adaptive_weights = None
+
+            if self.weight_calculator and self.config.get('use_adaptive_weights', True):
+                logger.info("Phase 5-1: 데이터 품질 평가 및 적응형 가중치 계산")
+
+                # 데이터 품질 평가
+                data_quality = DataQuality.from_analysis_results(
+                    voice_analysis=voice_analysis,
+                    text_analysis=text_analysis,
+                    audio_path=audio_path
+                )
+
+                # 적응형 가중치 계산
+                adaptive_weights = self.weight_calculator.calculate_adaptive_weights(
+                    data_quality=data_quality,
+                    user_profile=user_info
+                )
+
+                # 신뢰도 계산
+                confidence_scores = self.weight_calculator.calculate_confidence(
+                    weights=adaptive_weights,
+                    data_quality=data_quality
+                )
+
+                stage_result['data_quality'] = {
+                    'voice_quality': data_quality.voice_quality,
+                    'text_quality': data_quality.text_quality,
+                    'deep_quality': data_quality.deep_quality,
+                    'audio_duration': data_quality.audio_duration,
+                    'text_length': data_quality.text_length
+                }
+
+                stage_result['adaptive_weights'] = {
+                    indicator.value: {
+                        'voice': weight.voice,
+                        'text': weight.text,
+                        'deep': weight.deep
+                    }
+                    for indicator, weight in adaptive_weights.items()
+                }
+
+                stage_result['confidence_scores'] = {
+                    indicator.value: score
+                    for indicator, score in confidence_scores.items()
+                }
+
+                logger.info(f"적응형 가중치 적용: {stage_result['adaptive_weights']}")
+
+            # CPU 집약적인 동기 함수를 워커 프로세스 또는 공유 실행기에서 실행
+            indicators = await self._run_cpu(
+                'indicator', 'calculate',
+                voice_features=voice_analysis.get('features'),
+                text_analysis=text_analysis,
+                sincnet_results=sincnet_analysis,
+                adaptive_weights=adaptive_weights  # 적응형 가중치 전달
+            )
+            logger.info("Phase 5 완료: 정신건강 지표 계산 성공")
+            stage_result['indicators'] = indicators
+
+            # Phase 6: 위험도 평가
+            logger.info("Phase 6: 위험도 평가")
+            stage_result['risk_assessment'] = await self._run_cpu(
+                'indicator', 'calculate_risk_scores', indicators
+            )
+            logger.info("Phase 6 완료: 위험도 평가 성공")
+        except Exception as e:
+            logger.error(f"지표 계산/위험도 평가 실패: {e}")
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            stage_result['indicators'] = None
+            stage_result['risk_assessment'] = None
+
+        return stage_result
+
+    async def _stage_trend(
+        self,
+        indicator_result: Dict[str, Any],
+        history_records: Tuple[str, Optional[SeniorTrendState]],
+        analysis_id: str,
+        start_time: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Phase 7: 시계열 추세 분석 (증분 상태 기준)
+
+        상태 저장은 분석 결과가 저장된 뒤 _commit_trend_state에서 수행하므로,
+        여기서는 복사본에 현재 결과를 반영해 추세만 계산합니다.
+        """
+        logger.info("Phase 7: 시계열 추세 분석")
+        source, state = history_records
+        indicators = indicator_result['indicators']
+
+        if state is None:
+            logger.info("시계열 분석을 위한 충분한 과거 기록이 없습니다")
+            return None
+
+        state = SeniorTrendState.from_dict(state.to_dict())
+        total_count = state.count
+        if indicators:
+            # 현재 결과 반영 (윈도우 크기에만 비례, 과거 기록 재조회 없음)
+            state.update({
+                'analysis_timestamp': start_time.isoformat(),
+                'indicators': indicators.to_dict()
+            }, analysis_id=analysis_id)
+        # 지표 계산 실패 등으로 반영하지 않은 경우에도 기간 밖 기록은 정리
+        state.expire(start_time.isoformat())
+        previous_count = len(state.recent_times) - (state.count - total_count)
+
+        # Firestore 기록은 최소 2개, 로컬 history는 1개 이상 필요 (최근 30일 기준)
+        min_records = 2 if source == 'firestore' else 1
+        if previous_count < min_records:
+            logger.info("시계열 분석을 위한 충분한 과거 기록이 없습니다")
+            return None
+
+        loop = asyncio.get_event_loop()
+        trend_result = await loop.run_in_executor(
+            self.executor, state.snapshot, self.trend_analyzer
+        )
+        logger.info(f"Phase 7 완료: 시계열 분석 성공 ({source})")
+        return trend_result
+
+    def _commit_trend_state(
+        self,
+        user_id: str,
+        context: Dict[str, Any],
+        indicators: Dict[str, Any]
+    ) -> bool:
+        """
+        저장된 분석 결과를 Firestore 증분 추세 상태에 반영 (트랜잭션, 분석 ID 기준 1회)
+
+        Args:
+            user_id: 사용자 ID
+            context: 단계 그래프 컨텍스트 (analysis_id, start_time, history_records)
+            indicators: 5대 지표 dict
+
+        Returns:
+            반영 성공 여부
+        """
+        analysis_id = context['analysis_id']
+        _, base_state = context.get('history_records') or (None, None)
+        record = {
+            'analysis_timestamp': context['start_time'].isoformat(),
+            'indicators': indicators
+        }
+
+        def update_fn(stored: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            state = None
+            if not self.config.get('rebuild_trend_state'):
+                state = SeniorTrendState.from_dict(stored)
+            if state is None:
+                # 저장된 상태가 없으면 조회 단계에서 재구성한 상태에 이어서 반영
+                base = base_state.to_dict() if base_state else None
+                state = SeniorTrendState.from_dict(base) or SeniorTrendState(senior_id=user_id)
+            if state.is_applied(analysis_id):
+                logger.info(f"이미 추세 상태에 반영된 분석: {analysis_id}")
+                return None
+            state.update(record, analysis_id=analysis_id)
+            return state.to_dict()
+
+        return self.firestore_connector.update_trend_state(user_id, update_fn)
+
+    async def _stage_interpretation(
+        self,
+        voice_analysis: Dict[str, Any],
+        text_analysis: Optional[Dict[str, Any]],
+        indicator_result: Dict[str, Any],
+        trend_analysis: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Phase 8: AI 종합 해석"""
+        logger.info("Phase 8: AI 종합 해석")
+        comprehensive_analysis = {
+            'voice_analysis': voice_analysis.get('features'),
+            'text_analysis': text_analysis,
+            'indicators': indicator_result['indicators'].to_dict(),
+            'clinical_validation': indicator_result['risk_assessment'],
+            'trend_analysis': trend_analysis
+        }
+
+        return await self.comprehensive_interpreter.interpret(comprehensive_analysis)
+
+    async def _stage_report(
+        self,
+        indicator_result: Dict[str, Any],
+        trend_analysis: Optional[Dict[str, Any]],
+        user_info: Optional[Dict]
+    ) -> Optional[Dict[str, Any]]:
+        """Phase 9: 종합 리포트 생성 (Phase 8과 동시에 실행)"""
+        logger.info("Phase 9: 종합 리포트 생성")
+        try:
+            # 동기 함수를 워커 프로세스 또는 공유 실행기에서 실행
+            report = await self._run_cpu(
+                'report', 'generate',
+                indicator_result['indicators'],
+                indicator_result['risk_assessment'],
+                trend_analysis,
+                user_info
+            )
+            logger.info("Phase 9 완료: 리포트 생성 성공")
+            return report
+        except Exception as e:
+            logger.error(f"리포트 생성 실패: {e}")
+            return None
+
+    async def _analyze_voice(
+        self,
+        audio: DecodedAudio,
+        shared_audio: Optional[SharedAudio] = None
+    ) -> Dict[str, Any]:
         """음성 분석 실행 (타임아웃 관리 추가)"""
-        import asyncio
-        from concurrent.futures import ThreadPoolExecutor
-        from pathlib import Path
-        
         try:
-            # 파일 크기에 따른 동적 타임아웃 설정
-            file_size_mb = Path(audio_path).stat().st_size / (1024 * 1024)
+            # 파일 크기에 따른 동적 타임아웃 설정 (파일이 없으면 1분 ≈ 1MB로 환산)
+            file_size_mb = audio.file_size_mb
+            if file_size_mb is None:
+                file_size_mb = audio.duration / 60
             
             # 타임아웃 계산: 기본 60초 + MB당 20초 (최대 4분)
             timeout_seconds = min(60 + (file_size_mb * 20), 240)
             logger.info(f"음성 분석 타임아웃 설정: {timeout_seconds}초 (파일: {file_size_mb:.1f}MB)")
             
-            # CPU 집약적인 동기 함수를 별도 스레드에서 실행
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor(max_workers=1) as executor:
+            # CPU 집약적인 동기 함수를 워커 프로세스 또는 공유 실행기에서 실행
+            if self.worker_pool and shared_audio:
+                future = self.worker_pool.analyze_audio('voice', shared_audio)
+            else:
+                loop = asyncio.get_event_loop()
                 future = loop.run_in_executor(
-                    executor,
+                    self.executor,
                     self.voice_analyzer.analyze,
-                    audio_path
+                    audio
                 )
-                
-                # 타임아웃 적용
-                result = await asyncio.wait_for(future, timeout=timeout_seconds)
-                
-            return result
+
+            # 타임아웃 적용
+            return await asyncio.wait_for(future, timeout=timeout_seconds)
             
         except asyncio.TimeoutError:
             logger.error(f"음성 분석 타임아웃 ({timeout_seconds}초)")
@@ -587,12 +832,19 @@ class SeniorMentalHealthPipeline:
     
     # 비상 분석 함수 제거 - 실패 시 바로 에러 발생
     
-    async def _perform_stt(self, audio_path: str) -> Dict[str, Any]:
+    async def _perform_stt(
+        self,
+        audio_path: str,
+        decoded_audio: Optional[DecodedAudio] = None
+    ) -> Dict[str, Any]:
         """STT 실행"""
         try:
             # Google Cloud STT 사용
             if self.stt_connector:
-                result = await self.stt_connector.transcribe_with_diarization(audio_path)
+                result = await self.stt_connector.transcribe_with_diarization(
+                    audio_path,
+                    decoded_audio=decoded_audio
+                )
                 return result
             else:
                 logger.error("STT 커넥터가 초기화되지 않았습니다. Google Cloud 인증을 확인하세요.")
@@ -638,14 +890,10 @@ class SeniorMentalHealthPipeline:
         self,
         audio_path: str,
         segments: List[Dict],
-        speaker_info: Dict
+        speaker_info: Dict,
+        decoded_audio: Optional[DecodedAudio] = None
     ) -> Dict[str, Any]:
-        """시니어 화자의 음성 구간만 추출하여 임시 파일로 저장"""
-        import librosa
-        import soundfile as sf
-        import tempfile
-        import numpy as np
-        from pathlib import Path
+        """시니어 화자의 음성 구간을 원본 버퍼 위의 구간 뷰로 추출 (파일 저장 없음)"""
         import re
         
         senior_speaker_id = speaker_info.get('senior_speaker_id')
@@ -683,10 +931,12 @@ class SeniorMentalHealthPipeline:
         logger.info(f"화자 ID 변환: AI='{senior_speaker_id}' -> STT={senior_speaker_numeric}")
         
         try:
-            # 원본 오디오 로드
-            y, sr = librosa.load(audio_path, sr=None)
+            # 원본 오디오 (요청 단위로 이미 디코딩된 버퍼 재사용)
+            if decoded_audio is None:
+                decoded_audio = DecodedAudio.from_file(audio_path)
+            y, sr = decoded_audio.samples, decoded_audio.sample_rate
             
-            # 시니어 음성 구간 수집
+            # 시니어 음성 구간 수집 (샘플 인덱스 범위만 보관)
             senior_segments = []
             for seg in segments:
                 # 숫자 형식과 문자열 형식 모두 비교
@@ -703,8 +953,7 @@ class SeniorMentalHealthPipeline:
                     
                     # 유효한 범위 확인
                     if start_sample < len(y) and end_sample <= len(y) and start_sample < end_sample:
-                        segment_audio = y[start_sample:end_sample]
-                        senior_segments.append(segment_audio)
+                        senior_segments.append((start_sample, end_sample))
             
             if not senior_segments:
                 # 디버깅 정보 출력
@@ -737,26 +986,19 @@ class SeniorMentalHealthPipeline:
                     'available_speakers': list(available_speakers)
                 }
             
-            # 시니어 구간들을 연결
-            senior_audio = np.concatenate(senior_segments)
-            total_duration = len(senior_audio) / sr
-            
-            # 임시 파일에 저장
-            temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-            temp_path = temp_file.name
-            temp_file.close()
-            
-            sf.write(temp_path, senior_audio, sr)
+            # 시니어 구간 뷰 (연속 배열은 각 분석 단계에서 필요할 때 생성)
+            senior_audio = AudioSegmentView(decoded_audio, senior_segments)
+            total_duration = senior_audio.duration
             
             logger.info(f"시니어 음성 구간 추출 완료: {len(senior_segments)}개 구간, {total_duration:.2f}초")
             return {
                 'status': 'success',
-                'audio_path': temp_path,
+                'audio_path': audio_path,
+                'audio': senior_audio,
                 'message': f'시니어 음성 구간 추출 성공: {len(senior_segments)}개 구간',
                 'segments_extracted': len(senior_segments),
                 'total_duration': total_duration,
                 'using_original': False,
-                'temp_file_created': True,
                 'original_file_duration': len(y) / sr,
                 'extraction_ratio': total_duration / (len(y) / sr)
             }
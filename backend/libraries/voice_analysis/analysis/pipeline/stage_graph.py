@@ -0,0 +1,110 @@
+"""
+파이프라인 단계 그래프
+입력/출력을 선언한 단계들을 의존성 순서대로 실행하고, 서로 독립적인 단계는 동시에 실행
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineStage:
+    """파이프라인 단계 정의"""
+    name: str
+    func: Callable[..., Awaitable[Any]]  # 입력 키를 키워드 인자로 받는 코루틴 함수
+    inputs: Tuple[str, ...]
+    output: str
+
+
+class StageGraph:
+    """단계 의존성 그래프 (DAG)"""
+
+    def __init__(self, stages: Sequence[PipelineStage]):
+        """
+        Args:
+            stages: 실행할 단계 목록 (출력 키는 단계마다 고유해야 함)
+        """
+        self.stages: List[PipelineStage] = list(stages)
+        self._producers: Dict[str, str] = {}
+
+        for stage in self.stages:
+            if stage.output in self._producers:
+                raise ValueError(f"출력 키 중복: {stage.output}")
+            self._producers[stage.output] = stage.name
+
+        self._check_acyclic()
+
+    def _check_acyclic(self):
+        """순환 의존성 검사"""
+        by_name = {stage.name: stage for stage in self.stages}
+        visiting, done = set(), set()
+
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"단계 그래프에 순환 의존성 존재: {name}")
+            visiting.add(name)
+            for key in by_name[name].inputs:
+                producer = self._producers.get(key)
+                if producer:
+                    visit(producer)
+            visiting.discard(name)
+            done.add(name)
+
+        for stage in self.stages:
+            visit(stage.name)
+
+    async def run(self, context: Dict[str, Any]) -> Dict[str, float]:
+        """
+        그래프 실행
+
+        Args:
+            context: 초기 입력 값 (각 단계의 출력이 같은 dict에 기록됨)
+
+        Returns:
+            단계별 실행 시간 (ms)
+        """
+        for stage in self.stages:
+            missing = [
+                key for key in stage.inputs
+                if key not in context and key not in self._producers
+            ]
+            if missing:
+                raise KeyError(f"단계 '{stage.name}' 입력 누락: {missing}")
+
+        tasks: Dict[str, asyncio.Future] = {}
+        timings: Dict[str, float] = {}
+
+        async def run_stage(stage: PipelineStage):
+            # 선행 단계 완료 대기
+            dependencies = [
+                tasks[self._producers[key]]
+                for key in stage.inputs if key in self._producers
+            ]
+            if dependencies:
+                await asyncio.gather(*dependencies)
+
+            started = time.perf_counter()
+            value = await stage.func(**{key: context[key] for key in stage.inputs})
+            timings[stage.name] = (time.perf_counter() - started) * 1000
+            context[stage.output] = value
+            logger.debug(f"단계 완료: {stage.name} ({timings[stage.name]:.0f}ms)")
+
+        for stage in self.stages:
+            tasks[stage.name] = asyncio.ensure_future(run_stage(stage))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            # 한 단계가 실패하면 나머지 단계 취소
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        return timings
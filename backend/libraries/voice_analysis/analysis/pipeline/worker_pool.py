@@ -0,0 +1,219 @@
+"""
+CPU 집약 분석용 프로세스 풀
+librosa/NumPy 파이썬 코드가 GIL을 점유하므로 동시 요청이 코어 수만큼 병렬 처리되도록
+사전 워밍된 워커 프로세스에서 음성 특징 추출, SincNet, 지표 계산, 리포트 생성을 실행
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..utils.decoded_audio import DecodedAudio
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SharedAudioHandle:
+    """공유 메모리에 올린 오디오 버퍼 식별 정보 (워커로 전달되는 유일한 오디오 데이터)"""
+    name: str
+    num_samples: int
+    sample_rate: int
+    source_path: Optional[str] = None
+
+
+class SharedAudio:
+    """요청 단위 공유 메모리 오디오 버퍼 (같은 요청의 여러 단계가 재사용)"""
+
+    def __init__(self, audio: DecodedAudio):
+        """
+        Args:
+            audio: 공유할 오디오 버퍼 (구간 뷰는 연속 배열로 한 번 생성해 복사)
+        """
+        samples = audio.samples
+        self._shm = shared_memory.SharedMemory(create=True, size=max(samples.nbytes, 1))
+        buffer = np.ndarray(samples.shape, dtype=np.float32, buffer=self._shm.buf)
+        buffer[:] = samples
+        del buffer
+
+        self.handle = SharedAudioHandle(
+            name=self._shm.name,
+            num_samples=len(samples),
+            sample_rate=audio.sample_rate,
+            source_path=audio.source_path
+        )
+
+    def close(self):
+        """공유 메모리 해제 (모든 워커 작업이 끝난 뒤 호출)"""
+        if self._shm is None:
+            return
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+    def __enter__(self) -> 'SharedAudio':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# 워커 프로세스 전역 상태 (initializer에서 한 번 생성)
+_worker_components: Dict[str, Any] = {}
+
+
+def _init_worker(warm_sincnet: bool):
+    """워커 초기화: librosa import 및 분석기/SincNet 가중치 사전 로드"""
+    import librosa
+
+    # 첫 요청에서 발생하는 지연 초기화 비용을 미리 지불
+    librosa.feature.rms(y=np.zeros(4096, dtype=np.float32))
+
+    from ..core import VoiceAnalyzer, IndicatorCalculator
+    from .report_generator import ReportGenerator
+
+    _worker_components['voice'] = VoiceAnalyzer()
+    _worker_components['indicator'] = IndicatorCalculator()
+    _worker_components['report'] = ReportGenerator()
+
+    if warm_sincnet:
+        try:
+            from ..core import SincNetAnalyzer
+            _worker_components['sincnet'] = SincNetAnalyzer()
+        except Exception as e:
+            logger.warning(f"워커 SincNet 초기화 실패: {e}")
+
+    logger.info(f"분석 워커 준비 완료 (pid={os.getpid()})")
+
+
+def _ping() -> int:
+    """워커 기동 확인용"""
+    return os.getpid()
+
+
+def _run_audio_task(component: str, handle: SharedAudioHandle) -> Dict[str, Any]:
+    """공유 메모리 오디오를 복사 없이 연결해 분석 실행"""
+    analyzer = _worker_components.get(component)
+    if analyzer is None:
+        return {'status': 'error', 'error': f'{component} analyzer not available'}
+
+    shm = shared_memory.SharedMemory(name=handle.name)
+    audio = None
+    try:
+        audio = DecodedAudio(
+            np.ndarray((handle.num_samples,), dtype=np.float32, buffer=shm.buf),
+            handle.sample_rate,
+            source_path=handle.source_path
+        )
+        return analyzer.analyze(audio)
+    finally:
+        # 공유 버퍼를 참조하는 배열을 먼저 해제해야 close 가능
+        audio = None
+        try:
+            shm.close()
+        except BufferError:
+            logger.debug(f"공유 메모리 참조가 남아 있어 close 지연: {handle.name}")
+
+
+def _run_method(component: str, method: str, args: tuple, kwargs: dict) -> Any:
+    """워커에 상주하는 컴포넌트의 메서드 실행"""
+    return getattr(_worker_components[component], method)(*args, **kwargs)
+
+
+class CpuWorkerPool:
+    """사전 워밍된 프로세스 풀 (파이프라인 인스턴스와 수명을 같이함)"""
+
+    def __init__(self, max_workers: Optional[int] = None, warm_sincnet: bool = True):
+        """
+        Args:
+            max_workers: 워커 프로세스 수 (기본값: CPU 코어 수)
+            warm_sincnet: 워커 기동 시 SincNet 가중치 사전 로드 여부
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.warm_sincnet = warm_sincnet
+        self.executor = self._create_executor()
+        self._warm_futures: List[Future] = []
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """워커 프로세스 풀 생성 (워커는 기동 시 로컬 체크포인트로 SincNet 구성)"""
+        # fork는 gRPC/스레드 상태를 복제하므로 spawn 사용
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self.warm_sincnet,)
+        )
+
+    def warm(self) -> List[Future]:
+        """모든 워커를 미리 기동 (대기하지 않고 Future 목록 반환)"""
+        # 유휴 워커가 없는 상태에서 동시에 제출하면 max_workers개까지 프로세스가 생성됨
+        self._warm_futures = [
+            self.executor.submit(_ping) for _ in range(self.max_workers)
+        ]
+        return self._warm_futures
+
+    def recycle(self) -> List[Future]:
+        """
+        워커 전체 교체 (모델 재로드 후 호출)
+
+        워커는 각자 모델을 메모리에 올려 두므로 부모 프로세스의 재로드가 전달되지 않는다.
+        새 풀을 기동해 새 작업을 받게 하고, 기존 풀은 이미 제출된 작업을 마친 뒤 종료한다.
+        """
+        previous = self.executor
+        self.executor = self._create_executor()
+        futures = self.warm()
+        previous.shutdown(wait=False, cancel_futures=False)
+        logger.info(f"분석 워커 교체: {self.max_workers}개 워커 재기동")
+        return futures
+
+    def get_status(self) -> Dict[str, Any]:
+        """워커 워밍 상태"""
+        ready = [
+            f.result() for f in self._warm_futures
+            if f.done() and not f.exception()
+        ]
+        return {
+            'max_workers': self.max_workers,
+            'warm_workers': len(set(ready)),
+            'warming': sum(1 for f in self._warm_futures if not f.done())
+        }
+
+    async def analyze_audio(self, component: str, shared_audio: SharedAudio) -> Dict[str, Any]:
+        """
+        오디오 분석 실행 ('voice' 또는 'sincnet')
+
+        Args:
+            component: 분석기 이름
+            shared_audio: 공유 메모리 오디오 버퍼
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self.executor, _run_audio_task, component, shared_audio.handle
+        )
+
+    async def call(self, component: str, method: str, *args, **kwargs) -> Any:
+        """
+        워커 상주 컴포넌트 메서드 실행 ('indicator', 'report')
+
+        Args:
+            component: 컴포넌트 이름
+            method: 메서드 이름
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self.executor, _run_method, component, method, args, kwargs
+        )
+
+    def shutdown(self, wait: bool = False):
+        """워커 종료"""
+        self.executor.shutdown(wait=wait, cancel_futures=True)
@@ -13,6 +13,8 @@ from pathlib import Path
 from typing import Optional, Tuple, Union
 import logging
 
+from ..utils.decoded_audio import DecodedAudio
+
 logger = logging.getLogger(__name__)
 
 
@@ -130,17 +132,12 @@ class AudioProcessor:
     
     def _convert_24bit_to_float(self, data: bytes, n_samples: int) -> np.ndarray:
         """24-bit PCM을 float로 변환"""
-        # 24-bit는 3바이트씩 처리
-        result = np.zeros(n_samples, dtype=np.float32)
-        for i in range(n_samples):
-            # Little-endian 24-bit to 32-bit
-            b1, b2, b3 = data[i*3], data[i*3+1], data[i*3+2]
-            value = b1 | (b2 << 8) | (b3 << 16)
-            # Sign extension
-            if value & 0x800000:
-                value |= 0xFF000000
-            result[i] = np.int32(value) / 8388608.0
-        return result
+        # 3바이트 샘플을 32-bit 상위 3바이트에 배치한 뒤 산술 시프트로 부호 확장
+        raw = np.frombuffer(data, dtype=np.uint8, count=n_samples * 3).reshape(-1, 3)
+        padded = np.zeros((n_samples, 4), dtype=np.uint8)
+        padded[:, 1:] = raw
+        values = padded.view('<i4').reshape(-1) >> 8
+        return values.astype(np.float32) / 8388608.0
     
     def _load_with_ffmpeg(self, audio_path: Path, target_sr: int, mono: bool) -> Tuple[Optional[np.ndarray], int]:
         """FFmpeg를 사용한 오디오 로드"""
@@ -201,27 +198,12 @@ class AudioProcessor:
         
         return np.interp(new_indices, old_indices, audio)
     
-    def prepare_for_model(self, audio: np.ndarray, 
-                         window_size: int,
-                         stride: Optional[int] = None,
-                         pad_mode: str = 'constant') -> torch.Tensor:
-        """
-        모델 입력을 위한 오디오 준비
-        
-        Args:
-            audio: 오디오 배열
-            window_size: 모델이 요구하는 윈도우 크기
-            stride: 슬라이딩 윈도우 스트라이드 (기본: window_size // 2)
-            pad_mode: 패딩 모드 ('constant', 'reflect', 'replicate')
-            
-        Returns:
-            [n_windows, 1, window_size] 형태의 텐서
-        """
+    def _as_window_source(self, audio: np.ndarray, window_size: int,
+                          pad_mode: str) -> torch.Tensor:
+        """윈도우 추출용 1차원 float32 텐서 (짧으면 패딩, 그 외에는 복사 없음)"""
         if len(audio) == 0:
             raise ValueError("빈 오디오 배열")
         
-        stride = stride or window_size // 2
-        
         # 너무 짧은 경우 패딩
         if len(audio) < window_size:
             pad_length = window_size - len(audio)
@@ -234,41 +216,58 @@ class AudioProcessor:
             else:
                 raise ValueError(f"Unknown pad_mode: {pad_mode}")
         
-        # 슬라이딩 윈도우 생성
-        windows = []
-        for i in range(0, len(audio) - window_size + 1, stride):
-            window = audio[i:i + window_size]
-            windows.append(window)
-        
-        if not windows:
-            # 하나의 윈도우만 생성
-            windows = [audio[:window_size]]
+        # float32 연속 배열이면 그대로 공유 (읽기 전용 버퍼만 한 번 복사)
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        if not audio.flags.writeable:
+            audio = audio.copy()
+        return torch.from_numpy(audio)
+    
+    def prepare_for_model(self, audio: np.ndarray, 
+                         window_size: int,
+                         stride: Optional[int] = None,
+                         pad_mode: str = 'constant') -> torch.Tensor:
+        """
+        모델 입력을 위한 오디오 준비
         
-        # 텐서 변환
-        windows_array = np.stack(windows)
-        tensor = torch.from_numpy(windows_array).float()
+        윈도우는 원본 버퍼를 공유하는 strided 뷰로 생성되므로 윈도우별 복사가 없다.
         
-        # [n_windows, 1, window_size] 형태로
-        tensor = tensor.unsqueeze(1)
+        Args:
+            audio: 오디오 배열
+            window_size: 모델이 요구하는 윈도우 크기
+            stride: 슬라이딩 윈도우 스트라이드 (기본: window_size // 2)
+            pad_mode: 패딩 모드 ('constant', 'reflect', 'replicate')
+            
+        Returns:
+            [n_windows, 1, window_size] 형태의 텐서 (오디오 버퍼의 뷰)
+        """
+        stride = stride or window_size // 2
+        source = self._as_window_source(audio, window_size, pad_mode)
         
-        return tensor
+        # [n_windows, window_size] strided 뷰 -> [n_windows, 1, window_size]
+        return source.unfold(0, window_size, stride).unsqueeze(1)
     
-    def process_any_audio(self, audio_path: Union[str, Path],
+    def process_any_audio(self, audio_path: Union[str, Path, DecodedAudio],
                          model_window_size: int = 2937,
                          overlap: float = 0.5) -> Tuple[Optional[torch.Tensor], dict]:
         """
         어떤 오디오 파일이든 모델 입력으로 변환
         
         Args:
-            audio_path: 오디오 파일 경로
+            audio_path: 오디오 파일 경로 또는 디코딩된 오디오 버퍼
             model_window_size: 모델 입력 크기
             overlap: 윈도우 오버랩 비율 (0~1)
             
         Returns:
             (tensor, info_dict) or (None, error_dict)
         """
-        # 오디오 로드
-        audio, sr = self.load_audio(audio_path, target_sr=16000, mono=True)
+        if isinstance(audio_path, DecodedAudio):
+            # 이미 디코딩된 버퍼의 16kHz 뷰 사용 (재디코딩 없음)
+            sr = self.TARGET_SAMPLE_RATE
+            audio = audio_path.resample(sr)
+            audio_path = audio_path.source_path or '<memory>'
+        else:
+            # 오디오 로드
+            audio, sr = self.load_audio(audio_path, target_sr=16000, mono=True)
         
         if audio is None:
             return None, {'error': '오디오 로드 실패', 'path': str(audio_path)}
@@ -55,14 +55,14 @@ class SincNetModelManager:
         else:
             logger.info("로컬 캐시에 모델이 없음. Firebase Storage에서 다운로드 필요")
 
-    def _download_model_from_storage(self, model_type: str) -> bool:
-        """Firebase Storage에서 모델 다운로드"""
+    def _download_model_from_storage(self, model_type: str, force: bool = False) -> bool:
+        """Firebase Storage에서 모델 다운로드 (force=True면 기존 캐시를 새 체크포인트로 교체)"""
         try:
             filename = self.model_files[model_type]
             local_path = self.cache_dir / filename
 
             # 이미 존재하면 스킵
-            if local_path.exists():
+            if local_path.exists() and not force:
                 logger.info(f"모델이 이미 캐시됨: {filename}")
                 return True
 
@@ -74,8 +74,10 @@ class SincNetModelManager:
             blob_path = f"{self.storage_prefix}{filename}"
             blob = bucket.blob(blob_path)
 
-            # 다운로드
-            blob.download_to_filename(str(local_path))
+            # 임시 파일로 받은 뒤 교체 (다운로드 중에도 기존 파일은 유효)
+            download_path = local_path.with_suffix(local_path.suffix + '.download')
+            blob.download_to_filename(str(download_path))
+            os.replace(download_path, local_path)
 
             file_size_mb = local_path.stat().st_size / 1024 / 1024
             logger.info(f"모델 다운로드 완료: {filename} ({file_size_mb:.2f} MB)")
@@ -85,15 +87,17 @@ class SincNetModelManager:
             logger.error(f"모델 다운로드 실패 ({model_type}): {e}")
             return False
 
-    def _get_model_path(self, model_type: str) -> Optional[Path]:
+    def _get_model_path(self, model_type: str, force_download: bool = False) -> Optional[Path]:
         """모델 파일 경로 반환 (필요시 다운로드)"""
         filename = self.model_files[model_type]
         local_path = self.cache_dir / filename
 
-        # 로컬에 없으면 다운로드
-        if not local_path.exists():
-            if not self._download_model_from_storage(model_type):
-                return None
+        # 로컬에 없거나 강제 갱신이면 다운로드
+        if force_download or not local_path.exists():
+            if not self._download_model_from_storage(model_type, force=force_download):
+                if not local_path.exists():
+                    return None
+                logger.warning(f"모델 갱신 실패, 기존 캐시 사용: {filename}")
 
         return local_path
     
@@ -144,6 +148,10 @@ class SincNetModelManager:
         
         return loaded_models
     
+    def evict(self, model_type: str):
+        """특정 모델의 원본 체크포인트를 메모리 캐시에서 제거"""
+        self.models.pop(model_type, None)
+
     def clear_memory_cache(self):
         """메모리 캐시만 클리어 (모델 파일은 그대로 유지)"""
         self.models.clear()
@@ -0,0 +1,223 @@
+"""
+SincNet 추론 모델 레지스트리
+체크포인트를 eval 모드 모델로 프로세스당 한 번만 구성해 모든 요청이 공유
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .model_manager import SincNetModelManager, get_model_manager
+from .original_sincnet_model import FusedSincNetHeads, OriginalSincNetModel
+
+logger = logging.getLogger(__name__)
+
+MODEL_TYPES = ('depression', 'insomnia')
+
+
+def _file_sha256(path: Path, block_size: int = 1024 * 1024) -> str:
+    """체크포인트 파일 해시 (1MB 블록 단위)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SincNetModelRegistry:
+    """(모델 유형, 체크포인트 해시)별 추론 준비 완료 모델 보관소"""
+
+    def __init__(
+        self,
+        model_manager: Optional[SincNetModelManager] = None,
+        retry_interval: float = 60.0
+    ):
+        """
+        Args:
+            model_manager: 체크포인트 다운로드/로드 관리자 (기본값: 싱글톤)
+            retry_interval: 로드 실패 후 재시도까지 대기 시간 (초)
+        """
+        self.model_manager = model_manager or get_model_manager()
+        self.retry_interval = retry_interval
+
+        self._models: Dict[Tuple[str, str], OriginalSincNetModel] = {}
+        self._active: Dict[str, Tuple[str, str]] = {}
+        self._status: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+        # 활성 모델 조합별 융합 추론 모듈
+        self._fused: Optional[FusedSincNetHeads] = None
+        self._fused_key: Optional[Tuple[Tuple[str, str], ...]] = None
+
+    def get(self, model_type: str) -> Optional[OriginalSincNetModel]:
+        """
+        추론용 모델 반환 (최초 호출 시에만 구성)
+
+        Args:
+            model_type: 'depression' 또는 'insomnia'
+        """
+        key = self._active.get(model_type)
+        if key is None:
+            status = self._status.get(model_type, {})
+            failed_at = status.get('failed_at')
+            if failed_at and time.time() - failed_at < self.retry_interval:
+                return None
+            self._load(model_type)
+            key = self._active.get(model_type)
+
+        return self._models.get(key) if key else None
+
+    def get_fused(self) -> Optional[FusedSincNetHeads]:
+        """
+        모든 모델을 한 번의 배치 순전파로 실행하는 융합 모듈 반환
+
+        모델이 하나라도 없거나 구조가 호환되지 않으면 None (개별 추론 사용)
+        """
+        models = {model_type: self.get(model_type) for model_type in MODEL_TYPES}
+        if any(model is None for model in models.values()):
+            return None
+
+        key = tuple(self._active[model_type] for model_type in MODEL_TYPES)
+        with self._lock:
+            if self._fused_key != key:
+                try:
+                    self._fused = FusedSincNetHeads(models).freeze()
+                except ValueError as e:
+                    logger.warning(f"SincNet 융합 추론 불가, 개별 추론 사용: {e}")
+                    self._fused = None
+                self._fused_key = key
+            return self._fused
+
+    def warm(self, model_types: Iterable[str] = MODEL_TYPES) -> Dict[str, bool]:
+        """서비스 시작 시 모델 사전 구성"""
+        return {model_type: self.get(model_type) is not None for model_type in model_types}
+
+    def reload(self, model_type: Optional[str] = None, download: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Storage에 새 체크포인트가 올라왔을 때 명시적 재로드
+
+        체크포인트 해시가 같으면 기존 모델을 그대로 사용하고, 다르면 새 모델을
+        구성한 뒤 교체한다. 교체 전까지는 기존 모델로 계속 추론한다.
+        다운로드 실패 시 기존 캐시로 대체하지 않고 실패로 보고한다.
+
+        Args:
+            model_type: 재로드할 모델 (None이면 전체)
+            download: Storage에서 체크포인트를 다시 받을지 여부
+
+        Returns:
+            모델별 {'success': 재로드 성공 여부, 'swapped': 활성 모델 교체 여부, 'error': 오류}
+        """
+        model_types = [model_type] if model_type else list(MODEL_TYPES)
+        results = {}
+        for target in model_types:
+            swapped = self._load(target, refresh=True, download=download)
+            error = self._status.get(target, {}).get('error')
+            results[target] = {
+                'success': error is None,
+                'swapped': swapped,
+                'error': error
+            }
+        return results
+
+    def _load(self, model_type: str, refresh: bool = False, download: bool = False) -> bool:
+        """
+        체크포인트 해시 확인 후 모델 구성 및 활성화
+
+        Returns:
+            활성 모델이 바뀌었는지 여부 (최초 로드 포함, 해시가 같거나 실패하면 False)
+        """
+        with self._lock:
+            if not refresh and model_type in self._active:
+                return False
+
+            started = time.perf_counter()
+            try:
+                if download and not self.model_manager._download_model_from_storage(model_type, force=True):
+                    raise RuntimeError(f"체크포인트 다운로드 실패: {model_type}")
+
+                checkpoint_path = self.model_manager._get_model_path(model_type)
+                if checkpoint_path is None:
+                    raise RuntimeError(f"체크포인트를 찾을 수 없음: {model_type}")
+
+                checkpoint_hash = _file_sha256(checkpoint_path)
+                key = (model_type, checkpoint_hash)
+
+                if key not in self._models:
+                    checkpoint = self.model_manager.load_model(model_type, force_reload=refresh)
+                    if checkpoint is None:
+                        raise RuntimeError(f"체크포인트 로드 실패: {model_type}")
+                    self._models[key] = self._build(model_type, checkpoint)
+                    # 모델 구성 후 원본 체크포인트는 메모리에서 해제
+                    self.model_manager.evict(model_type)
+
+                previous = self._active.get(model_type)
+                self._active[model_type] = key
+                if previous and previous != key:
+                    self._models.pop(previous, None)
+                    logger.info(f"SincNet 모델 교체: {model_type} {previous[1][:12]} -> {checkpoint_hash[:12]}")
+
+                self._status[model_type] = {
+                    'ready': True,
+                    'checkpoint_hash': checkpoint_hash,
+                    'loaded_at': datetime.now().isoformat(),
+                    'load_time_ms': (time.perf_counter() - started) * 1000,
+                    'error': None
+                }
+                logger.info(f"SincNet 모델 준비 완료: {model_type} ({checkpoint_hash[:12]})")
+                return previous != key
+
+            except Exception as e:
+                logger.error(f"SincNet 모델 구성 실패 ({model_type}): {e}")
+                status = self._status.setdefault(model_type, {})
+                status['ready'] = model_type in self._active
+                status['error'] = str(e)
+                status['failed_at'] = time.time()
+                return False
+
+    @staticmethod
+    def _build(model_type: str, checkpoint: Dict) -> OriginalSincNetModel:
+        """원본 아키텍처 모델 구성 및 가중치 로드 (eval 모드, sinc 필터 고정)"""
+        from .original_sincnet_analyzer import OriginalSincNetAnalyzer
+
+        model = OriginalSincNetModel(OriginalSincNetAnalyzer.MODEL_CONFIGS[model_type])
+        if not OriginalSincNetAnalyzer._load_weights_from_checkpoint(model, checkpoint, model_type):
+            raise RuntimeError(f"가중치 로드 실패: {model_type}")
+
+        return model.freeze()
+
+    @property
+    def is_warm(self) -> bool:
+        """모든 모델이 추론 가능한 상태인지 여부"""
+        return all(model_type in self._active for model_type in MODEL_TYPES)
+
+    def health(self) -> Dict[str, Any]:
+        """모델별 준비 상태"""
+        models = {}
+        for model_type in MODEL_TYPES:
+            status = dict(self._status.get(model_type, {'ready': False, 'error': None}))
+            status.pop('failed_at', None)
+            models[model_type] = status
+
+        return {
+            'warm': self.is_warm,
+            'models': models
+        }
+
+
+# 싱글톤 인스턴스
+_model_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> SincNetModelRegistry:
+    """모델 레지스트리 싱글톤 반환"""
+    global _model_registry
+    if _model_registry is None:
+        with _registry_lock:
+            if _model_registry is None:
+                _model_registry = SincNetModelRegistry()
+    return _model_registry
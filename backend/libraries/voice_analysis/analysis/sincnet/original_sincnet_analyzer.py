@@ -7,12 +7,14 @@ import logging
 import torch
 import numpy as np
 from pathlib import Path
-from typing import Dict, Optional, Union, Tuple, List
+from typing import Dict, Iterator, Optional, Union, Tuple, List
 import configparser
 
 from .original_sincnet_model import OriginalSincNetModel, create_config_from_cfg
 from .audio_processor import AudioProcessor
 from .model_manager import get_model_manager
+from .model_registry import get_model_registry
+from ..utils.decoded_audio import DecodedAudio, as_decoded_audio
 
 logger = logging.getLogger(__name__)
 
@@ -20,74 +22,86 @@ logger = logging.getLogger(__name__)
 class OriginalSincNetAnalyzer:
     """SincNet Analyzer using the original authentic architecture"""
     
-    def __init__(self):
+    # Configuration for both models (from original .cfg files)
+    MODEL_CONFIGS = {
+        'depression': {
+            # Windowing - 200ms windows at 16kHz
+            'input_dim': 3200,  # 200ms * 16kHz / 1000
+            'fs': 16000,
+            
+            # CNN - 3 layers [80, 60, 60] filters
+            'cnn_N_filt': [80, 60, 60],
+            'cnn_len_filt': [251, 5, 5],
+            'cnn_max_pool_len': [3, 3, 3],
+            'cnn_use_laynorm_inp': True,
+            'cnn_use_batchnorm_inp': False,
+            'cnn_use_laynorm': [True, True, True],
+            'cnn_use_batchnorm': [False, False, False],
+            'cnn_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
+            'cnn_drop': [0.0, 0.0, 0.0],
+            
+            # DNN - 3 layers of 2048 neurons
+            'fc_lay': [2048, 2048, 2048],
+            'fc_drop': [0.0, 0.0, 0.0],
+            'fc_use_laynorm_inp': True,
+            'fc_use_batchnorm_inp': False,
+            'fc_use_batchnorm': [True, True, True],
+            'fc_use_laynorm': [False, False, False],
+            'fc_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
+            
+            # Classifier - 2-class output
+            'class_lay': 2,
+            'class_drop': 0.0,
+            'class_use_laynorm_inp': False,
+            'class_use_batchnorm_inp': False,
+            'class_use_batchnorm': False,
+            'class_use_laynorm': False,
+            'class_act': 'softmax'
+        },
+        'insomnia': {
+            # Same configuration as depression (both use same architecture)
+            'input_dim': 3200,
+            'fs': 16000,
+            'cnn_N_filt': [80, 60, 60],
+            'cnn_len_filt': [251, 5, 5],
+            'cnn_max_pool_len': [3, 3, 3],
+            'cnn_use_laynorm_inp': True,
+            'cnn_use_batchnorm_inp': False,
+            'cnn_use_laynorm': [True, True, True],
+            'cnn_use_batchnorm': [False, False, False],
+            'cnn_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
+            'cnn_drop': [0.0, 0.0, 0.0],
+            'fc_lay': [2048, 2048, 2048],
+            'fc_drop': [0.0, 0.0, 0.0],
+            'fc_use_laynorm_inp': True,
+            'fc_use_batchnorm_inp': False,
+            'fc_use_batchnorm': [True, True, True],
+            'fc_use_laynorm': [False, False, False],
+            'fc_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
+            'class_lay': 2,
+            'class_drop': 0.0,
+            'class_use_laynorm_inp': False,
+            'class_use_batchnorm_inp': False,
+            'class_use_batchnorm': False,
+            'class_use_laynorm': False,
+            'class_act': 'softmax'
+        }
+    }
+    
+    def __init__(self, registry=None, fused: bool = True,
+                 micro_batch_size: Optional[int] = 64):
+        """
+        Args:
+            registry: Model registry (defaults to the process-wide singleton)
+            fused: Run both heads in one batched forward pass when possible
+            micro_batch_size: Windows per forward pass to cap peak memory
+                (None processes all windows at once)
+        """
         self.logger = logging.getLogger(__name__)
+        self.fused = fused
+        self.micro_batch_size = micro_batch_size
         
-        # Configuration for both models (from original .cfg files)
-        self.model_configs = {
-            'depression': {
-                # Windowing - 200ms windows at 16kHz
-                'input_dim': 3200,  # 200ms * 16kHz / 1000
-                'fs': 16000,
-                
-                # CNN - 3 layers [80, 60, 60] filters
-                'cnn_N_filt': [80, 60, 60],
-                'cnn_len_filt': [251, 5, 5],
-                'cnn_max_pool_len': [3, 3, 3],
-                'cnn_use_laynorm_inp': True,
-                'cnn_use_batchnorm_inp': False,
-                'cnn_use_laynorm': [True, True, True],
-                'cnn_use_batchnorm': [False, False, False],
-                'cnn_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
-                'cnn_drop': [0.0, 0.0, 0.0],
-                
-                # DNN - 3 layers of 2048 neurons
-                'fc_lay': [2048, 2048, 2048],
-                'fc_drop': [0.0, 0.0, 0.0],
-                'fc_use_laynorm_inp': True,
-                'fc_use_batchnorm_inp': False,
-                'fc_use_batchnorm': [True, True, True],
-                'fc_use_laynorm': [False, False, False],
-                'fc_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
-                
-                # Classifier - 2-class output
-                'class_lay': 2,
-                'class_drop': 0.0,
-                'class_use_laynorm_inp': False,
-                'class_use_batchnorm_inp': False,
-                'class_use_batchnorm': False,
-                'class_use_laynorm': False,
-                'class_act': 'softmax'
-            },
-            'insomnia': {
-                # Same configuration as depression (both use same architecture)
-                'input_dim': 3200,
-                'fs': 16000,
-                'cnn_N_filt': [80, 60, 60],
-                'cnn_len_filt': [251, 5, 5],
-                'cnn_max_pool_len': [3, 3, 3],
-                'cnn_use_laynorm_inp': True,
-                'cnn_use_batchnorm_inp': False,
-                'cnn_use_laynorm': [True, True, True],
-                'cnn_use_batchnorm': [False, False, False],
-                'cnn_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
-                'cnn_drop': [0.0, 0.0, 0.0],
-                'fc_lay': [2048, 2048, 2048],
-                'fc_drop': [0.0, 0.0, 0.0],
-                'fc_use_laynorm_inp': True,
-                'fc_use_batchnorm_inp': False,
-                'fc_use_batchnorm': [True, True, True],
-                'fc_use_laynorm': [False, False, False],
-                'fc_act': ['leaky_relu', 'leaky_relu', 'leaky_relu'],
-                'class_lay': 2,
-                'class_drop': 0.0,
-                'class_use_laynorm_inp': False,
-                'class_use_batchnorm_inp': False,
-                'class_use_batchnorm': False,
-                'class_use_laynorm': False,
-                'class_act': 'softmax'
-            }
-        }
+        self.model_configs = self.MODEL_CONFIGS
         
         # Audio processor with correct window size
         self.audio_processor = AudioProcessor()
@@ -95,6 +109,9 @@ class OriginalSincNetAnalyzer:
         # Model manager for loading checkpoints
         self.model_manager = get_model_manager()
         
+        # Process-wide registry of ready-to-run (eval mode) models
+        self.registry = registry or get_model_registry()
+        
         # Models and loaded states
         self.models = {}
         self.model_loaded = {}
@@ -103,47 +120,20 @@ class OriginalSincNetAnalyzer:
         self._load_all_models()
     
     def _load_all_models(self):
-        """Load both depression and insomnia models with original architecture"""
+        """Fetch both models from the registry (built once per process)"""
         
-        model_types = ['depression', 'insomnia']
-        
-        for model_type in model_types:
-            try:
-                self.logger.info(f"Loading {model_type} model with original SincNet architecture...")
-                
-                # Load checkpoint from model manager
-                checkpoint = self.model_manager.load_model(model_type)
-                if checkpoint is None:
-                    self.logger.error(f"Failed to load {model_type} checkpoint")
-                    self.model_loaded[model_type] = False
-                    continue
-                
-                # Create model with original architecture
-                config = self.model_configs[model_type]
-                model = OriginalSincNetModel(config)
-                
-                # Load weights from checkpoint
-                success = self._load_weights_from_checkpoint(model, checkpoint, model_type)
-                
-                if success:
-                    model.eval()
-                    self.models[model_type] = model
-                    self.model_loaded[model_type] = True
-                    self.logger.info(f"✓ {model_type} model loaded successfully")
-                    
-                    # Log architecture details
-                    self.logger.info(f"  CNN: {config['cnn_N_filt']} filters, {config['cnn_len_filt']} kernel sizes")
-                    self.logger.info(f"  DNN: {config['fc_lay']} neurons")
-                    self.logger.info(f"  Input: {config['input_dim']} samples (200ms at {config['fs']}Hz)")
-                else:
-                    self.model_loaded[model_type] = False
-                    self.logger.error(f"Failed to load weights for {model_type}")
-                    
-            except Exception as e:
-                self.logger.error(f"Error loading {model_type} model: {str(e)}")
-                self.model_loaded[model_type] = False
+        for model_type in ['depression', 'insomnia']:
+            model = self.registry.get(model_type)
+            self.model_loaded[model_type] = model is not None
+            
+            if model is not None:
+                self.models[model_type] = model
+            else:
+                self.models.pop(model_type, None)
+                self.logger.error(f"Failed to load {model_type} model")
     
-    def _load_weights_from_checkpoint(self, model: OriginalSincNetModel, 
+    @staticmethod
+    def _load_weights_from_checkpoint(model: OriginalSincNetModel, 
                                     checkpoint: Dict, model_type: str) -> bool:
         """Load weights from checkpoint into the original model architecture"""
         try:
@@ -153,24 +143,25 @@ class OriginalSincNetAnalyzer:
             dnn2_params = checkpoint.get('DNN2_model_par', {})
             
             if not cnn_params or not dnn1_params or not dnn2_params:
-                self.logger.error(f"Missing parameter dictionaries in {model_type} checkpoint")
+                logger.error(f"Missing parameter dictionaries in {model_type} checkpoint")
                 return False
             
             # Load CNN parameters
-            self._load_cnn_weights(model.cnn, cnn_params)
+            OriginalSincNetAnalyzer._load_cnn_weights(model.cnn, cnn_params)
             
             # Load DNN parameters (DNN1 = main DNN, DNN2 = classifier)
-            self._load_dnn_weights(model.dnn, dnn1_params, 'DNN1')
-            self._load_dnn_weights(model.classifier, dnn2_params, 'DNN2')
+            OriginalSincNetAnalyzer._load_dnn_weights(model.dnn, dnn1_params, 'DNN1')
+            OriginalSincNetAnalyzer._load_dnn_weights(model.classifier, dnn2_params, 'DNN2')
             
-            self.logger.info(f"Successfully loaded all weights for {model_type}")
+            logger.info(f"Successfully loaded all weights for {model_type}")
             return True
             
         except Exception as e:
-            self.logger.error(f"Error loading weights for {model_type}: {str(e)}")
+            logger.error(f"Error loading weights for {model_type}: {str(e)}")
             return False
     
-    def _load_cnn_weights(self, cnn_model, cnn_params):
+    @staticmethod
+    def _load_cnn_weights(cnn_model, cnn_params):
         """Load CNN weights including SincConv parameters"""
         try:
             state_dict = {}
@@ -196,13 +187,14 @@ class OriginalSincNetAnalyzer:
             
             # Load the state dict
             cnn_model.load_state_dict(state_dict, strict=False)
-            self.logger.debug("CNN weights loaded successfully")
+            logger.debug("CNN weights loaded successfully")
             
         except Exception as e:
-            self.logger.error(f"Error loading CNN weights: {str(e)}")
+            logger.error(f"Error loading CNN weights: {str(e)}")
             raise
     
-    def _load_dnn_weights(self, dnn_model, dnn_params, layer_name):
+    @staticmethod
+    def _load_dnn_weights(dnn_model, dnn_params, layer_name):
         """Load DNN weights with proper mapping"""
         try:
             state_dict = {}
@@ -225,23 +217,32 @@ class OriginalSincNetAnalyzer:
             
             # Load the state dict
             dnn_model.load_state_dict(state_dict, strict=False)
-            self.logger.debug(f"{layer_name} weights loaded successfully")
+            logger.debug(f"{layer_name} weights loaded successfully")
             
         except Exception as e:
-            self.logger.error(f"Error loading {layer_name} weights: {str(e)}")
+            logger.error(f"Error loading {layer_name} weights: {str(e)}")
             raise
     
-    def analyze_audio(self, audio_path: Union[str, Path]) -> Dict:
+    def analyze_audio(self, audio_path: Union[str, Path, DecodedAudio, np.ndarray],
+                      sample_rate: Optional[int] = None) -> Dict:
         """
         Analyze audio file using original SincNet architecture
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, an already decoded audio buffer,
+                or a PCM array
+            sample_rate: Sample rate of ``audio_path`` when it is an array
             
         Returns:
             Analysis results with depression and insomnia scores
         """
         try:
+            if isinstance(audio_path, np.ndarray):
+                audio_path = as_decoded_audio(audio_path, sample_rate)
+            
+            # Pick up models swapped in by an explicit registry reload
+            self._load_all_models()
+            
             if not any(self.model_loaded.values()):
                 raise RuntimeError("No models loaded successfully")
             
@@ -255,23 +256,38 @@ class OriginalSincNetAnalyzer:
             if audio_windows is None:
                 raise RuntimeError("Audio processing failed")
             
-            # Apply proper normalization (zero mean, unit variance)
-            # This is critical for SincNet
-            audio_windows = self._normalize_audio(audio_windows)
+            # Proper normalization (zero mean, unit variance) is critical for SincNet.
+            # The windows stay a strided view of the audio buffer; the statistics are
+            # computed over all windows and applied one micro-batch at a time.
+            norm_stats = self._normalization_stats(audio_windows)
             
             self.logger.info(f"Processing {len(audio_windows)} windows of 3200 samples each")
-            self.logger.info(f"Audio stats: mean={audio_windows.mean():.6f}, std={audio_windows.std():.6f}")
+            self.logger.info(f"Audio stats: mean={norm_stats[0]:.6f}, std={norm_stats[1]:.6f}")
             self.logger.info(f"Audio range: [{audio_windows.min():.6f}, {audio_windows.max():.6f}]")
             
             # Run inference on all loaded models
             results = {}
             
+            fused_model = self.registry.get_fused() if self.fused else None
+            if fused_model is not None:
+                try:
+                    results = self._run_fused_inference(
+                        fused_model, audio_windows, norm_stats, audio_info
+                    )
+                except Exception as e:
+                    self.logger.error(f"Fused inference failed, running models separately: {str(e)}")
+                    results = {}
+            
             for model_type in ['depression', 'insomnia']:
+                if model_type in results:
+                    continue
+
                 if self.model_loaded[model_type]:
                     try:
                         result = self._run_model_inference(
                             self.models[model_type], 
                             audio_windows, 
+                            norm_stats,
                             model_type,
                             audio_info
                         )
@@ -285,7 +301,7 @@ class OriginalSincNetAnalyzer:
                     results[model_type] = {'error': 'Model not loaded'}
             
             # Generate final result
-            return self._generate_final_result(results, audio_path)
+            return self._generate_final_result(results, audio_info.get('original_path', audio_path))
             
         except Exception as e:
             self.logger.error(f"Analysis failed: {str(e)}", exc_info=True)
@@ -295,41 +311,92 @@ class OriginalSincNetAnalyzer:
                 'audio_path': str(audio_path)
             }
     
-    def _normalize_audio(self, audio_tensor: torch.Tensor) -> torch.Tensor:
+    def _normalization_stats(self, audio_tensor: torch.Tensor) -> Tuple[float, float]:
         """
-        Apply proper normalization for SincNet
-        Zero mean and unit variance normalization
-        """
-        # Calculate mean and std across all dimensions
-        mean = audio_tensor.mean()
-        std = audio_tensor.std()
+        Zero mean / unit variance statistics for SincNet normalization
         
-        # Apply normalization with epsilon for stability
-        normalized = (audio_tensor - mean) / (std + 1e-8)
+        Computed across all windows without materializing a normalized copy;
+        ``_normalized_batches`` applies them per micro-batch.
+        """
+        mean = audio_tensor.mean().item()
+        std = audio_tensor.std().item()
         
         self.logger.debug(f"Normalization: mean={mean:.6f}, std={std:.6f}")
-        self.logger.debug(f"After norm: mean={normalized.mean():.6f}, std={normalized.std():.6f}")
         
-        return normalized
+        return mean, std
+    
+    def _normalized_batches(self, audio_windows: torch.Tensor,
+                            norm_stats: Tuple[float, float]) -> Iterator[torch.Tensor]:
+        """Yield normalized micro-batches of ``micro_batch_size`` windows (one copy at a time)"""
+        mean, std = norm_stats
+        batch_size = self.micro_batch_size or max(1, audio_windows.shape[0])
+        for chunk in torch.split(audio_windows, batch_size):
+            # Apply normalization with epsilon for stability
+            yield (chunk - mean) / (std + 1e-8)
+    
+    @staticmethod
+    def _squeeze_channel(audio_windows: torch.Tensor) -> torch.Tensor:
+        """Ensure proper input shape for SincNet: [batch_size, sequence_length]"""
+        # The original SincNet expects [batch, seq_len] and reshapes internally to [batch, 1, seq_len]
+        if audio_windows.dim() == 3 and audio_windows.shape[1] == 1:
+            # Shape is [batch, 1, seq_len] - squeeze the channel dimension
+            audio_windows = audio_windows.squeeze(1)
+        return audio_windows
+    
+    def _forward_in_batches(self, model: OriginalSincNetModel,
+                            audio_windows: torch.Tensor,
+                            norm_stats: Tuple[float, float]) -> torch.Tensor:
+        """Forward pass over normalized micro-batches of ``micro_batch_size`` windows"""
+        return torch.cat([
+            model(chunk) for chunk in self._normalized_batches(audio_windows, norm_stats)
+        ], dim=0)
+    
+    def _run_fused_inference(self, fused_model, audio_windows: torch.Tensor,
+                             norm_stats: Tuple[float, float],
+                             audio_info: Dict) -> Dict[str, Dict]:
+        """Run all heads in one batched forward pass over the shared windows"""
+        
+        with torch.no_grad():
+            audio_windows = self._squeeze_channel(audio_windows)
+            self.logger.info(f"fused input shape: {audio_windows.shape}")
+            
+            chunks = [
+                fused_model(chunk) for chunk in self._normalized_batches(audio_windows, norm_stats)
+            ]
+            outputs = {
+                name: torch.cat([chunk[name] for chunk in chunks], dim=0)
+                for name in fused_model.head_names
+            }
+            
+            return {
+                model_type: self._summarize_outputs(
+                    outputs[model_type], fused_model.heads[model_type], model_type, audio_info
+                )
+                for model_type in fused_model.head_names
+            }
     
     def _run_model_inference(self, model: OriginalSincNetModel, 
                            audio_windows: torch.Tensor, 
+                           norm_stats: Tuple[float, float],
                            model_type: str, 
                            audio_info: Dict) -> Dict:
         """Run inference on a single model"""
         
         with torch.no_grad():
-            # Ensure proper input shape for SincNet: [batch_size, sequence_length]
-            # The original SincNet expects [batch, seq_len] and reshapes internally to [batch, 1, seq_len]
-            if audio_windows.dim() == 3 and audio_windows.shape[1] == 1:
-                # Shape is [batch, 1, seq_len] - squeeze the channel dimension
-                audio_windows = audio_windows.squeeze(1)
+            audio_windows = self._squeeze_channel(audio_windows)
             
             self.logger.info(f"{model_type} input shape: {audio_windows.shape}")
             
             # Forward pass
-            outputs = model(audio_windows)
+            outputs = self._forward_in_batches(model, audio_windows, norm_stats)
             
+            return self._summarize_outputs(outputs, model, model_type, audio_info)
+    
+    def _summarize_outputs(self, outputs: torch.Tensor, model: OriginalSincNetModel,
+                           model_type: str, audio_info: Dict) -> Dict:
+        """Convert classifier outputs into aggregated window predictions"""
+        
+        with torch.no_grad():
             self.logger.info(f"{model_type} raw outputs: {outputs}")
             self.logger.info(f"{model_type} output shape: {outputs.shape}")
             self.logger.info(f"{model_type} output range: [{outputs.min():.6f}, {outputs.max():.6f}]")
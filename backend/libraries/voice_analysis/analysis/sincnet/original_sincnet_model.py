@@ -8,7 +8,7 @@ import torch.nn as nn
 import torch.nn.functional as F
 import numpy as np
 import math
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -105,14 +105,44 @@ class SincConv_fast(nn.Module):
         # filter frequency band (out_channels, 1)
         self.band_hz_ = nn.Parameter(torch.Tensor(np.diff(hz)).view(-1, 1))
 
-        # Hamming window
+        # Hamming window (non-persistent buffers follow the module's device,
+        # so they are not copied on every forward call)
         n_lin = torch.linspace(0, (self.kernel_size/2)-1, 
                               steps=int((self.kernel_size/2)))
-        self.window_ = 0.54 - 0.46 * torch.cos(2*math.pi*n_lin/self.kernel_size)
+        self.register_buffer(
+            'window_', 0.54 - 0.46 * torch.cos(2*math.pi*n_lin/self.kernel_size),
+            persistent=False
+        )
 
         # (1, kernel_size/2)
         n = (self.kernel_size - 1) / 2.0
-        self.n_ = 2*math.pi*torch.arange(-n, 0).view(1, -1) / self.sample_rate
+        self.register_buffer(
+            'n_', 2*math.pi*torch.arange(-n, 0).view(1, -1) / self.sample_rate,
+            persistent=False
+        )
+
+        # Filter bank materialized by freeze() for inference
+        self.register_buffer('frozen_filters', None, persistent=False)
+
+    @property
+    def is_frozen(self) -> bool:
+        return self.frozen_filters is not None
+
+    def freeze(self):
+        """
+        Materialize the filter bank once for inference
+        
+        After freezing, forward is a plain ``conv1d`` with a constant kernel
+        (no per-call trig work) until ``unfreeze()`` is called.
+        """
+        with torch.no_grad():
+            self.frozen_filters = self.compute_filters().detach().clone()
+        return self
+
+    def unfreeze(self):
+        """Go back to building the filters from low_hz_/band_hz_ (training)"""
+        self.frozen_filters = None
+        return self
 
     def forward(self, waveforms):
         """
@@ -125,9 +155,24 @@ class SincConv_fast(nn.Module):
         features : `torch.Tensor` (batch_size, out_channels, n_samples_out)
             Batch of sinc filters activations.
         """
-        self.n_ = self.n_.to(waveforms.device)
-        self.window_ = self.window_.to(waveforms.device)
+        if self.frozen_filters is not None:
+            filters = self.frozen_filters
+        else:
+            filters = self.compute_filters()
+            self.filters = filters
 
+        return F.conv1d(waveforms, filters, stride=self.stride,
+                       padding=self.padding, dilation=self.dilation,
+                       bias=None, groups=1)
+
+    def compute_filters(self):
+        """
+        Build the band-pass filter bank from the learned cut-off frequencies
+
+        Returns
+        -------
+        filters : `torch.Tensor` (out_channels, 1, kernel_size)
+        """
         low = self.min_low_hz + torch.abs(self.low_hz_)
         high = torch.clamp(low + self.min_band_hz + torch.abs(self.band_hz_),
                           self.min_low_hz, self.sample_rate/2)
@@ -145,11 +190,7 @@ class SincConv_fast(nn.Module):
         band_pass = torch.cat([band_pass_left, band_pass_center, band_pass_right], dim=1)
         band_pass = band_pass / (2 * band[:, None])
 
-        self.filters = band_pass.view(self.out_channels, 1, self.kernel_size)
-
-        return F.conv1d(waveforms, self.filters, stride=self.stride,
-                       padding=self.padding, dilation=self.dilation,
-                       bias=None, groups=1)
+        return band_pass.view(self.out_channels, 1, self.kernel_size)
 
 
 class MLP(nn.Module):
@@ -316,18 +357,35 @@ class SincNet(nn.Module):
 
         x = x.view(batch, 1, seq_len)
         
+        return self.forward_from_sinc(self.conv[0](x))
+
+    def forward_from_sinc(self, sinc_out):
+        """
+        Run the CNN given the output of the first (sinc) convolution
+
+        Args:
+            sinc_out: Tensor [batch_size, cnn_N_filt[0], n_samples_out]
+        """
+        batch = sinc_out.shape[0]
+        x = sinc_out
+        
         for i in range(self.N_cnn_lay):
+            conv_out = sinc_out if i == 0 else self.conv[i](x)
+            
             if self.cnn_use_laynorm[i]:
                 if i == 0:
-                    x = self.drop[i](self.act[i](self.ln[i](F.max_pool1d(torch.abs(self.conv[i](x)), self.cnn_max_pool_len[i]))))
+                    x = self.drop[i](self.act[i](self.ln[i](F.max_pool1d(torch.abs(conv_out), self.cnn_max_pool_len[i]))))
                 else:
-                    x = self.drop[i](self.act[i](self.ln[i](F.max_pool1d(self.conv[i](x), self.cnn_max_pool_len[i]))))
+                    x = self.drop[i](self.act[i](self.ln[i](F.max_pool1d(conv_out, self.cnn_max_pool_len[i]))))
             
             if self.cnn_use_batchnorm[i]:
-                x = self.drop[i](self.act[i](self.bn[i](F.max_pool1d(self.conv[i](x), self.cnn_max_pool_len[i]))))
+                # Independent of the layer-norm branch (original SincNet semantics): when both are
+                # enabled the convolution is applied again to the layer-norm output
+                bn_in = self.conv[i](x) if self.cnn_use_laynorm[i] else conv_out
+                x = self.drop[i](self.act[i](self.bn[i](F.max_pool1d(bn_in, self.cnn_max_pool_len[i]))))
 
             if self.cnn_use_batchnorm[i] == False and self.cnn_use_laynorm[i] == False:
-                x = self.drop[i](self.act[i](F.max_pool1d(self.conv[i](x), self.cnn_max_pool_len[i])))
+                x = self.drop[i](self.act[i](F.max_pool1d(conv_out, self.cnn_max_pool_len[i])))
         
         x = x.view(batch, -1)
         return x
@@ -389,6 +447,13 @@ class OriginalSincNetModel(nn.Module):
         
         # Store config for reference
         self.config = config_dict
+    
+    def freeze(self):
+        """Inference mode: eval, no gradients and a precomputed sinc filter bank"""
+        self.eval()
+        self.requires_grad_(False)
+        self.cnn.conv[0].freeze()
+        return self
         
     def forward(self, x):
         """
@@ -412,6 +477,162 @@ class OriginalSincNetModel(nn.Module):
         return class_out
 
 
+class FusedSincNetHeads(nn.Module):
+    """
+    Several OriginalSincNetModel heads sharing one batched front-end pass
+
+    The input layer-norm statistics are computed once, the first-layer sinc
+    filters of every head are stacked into a single grouped ``conv1d``, and the
+    resulting channels are split back into each head's CNN/DNN trunk.
+    """
+    
+    def __init__(self, models: Dict[str, OriginalSincNetModel]):
+        super(FusedSincNetHeads, self).__init__()
+        
+        if not models:
+            raise ValueError('FusedSincNetHeads needs at least one model')
+        
+        self.head_names: List[str] = list(models.keys())
+        self.heads = nn.ModuleDict(models)
+        
+        cnns = [model.cnn for model in models.values()]
+        sincs = [cnn.conv[0] for cnn in cnns]
+        reference = sincs[0]
+        
+        for cnn, sinc in zip(cnns, sincs):
+            if cnn.cnn_use_batchnorm_inp:
+                raise ValueError('Fused inference does not support input batch normalization')
+            if (cnn.input_dim != cnns[0].input_dim or
+                    cnn.cnn_use_laynorm_inp != cnns[0].cnn_use_laynorm_inp or
+                    sinc.out_channels != reference.out_channels or
+                    sinc.kernel_size != reference.kernel_size or
+                    sinc.stride != reference.stride or
+                    sinc.padding != reference.padding or
+                    sinc.dilation != reference.dilation):
+                raise ValueError('Heads have incompatible sinc front-ends')
+        
+        self.use_laynorm_inp = bool(cnns[0].cnn_use_laynorm_inp)
+        self.split_sizes = [sinc.out_channels for sinc in sincs]
+        self.stride = reference.stride
+        self.padding = reference.padding
+        self.dilation = reference.dilation
+        
+        # Stacked filter bank cached by freeze()
+        self.register_buffer('frozen_filters', None, persistent=False)
+    
+    def _stacked_filters(self) -> torch.Tensor:
+        """(sum of out_channels, 1, kernel_size) filter bank of all heads"""
+        if self.frozen_filters is not None:
+            return self.frozen_filters
+        
+        filters = []
+        for name in self.head_names:
+            sinc = self.heads[name].cnn.conv[0]
+            filters.append(sinc.frozen_filters if sinc.is_frozen else sinc.compute_filters())
+        return torch.cat(filters, dim=0)
+    
+    def freeze(self):
+        """Freeze every head and cache the stacked filter bank"""
+        for name in self.head_names:
+            self.heads[name].freeze()
+        self.frozen_filters = self._stacked_filters().detach().clone()
+        return self
+    
+    def forward(self, x) -> Dict[str, torch.Tensor]:
+        """
+        Args:
+            x: Input tensor [batch_size, seq_len]
+            
+        Returns:
+            Classifier outputs per head name
+        """
+        batch, seq_len = x.shape
+        n_heads = len(self.head_names)
+        
+        if self.use_laynorm_inp:
+            # Shared normalization statistics, per-head affine parameters
+            ln0s = [self.heads[name].cnn.ln0 for name in self.head_names]
+            mean = x.mean(-1, keepdim=True)
+            std = x.std(-1, keepdim=True)
+            normalized = (x - mean).unsqueeze(1) / (std.unsqueeze(1) + ln0s[0].eps)
+            gamma = torch.stack([ln0.gamma for ln0 in ln0s]).unsqueeze(0)
+            beta = torch.stack([ln0.beta for ln0 in ln0s]).unsqueeze(0)
+            inputs = gamma * normalized + beta
+        else:
+            inputs = x.unsqueeze(1).expand(batch, n_heads, seq_len)
+        
+        # One grouped convolution: head k's filters only see head k's input channel
+        sinc_out = F.conv1d(inputs, self._stacked_filters(),
+                            stride=self.stride, padding=self.padding,
+                            dilation=self.dilation, bias=None, groups=n_heads)
+        
+        outputs = {}
+        for name, head_sinc in zip(self.head_names,
+                                   torch.split(sinc_out, self.split_sizes, dim=1)):
+            head = self.heads[name]
+            outputs[name] = head.classifier(head.dnn(head.cnn.forward_from_sinc(head_sinc)))
+        
+        return outputs
+    
+    def predict(self, x, micro_batch_size: Optional[int] = None) -> Dict[str, torch.Tensor]:
+        """
+        Forward pass in fixed-size micro-batches to bound peak memory
+        
+        Args:
+            x: Input tensor [n_windows, seq_len]
+            micro_batch_size: Windows per forward pass (None: all at once)
+        """
+        if not micro_batch_size or x.shape[0] <= micro_batch_size:
+            return self(x)
+        
+        chunks = [self(chunk) for chunk in torch.split(x, micro_batch_size)]
+        return {
+            name: torch.cat([chunk[name] for chunk in chunks], dim=0)
+            for name in self.head_names
+        }
+
+
+def export_inference_model(model: nn.Module, path: str, fmt: str = 'torchscript',
+                           input_dim: int = 3200, batch_size: int = 8) -> str:
+    """
+    Export a frozen model as a plain convolutional graph
+    
+    Args:
+        model: OriginalSincNetModel (frozen here if it is not already)
+        path: Output file path
+        fmt: 'torchscript' or 'onnx'
+        input_dim: Window length in samples
+        batch_size: Batch size of the example input used for tracing
+        
+    Returns:
+        The written path
+    """
+    if hasattr(model, 'freeze'):
+        model.freeze()
+    model.eval()
+    
+    example = torch.randn(batch_size, input_dim)
+    
+    with torch.no_grad():
+        if fmt == 'torchscript':
+            traced = torch.jit.trace(model, example)
+            traced = torch.jit.freeze(traced)
+            traced.save(path)
+        elif fmt == 'onnx':
+            torch.onnx.export(
+                model, example, path,
+                input_names=['waveform'],
+                output_names=['log_probs'],
+                dynamic_axes={'waveform': {0: 'batch'}, 'log_probs': {0: 'batch'}},
+                opset_version=17
+            )
+        else:
+            raise ValueError(f"Unsupported export format: {fmt}")
+    
+    logger.info(f"Exported frozen SincNet model ({fmt}): {path}")
+    return path
+
+
 def create_config_from_cfg(cfg_data: Dict) -> Dict:
     """Convert configuration dictionary to model config"""
     config = {
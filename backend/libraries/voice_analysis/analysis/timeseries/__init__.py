@@ -9,10 +9,23 @@ from .change_detector import ChangeDetector
 from .risk_predictor import RiskPredictor
 from .early_warning import EarlyWarningSystem
 from .trend_analyzer import TrendAnalyzer
+from .batch_trend_analyzer import BatchTrendAnalyzer
+from .trend_state import SeniorTrendState
 from datetime import datetime
 from typing import Dict, List, Optional
 import logging
 
+__all__ = [
+    'BaselineManager',
+    'ChangeDetector',
+    'RiskPredictor',
+    'EarlyWarningSystem',
+    'TrendAnalyzer',
+    'BatchTrendAnalyzer',
+    'SeniorTrendState',
+    'TimeSeriesAnalysisSystem'
+]
+
 class TimeSeriesAnalysisSystem:
     """시계열 분석 통합 시스템"""
     def __init__(self):
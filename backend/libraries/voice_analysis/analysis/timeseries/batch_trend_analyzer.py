@@ -0,0 +1,319 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+from typing import Dict, List, Optional
+import logging
+import warnings
+
+from .utils.trend_statistics import (
+    group_layout,
+    mann_kendall_s_grouped,
+    mann_kendall_variance_grouped,
+    sens_slope_grouped
+)
+
+class BatchTrendAnalyzer:
+    """
+    다수 시니어 일괄 추세 분석기
+
+    (senior_id, timestamp, indicator, value) 롱 포맷 표를 받아 시니어-지표 시계열 전체의
+    Mann-Kendall 검정, Sen's slope, 변동성, CUSUM 변화점, 베이스라인 편차를
+    그룹 단위 벡터 연산으로 한 번에 계산합니다. 결과 필드는 TrendAnalyzer /
+    ChangeDetector의 시니어별 결과와 같은 이름을 평탄화해 사용합니다.
+    """
+
+    KEY_COLUMNS = ['senior_id', 'indicator']
+
+    def __init__(self, significance_level: float = 0.05, cusum_threshold: float = 5.0,
+                 volatility_window: int = 5):
+        """
+        Args:
+            significance_level: 통계적 유의성 판단 기준
+            cusum_threshold: CUSUM 변화점 임계값 (ChangeDetector 기본값과 동일)
+            volatility_window: 롤링 변동성 최대 윈도우 크기
+        """
+        self.significance_level = significance_level
+        self.cusum_threshold = cusum_threshold
+        self.volatility_window = volatility_window
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def to_long_table(data_by_senior: Dict[str, List[Dict]]) -> pd.DataFrame:
+        """
+        시니어별 분석 결과 목록을 롱 포맷 표로 변환
+
+        indicators(DRI, SDI, ...) 형식과 mentalHealthAnalysis(depression, cognitive) 형식을 지원합니다.
+        """
+        rows = []
+        for senior_id, records in data_by_senior.items():
+            for record in records:
+                timestamp = record['analysis_timestamp']
+                if 'indicators' in record:
+                    for indicator, value in record['indicators'].items():
+                        rows.append((senior_id, timestamp, indicator, value))
+                elif 'mentalHealthAnalysis' in record:
+                    for indicator in ('depression', 'cognitive'):
+                        score = record['mentalHealthAnalysis'].get(indicator, {}).get('score')
+                        rows.append((senior_id, timestamp, indicator, score))
+        return pd.DataFrame(rows, columns=['senior_id', 'timestamp', 'indicator', 'value'])
+
+    def analyze(self, table: pd.DataFrame, baseline: Optional[pd.DataFrame] = None,
+                baseline_points: Optional[int] = None, min_points: int = 5) -> pd.DataFrame:
+        """
+        일괄 추세 분석
+
+        Args:
+            table: senior_id, timestamp, indicator, value 열을 가진 롱 포맷 표
+            baseline: senior_id, indicator, mean, std 열을 가진 베이스라인 표 (선택)
+            baseline_points: baseline이 없을 때 시계열 앞쪽 몇 개로 베이스라인을 잡을지
+                             (None이면 전체, BaselineManager와 동일)
+            min_points: 분석에 필요한 최소 데이터 수 (미만인 시계열은 제외)
+
+        Returns:
+            (senior_id, indicator)별 한 행의 결과 표
+        """
+        data = table[['senior_id', 'timestamp', 'indicator', 'value']].copy()
+        data['timestamp'] = pd.to_datetime(data['timestamp'], utc=True, format='ISO8601')
+        data['value'] = pd.to_numeric(data['value'], errors='coerce')
+        data = data.dropna(subset=['value'])
+        data = data.sort_values(['senior_id', 'indicator', 'timestamp'], kind='stable')
+
+        sizes = data.groupby(self.KEY_COLUMNS, sort=False)['value'].transform('size')
+        data = data[sizes >= min_points]
+        if data.empty:
+            return pd.DataFrame(columns=self.KEY_COLUMNS)
+
+        groups = data.groupby(self.KEY_COLUMNS, sort=False).ngroup().to_numpy(np.int64)
+        values = data['value'].to_numpy(np.float64)
+        timestamps = data['timestamp']
+        starts, lengths, positions = group_layout(groups)
+        ends = starts + lengths - 1
+
+        result = data.iloc[starts][self.KEY_COLUMNS].reset_index(drop=True)
+        result['data_points'] = lengths
+        first = timestamps.iloc[starts].reset_index(drop=True)
+        last = timestamps.iloc[ends].reset_index(drop=True)
+        result['time_span_days'] = (last - first).dt.days.to_numpy()
+
+        self._mann_kendall(values, groups, lengths, result)
+        self._sens_slope(values, groups, result)
+        self._linear_trend(values, groups, lengths, timestamps, first, result)
+        self._volatility(values, groups, starts, lengths, result)
+        self._cusum(values, groups, starts, lengths, timestamps, result)
+        self._baseline_deviation(values, groups, positions, lengths, baseline, baseline_points, result)
+
+        result['trend_strength'] = self._trend_strength(result)
+        result['confidence_level'] = self._confidence(result)
+
+        self.logger.info(f"일괄 추세 분석 완료: {result['senior_id'].nunique()}명, {len(result)}개 시계열")
+        return result
+
+    def _mann_kendall(self, values: np.ndarray, groups: np.ndarray, lengths: np.ndarray,
+                      result: pd.DataFrame):
+        """그룹별 Mann-Kendall 추세 검정 (TrendAnalyzer._mann_kendall_test와 동일 규칙)"""
+        s = mann_kendall_s_grouped(values, groups).astype(np.float64)
+        var_s = mann_kendall_variance_grouped(values, groups)
+        sd = np.sqrt(np.where(var_s > 0, var_s, 1.0))
+
+        z = np.where(s > 0, (s - 1) / sd, np.where(s < 0, (s + 1) / sd, 0.0))
+        z = np.where(var_s > 0, z, 0.0)
+        p_value = 2 * (1 - stats.norm.cdf(np.abs(z)))
+        significant = p_value < self.significance_level
+
+        result['mann_kendall_statistic'] = s.astype(np.int64)
+        result['mann_kendall_z_score'] = z
+        result['mann_kendall_p_value'] = p_value
+        result['mann_kendall_trend'] = np.where(
+            significant, np.where(s > 0, 'increasing', 'decreasing'), 'no_trend'
+        )
+        result['mann_kendall_significant'] = significant
+        result['mann_kendall_tau'] = s / (lengths * (lengths - 1) / 2)
+
+    def _sens_slope(self, values: np.ndarray, groups: np.ndarray, result: pd.DataFrame):
+        """그룹별 Sen's slope와 95% 신뢰구간"""
+        slopes = sens_slope_grouped(values, groups)
+        result['sens_slope'] = slopes[:, 0]
+        result['sens_slope_ci_lower'] = slopes[:, 1]
+        result['sens_slope_ci_upper'] = slopes[:, 2]
+        result['sens_slope_interpretation'] = self._interpret_slope(slopes[:, 0])
+
+    def _linear_trend(self, values: np.ndarray, groups: np.ndarray, lengths: np.ndarray,
+                      timestamps: pd.Series, first: pd.Series, result: pd.DataFrame):
+        """경과 일수 대비 선형 회귀 추세 (ChangeDetector._analyze_trend와 동일 규칙)"""
+        days = (timestamps.reset_index(drop=True) - first.iloc[groups].reset_index(drop=True))
+        days = days.dt.days.to_numpy(np.float64)
+        n = lengths.astype(np.float64)
+
+        mean_x = np.bincount(groups, weights=days) / n
+        mean_y = np.bincount(groups, weights=values) / n
+        dx = days - mean_x[groups]
+        dy = values - mean_y[groups]
+        sxx = np.bincount(groups, weights=dx * dx)
+        syy = np.bincount(groups, weights=dy * dy)
+        sxy = np.bincount(groups, weights=dx * dy)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = np.where(sxx > 0, sxy / sxx, np.nan)
+            r = np.clip(np.where((sxx > 0) & (syy > 0), sxy / np.sqrt(sxx * syy), 0.0), -1.0, 1.0)
+            dof = n - 2
+            t_stat = r * np.sqrt(dof / ((1.0 - r) * (1.0 + r)))
+        p_value = np.where(np.abs(r) >= 1.0, 0.0, 2 * stats.t.sf(np.abs(t_stat), dof))
+        p_value = np.where(sxx > 0, p_value, np.nan)
+        significant = p_value < self.significance_level
+
+        result['linear_trend'] = np.where(
+            significant, np.where(slope > 0, 'increasing', 'decreasing'), 'stable'
+        )
+        result['linear_slope'] = slope
+        result['linear_r_squared'] = r ** 2
+        result['linear_p_value'] = p_value
+        result['linear_rate_of_change'] = np.abs(slope) * 30
+
+    def _volatility(self, values: np.ndarray, groups: np.ndarray, starts: np.ndarray,
+                    lengths: np.ndarray, result: pd.DataFrame):
+        """변동성과 첫/마지막 롤링 윈도우 표준편차 비교 (TrendAnalyzer._analyze_volatility와 동일 규칙)"""
+        n = lengths.astype(np.float64)
+        mean = np.bincount(groups, weights=values) / n
+        volatility = np.sqrt(np.bincount(groups, weights=(values - mean[groups]) ** 2) / n)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cv = np.where(mean != 0, volatility / mean, 0.0)
+
+        # 윈도우 크기 min(window, n // 2): 첫 윈도우와 마지막 윈도우만 비교에 쓰인다
+        window = np.minimum(self.volatility_window, lengths // 2)
+        offsets = np.arange(self.volatility_window)
+        mask = offsets[None, :] < window[:, None]
+        head = np.where(mask, values[np.minimum(starts[:, None] + offsets, len(values) - 1)], np.nan)
+        tail_index = starts[:, None] + lengths[:, None] - window[:, None] + offsets
+        tail = np.where(mask, values[np.clip(tail_index, 0, len(values) - 1)], np.nan)
+        with warnings.catch_warnings():
+            # 윈도우가 0인 행(전부 NaN)의 자유도 경고 무시
+            warnings.simplefilter('ignore', RuntimeWarning)
+            head_std = np.nanstd(head, axis=1)
+            tail_std = np.nanstd(tail, axis=1)
+
+        volatility_trend = np.where(
+            window < 2, 'insufficient_data',
+            np.where((lengths - window + 1 > 1) & (tail_std > head_std), 'increasing', 'stable')
+        )
+        stability = np.select(
+            [lengths < 3, cv < 0.1, cv < 0.2, cv < 0.3],
+            ['insufficient_data', 'very_stable', 'stable', 'moderately_stable'], 'unstable'
+        )
+        volatility = np.where(lengths < 3, 0.0, volatility)
+
+        result['volatility'] = volatility
+        result['coefficient_of_variation'] = cv
+        result['volatility_trend'] = volatility_trend
+        result['stability'] = stability
+
+    def _cusum(self, values: np.ndarray, groups: np.ndarray, starts: np.ndarray,
+               lengths: np.ndarray, timestamps: pd.Series, result: pd.DataFrame):
+        """
+        CUSUM 변화점 감지 (ChangeDetector._cusum_change_detection과 동일 규칙)
+
+        누적합은 시점마다 이전 상태에 의존하므로 시간 축은 순차로, 시계열 축은 벡터로 진행한다.
+        """
+        n_groups = len(lengths)
+        mean = np.bincount(groups, weights=values) / lengths
+        cusum_pos = np.zeros(n_groups)
+        cusum_neg = np.zeros(n_groups)
+        detected = np.zeros(len(values), dtype=bool)
+
+        for step in range(int(lengths.max())):
+            active = np.flatnonzero(lengths > step)
+            index = starts[active] + step
+            deviation = values[index] - mean[active]
+            pos = np.maximum(0, cusum_pos[active] + deviation)
+            neg = np.minimum(0, cusum_neg[active] + deviation)
+            hit = (np.abs(pos) > self.cusum_threshold) | (np.abs(neg) > self.cusum_threshold)
+            detected[index[hit]] = True
+            cusum_pos[active] = np.where(hit, 0, pos)
+            cusum_neg[active] = np.where(hit, 0, neg)
+
+        # 3개 미만 시계열은 변화점을 찾지 않음
+        detected &= (lengths >= 3)[groups]
+        hit_index = np.flatnonzero(detected)
+        hit_groups = groups[hit_index]
+        positions = hit_index - starts[hit_groups]
+        iso_timestamps = timestamps.iloc[hit_index].map(lambda ts: ts.isoformat()).to_numpy()
+
+        change_points = [[] for _ in range(n_groups)]
+        change_timestamps = [[] for _ in range(n_groups)]
+        for group, position, timestamp in zip(hit_groups.tolist(), positions.tolist(), iso_timestamps):
+            change_points[group].append(position)
+            change_timestamps[group].append(timestamp)
+
+        result['change_points'] = change_points
+        result['change_point_timestamps'] = change_timestamps
+        result['change_point_count'] = np.bincount(hit_groups, minlength=n_groups)
+
+    def _baseline_deviation(self, values: np.ndarray, groups: np.ndarray, positions: np.ndarray,
+                            lengths: np.ndarray, baseline: Optional[pd.DataFrame],
+                            baseline_points: Optional[int], result: pd.DataFrame):
+        """
+        베이스라인 대비 편차 (TrendAnalyzer._compare_with_baseline, ChangeDetector._compare_with_baseline 규칙)
+        """
+        n = lengths.astype(np.float64)
+        current_mean = np.bincount(groups, weights=values) / n
+
+        if baseline is not None:
+            merged = result[self.KEY_COLUMNS].merge(
+                baseline[self.KEY_COLUMNS + ['mean', 'std']], on=self.KEY_COLUMNS, how='left'
+            )
+            baseline_mean = merged['mean'].to_numpy(np.float64)
+            baseline_std = merged['std'].to_numpy(np.float64)
+        else:
+            in_baseline = positions < baseline_points if baseline_points else np.ones(len(values), bool)
+            count = np.bincount(groups, weights=in_baseline, minlength=len(lengths))
+            baseline_mean = np.bincount(groups, weights=values * in_baseline) / count
+            squared = (values - baseline_mean[groups]) ** 2 * in_baseline
+            baseline_std = np.sqrt(np.bincount(groups, weights=squared) / count)
+
+        difference = current_mean - baseline_mean
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_score = np.where(baseline_std > 0, difference / baseline_std, 0.0)
+            sample_std = np.sqrt(np.bincount(groups, weights=(values - current_mean[groups]) ** 2) / (n - 1))
+            t_stat = difference / (sample_std / np.sqrt(n))
+        p_value = 2 * stats.t.sf(np.abs(t_stat), n - 1)
+
+        magnitude = np.abs(z_score)
+        result['baseline_mean'] = baseline_mean
+        result['baseline_std'] = baseline_std
+        result['current_mean'] = current_mean
+        result['difference'] = difference
+        result['z_score'] = z_score
+        result['deviation_level'] = np.select(
+            [magnitude < 1, magnitude < 2, magnitude < 3], ['normal', 'mild', 'moderate'], 'severe'
+        )
+        result['direction'] = np.where(current_mean > baseline_mean, 'above', 'below')
+        result['t_statistic'] = t_stat
+        result['baseline_p_value'] = p_value
+        result['significant_change'] = p_value < self.significance_level
+
+    def _trend_strength(self, result: pd.DataFrame) -> np.ndarray:
+        """추세 강도 (TrendAnalyzer._calculate_trend_strength와 동일 규칙)"""
+        tau = result['mann_kendall_tau'].abs().to_numpy()
+        slope = result['sens_slope'].abs().to_numpy()
+        return np.where(
+            ~result['mann_kendall_significant'].to_numpy(), 'no_trend',
+            np.select([(tau > 0.5) & (slope > 0.1), (tau > 0.3) & (slope > 0.05)],
+                      ['strong', 'moderate'], 'weak')
+        )
+
+    def _confidence(self, result: pd.DataFrame) -> np.ndarray:
+        """분석 신뢰도 (TrendAnalyzer._calculate_confidence와 동일 규칙)"""
+        n = result['data_points'].to_numpy()
+        p_value = result['mann_kendall_p_value'].to_numpy()
+        return np.select(
+            [n < 5, n < 10, n < 20, p_value < 0.01, p_value < 0.05],
+            ['very_low', 'low', 'medium', 'very_high', 'high'], 'medium'
+        )
+
+    def _interpret_slope(self, slope: np.ndarray) -> np.ndarray:
+        """기울기 해석 (TrendAnalyzer._interpret_slope와 동일 규칙)"""
+        return np.select(
+            [np.abs(slope) < 0.01, slope > 0.1, slope > 0.05, slope > 0, slope < -0.1, slope < -0.05],
+            ['negligible_change', 'strong_increase', 'moderate_increase', 'mild_increase',
+             'strong_decrease', 'moderate_decrease'],
+            'mild_decrease'
+        )
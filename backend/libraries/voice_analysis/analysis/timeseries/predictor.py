@@ -5,8 +5,7 @@
 
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
@@ -16,10 +15,11 @@ logger = logging.getLogger(__name__)
 class MentalHealthPredictor:
     """정신건강 지표 예측기"""
     
-    def __init__(self):
-        self.models = {}
-        self.scalers = {}
+    def __init__(self, window_size: int = 3):
+        self.window_size = window_size
         self.min_training_points = 5
+        # 최대 특이값 대비 이 비율 이하 특이값은 0으로 간주 (수치 오차로 생긴 거대 계수 방지)
+        self.rank_tolerance = 1e-10
         
     def predict(
         self,
@@ -50,16 +50,9 @@ class MentalHealthPredictor:
         
         # 예측할 지표 선택
         indicators = [indicator] if indicator else ['DRI', 'SDI', 'CFL', 'ES', 'OV']
+        indicators = [ind for ind in indicators if ind in df.columns]
         
-        predictions = {}
-        for ind in indicators:
-            if ind in df.columns:
-                pred_result = self._predict_indicator(
-                    df[ind],
-                    prediction_horizon,
-                    ind
-                )
-                predictions[ind] = pred_result
+        predictions = self._predict_indicators(df, indicators, prediction_horizon)
         
         # 종합 위험도 예측
         risk_prediction = self._predict_risk_trajectory(predictions)
@@ -76,125 +69,207 @@ class MentalHealthPredictor:
     def _prepare_data(self, historical_data: List[Dict]) -> pd.DataFrame:
         """데이터 준비"""
         
-        data = []
-        for record in historical_data:
-            row = {
-                'timestamp': pd.to_datetime(record['timestamp'])
-            }
-            if 'indicators' in record:
-                row.update(record['indicators'])
-            data.append(row)
-        
-        df = pd.DataFrame(data)
-        df.set_index('timestamp', inplace=True)
-        df.sort_index(inplace=True)
+        # 타임스탬프는 한 번에 변환하고 지표는 레코드 목록에서 바로 열 단위 프레임 구성
+        df = pd.DataFrame.from_records(
+            [record.get('indicators') or {} for record in historical_data],
+            index=pd.DatetimeIndex(
+                pd.to_datetime([record['timestamp'] for record in historical_data]),
+                name='timestamp'
+            )
+        )
+        df.sort_index(inplace=True, kind='stable')
         
         # 결측값 처리
-        df.fillna(method='ffill', inplace=True)
-        df.fillna(0.5, inplace=True)
+        df = df.ffill()
+        df = df.fillna(0.5)
         
         return df
     
-    def _predict_indicator(
+    def _predict_indicators(
         self,
-        series: pd.Series,
-        horizon: int,
-        indicator_name: str
-    ) -> Dict[str, Any]:
-        """개별 지표 예측"""
+        df: pd.DataFrame,
+        indicators: List[str],
+        horizon: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """지표 전체 예측 (지표별 회귀를 한 번의 다중 출력 풀이로 학습)"""
         
-        # 특징 생성
-        X, y = self._create_features(series)
+        if not indicators:
+            return {}
         
-        if len(X) < 3:
+        # (지표 수, 시점 수) 배열
+        values = df[indicators].to_numpy(dtype=np.float64).T
+        
+        if values.shape[1] - self.window_size < 3:
             return {
-                'status': 'insufficient_data',
-                'current_value': float(series.iloc[-1])
+                ind: {
+                    'status': 'insufficient_data',
+                    'current_value': float(values[k, -1])
+                }
+                for k, ind in enumerate(indicators)
             }
         
-        # 모델 학습
-        model = LinearRegression()
-        scaler = StandardScaler()
-        
-        X_scaled = scaler.fit_transform(X)
-        model.fit(X_scaled, y)
+        fit = self._fit(values)
         
-        # 예측
-        predictions = []
-        last_values = series.iloc[-3:].values
+        # 예측: 최근 윈도우에서 다음 값을 지표 전체에 대해 동시에 예측
+        forecast = np.empty((len(indicators), horizon))
+        last_values = values[:, -self.window_size:].copy()
         
         for i in range(horizon):
-            # 다음 값 예측을 위한 특징
-            next_features = self._extract_features(last_values)
-            next_features_scaled = scaler.transform([next_features])
-            
-            # 예측
-            next_value = model.predict(next_features_scaled)[0]
+            next_features = self._window_features(last_values)[:, 0, :]
+            next_value = self._apply_fit(fit, next_features)
             
             # 범위 제한 (0-1)
             next_value = np.clip(next_value, 0, 1)
-            
-            predictions.append(float(next_value))
+            forecast[:, i] = next_value
             
             # 슬라이딩 윈도우 업데이트
-            last_values = np.append(last_values[1:], next_value)
+            last_values = np.concatenate([last_values[:, 1:], next_value[:, None]], axis=1)
         
-        # 신뢰 구간 계산
-        confidence_interval = self._calculate_confidence_interval(
-            series, predictions
-        )
+        predictions = {}
+        for k, ind in enumerate(indicators):
+            series = df[ind]
+            indicator_predictions = forecast[k].tolist()
+            predictions[ind] = {
+                'status': 'success',
+                'current_value': float(values[k, -1]),
+                'predictions': indicator_predictions,
+                'confidence_interval': self._calculate_confidence_interval(
+                    series, indicator_predictions
+                ),
+                'trend': self._analyze_prediction_trend(indicator_predictions),
+                'model_score': float(fit['score'][k])
+            }
         
-        # 추세 분석
-        trend = self._analyze_prediction_trend(predictions)
+        return predictions
+    
+    def _predict_indicator(
+        self,
+        series: pd.Series,
+        horizon: int,
+        indicator_name: str
+    ) -> Dict[str, Any]:
+        """개별 지표 예측"""
+        
+        df = series.to_frame(indicator_name)
+        return self._predict_indicators(df, [indicator_name], horizon)[indicator_name]
+    
+    def _fit(self, values: np.ndarray) -> Dict[str, Any]:
+        """
+        지표별 선형 회귀 (StandardScaler + LinearRegression과 같은 결과)
+        
+        Args:
+            values: (지표 수, 시점 수) 배열
+        """
+        
+        X, y = self._create_window_matrix(values)
+        
+        # 표준화 (분산 0인 특징은 StandardScaler처럼 척도 1)
+        mean = X.mean(axis=1, keepdims=True)
+        scale = X.std(axis=1, keepdims=True)
+        scale[scale == 0] = 1.0
+        X_scaled = (X - mean) / scale
+        
+        # 절편 포함 최소제곱: 중심화 후 지표 전체를 배치 의사역행렬로 한 번에 풀이
+        # (윈도우 3에서는 기울기 = 변화량 / 2로 특징이 선형 종속이므로 상대 특이값 기준으로 절단)
+        X_centered = X_scaled - X_scaled.mean(axis=1, keepdims=True)
+        y_mean = y.mean(axis=1)
+        coef = np.matmul(
+            np.linalg.pinv(X_centered, rcond=self.rank_tolerance),
+            (y - y_mean[:, None])[..., None]
+        )[..., 0]
+        intercept = y_mean - np.einsum('kp,kp->k', X_scaled.mean(axis=1), coef)
+        
+        # 학습 데이터 결정계수 (LinearRegression.score와 같은 정의)
+        fitted = np.einsum('kmp,kp->km', X_scaled, coef) + intercept[:, None]
+        ss_res = ((y - fitted) ** 2).sum(axis=1)
+        ss_tot = ((y - y_mean[:, None]) ** 2).sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            score = np.where(ss_tot > 0, 1 - ss_res / ss_tot, np.where(ss_res == 0, 1.0, 0.0))
         
         return {
-            'status': 'success',
-            'current_value': float(series.iloc[-1]),
-            'predictions': predictions,
-            'confidence_interval': confidence_interval,
-            'trend': trend,
-            'model_score': float(model.score(X_scaled, y))
+            'mean': mean[:, 0, :],
+            'scale': scale[:, 0, :],
+            'coef': coef,
+            'intercept': intercept,
+            'score': score
         }
     
+    @staticmethod
+    def _apply_fit(fit: Dict[str, Any], features: np.ndarray) -> np.ndarray:
+        """(지표 수, 특징 수) 특징으로 지표별 다음 값 계산"""
+        
+        scaled = (features - fit['mean']) / fit['scale']
+        return np.einsum('kp,kp->k', scaled, fit['coef']) + fit['intercept']
+    
     def _create_features(self, series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
         """특징 생성"""
         
-        features = []
-        targets = []
+        X, y = self._create_window_matrix(series.to_numpy(dtype=np.float64)[None, :])
+        return X[0], y[0]
+    
+    def _create_window_matrix(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        슬라이딩 윈도우 특징과 다음 값 타깃
+        
+        Args:
+            values: (지표 수, 시점 수) 배열
+            
+        Returns:
+            (지표 수, 윈도우 수, 특징 수) 특징, (지표 수, 윈도우 수) 타깃
+        """
         
-        # 슬라이딩 윈도우 (3일)
-        window_size = 3
+        features = self._window_features(values[:, :-1])
+        targets = values[:, self.window_size:]
+        return features, targets
+    
+    def _window_features(self, values: np.ndarray, window_size: Optional[int] = None) -> np.ndarray:
+        """
+        모든 윈도우의 특징을 한 번에 계산 (평균, 표준편차, 마지막 값, 변화량, 최대, 최소, 기울기)
         
-        for i in range(window_size, len(series)):
-            window = series.iloc[i-window_size:i].values
-            feature_vector = self._extract_features(window)
+        Args:
+            values: (지표 수, 시점 수) 배열
+            window_size: 윈도우 크기 (기본값: self.window_size)
             
-            features.append(feature_vector)
-            targets.append(series.iloc[i])
+        Returns:
+            (지표 수, 윈도우 수, 7) 배열
+        """
         
-        return np.array(features), np.array(targets)
+        w = window_size or self.window_size
+        windows = sliding_window_view(values, w, axis=1)
+        
+        # 누적합 기반 이동 합계: Σy, Σ t·y (상쇄 오차를 줄이기 위해 지표별 평균으로 중심화)
+        offset = values.mean(axis=1, keepdims=True)
+        centered = values - offset
+        t = np.arange(values.shape[1], dtype=np.float64)
+        zero = np.zeros((values.shape[0], 1))
+        cum_y = np.concatenate([zero, np.cumsum(centered, axis=1)], axis=1)
+        cum_ty = np.concatenate([zero, np.cumsum(centered * t, axis=1)], axis=1)
+        sum_y = cum_y[:, w:] - cum_y[:, :-w]
+        sum_ty = cum_ty[:, w:] - cum_ty[:, :-w]
+        
+        # 윈도우 내 위치 j = t - start 기준 Σ j·y, 닫힌 형태의 최소제곱 기울기
+        start = t[:values.shape[1] - w + 1]
+        sum_jy = sum_ty - start * sum_y
+        if w > 1:
+            slope = (sum_jy - (w - 1) / 2 * sum_y) / (w * (w * w - 1) / 12)
+        else:
+            slope = np.zeros_like(sum_y)
+        
+        return np.stack([
+            sum_y / w + offset,                   # 평균
+            windows.std(axis=-1),                 # 표준편차
+            windows[..., -1],                     # 마지막 값
+            windows[..., -1] - windows[..., 0],   # 변화량
+            windows.max(axis=-1),                 # 최대값
+            windows.min(axis=-1),                 # 최소값
+            slope                                 # 추세 (선형 회귀 기울기)
+        ], axis=-1)
     
     def _extract_features(self, window: np.ndarray) -> np.ndarray:
         """윈도우에서 특징 추출"""
         
-        features = [
-            np.mean(window),           # 평균
-            np.std(window),            # 표준편차
-            window[-1],                # 마지막 값
-            window[-1] - window[0],    # 변화량
-            np.max(window),            # 최대값
-            np.min(window)             # 최소값
-        ]
-        
-        # 추세 (선형 회귀 기울기)
-        if len(window) > 1:
-            x = np.arange(len(window))
-            slope = np.polyfit(x, window, 1)[0]
-            features.append(slope)
-        else:
-            features.append(0)
-        
-        return np.array(features)
+        window = np.asarray(window, dtype=np.float64)
+        return self._window_features(window[None, :], len(window))[0, 0]
     
     def _calculate_confidence_interval(
         self,
@@ -11,6 +11,13 @@ import warnings
 from statsmodels.tsa.seasonal import seasonal_decompose
 from statsmodels.nonparametric.smoothers_lowess import lowess
 
+from .utils.trend_statistics import (
+    mann_kendall_result,
+    mann_kendall_s,
+    mann_kendall_variance,
+    sens_slope as estimate_sens_slope
+)
+
 class TrendAnalyzer:
     """
     고급 시계열 추세 분석기
@@ -48,36 +55,65 @@ class TrendAnalyzer:
         timestamps = [datetime.fromisoformat(d['analysis_timestamp'].replace('Z', '+00:00')) 
                      for d in sorted_data]
         
-        results = {
-            'analysis_date': datetime.now().isoformat(),
-            'data_points': len(sorted_data),
-            'time_span_days': (timestamps[-1] - timestamps[0]).days,
-            'trends': {}
-        }
-        
-        # 각 지표별 추세 분석
+        # 각 지표별 시계열 추출
         # 데이터 구조에 따라 유연하게 처리
         if sorted_data and 'indicators' in sorted_data[0]:
             # 새로운 형식 (indicators.DRI, SDI, etc.)
             metrics = ['DRI', 'SDI', 'CFL', 'ES', 'OV']
-            for metric in metrics:
-                values = [d['indicators'].get(metric, 0) for d in sorted_data]
-                results['trends'][metric] = self._analyze_metric_trend(
-                    timestamps, values, metric, baseline
-                )
+            series = {
+                metric: [d['indicators'].get(metric, 0) for d in sorted_data]
+                for metric in metrics
+            }
         elif sorted_data and 'mentalHealthAnalysis' in sorted_data[0]:
             # 기존 형식
             metrics = ['depression', 'cognitive']
-            for metric in metrics:
-                values = [d['mentalHealthAnalysis'][metric]['score'] for d in sorted_data]
-                results['trends'][metric] = self._analyze_metric_trend(
-                    timestamps, values, metric, baseline
-                )
+            series = {
+                metric: [d['mentalHealthAnalysis'][metric]['score'] for d in sorted_data]
+                for metric in metrics
+            }
         else:
             # 기본 처리
             return self._insufficient_data_response()
+        
+        return self.analyze_series(timestamps, series, baseline=baseline, records=sorted_data)
+    
+    def analyze_series(self, timestamps: List[datetime], series: Dict[str, List[float]],
+                       baseline: Optional[Dict] = None, records: Optional[List[Dict]] = None,
+                       mann_kendall: Optional[Dict[str, Dict]] = None) -> Dict:
+        """
+        지표별로 정리된 시계열의 추세 분석 (analyze_trends와 같은 결과 형식)
+        
+        Args:
+            timestamps: 시간순 타임스탬프
+            series: 지표별 값 목록 (timestamps와 같은 길이)
+            baseline: 베이스라인 정보 (선택사항)
+            records: 제거된 패턴 분석용 원본 기록 (없으면 빈 기록으로 간주)
+            mann_kendall: 지표별로 미리 계산한 Mann-Kendall 결과 (증분 상태의 누적 S 등)
+            
+        Returns:
+            종합적인 추세 분석 결과 (5개 미만이면 데이터 부족 응답)
+        """
+        if len(timestamps) < 5:
+            return self._insufficient_data_response()
+        
+        results = {
+            'analysis_date': datetime.now().isoformat(),
+            'data_points': len(timestamps),
+            'time_span_days': (timestamps[-1] - timestamps[0]).days,
+            'trends': {}
+        }
+        
+        # 각 지표별 추세 분석
+        for metric, values in series.items():
+            results['trends'][metric] = self._analyze_metric_trend(
+                timestamps, values, metric, baseline,
+                mk_result=(mann_kendall or {}).get(metric)
+            )
+        
         # 제거된 추세 분석
-        removed_trends = self._analyze_removed_trends(sorted_data, timestamps)
+        if records is None:
+            records = [{} for _ in timestamps]
+        removed_trends = self._analyze_removed_trends(records, timestamps)
         results['trends']['removed_patterns'] = removed_trends
         
         # 전체적인 추세 요약
@@ -86,11 +122,13 @@ class TrendAnalyzer:
         return results
     
     def _analyze_metric_trend(self, timestamps: List[datetime], values: List[float], 
-                             metric: str, baseline: Optional[Dict]) -> Dict:
+                             metric: str, baseline: Optional[Dict],
+                             mk_result: Optional[Dict] = None) -> Dict:
         """개별 지표의 추세 분석"""
         
-        # 1. Mann-Kendall 추세 검정
-        mk_result = self._mann_kendall_test(values)
+        # 1. Mann-Kendall 추세 검정 (미리 계산된 결과가 없을 때만)
+        if mk_result is None:
+            mk_result = self._mann_kendall_test(values)
         
         # 2. Sen's slope 추정
         sens_slope = self._calculate_sens_slope(values)
@@ -126,76 +164,29 @@ class TrendAnalyzer:
         """Mann-Kendall 추세 검정 수행"""
         n = len(values)
         
-        # Kendall's S 통계량 계산
-        s = 0
-        for i in range(n-1):
-            for j in range(i+1, n):
-                s += np.sign(values[j] - values[i])
+        # Kendall's S 통계량 계산 (병합 단계별 순위 계수, O(n log n))
+        s = mann_kendall_s(values)
         
         # 분산 계산 (타이 값 보정 포함)
-        unique_values, counts = np.unique(values, return_counts=True)
-        tie_correction = sum(c * (c - 1) * (2 * c + 5) for c in counts if c > 1)
-        var_s = (n * (n - 1) * (2 * n + 5) - tie_correction) / 18
-        
-        # Z 점수 계산
-        if s > 0:
-            z = (s - 1) / np.sqrt(var_s) if var_s > 0 else 0
-        elif s < 0:
-            z = (s + 1) / np.sqrt(var_s) if var_s > 0 else 0
-        else:
-            z = 0
+        var_s = mann_kendall_variance(values)
         
-        # p-value 계산
-        p_value = 2 * (1 - stats.norm.cdf(abs(z)))
-        
-        # 추세 방향 결정
-        if p_value < self.significance_level:
-            trend = 'increasing' if s > 0 else 'decreasing'
-        else:
-            trend = 'no_trend'
-        
-        return {
-            'statistic': s,
-            'z_score': z,
-            'p_value': p_value,
-            'trend': trend,
-            'significant': p_value < self.significance_level,
-            'tau': s / (n * (n - 1) / 2)  # Kendall's tau 계산
-        }
+        # Z 점수, p-value, 추세 방향
+        return mann_kendall_result(s, var_s, n, self.significance_level)
     
     def _calculate_sens_slope(self, values: List[float]) -> Dict:
         """Sen's slope 추정 (비모수적 기울기)"""
-        n = len(values)
-        slopes = []
-        
-        for i in range(n-1):
-            for j in range(i+1, n):
-                if j != i:
-                    slope = (values[j] - values[i]) / (j - i)
-                    slopes.append(slope)
-        
-        if not slopes:
+        # 모든 쌍 기울기의 중앙값과 95% 신뢰구간 순위 통계량만 선택
+        result = estimate_sens_slope(values)
+        if result is None:
             return {'slope': 0, 'confidence_interval': (0, 0)}
         
-        # 중앙값이 Sen's slope
-        sens_slope = np.median(slopes)
-        
-        # 95% 신뢰구간 계산
-        slopes_sorted = np.sort(slopes)
-        n_slopes = len(slopes_sorted)
-        alpha = 1 - 0.95
-        rank_lower = int(np.floor((n_slopes - 1.96 * np.sqrt(n_slopes)) / 2))
-        rank_upper = int(np.ceil((n_slopes + 1.96 * np.sqrt(n_slopes)) / 2))
-        
-        rank_lower = max(0, rank_lower)
-        rank_upper = min(n_slopes - 1, rank_upper)
-        
-        confidence_interval = (slopes_sorted[rank_lower], slopes_sorted[rank_upper])
+        slope, ci_lower, ci_upper = result
+        confidence_interval = (ci_lower, ci_upper)
         
         return {
-            'slope': sens_slope,
+            'slope': slope,
             'confidence_interval': confidence_interval,
-            'interpretation': self._interpret_slope(sens_slope)
+            'interpretation': self._interpret_slope(slope)
         }
     
     def _linear_trend_analysis(self, timestamps: List[datetime], values: List[float]) -> Dict:
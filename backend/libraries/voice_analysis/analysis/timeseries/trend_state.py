@@ -0,0 +1,387 @@
+"""
+시니어별 증분 추세 상태
+분석마다 과거 기록을 다시 조회해 베이스라인/CUSUM/추세를 처음부터 계산하지 않도록,
+Welford 평균/분산, EMA 베이스라인, CUSUM 누적합, 최근 윈도우의 Mann-Kendall S를
+상태로 보관하고 새 분석 1건마다 윈도우 크기에만 비례하는 시간으로 갱신한다.
+최근 윈도우는 과거 기록 조회 범위(최근 30일)와 같게 유지하므로 snapshot()은
+TrendAnalyzer.analyze_trends와 같은 결과 형식과 최소 데이터 수(5개) 기준을 따른다.
+상태는 dict로 직렬화해 저장하며, 보정이 필요하면 과거 기록으로 다시 만든다.
+"""
+
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .trend_analyzer import TrendAnalyzer
+from .utils.trend_statistics import mann_kendall_result, mann_kendall_s, mann_kendall_variance
+
+logger = logging.getLogger(__name__)
+
+# 저장 형식이 바뀌면 올려서 기존 상태를 과거 기록으로 재구성
+TREND_STATE_VERSION = 2
+
+INDICATORS = ('DRI', 'SDI', 'CFL', 'ES', 'OV')
+
+
+def _sign_sum(value: float, others: Iterable[float]) -> int:
+    """Σ sign(value - other)"""
+    others = np.asarray(list(others), dtype=np.float64)
+    return int(np.count_nonzero(value > others)) - int(np.count_nonzero(value < others))
+
+
+def _parse_time(timestamp: str) -> datetime:
+    """ISO 타임스탬프 -> datetime (시간대가 있으면 UTC 기준으로 변환 후 제거)"""
+    parsed = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _expired(times: List[str], cutoff: Optional[datetime], window_size: int) -> bool:
+    """윈도우의 가장 오래된 항목을 제거해야 하는지 (개수 상한 초과 또는 기간 밖)"""
+    if not times:
+        return False
+    return len(times) > window_size or (cutoff is not None and _parse_time(times[0]) < cutoff)
+
+
+@dataclass
+class IndicatorState:
+    """지표 하나의 누적 통계"""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    ema: Optional[float] = None
+    ema_first: Optional[float] = None
+    cusum_pos: float = 0.0
+    cusum_neg: float = 0.0
+    change_count: int = 0
+    last_change: Optional[str] = None
+    window: List[float] = field(default_factory=list)
+    window_times: List[str] = field(default_factory=list)
+    window_s: int = 0
+
+    @property
+    def variance(self) -> float:
+        """모분산 (BaselineManager의 np.std와 같은 기준)"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.variance))
+
+    def update(self, value: float, timestamp: str, ema_alpha: float,
+               cusum_threshold: float) -> bool:
+        """
+        값 하나 반영 (윈도우 정리는 trim에서 수행)
+
+        Returns:
+            CUSUM 변화점 감지 여부
+        """
+        # CUSUM: 갱신 전 누적 평균을 기준으로 편차 누적, 임계값 초과 시 변화점 기록 후 초기화
+        reference = self.mean if self.count else value
+        deviation = value - reference
+        self.cusum_pos = max(0.0, self.cusum_pos + deviation)
+        self.cusum_neg = min(0.0, self.cusum_neg + deviation)
+        changed = abs(self.cusum_pos) > cusum_threshold or abs(self.cusum_neg) > cusum_threshold
+        if changed:
+            self.change_count += 1
+            self.last_change = timestamp
+            self.cusum_pos = 0.0
+            self.cusum_neg = 0.0
+
+        # Welford 평균/분산
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+        # EMA 베이스라인 (BaselineManager.update_baseline과 같은 갱신식)
+        if self.ema is None:
+            self.ema = value
+            self.ema_first = value
+        else:
+            self.ema = ema_alpha * value + (1 - ema_alpha) * self.ema
+
+        # 최근 윈도우 Mann-Kendall S: 새 값과 기존 값 쌍을 더함
+        self.window_s += _sign_sum(value, self.window)
+        self.window.append(value)
+        self.window_times.append(timestamp)
+        return changed
+
+    def trim(self, cutoff: Optional[datetime], window_size: int):
+        """cutoff 이전이거나 개수 상한을 넘는 오래된 값을 윈도우에서 제거"""
+        while _expired(self.window_times, cutoff, window_size):
+            oldest = self.window.pop(0)
+            self.window_times.pop(0)
+            # 제거 쌍의 기여분 Σ sign(w_j - oldest) = -Σ sign(oldest - w_j)
+            self.window_s += _sign_sum(oldest, self.window)
+
+    def merge(self, later: 'IndicatorState', ema_alpha: float, window_size: int,
+              cutoff: Optional[datetime] = None) -> 'IndicatorState':
+        """
+        이후 기간의 상태를 이어 붙인 상태 (self 다음에 later의 관측이 온다고 가정)
+        """
+        if later.count == 0 or self.count == 0:
+            merged = IndicatorState(**asdict(self if later.count == 0 else later))
+            merged.trim(cutoff, window_size)
+            return merged
+
+        count = self.count + later.count
+        delta = later.mean - self.mean
+        mean = self.mean + delta * later.count / count
+        m2 = self.m2 + later.m2 + delta * delta * self.count * later.count / count
+
+        # later의 EMA는 첫 값에서 시작했으므로, self.ema에서 시작했을 때와의 차이를 감쇠시켜 더함
+        ema = later.ema + (1 - ema_alpha) ** later.count * (self.ema - later.ema_first)
+
+        window = self.window + later.window
+        window_times = self.window_times + later.window_times
+        while _expired(window_times, cutoff, window_size):
+            window.pop(0)
+            window_times.pop(0)
+
+        return IndicatorState(
+            count=count,
+            mean=mean,
+            m2=m2,
+            ema=ema,
+            ema_first=self.ema_first,
+            cusum_pos=later.cusum_pos,
+            cusum_neg=later.cusum_neg,
+            change_count=self.change_count + later.change_count,
+            last_change=later.last_change or self.last_change,
+            window=window,
+            window_times=window_times,
+            window_s=mann_kendall_s(window)
+        )
+
+
+@dataclass
+class SeniorTrendState:
+    """시니어 한 명의 지표별 증분 추세 상태"""
+    senior_id: str
+    indicators: Dict[str, IndicatorState] = field(default_factory=dict)
+    count: int = 0
+    first_timestamp: Optional[str] = None
+    last_timestamp: Optional[str] = None
+    # 최근 윈도우 안의 기록 시점 (지표별 결측과 무관, 최소 데이터 수 판단과 정렬 기준)
+    recent_times: List[str] = field(default_factory=list)
+    # 반영한 분석 ID (재시도로 같은 분석이 두 번 반영되지 않도록)
+    applied_ids: List[str] = field(default_factory=list)
+    # 최근 윈도우 기간(일, None이면 제한 없음)과 상태 크기 상한
+    window_days: Optional[float] = 30.0
+    window_size: int = 500
+    ema_alpha: float = 0.1
+    cusum_threshold: float = 5.0
+    version: int = TREND_STATE_VERSION
+
+    @staticmethod
+    def extract(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        분석 기록에서 (타임스탬프, 분석 ID, 지표 값) 추출
+
+        파이프라인 결과(analysis_timestamp, indicators)와 Firestore 새 스키마
+        (timestamp, analysisId/callId, coreIndicators.{지표}.value)를 모두 지원합니다.
+        """
+        timestamp = record.get('analysis_timestamp') or record.get('timestamp')
+        if not timestamp:
+            return None
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+
+        raw = record.get('indicators') or record.get('coreIndicators') or {}
+        values = {}
+        for name in INDICATORS:
+            value = raw.get(name)
+            if isinstance(value, dict):
+                value = value.get('value', value.get('score'))
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and np.isfinite(value):
+                values[name] = float(value)
+        return {
+            'timestamp': str(timestamp),
+            'analysis_id': record.get('analysisId') or record.get('callId') or None,
+            'values': values
+        }
+
+    def update(self, record: Dict[str, Any], analysis_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        새 분석 1건 반영
+
+        지표 값이 없는 기록은 반영하지 않습니다. 분석 ID가 있으면 이미 반영한 ID를,
+        없으면 마지막 반영 시점 이전 기록을 무시합니다.
+
+        Args:
+            record: 분석 기록
+            analysis_id: 분석(통화) ID (없으면 기록의 analysisId/callId 사용)
+
+        Returns:
+            이번 갱신에서 감지된 변화점 목록
+        """
+        extracted = self.extract(record)
+        if extracted is None or not extracted['values']:
+            return []
+
+        timestamp = extracted['timestamp']
+        analysis_id = analysis_id or extracted['analysis_id']
+        if analysis_id:
+            if analysis_id in self.applied_ids:
+                logger.debug(f"이미 반영된 분석 무시: {analysis_id}")
+                return []
+        elif self.last_timestamp and timestamp <= self.last_timestamp:
+            logger.debug(f"이미 반영된 시점의 기록 무시: {timestamp}")
+            return []
+
+        changes = []
+        for name, value in extracted['values'].items():
+            state = self.indicators.setdefault(name, IndicatorState())
+            if state.update(value, timestamp, self.ema_alpha, self.cusum_threshold):
+                changes.append({'metric': name, 'timestamp': timestamp, 'value': value})
+
+        self.count += 1
+        self.first_timestamp = min(self.first_timestamp or timestamp, timestamp)
+        self.last_timestamp = max(self.last_timestamp or timestamp, timestamp)
+        self.recent_times.append(timestamp)
+        if analysis_id:
+            self.applied_ids = (self.applied_ids + [analysis_id])[-self.window_size:]
+        self.expire(self.last_timestamp)
+        return changes
+
+    def is_applied(self, analysis_id: Optional[str]) -> bool:
+        """이미 반영한 분석인지 여부"""
+        return bool(analysis_id) and analysis_id in self.applied_ids
+
+    def expire(self, now: str):
+        """
+        기준 시점에서 window_days 이전 기록을 최근 윈도우에서 제거
+        (누적 평균/분산/EMA/CUSUM은 유지)
+        """
+        cutoff = None
+        if self.window_days:
+            cutoff = _parse_time(now) - timedelta(days=self.window_days)
+        for state in self.indicators.values():
+            state.trim(cutoff, self.window_size)
+        while _expired(self.recent_times, cutoff, self.window_size):
+            self.recent_times.pop(0)
+
+    @classmethod
+    def rebuild(cls, senior_id: str, history: List[Dict[str, Any]], **params) -> 'SeniorTrendState':
+        """과거 기록 전체로 상태 재구성 (보정/초기화 경로)"""
+        state = cls(senior_id=senior_id, **params)
+        records = [r for r in history if cls.extract(r) is not None]
+        for record in sorted(records, key=lambda r: cls.extract(r)['timestamp']):
+            state.update(record)
+        logger.info(f"추세 상태 재구성: {senior_id}, 기록 {state.count}개")
+        return state
+
+    def merge(self, later: 'SeniorTrendState') -> 'SeniorTrendState':
+        """이후 기간의 상태를 이어 붙인 새 상태"""
+        last_timestamp = later.last_timestamp or self.last_timestamp
+        cutoff = None
+        if self.window_days and last_timestamp:
+            cutoff = _parse_time(last_timestamp) - timedelta(days=self.window_days)
+
+        names = list(dict.fromkeys(list(self.indicators) + list(later.indicators)))
+        merged = SeniorTrendState(
+            senior_id=self.senior_id,
+            indicators={
+                name: self.indicators.get(name, IndicatorState()).merge(
+                    later.indicators.get(name, IndicatorState()), self.ema_alpha,
+                    self.window_size, cutoff
+                )
+                for name in names
+            },
+            count=self.count + later.count,
+            first_timestamp=self.first_timestamp or later.first_timestamp,
+            last_timestamp=last_timestamp,
+            recent_times=self.recent_times + later.recent_times,
+            applied_ids=(self.applied_ids + later.applied_ids)[-self.window_size:],
+            window_days=self.window_days,
+            window_size=self.window_size,
+            ema_alpha=self.ema_alpha,
+            cusum_threshold=self.cusum_threshold
+        )
+        if last_timestamp:
+            merged.expire(last_timestamp)
+        return merged
+
+    def to_dict(self) -> Dict[str, Any]:
+        """저장용 dict"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional['SeniorTrendState']:
+        """저장된 dict 복원 (버전이 다르면 None)"""
+        if not data or data.get('version') != TREND_STATE_VERSION:
+            return None
+        data = {key: value for key, value in data.items() if key in cls.__dataclass_fields__}
+        data['indicators'] = {
+            name: IndicatorState(**values) for name, values in data.get('indicators', {}).items()
+        }
+        return cls(**data)
+
+    def snapshot(self, analyzer: Optional[TrendAnalyzer] = None) -> Dict[str, Any]:
+        """
+        현재 상태의 추세 분석 결과 (윈도우 크기에만 비례, 전체 기록 수와 무관)
+
+        최근 윈도우 값으로 TrendAnalyzer.analyze_series를 실행하므로 결과 형식과
+        최소 데이터 수 기준은 analyze_trends와 같습니다. 베이스라인 비교는 누적 평균/표준편차
+        기준이며, indicator_trends/baseline_established/baseline_values/significant_changes와
+        지표별 cusum이 추가됩니다.
+        """
+        analyzer = analyzer or TrendAnalyzer()
+        timestamps = [_parse_time(timestamp) for timestamp in self.recent_times]
+
+        # analyze_trends와 같이 5대 지표를 모두 포함 (해당 시점 값이 없으면 0)
+        series = {}
+        mann_kendall = {}
+        for name in INDICATORS:
+            state = self.indicators.get(name, IndicatorState())
+            values_by_time = dict(zip(state.window_times, state.window))
+            series[name] = [values_by_time.get(timestamp, 0) for timestamp in self.recent_times]
+            # 결측 없이 정렬된 지표만 누적 S 사용
+            if state.window_times == self.recent_times and len(state.window) >= 2:
+                mann_kendall[name] = mann_kendall_result(
+                    state.window_s, mann_kendall_variance(state.window), len(state.window),
+                    analyzer.significance_level
+                )
+
+        baseline = {
+            'mental_health': {
+                name: {'mean': state.mean, 'std': state.std}
+                for name, state in self.indicators.items()
+            }
+        }
+        result = analyzer.analyze_series(
+            timestamps, series, baseline=baseline, mann_kendall=mann_kendall
+        )
+        if result.get('status') == 'insufficient_data':
+            return result
+
+        for name, state in self.indicators.items():
+            result['trends'][name]['cusum'] = {
+                'positive': state.cusum_pos,
+                'negative': state.cusum_neg,
+                'change_count': state.change_count,
+                'last_change': state.last_change
+            }
+
+        result.update({
+            'indicator_trends': {
+                name: {'trend': result['trends'][name]['mann_kendall']['trend']}
+                for name in INDICATORS
+            },
+            'baseline_established': self.count >= 5,
+            'baseline_values': {
+                name: {'mean': state.mean, 'std': state.std, 'ema': state.ema}
+                for name, state in self.indicators.items()
+            },
+            'significant_changes': [
+                {'metric': name, 'timestamp': state.last_change, 'change_count': state.change_count}
+                for name, state in self.indicators.items() if state.last_change
+            ],
+            'source': 'incremental_state'
+        })
+        return result
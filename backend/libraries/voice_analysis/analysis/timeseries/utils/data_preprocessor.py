@@ -14,8 +14,12 @@ class DataPreprocessor:
     
     결측치 처리, 이상치 제거, 정규화, 스무딩, 변환 등
     시계열 분석을 위한 다양한 전처리 기능을 제공합니다.
+    레코드 리스트는 입구에서 한 번만 지표 점수 열 프레임으로 변환하고,
+    모든 단계를 열 단위 배열 연산으로 수행한 뒤 출구에서 레코드로 되돌립니다.
     """
     
+    METRICS = ['depression', 'cognitive']
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.scaler = None
@@ -54,7 +58,6 @@ class DataPreprocessor:
         if options:
             default_options.update(options)
         
-        processed_data = data.copy()
         transformation_info = {
             'original_length': len(data),
             'steps_applied': [],
@@ -62,59 +65,62 @@ class DataPreprocessor:
         }
         
         # 1. 데이터 검증 및 기본 통계
-        validation_result = self._validate_data(processed_data)
+        validation_result = self._validate_data(data)
         transformation_info['validation'] = validation_result
         
         if not validation_result['is_valid']:
-            return processed_data, transformation_info
+            return data.copy(), transformation_info
+        
+        # 지표 점수를 한 번만 열 단위 프레임으로 변환 (인덱스 = 원본 레코드 위치)
+        frame = self._convert_to_dataframe(data)
         
         # 2. 결측치 처리
         if default_options['handle_missing']:
-            processed_data, missing_info = self._handle_missing_values(
-                processed_data, method=default_options['handle_missing']
+            frame, missing_info = self._handle_missing_values(
+                frame, method=default_options['handle_missing']
             )
             transformation_info['steps_applied'].append('missing_values_handled')
             transformation_info['missing_treatment'] = missing_info
         
         # 3. 이상치 처리
         if default_options['outlier_treatment']:
-            processed_data, outlier_info = self._handle_outliers(
-                processed_data, method=default_options['outlier_treatment']
+            frame, outlier_info = self._handle_outliers(
+                frame, method=default_options['outlier_treatment']
             )
             transformation_info['steps_applied'].append('outliers_handled')
             transformation_info['outlier_treatment'] = outlier_info
         
         # 4. 스무딩
         if default_options['smoothing']:
-            processed_data, smoothing_info = self._apply_smoothing(processed_data)
+            frame, smoothing_info = self._apply_smoothing(frame)
             transformation_info['steps_applied'].append('smoothing_applied')
             transformation_info['smoothing'] = smoothing_info
         
         # 5. 추세 제거
         if default_options['detrend']:
-            processed_data, detrend_info = self._detrend_data(processed_data)
+            frame, detrend_info = self._detrend_data(frame)
             transformation_info['steps_applied'].append('detrending_applied')
             transformation_info['detrending'] = detrend_info
         
         # 6. 차분
         if default_options['difference']:
-            processed_data, diff_info = self._apply_differencing(processed_data)
+            frame, diff_info = self._apply_differencing(frame)
             transformation_info['steps_applied'].append('differencing_applied')
             transformation_info['differencing'] = diff_info
         
         # 7. 정규화
         if default_options['normalization']:
-            processed_data, norm_info = self._normalize_data(
-                processed_data, method=default_options['normalization']
+            frame, norm_info = self._normalize_data(
+                frame, method=default_options['normalization']
             )
             transformation_info['steps_applied'].append('normalization_applied')
             transformation_info['normalization'] = norm_info
         
         # 최종 통계
-        transformation_info['final_length'] = len(processed_data)
-        transformation_info['final_statistics'] = self._calculate_statistics(processed_data)
+        transformation_info['final_length'] = len(frame)
+        transformation_info['final_statistics'] = self._calculate_statistics(frame)
         
-        return processed_data, transformation_info
+        return self._convert_from_dataframe(frame, data), transformation_info
     
     def _validate_data(self, data: List[Dict]) -> Dict:
         """데이터 유효성 검증"""
@@ -145,7 +151,7 @@ class DataPreprocessor:
             except:
                 return {'is_valid': False, 'reason': 'invalid_timestamp_format'}
         
-        is_sorted = all(timestamps[i] <= timestamps[i+1] for i in range(len(timestamps)-1))
+        is_sorted = all(a <= b for a, b in zip(timestamps, timestamps[1:]))
         
         return {
             'is_valid': True,
@@ -154,7 +160,7 @@ class DataPreprocessor:
             'data_points': len(data)
         }
     
-    def _handle_missing_values(self, data: List[Dict], method: str = 'interpolate') -> Tuple[List[Dict], Dict]:
+    def _handle_missing_values(self, df: pd.DataFrame, method: str = 'interpolate') -> Tuple[pd.DataFrame, Dict]:
         """결측치 처리"""
         missing_info = {
             'method': method,
@@ -162,16 +168,13 @@ class DataPreprocessor:
             'interpolated_points': []
         }
         
-        # 시계열 데이터를 DataFrame으로 변환
-        df = self._convert_to_dataframe(data)
-        
         # 결측치 식별
-        missing_mask = df.isnull().any(axis=1)
-        missing_indices = df[missing_mask].index.tolist()
+        missing_mask = df.isnull().to_numpy().any(axis=1)
+        missing_indices = df.index[missing_mask].tolist()
         missing_info['missing_points'] = missing_indices
         
         if not missing_indices:
-            return data, missing_info
+            return df, missing_info
         
         if method == 'interpolate':
             # 선형 보간
@@ -180,11 +183,11 @@ class DataPreprocessor:
             
         elif method == 'forward_fill':
             # 전방향 채우기
-            df_interpolated = df.fillna(method='ffill')
+            df_interpolated = df.ffill()
             
         elif method == 'backward_fill':
             # 후방향 채우기
-            df_interpolated = df.fillna(method='bfill')
+            df_interpolated = df.bfill()
             
         elif method == 'mean':
             # 평균값으로 채우기
@@ -196,19 +199,16 @@ class DataPreprocessor:
             
         elif method == 'drop':
             # 결측치가 있는 행 삭제
-            df_interpolated = df.dropna()
+            df_interpolated = df[~missing_mask]
             missing_info['dropped_indices'] = missing_indices
             
         else:
             self.logger.warning(f"Unknown missing value method: {method}")
-            return data, missing_info
+            return df, missing_info
         
-        # DataFrame을 다시 딕셔너리 리스트로 변환
-        processed_data = self._convert_from_dataframe(df_interpolated, data)
-        
-        return processed_data, missing_info
+        return df_interpolated, missing_info
     
-    def _handle_outliers(self, data: List[Dict], method: str = 'winsorize') -> Tuple[List[Dict], Dict]:
+    def _handle_outliers(self, df: pd.DataFrame, method: str = 'winsorize') -> Tuple[pd.DataFrame, Dict]:
         """이상치 처리"""
         outlier_info = {
             'method': method,
@@ -216,14 +216,14 @@ class DataPreprocessor:
             'outliers_treated': {}
         }
         
-        processed_data = data.copy()
-        metrics = ['depression', 'cognitive']
+        df = df.copy()
         
-        for metric in metrics:
-            values = [d['mentalHealthAnalysis'][metric]['score'] for d in processed_data]
+        for metric in self.METRICS:
+            values = df[metric].to_numpy()
             
             # 이상치 탐지
-            outlier_indices = self._detect_outliers_iqr(values)
+            outlier_mask = self._outlier_mask_iqr(values)
+            outlier_indices = np.flatnonzero(outlier_mask).tolist()
             outlier_info['outliers_detected'][metric] = outlier_indices
             
             if not outlier_indices:
@@ -235,46 +235,37 @@ class DataPreprocessor:
                 
             elif method == 'clip':
                 # IQR 기반 클리핑
-                q1, q3 = np.percentile(values, [25, 75])
-                iqr = q3 - q1
-                lower_bound = q1 - 1.5 * iqr
-                upper_bound = q3 + 1.5 * iqr
+                lower_bound, upper_bound = self._iqr_bounds(values)
                 treated_values = np.clip(values, lower_bound, upper_bound)
                 
             elif method == 'remove':
                 # 이상치 제거 (해당 데이터포인트 전체 제거)
-                mask = np.ones(len(values), dtype=bool)
-                mask[outlier_indices] = False
-                processed_data = [processed_data[i] for i in range(len(processed_data)) if mask[i]]
+                df = df[~outlier_mask]
                 outlier_info['outliers_treated'][metric] = 'removed'
                 continue
                 
             elif method == 'interpolate':
-                # 이상치를 보간으로 대체
+                # 이상치를 양옆의 정상값 사이 선형 보간으로 대체 (양 끝은 가장 가까운 정상값)
+                positions = np.arange(len(values))
                 treated_values = values.copy()
-                for idx in outlier_indices:
-                    if idx > 0 and idx < len(values) - 1:
-                        treated_values[idx] = (treated_values[idx-1] + treated_values[idx+1]) / 2
-                    elif idx == 0:
-                        treated_values[idx] = treated_values[1]
-                    else:
-                        treated_values[idx] = treated_values[-2]
+                if outlier_mask.all():
+                    continue
+                treated_values[outlier_mask] = np.interp(
+                    positions[outlier_mask], positions[~outlier_mask], values[~outlier_mask]
+                )
                         
             else:
                 self.logger.warning(f"Unknown outlier method: {method}")
                 continue
             
-            # 처리된 값을 다시 데이터에 적용
-            if method != 'remove':
-                for i, new_value in enumerate(treated_values):
-                    processed_data[i]['mentalHealthAnalysis'][metric]['score'] = float(new_value)
-                
-                outlier_info['outliers_treated'][metric] = len(outlier_indices)
+            # 처리된 값을 열 단위로 적용
+            df[metric] = np.asarray(treated_values, dtype=np.float64)
+            outlier_info['outliers_treated'][metric] = len(outlier_indices)
         
-        return processed_data, outlier_info
+        return df, outlier_info
     
-    def _apply_smoothing(self, data: List[Dict], method: str = 'moving_average', 
-                        window: int = 3) -> Tuple[List[Dict], Dict]:
+    def _apply_smoothing(self, df: pd.DataFrame, method: str = 'moving_average', 
+                        window: int = 3) -> Tuple[pd.DataFrame, Dict]:
         """스무딩 적용"""
         smoothing_info = {
             'method': method,
@@ -282,89 +273,63 @@ class DataPreprocessor:
             'smoothed_metrics': []
         }
         
-        processed_data = data.copy()
-        metrics = ['depression', 'cognitive']
+        values = df[self.METRICS].to_numpy()
         
-        for metric in metrics:
-            values = [d['mentalHealthAnalysis'][metric]['score'] for d in processed_data]
-            
-            if method == 'moving_average':
-                smoothed_values = self._moving_average(values, window)
-            elif method == 'exponential':
-                smoothed_values = self._exponential_smoothing(values, alpha=0.3)
-            elif method == 'savgol':
-                if len(values) >= window and window >= 3:
-                    smoothed_values = signal.savgol_filter(values, window, 2)
-                else:
-                    smoothed_values = values
+        if method == 'moving_average':
+            smoothed_values = self._moving_average(values, window)
+        elif method == 'exponential':
+            smoothed_values = self._exponential_smoothing(values, alpha=0.3)
+        elif method == 'savgol':
+            if len(values) >= window and window >= 3:
+                smoothed_values = signal.savgol_filter(values, window, 2, axis=0)
             else:
-                self.logger.warning(f"Unknown smoothing method: {method}")
-                continue
-            
-            # 스무딩된 값을 데이터에 적용
-            for i, smoothed_value in enumerate(smoothed_values):
-                processed_data[i]['mentalHealthAnalysis'][metric]['score'] = float(smoothed_value)
-            
-            smoothing_info['smoothed_metrics'].append(metric)
+                smoothed_values = values
+        else:
+            self.logger.warning(f"Unknown smoothing method: {method}")
+            return df, smoothing_info
+        
+        df = df.copy()
+        df[self.METRICS] = smoothed_values
+        smoothing_info['smoothed_metrics'] = list(self.METRICS)
         
-        return processed_data, smoothing_info
+        return df, smoothing_info
     
-    def _detrend_data(self, data: List[Dict]) -> Tuple[List[Dict], Dict]:
+    def _detrend_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
         """추세 제거"""
         detrend_info = {
             'method': 'linear_detrend',
-            'detrended_metrics': []
+            'detrended_metrics': list(self.METRICS)
         }
         
-        processed_data = data.copy()
-        metrics = ['depression', 'cognitive']
+        values = df[self.METRICS].to_numpy()
         
-        for metric in metrics:
-            values = np.array([d['mentalHealthAnalysis'][metric]['score'] for d in processed_data])
-            
-            # 선형 추세 제거
-            detrended_values = signal.detrend(values, type='linear')
-            
-            # 원래 평균 복원 (추세만 제거하고 수준은 유지)
-            detrended_values += np.mean(values)
-            
-            # 처리된 값을 데이터에 적용
-            for i, detrended_value in enumerate(detrended_values):
-                processed_data[i]['mentalHealthAnalysis'][metric]['score'] = float(detrended_value)
-            
-            detrend_info['detrended_metrics'].append(metric)
+        # 선형 추세 제거 후 원래 평균 복원 (추세만 제거하고 수준은 유지)
+        detrended_values = signal.detrend(values, axis=0, type='linear') + values.mean(axis=0)
         
-        return processed_data, detrend_info
+        df = df.copy()
+        df[self.METRICS] = detrended_values
+        
+        return df, detrend_info
     
-    def _apply_differencing(self, data: List[Dict], order: int = 1) -> Tuple[List[Dict], Dict]:
+    def _apply_differencing(self, df: pd.DataFrame, order: int = 1) -> Tuple[pd.DataFrame, Dict]:
         """차분 적용"""
         diff_info = {
             'order': order,
-            'differenced_metrics': [],
+            'differenced_metrics': list(self.METRICS),
             'lost_observations': order
         }
         
-        if len(data) <= order:
-            return data, {'error': 'insufficient_data_for_differencing'}
-        
-        processed_data = data[order:].copy()  # 차분으로 인해 관측치 손실
-        metrics = ['depression', 'cognitive']
+        if len(df) <= order:
+            return df, {'error': 'insufficient_data_for_differencing'}
         
-        for metric in metrics:
-            values = [d['mentalHealthAnalysis'][metric]['score'] for d in data]
-            
-            # 차분 계산
-            diff_values = np.diff(values, n=order)
-            
-            # 차분된 값을 데이터에 적용
-            for i, diff_value in enumerate(diff_values):
-                processed_data[i]['mentalHealthAnalysis'][metric]['score'] = float(diff_value)
-            
-            diff_info['differenced_metrics'].append(metric)
+        # 차분으로 인해 앞쪽 관측치 손실, 나머지 행에 차분값 적용
+        diff_values = np.diff(df[self.METRICS].to_numpy(), n=order, axis=0)
+        df = df.iloc[order:].copy()
+        df[self.METRICS] = diff_values
         
-        return processed_data, diff_info
+        return df, diff_info
     
-    def _normalize_data(self, data: List[Dict], method: str = 'standardize') -> Tuple[List[Dict], Dict]:
+    def _normalize_data(self, df: pd.DataFrame, method: str = 'standardize') -> Tuple[pd.DataFrame, Dict]:
         """데이터 정규화"""
         norm_info = {
             'method': method,
@@ -372,153 +337,156 @@ class DataPreprocessor:
             'scalers': {}
         }
         
-        processed_data = data.copy()
-        metrics = ['depression', 'cognitive']
+        if method == 'standardize':
+            scaler = StandardScaler()
+        elif method == 'minmax':
+            scaler = MinMaxScaler()
+        elif method == 'robust':
+            scaler = RobustScaler()
+        else:
+            self.logger.warning(f"Unknown normalization method: {method}")
+            return df, norm_info
         
-        for metric in metrics:
-            values = np.array([d['mentalHealthAnalysis'][metric]['score'] for d in processed_data]).reshape(-1, 1)
-            
-            if method == 'standardize':
-                scaler = StandardScaler()
-            elif method == 'minmax':
-                scaler = MinMaxScaler()
-            elif method == 'robust':
-                scaler = RobustScaler()
-            else:
-                self.logger.warning(f"Unknown normalization method: {method}")
-                continue
-            
-            # 정규화 적용
-            normalized_values = scaler.fit_transform(values).flatten()
-            
-            # 정규화된 값을 데이터에 적용
-            for i, norm_value in enumerate(normalized_values):
-                processed_data[i]['mentalHealthAnalysis'][metric]['score'] = float(norm_value)
-            
+        # 지표 전체를 한 번에 정규화 (열별 독립 적합)
+        df = df.copy()
+        df[self.METRICS] = scaler.fit_transform(df[self.METRICS].to_numpy())
+        
+        for column, metric in enumerate(self.METRICS):
             norm_info['normalized_metrics'].append(metric)
             norm_info['scalers'][metric] = {
-                'mean': getattr(scaler, 'mean_', [None])[0],
-                'scale': getattr(scaler, 'scale_', [None])[0],
-                'min': getattr(scaler, 'data_min_', [None])[0],
-                'max': getattr(scaler, 'data_max_', [None])[0]
+                key: (getattr(scaler, attribute)[column] if hasattr(scaler, attribute) else None)
+                for key, attribute in (
+                    ('mean', 'mean_'), ('scale', 'scale_'), ('min', 'data_min_'), ('max', 'data_max_')
+                )
             }
         
-        return processed_data, norm_info
+        return df, norm_info
     
     # 보조 메서드들
     def _convert_to_dataframe(self, data: List[Dict]) -> pd.DataFrame:
-        """딕셔너리 리스트를 DataFrame으로 변환"""
-        records = []
-        for item in data:
-            record = {
-                'timestamp': item['analysis_timestamp'],
-                'depression': item['mentalHealthAnalysis']['depression']['score'],
-                'cognitive': item['mentalHealthAnalysis']['cognitive']['score']
-            }
-            # 제거됨 - SincNet만 사용
-            record['speechRate'] = 0
-            record['pauseRatio'] = 0
-            records.append(record)
-        
-        return pd.DataFrame(records)
+        """딕셔너리 리스트를 지표 점수 열 프레임으로 변환 (인덱스 = 레코드 위치)"""
+        columns = {
+            metric: np.array(
+                [item['mentalHealthAnalysis'][metric]['score'] for item in data], dtype=np.float64
+            )
+            for metric in self.METRICS
+        }
+        return pd.DataFrame(columns, index=pd.RangeIndex(len(data)))
     
     def _convert_from_dataframe(self, df: pd.DataFrame, original_data: List[Dict]) -> List[Dict]:
-        """DataFrame을 딕셔너리 리스트로 변환"""
+        """
+        프레임을 딕셔너리 리스트로 변환
+        
+        프레임 인덱스의 원본 레코드를 복사해 점수만 바꿉니다 (원본 레코드는 수정하지 않음).
+        """
+        positions = df.index.to_numpy()
+        scores = {metric: df[metric].to_numpy().tolist() for metric in self.METRICS}
+        
         result = []
-        for i, row in df.iterrows():
-            if i >= len(original_data):
-                break
-                
-            item = original_data[i].copy()
-            item['mentalHealthAnalysis']['depression']['score'] = float(row['depression'])
-            item['mentalHealthAnalysis']['cognitive']['score'] = float(row['cognitive'])
-            
-            # 제거됨 - SincNet만 사용
-            
+        for row, position in enumerate(positions.tolist()):
+            item = original_data[position].copy()
+            analysis = dict(item['mentalHealthAnalysis'])
+            for metric in self.METRICS:
+                analysis[metric] = {**analysis[metric], 'score': scores[metric][row]}
+            item['mentalHealthAnalysis'] = analysis
             result.append(item)
         
         return result
     
-    def _detect_outliers_iqr(self, values: List[float]) -> List[int]:
-        """IQR 방법으로 이상치 탐지"""
+    def _iqr_bounds(self, values: np.ndarray) -> Tuple[float, float]:
+        """IQR 이상치 경계 (Q1 - 1.5·IQR, Q3 + 1.5·IQR)"""
         q1, q3 = np.percentile(values, [25, 75])
         iqr = q3 - q1
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
-        
-        outliers = []
-        for i, value in enumerate(values):
-            if value < lower_bound or value > upper_bound:
-                outliers.append(i)
-        
-        return outliers
+        return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    
+    def _outlier_mask_iqr(self, values: np.ndarray) -> np.ndarray:
+        """IQR 방법의 이상치 여부 마스크"""
+        lower_bound, upper_bound = self._iqr_bounds(values)
+        return (values < lower_bound) | (values > upper_bound)
+    
+    def _detect_outliers_iqr(self, values: List[float]) -> List[int]:
+        """IQR 방법으로 이상치 탐지"""
+        return np.flatnonzero(self._outlier_mask_iqr(np.asarray(values, dtype=np.float64))).tolist()
     
     def _winsorize_values(self, values: List[float], limits: Tuple[float, float]) -> np.ndarray:
-        """Winsorization 적용"""
-        from scipy.stats import mstats
-        return mstats.winsorize(values, limits=limits)
+        """
+        Winsorization 적용 (scipy.stats.mstats.winsorize와 같은 순위 기준)
+        
+        하위 int(n·lower)개는 그 다음 순위 값으로, 상위 int(n·upper)개는 그 이전 순위 값으로 자릅니다.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        lower_count = int(limits[0] * n)
+        upper_index = n - int(limits[1] * n) - 1
+        if n == 0 or upper_index < lower_count:
+            return values.copy()
+        
+        bounds = np.partition(values, [lower_count, upper_index])
+        return np.clip(values, bounds[lower_count], bounds[upper_index])
     
-    def _moving_average(self, values: List[float], window: int) -> np.ndarray:
-        """이동 평균 계산"""
+    def _moving_average(self, values: np.ndarray, window: int) -> np.ndarray:
+        """
+        중심 이동 평균 (양 끝은 창이 잘린 만큼만 평균), 열 단위로 누적합 계산
+        """
+        values = np.asarray(values, dtype=np.float64)
         if window <= 1:
-            return np.array(values)
+            return values.copy()
         
-        smoothed = []
-        for i in range(len(values)):
-            start_idx = max(0, i - window // 2)
-            end_idx = min(len(values), i + window // 2 + 1)
-            smoothed.append(np.mean(values[start_idx:end_idx]))
+        n = len(values)
+        half = window // 2
+        positions = np.arange(n)
+        start = np.maximum(0, positions - half)
+        end = np.minimum(n, positions + half + 1)
         
-        return np.array(smoothed)
+        cumulative = np.concatenate([np.zeros((1,) + values.shape[1:]), np.cumsum(values, axis=0)])
+        counts = (end - start).reshape((-1,) + (1,) * (values.ndim - 1))
+        return (cumulative[end] - cumulative[start]) / counts
     
-    def _exponential_smoothing(self, values: List[float], alpha: float = 0.3) -> np.ndarray:
-        """지수 평활법 적용"""
-        result = [values[0]]
-        for i in range(1, len(values)):
-            result.append(alpha * values[i] + (1 - alpha) * result[-1])
-        return np.array(result)
+    def _exponential_smoothing(self, values: np.ndarray, alpha: float = 0.3) -> np.ndarray:
+        """지수 평활법 적용 (y[t] = α·x[t] + (1-α)·y[t-1], y[0] = x[0])"""
+        values = np.asarray(values, dtype=np.float64)
+        initial = (1 - alpha) * values[:1]
+        smoothed, _ = signal.lfilter([alpha], [1, alpha - 1], values, axis=0, zi=initial)
+        return smoothed
     
-    def _calculate_statistics(self, data: List[Dict]) -> Dict:
+    def _calculate_statistics(self, df: pd.DataFrame) -> Dict:
         """기본 통계량 계산"""
-        if not data:
+        if df.empty:
             return {}
         
-        stats = {}
-        metrics = ['depression', 'cognitive']
-        
-        for metric in metrics:
-            values = [d['mentalHealthAnalysis'][metric]['score'] for d in data]
-            stats[metric] = {
-                'mean': np.mean(values),
-                'std': np.std(values),
-                'min': np.min(values),
-                'max': np.max(values),
-                'median': np.median(values)
-            }
+        values = df[self.METRICS].to_numpy()
+        means = values.mean(axis=0)
+        stds = values.std(axis=0)
+        mins = values.min(axis=0)
+        maxs = values.max(axis=0)
+        medians = np.median(values, axis=0)
         
-        return stats
+        return {
+            metric: {
+                'mean': means[column],
+                'std': stds[column],
+                'min': mins[column],
+                'max': maxs[column],
+                'median': medians[column]
+            }
+            for column, metric in enumerate(self.METRICS)
+        }
     
     def reverse_normalization(self, data: List[Dict], norm_info: Dict) -> List[Dict]:
         """정규화 역변환"""
         if 'scalers' not in norm_info:
             return data
         
-        result = data.copy()
+        df = self._convert_to_dataframe(data)
         
         for metric in norm_info['normalized_metrics']:
             scaler_info = norm_info['scalers'][metric]
-            values = [d['mentalHealthAnalysis'][metric]['score'] for d in result]
             
             # 역변환
             if norm_info['method'] == 'standardize':
-                original_values = [v * scaler_info['scale'] + scaler_info['mean'] for v in values]
+                df[metric] = df[metric] * scaler_info['scale'] + scaler_info['mean']
             elif norm_info['method'] == 'minmax':
-                original_values = [v * (scaler_info['max'] - scaler_info['min']) + scaler_info['min'] for v in values]
-            else:
-                original_values = values  # 다른 방법들은 복잡한 역변환 필요
-            
-            # 역변환된 값을 적용
-            for i, orig_value in enumerate(original_values):
-                result[i]['mentalHealthAnalysis'][metric]['score'] = float(orig_value)
+                df[metric] = df[metric] * (scaler_info['max'] - scaler_info['min']) + scaler_info['min']
+            # 다른 방법들은 복잡한 역변환 필요
         
-        return result 
\ No newline at end of file
+        return self._convert_from_dataframe(df, data)
@@ -0,0 +1,299 @@
+"""
+Mann-Kendall S 통계량과 Sen's slope의 O(n log n) / 벡터화 계산
+
+S는 모든 쌍(i < j)의 sign(x_j - x_i) 합이므로, 구간을 두 배씩 키우는 병합 단계마다
+오른쪽 원소보다 작은/큰 왼쪽 원소 수를 searchsorted로 세어 합산한다 (타이는 0).
+Sen's slope는 중간 크기까지 lag별 차분을 한 번에 만들어 필요한 순위만 partition으로 고르고,
+큰 n에서는 표본으로 순위 구간을 잡은 뒤 lag 단위로 훑어 구간 안의 기울기만 모아 정확히 선택한다.
+*_grouped 함수는 여러 시계열을 (그룹 번호, 시간) 순으로 이어 붙인 배열에서 그룹별 값을 한 번에 계산한다.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import stats
+
+# 모든 쌍 기울기를 한 번에 만드는 최대 n (n(n-1)/2개 float64, 3000이면 약 36MB)
+SENS_DENSE_MAX_N = 3000
+
+# 큰 n 경로의 표본 기울기 수
+SENS_SAMPLE_SIZE = 20000
+
+# 그룹 일괄 계산에서 한 번에 만드는 기울기 행렬 최대 원소 수
+SENS_GROUP_CHUNK_PAIRS = 2_000_000
+
+
+def _dense_ranks(values: np.ndarray) -> Tuple[np.ndarray, int]:
+    """값 순서를 보존하는 0부터의 정수 순위 (같은 값은 같은 순위)"""
+    unique, ranks = np.unique(values, return_inverse=True)
+    return ranks.astype(np.int64), len(unique)
+
+
+def group_layout(groups: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (그룹별 시작 위치, 그룹별 길이, 원소별 그룹 내 위치)
+
+    groups는 0부터 시작하는 연속 그룹 번호이며 오름차순으로 정렬되어 있어야 한다.
+    """
+    n_groups = int(groups[-1]) + 1 if len(groups) else 0
+    lengths = np.bincount(groups, minlength=n_groups)
+    starts = np.zeros(n_groups, dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    positions = np.arange(len(groups)) - starts[groups]
+    return starts, lengths, positions
+
+
+def mann_kendall_s(values: Sequence[float]) -> int:
+    """
+    Mann-Kendall S = Σ_{i<j} sign(x_j - x_i)
+    """
+    x = np.asarray(values, dtype=np.float64)
+    if len(x) < 2:
+        return 0
+    return int(mann_kendall_s_grouped(x, np.zeros(len(x), dtype=np.int64))[0])
+
+
+def mann_kendall_s_grouped(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """
+    그룹별 Mann-Kendall S
+
+    폭 w 단계에서 각 2w 블록의 오른쪽 절반 원소마다 왼쪽 절반에서 더 작은 값과
+    더 큰 값의 수를 센다. 모든 쌍은 정확히 한 단계에서 한 번 세어진다.
+
+    Args:
+        values: 그룹, 시간 순으로 이어 붙인 값
+        groups: 원소별 그룹 번호 (0부터 연속, 오름차순)
+    """
+    x = np.asarray(values, dtype=np.float64)
+    groups = np.asarray(groups, dtype=np.int64)
+    _, lengths, positions = group_layout(groups)
+    s = np.zeros(len(lengths), dtype=np.int64)
+    if len(x) < 2:
+        return s
+
+    ranks, m = _dense_ranks(x)
+    max_length = int(lengths.max())
+    width = 1
+    while width < max_length:
+        blocks_per_group = (max_length - 1) // (2 * width) + 1
+        block = groups * blocks_per_group + positions // (2 * width)
+        is_left = (positions // width) % 2 == 0
+        # 블록 번호 * m + 순위: 블록별로 정렬된 왼쪽 키 한 배열에서 블록 범위 안만 검색된다
+        # 오른쪽 키도 정렬해 두면 searchsorted가 순차 접근으로 진행된다
+        left_keys = np.sort(block[is_left] * m + ranks[is_left])
+        right_keys = np.sort(block[~is_left] * m + ranks[~is_left])
+        right_block = right_keys // m
+
+        left_counts = np.bincount(block[is_left], minlength=len(lengths) * blocks_per_group)
+        block_end = np.cumsum(left_counts)
+        block_start = (block_end - left_counts)[right_block]
+        smaller = np.searchsorted(left_keys, right_keys, side='left') - block_start
+        larger = block_end[right_block] - np.searchsorted(left_keys, right_keys, side='right')
+
+        s += np.rint(np.bincount(right_block // blocks_per_group, weights=smaller - larger,
+                                 minlength=len(s))).astype(np.int64)
+        width *= 2
+    return s
+
+
+def mann_kendall_variance(values: Sequence[float]) -> float:
+    """타이 보정을 포함한 S의 분산"""
+    x = np.asarray(values, dtype=np.float64)
+    return float(mann_kendall_variance_grouped(x, np.zeros(len(x), dtype=np.int64))[0])
+
+
+def mann_kendall_result(s: int, var_s: float, n: int, significance_level: float = 0.05) -> Dict:
+    """
+    S 통계량과 분산으로 Mann-Kendall 검정 결과 구성 (연속성 보정 Z, 양측 p-value)
+    """
+    if s > 0:
+        z = (s - 1) / np.sqrt(var_s) if var_s > 0 else 0
+    elif s < 0:
+        z = (s + 1) / np.sqrt(var_s) if var_s > 0 else 0
+    else:
+        z = 0
+
+    p_value = 2 * (1 - stats.norm.cdf(abs(z)))
+
+    if p_value < significance_level:
+        trend = 'increasing' if s > 0 else 'decreasing'
+    else:
+        trend = 'no_trend'
+
+    return {
+        'statistic': s,
+        'z_score': z,
+        'p_value': p_value,
+        'trend': trend,
+        'significant': p_value < significance_level,
+        'tau': s / (n * (n - 1) / 2)  # Kendall's tau 계산
+    }
+
+
+def mann_kendall_variance_grouped(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """그룹별 타이 보정 S 분산"""
+    x = np.asarray(values, dtype=np.float64)
+    groups = np.asarray(groups, dtype=np.int64)
+    _, lengths, _ = group_layout(groups)
+    if len(x) == 0:
+        return np.zeros(len(lengths))
+
+    ranks, m = _dense_ranks(x)
+    tie_keys, counts = np.unique(groups * m + ranks, return_counts=True)
+    counts = counts.astype(np.float64)
+    tie_correction = np.bincount(tie_keys // m, weights=counts * (counts - 1) * (2 * counts + 5),
+                                 minlength=len(lengths))
+
+    n = lengths.astype(np.float64)
+    return (n * (n - 1) * (2 * n + 5) - tie_correction) / 18
+
+
+def sens_slope_ranks(n_slopes: int) -> Tuple[int, int, int, int]:
+    """
+    (중앙값 하위 순위, 중앙값 상위 순위, 95% 신뢰구간 하한 순위, 상한 순위), 0부터 시작
+    """
+    rank_lower = int(np.floor((n_slopes - 1.96 * np.sqrt(n_slopes)) / 2))
+    rank_upper = int(np.ceil((n_slopes + 1.96 * np.sqrt(n_slopes)) / 2))
+    rank_lower = max(0, rank_lower)
+    rank_upper = min(n_slopes - 1, rank_upper)
+    return (n_slopes - 1) // 2, n_slopes // 2, rank_lower, rank_upper
+
+
+def pairwise_slopes(values: Sequence[float]) -> np.ndarray:
+    """모든 쌍(i < j)의 기울기 (x_j - x_i) / (j - i), lag 순서로 이어 붙임"""
+    x = np.asarray(values, dtype=np.float64)
+    n = len(x)
+    if n < 2:
+        return np.zeros(0)
+    return np.concatenate([(x[lag:] - x[:-lag]) / lag for lag in range(1, n)])
+
+
+def sens_slope(values: Sequence[float], dense_max_n: int = SENS_DENSE_MAX_N,
+               sample_size: int = SENS_SAMPLE_SIZE,
+               seed: int = 0) -> Optional[Tuple[float, float, float]]:
+    """
+    Sen's slope와 95% 신뢰구간
+
+    Args:
+        values: 등간격 시계열 값
+        dense_max_n: 이 길이까지는 모든 기울기를 한 번에 계산
+        sample_size: 큰 n 경로의 표본 기울기 수
+        seed: 표본 난수 시드
+
+    Returns:
+        (기울기 중앙값, 신뢰구간 하한, 상한), 기울기가 없으면 None
+    """
+    n = len(values)
+    if n < 2:
+        return None
+
+    n_slopes = n * (n - 1) // 2
+    ranks = sens_slope_ranks(n_slopes)
+
+    if n <= dense_max_n:
+        slopes = pairwise_slopes(values)
+        picked = np.partition(slopes, sorted(set(ranks)))
+        ordered = {rank: picked[rank] for rank in ranks}
+    else:
+        ordered = _select_slopes(np.asarray(values, dtype=np.float64), ranks, sample_size, seed)
+
+    median = (ordered[ranks[0]] + ordered[ranks[1]]) / 2
+    return float(median), float(ordered[ranks[2]]), float(ordered[ranks[3]])
+
+
+def sens_slope_grouped(values: np.ndarray, groups: np.ndarray,
+                       chunk_pairs: int = SENS_GROUP_CHUNK_PAIRS) -> np.ndarray:
+    """
+    그룹별 Sen's slope와 95% 신뢰구간
+
+    같은 길이 L의 그룹을 (그룹 수, L(L-1)/2) 기울기 행렬로 묶어 행별 partition으로
+    필요한 순위만 고른다 (행렬 원소 수는 chunk_pairs 이하). 한 그룹만으로 chunk_pairs를
+    넘으면 sens_slope로 따로 계산한다.
+
+    Returns:
+        (그룹 수, 3) 배열: 기울기, 신뢰구간 하한, 상한 (길이 2 미만 그룹은 0)
+    """
+    x = np.asarray(values, dtype=np.float64)
+    groups = np.asarray(groups, dtype=np.int64)
+    starts, lengths, _ = group_layout(groups)
+    result = np.zeros((len(lengths), 3))
+
+    for length in np.unique(lengths[lengths >= 2]).tolist():
+        members = np.flatnonzero(lengths == length)
+        n_slopes = length * (length - 1) // 2
+
+        if n_slopes > chunk_pairs:
+            for group in members.tolist():
+                result[group] = sens_slope(x[starts[group]:starts[group] + length])
+            continue
+
+        ranks = sens_slope_ranks(n_slopes)
+        kth = sorted(set(ranks))
+        rows = max(1, chunk_pairs // n_slopes)
+        for offset in range(0, len(members), rows):
+            chunk = members[offset:offset + rows]
+            series = x[starts[chunk][:, None] + np.arange(length)]
+
+            # pairwise_slopes와 같은 lag 순서로 행마다 기울기 배치
+            slopes = np.empty((len(chunk), n_slopes))
+            column = 0
+            for lag in range(1, length):
+                width = length - lag
+                np.divide(series[:, lag:] - series[:, :-lag], lag, out=slopes[:, column:column + width])
+                column += width
+
+            picked = np.partition(slopes, kth, axis=1)
+            result[chunk, 0] = (picked[:, ranks[0]] + picked[:, ranks[1]]) / 2
+            result[chunk, 1] = picked[:, ranks[2]]
+            result[chunk, 2] = picked[:, ranks[3]]
+    return result
+
+
+def _select_slopes(x: np.ndarray, ranks: Sequence[int], sample_size: int, seed: int) -> Dict[int, float]:
+    """
+    모든 기울기를 저장하지 않고 정확한 순위 통계량 선택
+
+    임의 쌍 표본의 분위수로 필요한 순위들을 감싸는 [lo, hi]를 추정하고, lag 단위로
+    모든 기울기를 훑으며 lo 미만 개수만 세고 구간 안의 기울기만 모은다.
+    표본 추정이 빗나가 순위가 구간 밖이면 해당 방향을 열어 한 번 더 훑는다.
+    """
+    n = len(x)
+    n_slopes = n * (n - 1) // 2
+    low_rank, high_rank = min(ranks), max(ranks)
+
+    rng = np.random.default_rng(seed)
+    i = rng.integers(0, n, sample_size)
+    j = rng.integers(0, n, sample_size)
+    keep = i != j
+    i, j = np.minimum(i[keep], j[keep]), np.maximum(i[keep], j[keep])
+    sample = np.sort((x[j] - x[i]) / (j - i))
+
+    # 표본 분위수의 표준오차 여유를 두고 구간 설정
+    margin = 4.0 * np.sqrt(len(sample)) + 2
+    lo_index = int(np.floor(low_rank / n_slopes * len(sample) - margin))
+    hi_index = int(np.ceil(high_rank / n_slopes * len(sample) + margin))
+    lo = sample[lo_index] if lo_index >= 0 else -np.inf
+    hi = sample[hi_index] if hi_index < len(sample) else np.inf
+
+    for _ in range(2):
+        below, inside = _scan_slopes(x, lo, hi)
+        if below <= low_rank and high_rank < below + len(inside):
+            inside.sort()
+            return {rank: inside[rank - below] for rank in ranks}
+        if below > low_rank:
+            lo = -np.inf
+        if high_rank >= below + len(inside):
+            hi = np.inf
+
+    raise RuntimeError("Sen's slope 순위 선택 실패")
+
+
+def _scan_slopes(x: np.ndarray, lo: float, hi: float) -> Tuple[int, np.ndarray]:
+    """(lo 미만 기울기 수, lo 이상 hi 이하 기울기 배열)"""
+    below = 0
+    inside = []
+    for lag in range(1, len(x)):
+        slopes = (x[lag:] - x[:-lag]) / lag
+        below += int(np.count_nonzero(slopes < lo))
+        inside.append(slopes[(slopes >= lo) & (slopes <= hi)])
+    return below, np.concatenate(inside)
@@ -12,10 +12,11 @@ import json
 import base64
 import tempfile
 import io
-from typing import Dict, Any, List, Optional, Tuple
+from typing import AsyncIterator, Callable, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import time
 from datetime import datetime
+from contextlib import aclosing
 import hashlib
 
 from google.cloud import speech
@@ -25,11 +26,15 @@ from google.api_core import retry
 from google.api_core.exceptions import GoogleAPIError
 import numpy as np
 import librosa
-import soundfile as sf
-import openai
-from openai import OpenAI  # OpenAI 1.51.0에서는 동기 클라이언트 사용
 import google.generativeai as genai
 from .firebase_storage_connector import FirebaseStorageConnector
+from .decoded_audio import DecodedAudio
+from .operation_waiter import get_stt_operation_waiter
+from .transcript_cache import create_transcript_cache, make_cache_key
+from .chunked_stt import SpeakerStitcher, concat_word_tables, plan_chunks
+from .linear16_stream import open_linear16_stream, prefetch, upload_blocks
+from .llm_client_pool import get_llm_client_pool
+from .hedging import HedgePolicy, hedged_race
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +82,18 @@ class GoogleCloudSpeechConnector:
         # Long Running 작업 상태 캐시
         self.operation_cache = {}
 
+        # 프로세스 전역 STT 작업 대기기 (동시 작업 수 제한 공유)
+        self.operation_waiter = get_stt_operation_waiter()
+
+        # 같은 녹음 재분석 시 업로드/인식을 생략하는 전사 캐시 (None이면 비활성화)
+        self.transcript_cache = create_transcript_cache()
+
+        # 긴 녹음 청크 병렬 인식 설정
+        self.chunked_mode = os.getenv('STT_CHUNKED_MODE', 'false').lower() in ('1', 'true', 'yes')
+        self.chunked_min_duration = float(os.getenv('STT_CHUNKED_MIN_DURATION', '180'))
+        self.chunk_duration = float(os.getenv('STT_CHUNK_DURATION', '60'))
+        self.chunk_concurrency = int(os.getenv('STT_CHUNK_CONCURRENCY', '4'))
+
         logger.info(f"Google Cloud Speech API 연동 초기화 완료 - Project: {self.project_id}")
 
     async def transcribe_with_diarization(
@@ -84,7 +101,10 @@ class GoogleCloudSpeechConnector:
         audio_path: str,
         language_code: str = 'ko-KR',
         enable_word_confidence: bool = True,
-        use_enhanced_model: bool = True
+        use_enhanced_model: bool = True,
+        decoded_audio: Optional[DecodedAudio] = None,
+        chunked: Optional[bool] = None,
+        on_chunk: Optional[Callable[[Dict[str, Any]], Any]] = None
     ) -> Dict[str, Any]:
         """
         화자 분리를 포함한 음성 인식 (3분 이상 긴 오디오 최적화)
@@ -94,6 +114,10 @@ class GoogleCloudSpeechConnector:
             language_code: 언어 코드
             enable_word_confidence: 단어별 신뢰도 포함 여부
             use_enhanced_model: 향상된 모델 사용 여부
+            decoded_audio: 이미 디코딩된 오디오 버퍼 (있으면 재디코딩 생략)
+            chunked: 청크 병렬 인식 사용 여부 (None이면 STT_CHUNKED_MODE와 길이로 결정)
+            on_chunk: 청크 모드에서 앞 청크부터 완료되는 대로 호출되는 콜백 (코루틴 가능).
+                      청크가 하나라도 전달된 뒤 실패하면 단일 인식으로 대체하지 않고 오류를 반환
 
         Returns:
             전사 결과 with 화자 분리 정보
@@ -102,22 +126,13 @@ class GoogleCloudSpeechConnector:
             start_time = time.time()
 
             # 1. 오디오 메타데이터 추출
-            audio_metadata = self._get_audio_metadata(audio_path)
+            audio_metadata = self._get_audio_metadata(audio_path, decoded_audio)
             duration = audio_metadata.get('duration', 0)
             sample_rate = audio_metadata.get('sample_rate', 16000)
 
             logger.info(f"오디오 분석 시작: {duration:.1f}초, {sample_rate}Hz")
 
-            # 2. Firebase Storage에 업로드 (3분 이상은 필수)
-            if duration >= 180 or not os.path.exists(audio_path):
-                # Firebase Storage 또는 GCS에 업로드
-                gs_uri = await self._upload_to_storage(audio_path)
-                logger.info(f"오디오 파일 Storage 업로드 완료: {gs_uri}")
-            else:
-                # 짧은 파일도 일관성을 위해 Storage 사용 권장
-                gs_uri = await self._upload_to_storage(audio_path)
-
-            # 3. Speech Recognition 설정 구성
+            # 2. Speech Recognition 설정 구성
             # 변환된 LINEAR16 오디오는 항상 16000Hz
             config = self._build_recognition_config(
                 sample_rate=16000,  # LINEAR16 변환 후 항상 16000Hz
@@ -127,21 +142,36 @@ class GoogleCloudSpeechConnector:
                 enable_diarization=True
             )
 
-            # 4. Long Running API 실행 (3분 이상 필수)
-            operation = await self._start_long_running_recognition(gs_uri, config)
-
-            # 5. 작업 진행 상황 모니터링
-            result = await self._wait_for_operation(operation)
+            # 3. 긴 녹음은 청크 병렬 인식, 실패하거나 짧으면 단일 Long Running 인식
+            if chunked is None:
+                chunked = self.chunked_mode and duration >= self.chunked_min_duration
 
-            # 6. 화자 분리 결과 처리
-            processed_result = self._process_diarization_result(result, audio_metadata)
+            processed_result = None
+            if chunked:
+                emitted = []
 
-            # 7. 화자 신뢰도 및 검증
-            processed_result = self._validate_speaker_separation(processed_result)
+                def forward(chunk_result: Dict[str, Any]) -> Any:
+                    emitted.append(chunk_result['index'])
+                    return on_chunk(chunk_result)
 
-            # 8. Storage 정리 (임시 파일)
-            if 'temp/' in gs_uri:
-                await self._cleanup_storage(gs_uri)
+                try:
+                    processed_result = await self._transcribe_chunked(
+                        audio_path, decoded_audio, config, forward if on_chunk else None
+                    )
+                    api_type = 'chunked'
+                except Exception as e:
+                    if emitted:
+                        # 콜백이 이미 부분 결과를 받았으면 다른 전사로 대체하지 않고 실패 처리
+                        # (콜백이 받은 청크와 최종 전사가 어긋나지 않도록)
+                        logger.error(f"청크 STT 실패 (청크 {len(emitted)}개 전달 후): {e}")
+                        raise
+                    logger.warning(f"청크 STT 실패, 단일 Long Running 인식으로 진행: {e}")
+                    processed_result = None
+
+            if processed_result is None:
+                processed_result, api_type = await self._transcribe_single(
+                    audio_path, decoded_audio, language_code, config, audio_metadata
+                )
 
             processing_time = time.time() - start_time
             processed_result['metadata'] = {
@@ -150,8 +180,11 @@ class GoogleCloudSpeechConnector:
                 'sample_rate': 16000,  # 변환된 샘플레이트
                 'original_sample_rate': sample_rate,
                 'model_used': 'enhanced' if use_enhanced_model else 'standard',
-                'api_type': 'long_running'
+                'api_type': api_type,
+                'cache_hit': api_type == 'cache'
             }
+            if api_type == 'chunked':
+                processed_result['metadata']['chunk_count'] = processed_result.pop('chunk_count')
 
             logger.info(f"STT 및 화자 분리 완료 - 처리시간: {processing_time:.2f}초")
             return processed_result
@@ -165,11 +198,182 @@ class GoogleCloudSpeechConnector:
                 'transcript': ''
             }
 
-    def _get_audio_metadata(self, audio_path: str) -> Dict[str, Any]:
-        """오디오 파일 메타데이터 추출"""
+    async def _transcribe_single(
+        self,
+        audio_path: str,
+        decoded_audio: Optional[DecodedAudio],
+        language_code: str,
+        config: speech.RecognitionConfig,
+        audio_metadata: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], str]:
+        """전체 파일 단일 Long Running 인식 (전사 캐시 사용)"""
+
+        # 오디오 해시 (원본은 1MB 블록으로 한 번만 읽고 blob 이름에도 재사용)
+        audio_hash = await asyncio.to_thread(self._get_audio_hash, audio_path, decoded_audio)
+        cache_key = None
+        if audio_hash and self.transcript_cache:
+            cache_key = make_cache_key(audio_hash, language_code, self._get_config_digest(config))
+
+        # 캐시 적중 시 업로드와 인식 생략
+        result = await self._load_cached_response(cache_key)
+        cache_hit = result is not None
+        gs_uri = None
+
+        if cache_hit:
+            logger.info(f"STT 캐시 적중 - 업로드/인식 생략 ({cache_key[:12]})")
+        else:
+            # GCS에 스트리밍 업로드 (Long Running API는 Storage URI 필요)
+            gs_uri = await self._upload_to_storage(audio_path, decoded_audio, file_hash=audio_hash)
+            logger.info(f"오디오 파일 Storage 업로드 완료: {gs_uri}")
+
+            # Long Running API 실행 및 완료 대기 (프로세스당 동시 작업 수 제한)
+            async with self.operation_waiter.slot():
+                operation = await self._start_long_running_recognition(gs_uri, config)
+                result = await self._wait_for_operation(operation)
+
+            await self._store_cached_response(cache_key, result)
+
+        # 화자 분리 결과 처리
+        processed_result = self._process_diarization_result(result, audio_metadata)
+
+        # 화자 신뢰도 및 검증
+        processed_result = self._validate_speaker_separation(processed_result)
+
+        # Storage 정리 (임시 파일)
+        if gs_uri and 'temp/' in gs_uri:
+            await self._cleanup_storage(gs_uri)
+
+        return processed_result, 'cache' if cache_hit else 'long_running'
+
+    async def iter_chunked_transcription(
+        self,
+        decoded_audio: DecodedAudio,
+        config: speech.RecognitionConfig
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        청크 병렬 인식 결과를 녹음 순서대로 생성
+
+        모든 청크를 chunk_concurrency개까지 동시에 인식하고, 앞 청크부터 완료되는 즉시
+        전체 기준 화자 ID로 맞춘 결과를 내보낸다. 소비자가 중단하면 남은 인식은 취소된다.
+
+        Args:
+            decoded_audio: 디코딩된 오디오 버퍼
+            config: 인식 설정 (LINEAR16 16kHz)
+
+        Yields:
+            index, start_time, end_time, is_last, segments, transcript, word_table
+        """
+        sr = 16000
+        samples = decoded_audio.resample(sr)
+        pcm = await asyncio.to_thread(decoded_audio.to_linear16, sr)
+        chunks = await asyncio.to_thread(
+            plan_chunks, samples, sr,
+            target_duration=self.chunk_duration,
+            min_duration=self.chunk_duration / 2,
+            max_duration=self.chunk_duration * 1.5
+        )
+        logger.info(f"청크 STT 시작: {len(chunks)}개 청크, 동시 {self.chunk_concurrency}개")
+
+        semaphore = asyncio.Semaphore(self.chunk_concurrency)
+
+        async def recognize(chunk) -> Any:
+            async with semaphore, self.operation_waiter.slot():
+                # 60초 내외 LINEAR16은 인라인 전송 한도 안이므로 Storage 업로드 생략
+                audio = speech.RecognitionAudio(content=pcm[chunk.start:chunk.end].tobytes())
+                operation = await asyncio.to_thread(
+                    self.client.long_running_recognize,
+                    config=config,
+                    audio=audio,
+                    retry=retry.Retry(deadline=600)
+                )
+                return await self._wait_for_operation(operation)
+
+        tasks = [asyncio.create_task(recognize(chunk)) for chunk in chunks]
+        stitcher = SpeakerStitcher(sample_rate=sr)
+        try:
+            for chunk, task in zip(chunks, tasks):
+                response = await task
+                table, _ = self._build_word_table(response.results)
+                table = await asyncio.to_thread(stitcher.add_chunk, table, chunk, samples)
+                yield {
+                    'index': chunk.index,
+                    **chunk.bounds_seconds(sr),
+                    'is_last': chunk.index == len(chunks) - 1,
+                    'segments': self._segments_from_word_table(dict(table)),
+                    'transcript': ' '.join(table['word']),
+                    'word_table': table
+                }
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            # 취소한 인식이 실제로 끝날 때까지 기다리고, 소비되지 않은 예외도 회수
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _transcribe_chunked(
+        self,
+        audio_path: str,
+        decoded_audio: Optional[DecodedAudio],
+        config: speech.RecognitionConfig,
+        on_chunk: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> Dict[str, Any]:
+        """청크 병렬 인식 후 단일 인식과 같은 형식의 결과로 조립"""
+        if decoded_audio is None:
+            decoded_audio = await asyncio.to_thread(DecodedAudio.from_file, audio_path)
+
+        tables = []
+        # 중간에 실패해도 남은 청크 인식을 즉시 정리하도록 생성기를 명시적으로 닫음
+        async with aclosing(self.iter_chunked_transcription(decoded_audio, config)) as chunk_results:
+            async for chunk_result in chunk_results:
+                tables.append(chunk_result['word_table'])
+                if on_chunk is not None:
+                    callback_result = on_chunk(chunk_result)
+                    if asyncio.iscoroutine(callback_result):
+                        await callback_result
+
+        table = concat_word_tables(tables)
+        segments = self._segments_from_word_table(table)
+        speaker_stats = self._speaker_stats_from_word_table(table, segments)
+
+        processed_result = self._validate_speaker_separation({
+            'status': 'success',
+            'segments': segments,
+            'transcript': ' '.join(table['word']),
+            'speaker_stats': speaker_stats,
+            'total_segments': len(segments),
+            'total_speakers': len(speaker_stats)
+        })
+        processed_result['chunk_count'] = len(tables)
+        return processed_result
+
+    def _get_audio_metadata(
+        self,
+        audio_path: str,
+        decoded_audio: Optional[DecodedAudio] = None
+    ) -> Dict[str, Any]:
+        """
+        오디오 파일 메타데이터 추출
+
+        디코딩된 버퍼가 없으면 파일 헤더만 읽는다 (전사 캐시 적중 시에도 전체 디코딩 없음).
+        품질 지표(SNR, 에너지)는 버퍼가 이미 메모리에 있을 때만 계산한다.
+        """
         try:
-            # librosa로 오디오 정보 추출
-            y, sr = librosa.load(audio_path, sr=None, mono=True)
+            file_size = os.path.getsize(audio_path) if os.path.exists(audio_path) else 0
+
+            if decoded_audio is None:
+                # 헤더 기반 길이/샘플레이트 (soundfile, 실패 시 audioread)
+                sr = librosa.get_samplerate(audio_path)
+                duration = librosa.get_duration(path=audio_path)
+                return {
+                    'duration': duration,
+                    'sample_rate': sr,
+                    'channels': 1,  # mono로 변환
+                    'total_samples': int(round(duration * sr)),
+                    'file_size': file_size
+                }
+
+            # 요청 단위로 디코딩된 버퍼 재사용
+            y, sr = decoded_audio.samples, decoded_audio.sample_rate
             duration = len(y) / sr
 
             # 추가 메타데이터
@@ -178,7 +382,7 @@ class GoogleCloudSpeechConnector:
                 'sample_rate': sr,
                 'channels': 1,  # mono로 변환
                 'total_samples': len(y),
-                'file_size': os.path.getsize(audio_path) if os.path.exists(audio_path) else 0
+                'file_size': file_size
             }
 
             # 오디오 품질 평가
@@ -208,64 +412,52 @@ class GoogleCloudSpeechConnector:
         except:
             return 20.0
 
-    async def _upload_to_storage(self, audio_path: str) -> str:
-        """Firebase Storage 또는 Google Cloud Storage에 업로드 (PCM 변환 포함)"""
+    async def _upload_to_storage(
+        self,
+        audio_path: str,
+        decoded_audio: Optional[DecodedAudio] = None,
+        file_hash: Optional[str] = None
+    ) -> str:
+        """Google Cloud Storage에 LINEAR16 PCM으로 스트리밍 업로드 (임시 파일 없음)"""
         try:
-            # 파일 해시로 중복 체크
-            file_hash = self._get_file_hash(audio_path)
-
-            # 오디오 형식 변환 (PCM LINEAR16으로)
-            converted_path = await self._convert_to_linear16(audio_path)
-
-            # Firebase Storage 우선 시도
-            if self.storage_connector:
-                gs_uri, blob_name = self.storage_connector.upload_temp_audio(converted_path)
+            # 파일 해시로 중복 체크 (호출자가 이미 계산했으면 재사용)
+            if file_hash is None:
+                file_hash = await asyncio.to_thread(self._get_audio_hash, audio_path, decoded_audio)
 
-                # Firebase Storage는 로컬 경로를 반환하므로 GCS URI 형식으로 변환
-                if not gs_uri.startswith('gs://'):
-                    # Google Cloud Storage에 직접 업로드
-                    gs_uri = await self._upload_to_gcs(converted_path, file_hash)
-
-                # 임시 변환 파일 삭제
-                if converted_path != audio_path:
-                    os.unlink(converted_path)
-
-                return gs_uri
-            else:
-                # Google Cloud Storage 직접 업로드
-                gs_uri = await self._upload_to_gcs(converted_path, file_hash)
-
-                # 임시 변환 파일 삭제
-                if converted_path != audio_path:
-                    os.unlink(converted_path)
-
-                return gs_uri
+            # 변환과 업로드는 블로킹 작업이므로 스레드에서 실행
+            return await asyncio.to_thread(
+                self._upload_to_gcs, audio_path, file_hash or 'nohash', decoded_audio
+            )
 
         except Exception as e:
             logger.error(f"Storage 업로드 실패: {e}")
             raise
 
-    async def _upload_to_gcs(self, audio_path: str, file_hash: str) -> str:
-        """Google Cloud Storage에 직접 업로드"""
+    def _upload_to_gcs(
+        self,
+        audio_path: str,
+        file_hash: str,
+        decoded_audio: Optional[DecodedAudio] = None
+    ) -> str:
+        """
+        LINEAR16 변환 블록을 Google Cloud Storage resumable 업로드로 바로 전송
+
+        인코딩은 별도 스레드(또는 FFmpeg 프로세스)에서 몇 블록 앞서 진행되어 업로드와 겹친다.
+        """
         try:
             bucket = self.storage_client.bucket(self.bucket_name)
+            stream = open_linear16_stream(audio_path, decoded_audio, target_sr=16000)
 
             # 고유한 blob 이름 생성
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = Path(audio_path).name
+            filename = f"{Path(audio_path).stem}_linear16.{stream.extension}"
             blob_name = f"audio/temp/{timestamp}_{file_hash[:8]}_{filename}"
 
             blob = bucket.blob(blob_name)
-
-            # 업로드 (재시도 포함)
-            with open(audio_path, 'rb') as audio_file:
-                blob.upload_from_file(
-                    audio_file,
-                    retry=retry.Retry(deadline=300)  # 5분 타임아웃
-                )
+            uploaded = upload_blocks(blob, prefetch(stream.blocks), stream.content_type)
 
             gs_uri = f"gs://{self.bucket_name}/{blob_name}"
-            logger.info(f"GCS 업로드 완료: {gs_uri}")
+            logger.info(f"GCS 스트리밍 업로드 완료: {gs_uri} ({uploaded / 1024 / 1024:.1f}MB)")
 
             return gs_uri
 
@@ -273,52 +465,65 @@ class GoogleCloudSpeechConnector:
             logger.error(f"GCS 업로드 실패: {e}")
             raise
 
-    def _get_file_hash(self, file_path: str) -> str:
-        """파일 해시 계산"""
+    def _get_file_hash(self, file_path: str, block_size: int = 1024 * 1024) -> str:
+        """파일 해시 계산 (1MB 블록 단위)"""
         hash_md5 = hashlib.md5()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in iter(lambda: f.read(block_size), b""):
                 hash_md5.update(chunk)
         return hash_md5.hexdigest()
 
-    async def _convert_to_linear16(self, audio_path: str) -> str:
-        """오디오를 LINEAR16 PCM 형식으로 변환"""
-        try:
-            # 이미 WAV 파일인지 확인
-            if audio_path.lower().endswith('.wav'):
-                # WAV 파일이어도 형식 확인 및 변환
-                audio, sr = librosa.load(audio_path, sr=16000, mono=True)
-
-                # 16-bit PCM으로 변환
-                audio_16bit = (audio * 32767).astype(np.int16)
-
-                # 임시 파일로 저장
-                temp_path = audio_path.replace('.wav', '_linear16.wav')
-                sf.write(temp_path, audio_16bit, 16000, subtype='PCM_16')
-
-                logger.info(f"WAV 파일을 LINEAR16 PCM으로 변환: {temp_path}")
-                return temp_path
-            else:
-                # m4a, mp3 등 다른 형식
-                logger.info(f"오디오 형식 변환 시작: {audio_path}")
-
-                # librosa로 로드 (자동으로 디코딩)
-                audio, sr = librosa.load(audio_path, sr=16000, mono=True)
+    def _get_audio_hash(
+        self,
+        audio_path: str,
+        decoded_audio: Optional[DecodedAudio] = None
+    ) -> Optional[str]:
+        """
+        오디오 내용 해시 (로컬 파일이 없으면 디코딩된 PCM 기준, 둘 다 없으면 None)
 
-                # 16-bit PCM으로 변환
-                audio_16bit = (audio * 32767).astype(np.int16)
+        캐시 키는 업로드 전에 알아야 적중 시 변환/업로드를 생략할 수 있고, 업로드되는 것은
+        원본이 아닌 LINEAR16 변환본이므로 업로드 스트림에서 해시를 계산하지 않는다.
+        원본은 여기서 1MB 블록으로 한 번 읽고, 결과는 blob 이름에도 재사용한다.
+        """
+        if os.path.exists(audio_path):
+            return self._get_file_hash(audio_path)
+        if decoded_audio is not None:
+            samples = np.ascontiguousarray(decoded_audio.samples)
+            return hashlib.md5(memoryview(samples).cast('B')).hexdigest()
+        return None
+
+    @staticmethod
+    def _get_config_digest(config: speech.RecognitionConfig) -> str:
+        """인식 설정 지문 (설정이 바뀌면 캐시 키도 바뀜)"""
+        return hashlib.sha256(speech.RecognitionConfig.serialize(config)).hexdigest()
+
+    async def _load_cached_response(self, cache_key: Optional[str]) -> Optional[Any]:
+        """캐시된 Speech API 응답 복원"""
+        if cache_key is None:
+            return None
+
+        data = await asyncio.to_thread(self.transcript_cache.get, cache_key)
+        if data is None:
+            return None
 
-                # 임시 WAV 파일로 저장
-                temp_path = audio_path + '_linear16.wav'
-                sf.write(temp_path, audio_16bit, 16000, subtype='PCM_16')
+        try:
+            return speech.LongRunningRecognizeResponse.deserialize(data)
+        except Exception as e:
+            logger.warning(f"STT 캐시 항목 복원 실패, 재인식 진행: {e}")
+            return None
 
-                logger.info(f"오디오를 LINEAR16 PCM으로 변환 완료: {temp_path}")
-                return temp_path
+    async def _store_cached_response(self, cache_key: Optional[str], response: Any):
+        """Speech API 원본 응답 저장 (후처리 로직이 바뀌어도 재사용 가능)"""
+        if cache_key is None:
+            return
 
+        try:
+            data = type(response).serialize(response)
         except Exception as e:
-            logger.error(f"오디오 변환 실패: {e}")
-            # 변환 실패 시 원본 파일 반환
-            return audio_path
+            logger.warning(f"STT 응답 직렬화 실패, 캐시 저장 생략: {e}")
+            return
+
+        await asyncio.to_thread(self.transcript_cache.set, cache_key, data)
 
     def _build_recognition_config(
         self,
@@ -379,8 +584,9 @@ class GoogleCloudSpeechConnector:
 
         audio = speech.RecognitionAudio(uri=gs_uri)
 
-        # Long Running 작업 시작
-        operation = self.client.long_running_recognize(
+        # Long Running 작업 시작 (요청 RPC는 스레드에서 실행)
+        operation = await asyncio.to_thread(
+            self.client.long_running_recognize,
             config=config,
             audio=audio,
             retry=retry.Retry(deadline=600)  # 10분 타임아웃
@@ -399,62 +605,49 @@ class GoogleCloudSpeechConnector:
 
         return operation
 
-    async def _wait_for_operation(self, operation: Any, poll_interval: int = 5) -> Any:
-        """Long Running 작업 완료 대기"""
+    async def _wait_for_operation(self, operation: Any, timeout: float = 1800) -> Any:
+        """
+        Long Running 작업 완료 대기 (이벤트 루프 비점유)
+
+        done()을 지수 백오프 간격으로 폴링하며, 요청 태스크가 취소되면
+        원격 작업도 취소 요청한다.
+        """
 
         logger.info("작업 진행 상황 모니터링 시작...")
 
         try:
-            # result() 메서드를 사용하여 완료 대기 (권장 방식)
-            # timeout을 설정하여 최대 30분까지 대기
-            result = operation.result(timeout=1800)  # 30분 타임아웃
+            result = await self.operation_waiter.wait(operation, timeout=timeout)
             logger.info("Long Running Recognition 완료")
             return result
 
+        except asyncio.CancelledError:
+            logger.warning("Speech API 작업 대기 취소됨 - 원격 작업 취소 요청")
+            raise
+
         except Exception as e:
             logger.error(f"Speech API 작업 대기 중 오류: {e}")
-            # 대체 방법: 폴링을 통한 수동 대기
-            try:
-                start_time = time.time()
-                while True:
-                    # done() 메서드가 있는 경우만 사용
-                    if hasattr(operation, 'done') and callable(operation.done):
-                        if operation.done():
-                            break
-
-                    # 타임아웃 체크
-                    if time.time() - start_time > 1800:
-                        raise TimeoutError("STT 처리 시간 초과 (30분)")
-
-                    await asyncio.sleep(poll_interval)
-
-                # 결과 가져오기
-                if hasattr(operation, 'result'):
-                    result = operation.result()
-                    logger.info("Long Running Recognition 완료 (폴백 방식)")
-                    return result
-                else:
-                    raise RuntimeError("Operation 객체에 result() 메서드가 없습니다")
+            raise
 
-            except Exception as fallback_error:
-                logger.error(f"폴백 방식도 실패: {fallback_error}")
-                raise
+        finally:
+            # 완료/취소된 작업 객체는 캐시에서 해제
+            self.operation_cache.pop(str(id(operation)), None)
 
     def _process_diarization_result(
         self,
         result: Any,
         audio_metadata: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """화자 분리 결과 처리"""
+        """
+        화자 분리 결과 처리
 
-        segments = []
-        full_transcript = []
-        speaker_stats = {}
+        단어를 (시작, 종료, 화자, 신뢰도) 병렬 배열로 한 번만 모은 뒤, 화자 변경 지점의
+        run-length로 세그먼트를, np.bincount로 화자 통계를 계산한다.
+        """
 
-        # 🔍 상세 디버깅: API 응답 구조 분석
-        logger.info(f"🔍 API 응답 분석: result.results 개수={len(result.results) if hasattr(result, 'results') and result.results else 0}")
+        result_count = len(result.results) if hasattr(result, 'results') and result.results else 0
+        logger.info(f"🔍 API 응답 분석: result.results 개수={result_count}")
 
-        if not hasattr(result, 'results') or not result.results:
+        if not result_count:
             logger.error("⚠️ result.results가 없거나 비어있음")
             return {
                 'status': 'error',
@@ -464,134 +657,158 @@ class GoogleCloudSpeechConnector:
                 'error': 'API 결과에 results 속성이 없음'
             }
 
-        # 각 결과 처리
-        for i, result_item in enumerate(result.results):
-            alternative = result_item.alternatives[0] if result_item.alternatives else None
+        table, full_transcript = self._build_word_table(result.results)
+        segments = self._segments_from_word_table(table)
+        speaker_stats = self._speaker_stats_from_word_table(table, segments)
 
-            logger.info(f"🔍 결과 {i}: alternatives 개수={len(result_item.alternatives) if result_item.alternatives else 0}")
+        logger.info(f"화자분리 결과: segments={len(segments)}, speakers={len(speaker_stats)}")
+        if len(segments) == 0:
+            logger.warning("⚠️ 화자분리 결과가 비어있음!")
+            logger.warning(f"전체 결과 수: {result_count}")
+            for i, result_item in enumerate(result.results):
+                if result_item.alternatives:
+                    alt = result_item.alternatives[0]
+                    logger.warning(f"결과 {i}: transcript='{alt.transcript}', words={len(alt.words)}")
+                    if alt.words:
+                        logger.warning(f"speaker_tag 존재여부: {hasattr(alt.words[0], 'speaker_tag')}")
 
+        return {
+            'status': 'success',
+            'segments': segments,
+            'transcript': ' '.join(full_transcript),
+            'speaker_stats': speaker_stats,
+            'total_segments': len(segments),
+            'total_speakers': len(speaker_stats)
+        }
+
+    def _build_word_table(self, results: Any) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        인식 결과의 단어를 병렬 배열 테이블로 변환 (화자 태그 없는 단어 제외)
+
+        Returns:
+            (word/start/end/speaker/confidence/result 배열 테이블, 결과별 전체 텍스트 목록)
+        """
+        words: List[str] = []
+        starts: List[float] = []
+        ends: List[float] = []
+        speakers: List[int] = []
+        confidences: List[float] = []
+        result_ids: List[int] = []
+        full_transcript: List[str] = []
+        missing_tags = 0
+
+        for i, result_item in enumerate(results):
+            alternative = result_item.alternatives[0] if result_item.alternatives else None
             if not alternative:
                 logger.warning(f"⚠️ 결과 {i}에 alternative가 없음")
                 continue
 
-            # 화자별 단어 처리
-            current_speaker = None
-            current_segment = None
-
-            words_count = len(alternative.words) if alternative.words else 0
-            logger.info(f"🔍 결과 {i}: 단어 수={words_count}")
-
-            if words_count == 0:
+            if not alternative.words:
                 logger.warning(f"⚠️ 결과 {i}에 단어가 없음")
                 continue
 
-            # 화자분리 디버깅: 첫 번째 단어의 모든 속성 확인
-            if i == 0 and alternative.words:
-                first_word = alternative.words[0]
-                word_attrs = [attr for attr in dir(first_word) if not attr.startswith('_')]
-                logger.info(f"🎯 첫 단어의 모든 속성: {word_attrs}")
-                logger.info(f"🎯 speaker_tag 존재 여부: {'speaker_tag' in word_attrs}")
-                if hasattr(first_word, 'speaker_tag'):
-                    logger.info(f"🎯 첫 단어 speaker_tag 값: {first_word.speaker_tag}")
-                else:
-                    logger.warning("🚨 speaker_tag 속성이 없음 - 화자분리 설정 확인 필요")
-
-            # 처음 몇 개 단어의 speaker_tag 확인 (디버깅용)
-            for j, word in enumerate(alternative.words[:5]):
-                speaker_tag = getattr(word, 'speaker_tag', None)
-                word_attrs = [attr for attr in dir(word) if not attr.startswith('_')] if speaker_tag is None else []
-                logger.info(f"🔍 단어 {j}: '{word.word}' speaker_tag={speaker_tag}" +
-                           (f" 속성: {word_attrs}" if word_attrs else ""))
+            logger.debug(f"🔍 결과 {i}: 단어 수={len(alternative.words)}")
 
             for word_info in alternative.words:
                 speaker_tag = getattr(word_info, 'speaker_tag', None)
-                logger.debug(f"단어: {word_info.word}, speaker_tag: {speaker_tag}")
-
                 if speaker_tag is None:
-                    logger.warning(f"단어 '{word_info.word}'에 speaker_tag가 없음")
+                    missing_tags += 1
                     continue
 
-                # 화자 변경 감지
-                if speaker_tag != current_speaker:
-                    # 이전 세그먼트 저장
-                    if current_segment:
-                        segments.append(current_segment)
-
-                    # 새 세그먼트 시작
-                    current_speaker = speaker_tag
-                    current_segment = {
-                        'speaker_id': speaker_tag,
-                        'text': word_info.word,
-                        'start_time': word_info.start_time.total_seconds(),
-                        'end_time': word_info.end_time.total_seconds(),
-                        'confidence': word_info.confidence if hasattr(word_info, 'confidence') else 1.0,
-                        'words': [word_info.word]
-                    }
-
-                    # 화자 통계 업데이트
-                    if speaker_tag not in speaker_stats:
-                        speaker_stats[speaker_tag] = {
-                            'total_duration': 0,
-                            'word_count': 0,
-                            'segment_count': 0,
-                            'avg_confidence': []
-                        }
-                    speaker_stats[speaker_tag]['segment_count'] += 1
+                words.append(word_info.word)
+                starts.append(word_info.start_time.total_seconds())
+                ends.append(word_info.end_time.total_seconds())
+                speakers.append(speaker_tag)
+                confidences.append(getattr(word_info, 'confidence', 1.0))
+                result_ids.append(i)
 
-                else:
-                    # 현재 세그먼트에 단어 추가
-                    if current_segment:
-                        current_segment['text'] += ' ' + word_info.word
-                        current_segment['words'].append(word_info.word)
-                        current_segment['end_time'] = word_info.end_time.total_seconds()
-
-                # 화자 통계 업데이트
-                if speaker_tag in speaker_stats:
-                    speaker_stats[speaker_tag]['word_count'] += 1
-                    if hasattr(word_info, 'confidence'):
-                        speaker_stats[speaker_tag]['avg_confidence'].append(word_info.confidence)
-
-            # 마지막 세그먼트 저장
-            if current_segment:
-                segments.append(current_segment)
-
-            # 전체 텍스트
             full_transcript.append(alternative.transcript)
 
-        # 세그먼트 후처리
-        for segment in segments:
-            segment['duration'] = segment['end_time'] - segment['start_time']
+        if missing_tags:
+            logger.warning(f"🚨 speaker_tag가 없는 단어 {missing_tags}개 제외 - 화자분리 설정 확인 필요")
 
-        # 화자 통계 계산
-        for speaker_id, stats in speaker_stats.items():
-            stats['total_duration'] = sum(
-                seg['duration'] for seg in segments if seg['speaker_id'] == speaker_id
-            )
-            stats['avg_confidence'] = np.mean(stats['avg_confidence']) if stats['avg_confidence'] else 1.0
-            stats['speaking_rate'] = stats['word_count'] / max(stats['total_duration'], 1)
+        table = {
+            'word': words,
+            'start': np.asarray(starts, dtype=np.float64),
+            'end': np.asarray(ends, dtype=np.float64),
+            'speaker': np.asarray(speakers, dtype=np.int64),
+            'confidence': np.asarray(confidences, dtype=np.float64),
+            'result': np.asarray(result_ids, dtype=np.int64)
+        }
+        return table, full_transcript
+
+    @staticmethod
+    def _segment_bounds(table: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """세그먼트 [시작, 끝) 단어 인덱스 (화자 또는 결과 항목이 바뀌는 지점에서 분할)"""
+        speaker, result_id = table['speaker'], table['result']
+        if len(speaker) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+
+        changes = (speaker[1:] != speaker[:-1]) | (result_id[1:] != result_id[:-1])
+        first = np.concatenate(([0], np.flatnonzero(changes) + 1))
+        stop = np.concatenate((first[1:], [len(speaker)]))
+        return first, stop
+
+    def _segments_from_word_table(self, table: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """화자 run-length 단위 세그먼트 생성"""
+        first, stop = self._segment_bounds(table)
+        table['segment_first'] = first
+
+        words = table['word']
+        speakers = table['speaker'][first].tolist()
+        start_times = table['start'][first].tolist()
+        end_times = table['end'][stop - 1].tolist()
+        confidences = table['confidence'][first].tolist()
 
-        # 디버깅 로그 추가
-        logger.info(f"화자분리 결과: segments={len(segments)}, speakers={len(speaker_stats)}")
-        if len(segments) == 0:
-            logger.warning("⚠️ 화자분리 결과가 비어있음!")
-            logger.warning(f"전체 결과 수: {len(result.results)}")
-            for i, result_item in enumerate(result.results):
-                if result_item.alternatives:
-                    alt = result_item.alternatives[0]
-                    logger.warning(f"결과 {i}: transcript='{alt.transcript}', words={len(alt.words)}")
-                    if alt.words:
-                        word_sample = alt.words[0]
-                        logger.warning(f"첫 번째 단어 속성: {dir(word_sample)}")
-                        logger.warning(f"speaker_tag 존재여부: {hasattr(word_sample, 'speaker_tag')}")
+        segments = []
+        for speaker_id, a, b, start_time, end_time, confidence in zip(
+            speakers, first.tolist(), stop.tolist(), start_times, end_times, confidences
+        ):
+            segment_words = words[a:b]
+            segments.append({
+                'speaker_id': speaker_id,
+                'text': ' '.join(segment_words),
+                'start_time': start_time,
+                'end_time': end_time,
+                'confidence': confidence,
+                'words': segment_words,
+                'duration': end_time - start_time
+            })
+        return segments
+
+    @staticmethod
+    def _speaker_stats_from_word_table(
+        table: Dict[str, Any],
+        segments: List[Dict[str, Any]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """화자별 통계 (첫 등장 순서, np.bincount 집계)"""
+        speaker = table['speaker']
+        if len(speaker) == 0:
+            return {}
+
+        tags, first_seen, word_index = np.unique(speaker, return_index=True, return_inverse=True)
+        segment_index = word_index[table['segment_first']]
+        durations = np.asarray([segment['duration'] for segment in segments], dtype=np.float64)
+        n_speakers = len(tags)
+
+        word_counts = np.bincount(word_index, minlength=n_speakers)
+        confidence_sums = np.bincount(word_index, weights=table['confidence'], minlength=n_speakers)
+        segment_counts = np.bincount(segment_index, minlength=n_speakers)
+        total_durations = np.bincount(segment_index, weights=durations, minlength=n_speakers)
 
-        return {
-            'status': 'success',
-            'segments': segments,
-            'transcript': ' '.join(full_transcript),
-            'speaker_stats': speaker_stats,
-            'total_segments': len(segments),
-            'total_speakers': len(speaker_stats)
-        }
+        speaker_stats = {}
+        for k in np.argsort(first_seen, kind='stable'):
+            word_count = int(word_counts[k])
+            total_duration = float(total_durations[k])
+            speaker_stats[int(tags[k])] = {
+                'total_duration': total_duration,
+                'word_count': word_count,
+                'segment_count': int(segment_counts[k]),
+                'avg_confidence': float(confidence_sums[k] / word_count),
+                'speaking_rate': word_count / max(total_duration, 1)
+            }
+        return speaker_stats
 
     def _validate_speaker_separation(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """화자 분리 결과 검증 및 보정"""
@@ -707,8 +924,8 @@ class OpenAIConnector:
         if not self.api_key:
             raise ValueError("OpenAI API 키가 필요합니다")
 
-        # OpenAI 클라이언트 초기화 (1.51.0 동기 버전 사용)
-        self.client = OpenAI(api_key=self.api_key)
+        # 프로세스 공유 비동기 클라이언트 풀 (동시 호출 수/속도/시간 제한)
+        self.pool = get_llm_client_pool()
 
         logger.info("OpenAI API 연동 초기화 완료")
 
@@ -737,20 +954,19 @@ class OpenAIConnector:
             # 사용자 프롬프트 구성
             user_prompt = self._build_user_prompt(text, context)
 
-            # API 호출
-            # 동기 클라이언트를 비동기로 실행
-            import asyncio
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.3,
-                max_tokens=2000,
-                response_format={"type": "json_object"}
+            # API 호출 (공유 비동기 클라이언트)
+            client = self.pool.openai_client(self.api_key)
+            response = await self.pool.call(
+                'openai',
+                lambda: client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=0.3,
+                    max_tokens=2000,
+                    response_format={"type": "json_object"}
                 )
             )
 
@@ -845,18 +1061,14 @@ class XAIConnector:
             api_key: XAI API 키
         """
         self.api_key = api_key or os.getenv('XAI_API_KEY')
-        self.base_url = "https://api.x.ai/v1"
         self.model = "grok-4-0709"
 
+        # 프로세스 공유 비동기 클라이언트 풀 (api.x.ai, OpenAI 호환)
+        self.pool = get_llm_client_pool()
+
         if not self.api_key:
             logger.warning("XAI API 키가 없습니다 - OpenAI로 fallback됩니다")
-            self.client = None
         else:
-            from openai import AsyncOpenAI
-            self.client = AsyncOpenAI(
-                api_key=self.api_key,
-                base_url=self.base_url
-            )
             logger.info("XAI (Grok) API 연동 초기화 완료")
 
     async def analyze_text(
@@ -877,7 +1089,7 @@ class XAIConnector:
             분석 결과
         """
 
-        if not self.client:
+        if not self.api_key:
             raise ValueError("XAI API가 초기화되지 않았습니다")
 
         try:
@@ -887,20 +1099,19 @@ class XAIConnector:
             # 사용자 프롬프트 구성
             user_prompt = self._build_user_prompt(text, context)
 
-            # API 호출
-            # 동기 클라이언트를 비동기로 실행
-            import asyncio
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.3,
-                max_tokens=2000,
-                response_format={"type": "json_object"}
+            # API 호출 (공유 비동기 클라이언트)
+            client = self.pool.xai_client(self.api_key)
+            response = await self.pool.call(
+                'xai',
+                lambda: client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=0.3,
+                    max_tokens=2000,
+                    response_format={"type": "json_object"}
                 )
             )
 
@@ -1001,6 +1212,9 @@ class GeminiConnector:
             self.client = genai.GenerativeModel('gemini-2.0-flash-exp')
             logger.info("Gemini API 연동 초기화 완료")
 
+        # 프로세스 공유 호출 제한 (Gemini 비동기 클라이언트는 SDK가 관리)
+        self.pool = get_llm_client_pool()
+
     async def analyze_text(
         self,
         text: str,
@@ -1032,13 +1246,15 @@ class GeminiConnector:
             # 전체 프롬프트 조합
             full_prompt = f"{system_prompt}\n\n{user_prompt}"
 
-            # Gemini API 호출
-            response = await asyncio.to_thread(
-                self.client.generate_content,
-                full_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,
-                    max_output_tokens=2000,
+            # Gemini API 호출 (비동기)
+            response = await self.pool.call(
+                'gemini',
+                lambda: self.client.generate_content_async(
+                    full_prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        temperature=0.3,
+                        max_output_tokens=2000,
+                    )
                 )
             )
 
@@ -1143,7 +1359,8 @@ JSON 형식으로만 응답해주세요:
                     "key_topics": ["일반적 대화"],
                     "concerns": [],
                     "coherence_score": 0.7,
-                    "interpretation": "JSON 파싱 실패로 인한 기본값"
+                    "interpretation": "JSON 파싱 실패로 인한 기본값",
+                    "parse_error": True
                 }
         except:
             return {
@@ -1157,7 +1374,8 @@ JSON 형식으로만 응답해주세요:
                 "key_topics": ["파싱 오류"],
                 "concerns": [],
                 "coherence_score": 0.5,
-                "interpretation": "응답 파싱 실패"
+                "interpretation": "응답 파싱 실패",
+                "parse_error": True
             }
 
 
@@ -1185,7 +1403,7 @@ class MultiLLMConnector:
         # OpenAI 커넥터 초기화 (2순위)
         try:
             self.openai_connector = OpenAIConnector(openai_api_key)
-            self.openai_available = self.openai_connector.client is not None
+            self.openai_available = bool(self.openai_connector.api_key)
         except Exception as e:
             logger.warning(f"OpenAI 커넥터 초기화 실패: {e}")
             self.openai_connector = None
@@ -1194,7 +1412,7 @@ class MultiLLMConnector:
         # XAI 커넥터 초기화 (3순위)
         try:
             self.xai_connector = XAIConnector(xai_api_key)
-            self.xai_available = self.xai_connector.client is not None
+            self.xai_available = bool(self.xai_connector.api_key)
         except Exception as e:
             logger.warning(f"XAI 커넥터 초기화 실패: {e}")
             self.xai_connector = None
@@ -1204,8 +1422,21 @@ class MultiLLMConnector:
         if not self.gemini_available and not self.openai_available and not self.xai_available:
             raise ValueError("Gemini, OpenAI, XAI API 모두 사용할 수 없습니다")
 
+        # 헤징 정책 (1순위가 최근 지연 분위수 안에 응답하지 않으면 다음 제공자 동시 시작)
+        self.hedging_enabled = os.getenv('LLM_HEDGING_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+        self.hedge_policy = HedgePolicy(
+            percentile=float(os.getenv('LLM_HEDGE_PERCENTILE', '95')) / 100.0,
+            min_delay=float(os.getenv('LLM_HEDGE_MIN_DELAY', '1.0')),
+            max_delay=float(os.getenv('LLM_HEDGE_MAX_DELAY', '30.0')),
+            default_delay=float(os.getenv('LLM_HEDGE_DEFAULT_DELAY', '10.0'))
+        )
+
         logger.info(f"MultiLLM 초기화 완료 - Gemini: {self.gemini_available}, OpenAI: {self.openai_available}, XAI: {self.xai_available}")
 
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """제공자별 동시 호출/대기 상태"""
+        return get_llm_client_pool().get_stats()
+
     async def analyze_text(
         self,
         text: str,
@@ -1215,6 +1446,9 @@ class MultiLLMConnector:
         """
         텍스트 분석 (Gemini 1순위, OpenAI 2순위, XAI 3순위)
 
+        앞 순위 제공자가 실패하거나 최근 지연 분위수(헤지 지연) 안에 응답하지 않으면
+        다음 제공자를 시작하고, 먼저 도착한 유효한 응답을 사용한다.
+
         Args:
             text: 분석할 텍스트
             context: 추가 컨텍스트
@@ -1236,73 +1470,63 @@ class MultiLLMConnector:
                 logger.info("XAI 강제 사용 모드")
                 return await self.xai_connector.analyze_text(text, context)
 
-        # Gemini 우선 시도 (1순위)
-        if self.gemini_available:
-            try:
-                logger.info("Gemini API 시도 중...")
-                result = await self.gemini_connector.analyze_text(text, context)
-                logger.info("Gemini API 성공")
-                return result
-
-            except Exception as e:
-                logger.warning(f"Gemini API 실패, OpenAI로 fallback: {e}")
-
-                # OpenAI fallback (2순위)
-                if self.openai_available:
-                    try:
-                        logger.info("OpenAI API fallback 시도 중...")
-                        result = await self.openai_connector.analyze_text(text, context)
-                        result['fallback_used'] = True
-                        result['fallback_reason'] = str(e)
-                        logger.info("OpenAI API fallback 성공")
-                        return result
-                    except Exception as openai_error:
-                        logger.warning(f"OpenAI fallback 실패, XAI로 시도: {openai_error}")
-
-                        # XAI fallback (3순위)
-                        if self.xai_available:
-                            try:
-                                logger.info("XAI API fallback 시도 중...")
-                                result = await self.xai_connector.analyze_text(text, context)
-                                result['fallback_used'] = True
-                                result['fallback_level'] = 2
-                                result['fallback_reason'] = f"Gemini: {e}, OpenAI: {openai_error}"
-                                logger.info("XAI API fallback 성공")
-                                return result
-                            except Exception as xai_error:
-                                logger.error(f"모든 API 실패: Gemini: {e}, OpenAI: {openai_error}, XAI: {xai_error}")
-                                return self._get_error_response(f"모든 API 실패")
-                        else:
-                            return self._get_error_response(f"Gemini/OpenAI 실패, XAI 사용 불가")
-                else:
-                    return self._get_error_response(f"Gemini 실패, OpenAI 사용 불가: {e}")
+        # 우선순위 순서 (Gemini 1순위, OpenAI 2순위, XAI 3순위)
+        providers = [
+            (name, connector)
+            for name, connector, available in (
+                ('gemini', self.gemini_connector, self.gemini_available),
+                ('openai', self.openai_connector, self.openai_available),
+                ('xai', self.xai_connector, self.xai_available)
+            )
+            if available
+        ]
+        if not providers:
+            return self._get_error_response("사용 가능한 API가 없습니다")
 
-        # Gemini 사용 불가시 OpenAI 사용 (2순위)
-        elif self.openai_available:
-            logger.info("Gemini 사용 불가, OpenAI 사용")
-            try:
-                result = await self.openai_connector.analyze_text(text, context)
-                result['gemini_unavailable'] = True
-                return result
-            except Exception as e:
-                logger.warning(f"OpenAI 실패, XAI로 fallback: {e}")
-                if self.xai_available:
-                    try:
-                        result = await self.xai_connector.analyze_text(text, context)
-                        result['fallback_used'] = True
-                        return result
-                    except Exception as xai_error:
-                        return self._get_error_response(f"OpenAI/XAI 모두 실패")
-
-        # XAI만 사용 가능 (3순위)
-        elif self.xai_available:
-            logger.info("Gemini/OpenAI 사용 불가, XAI만 사용")
-            result = await self.xai_connector.analyze_text(text, context)
+        # 각 제공자의 헤지 지연 (비활성화 시 실패할 때만 다음 제공자로 넘어가는 순차 fallback)
+        pool = get_llm_client_pool()
+        delays = [
+            self.hedge_policy.delay(pool.limiter(name).latency) if self.hedging_enabled else float('inf')
+            for name, _ in providers
+        ]
+        attempts = [
+            (name, lambda connector=connector: connector.analyze_text(text, context))
+            for name, connector in providers
+        ]
+
+        try:
+            outcome = await hedged_race(attempts, delays, is_valid=self._is_valid_response)
+        except Exception as e:
+            logger.error(f"모든 API 실패: {e}")
+            return self._get_error_response("모든 API 실패")
+
+        result = outcome.result
+        result['hedged'] = outcome.hedged
+        result['providers_launched'] = outcome.launched
+        if outcome.index > 0:
+            result['fallback_used'] = True
+            result['fallback_level'] = outcome.index
+            result['fallback_reason'] = (
+                ", ".join(f"{name}: {error}" for name, error in outcome.errors.items())
+                or f"{providers[0][0]} 응답 지연 (헤지)"
+            )
+        if outcome.provider == 'openai' and not self.gemini_available:
+            result['gemini_unavailable'] = True
+        if outcome.provider == 'xai' and len(providers) == 1:
             result['only_xai'] = True
-            return result
 
-        else:
-            return self._get_error_response("사용 가능한 API가 없습니다")
+        logger.info(f"{outcome.provider} API 응답 사용 (시작: {outcome.launched})")
+        return result
+
+    @staticmethod
+    def _is_valid_response(result: Any) -> bool:
+        """성공 상태이고 분석 결과가 있는 응답만 유효"""
+        return (
+            isinstance(result, dict)
+            and result.get('status') == 'success'
+            and isinstance(result.get('analysis'), dict)
+            and bool(result['analysis'])
+        )
 
     def _get_error_response(self, error_message: str) -> Dict[str, Any]:
         """에러 응답 생성"""
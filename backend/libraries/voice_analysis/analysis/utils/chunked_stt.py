@@ -0,0 +1,312 @@
+"""
+긴 녹음용 청크 STT 보조 모듈
+디코딩된 오디오를 무음 경계에서 약 60초 청크로 나누고, 청크별 화자 태그를
+겹침 구간과 화자 임베딩으로 전체 녹음 기준 화자 ID에 맞춘다.
+"""
+
+import itertools
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AudioChunk:
+    """
+    STT 청크 (샘플 인덱스)
+
+    [start, core_start)는 이전 청크와 겹치는 구간으로 화자 매칭에만 쓰이고,
+    결과 단어는 [core_start, end) 구간만 사용한다.
+    """
+    index: int
+    start: int
+    end: int
+    core_start: int
+
+    def bounds_seconds(self, sample_rate: int) -> Dict[str, float]:
+        """초 단위 경계"""
+        return {
+            'start_time': self.start / sample_rate,
+            'core_start_time': self.core_start / sample_rate,
+            'end_time': self.end / sample_rate
+        }
+
+
+def plan_chunks(
+    samples: np.ndarray,
+    sample_rate: int,
+    target_duration: float = 60.0,
+    min_duration: float = 30.0,
+    max_duration: float = 90.0,
+    overlap: float = 2.0,
+    top_db: float = 30
+) -> List[AudioChunk]:
+    """
+    VAD 무음 구간 중앙에서 청크 경계 결정
+
+    각 경계는 [min_duration, max_duration] 범위의 무음 중앙 중 target_duration에
+    가장 가까운 지점이며, 무음이 없으면 max_duration에서 자른다.
+
+    Args:
+        samples: 모노 PCM
+        sample_rate: 샘플레이트
+        target_duration: 목표 청크 길이 (초)
+        min_duration: 최소 청크 길이 (초)
+        max_duration: 최대 청크 길이 (초)
+        overlap: 이전 청크와 겹치는 길이 (초)
+        top_db: 무음 판정 기준 (librosa.effects.split)
+    """
+    import librosa
+
+    n = len(samples)
+    max_samples = int(max_duration * sample_rate)
+    if n <= max_samples:
+        return [AudioChunk(index=0, start=0, end=n, core_start=0)]
+
+    min_samples = int(min_duration * sample_rate)
+    target_samples = int(target_duration * sample_rate)
+    overlap_samples = int(overlap * sample_rate)
+
+    intervals = librosa.effects.split(samples, top_db=top_db)
+    if len(intervals) > 1:
+        gaps = (intervals[:-1, 1] + intervals[1:, 0]) // 2
+    else:
+        gaps = np.zeros(0, dtype=np.int64)
+
+    cuts = []
+    core_start = 0
+    while n - core_start > max_samples:
+        low = core_start + min_samples
+        # 마지막 청크도 최소 길이 이상이 되도록 상한 조정
+        high = min(core_start + max_samples, n - min_samples)
+        candidates = gaps[(gaps >= low) & (gaps <= high)]
+        if len(candidates):
+            cut = int(candidates[np.argmin(np.abs(candidates - (core_start + target_samples)))])
+        else:
+            cut = high
+        cuts.append(cut)
+        core_start = cut
+
+    bounds = [0] + cuts + [n]
+    return [
+        AudioChunk(
+            index=i,
+            start=max(0, bounds[i] - overlap_samples) if i else 0,
+            end=bounds[i + 1],
+            core_start=bounds[i]
+        )
+        for i in range(len(bounds) - 1)
+    ]
+
+
+def slice_word_table(table: Dict[str, Any], indices: np.ndarray) -> Dict[str, Any]:
+    """단어 테이블 행 선택"""
+    words = table['word']
+    return {
+        'word': [words[i] for i in indices.tolist()],
+        **{key: table[key][indices] for key in ('start', 'end', 'speaker', 'confidence', 'result')}
+    }
+
+
+def concat_word_tables(tables: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """청크별 단어 테이블 연결 (청크 경계에서도 같은 화자 세그먼트가 이어지도록 result는 0)"""
+    merged = {
+        'word': [word for table in tables for word in table['word']],
+        **{
+            key: np.concatenate([table[key] for table in tables]) if tables else np.zeros(0)
+            for key in ('start', 'end', 'speaker', 'confidence')
+        }
+    }
+    merged['speaker'] = merged['speaker'].astype(np.int64)
+    merged['result'] = np.zeros(len(merged['word']), dtype=np.int64)
+    return merged
+
+
+class SpeakerStitcher:
+    """청크별 지역 화자 태그를 녹음 전체 화자 ID로 매핑"""
+
+    def __init__(self, sample_rate: int, max_speakers: int = 2,
+                 embedding_weight: float = 1.0, new_speaker_score: float = 0.3,
+                 n_mfcc: int = 20):
+        """
+        Args:
+            sample_rate: 청크 오디오 샘플레이트
+            max_speakers: 최대 화자 수 (인식 설정과 동일)
+            embedding_weight: 임베딩 유사도 가중치 (겹침 구간 일치 시간(초)과 합산)
+            new_speaker_score: 새 화자로 판단할 때의 기준 점수
+            n_mfcc: 임베딩용 MFCC 차수
+        """
+        self.sample_rate = sample_rate
+        self.max_speakers = max_speakers
+        self.embedding_weight = embedding_weight
+        self.new_speaker_score = new_speaker_score
+        self.n_mfcc = n_mfcc
+
+        # 임베딩이 없는 화자도 포함한, 지금까지 배정된 모든 전체 화자 ID
+        self.speaker_ids: Set[int] = set()
+        self.centroids: Dict[int, np.ndarray] = {}
+        self.centroid_weights: Dict[int, float] = {}
+        self._previous: Optional[Dict[str, Any]] = None
+
+    def add_chunk(self, table: Dict[str, Any], chunk: AudioChunk,
+                  samples: np.ndarray) -> Dict[str, Any]:
+        """
+        청크 인식 결과를 전체 기준으로 변환
+
+        Args:
+            table: 청크 기준 시간의 단어 테이블
+            chunk: 청크 경계
+            samples: 전체 녹음 PCM (sample_rate 기준)
+
+        Returns:
+            절대 시간, 전체 화자 ID, 겹침 구간 제외가 적용된 단어 테이블
+        """
+        offset = chunk.start / self.sample_rate
+        table = dict(table)
+        table['start'] = table['start'] + offset
+        table['end'] = table['end'] + offset
+
+        embeddings = self._speaker_embeddings(table, samples[chunk.start:chunk.end], offset)
+        mapping = self._assign(table, embeddings, chunk)
+        self.speaker_ids.update(mapping.values())
+        table['speaker'] = np.asarray(
+            [mapping[tag] for tag in table['speaker'].tolist()], dtype=np.int64
+        )
+
+        for local, (vector, weight) in embeddings.items():
+            self._update_centroid(mapping[local], vector, weight)
+
+        # 겹침 구간 단어는 이전 청크 결과 사용
+        core_start_time = chunk.core_start / self.sample_rate
+        kept = slice_word_table(table, np.flatnonzero(table['start'] >= core_start_time))
+        self._previous = kept
+        logger.debug(f"청크 {chunk.index} 화자 매핑: {mapping}")
+        return kept
+
+    def _speaker_embeddings(self, table: Dict[str, Any], audio: np.ndarray,
+                            offset: float) -> Dict[int, Any]:
+        """지역 화자별 (MFCC 평균 벡터, 프레임 수) - 청크 평균을 뺀 c1 이상 계수"""
+        import librosa
+
+        speakers = np.unique(table['speaker'])
+        if len(audio) == 0 or len(speakers) == 0:
+            return {}
+
+        hop_length = self.sample_rate // 100
+        mfcc = librosa.feature.mfcc(
+            y=audio, sr=self.sample_rate, n_mfcc=self.n_mfcc, hop_length=hop_length
+        )[1:]
+        n_frames = mfcc.shape[1]
+
+        # 단어 구간 -> 프레임 범위 (차분 배열로 화자별 마스크 생성)
+        first = np.clip(((table['start'] - offset) * 100).astype(np.int64), 0, n_frames)
+        last = np.clip(((table['end'] - offset) * 100).astype(np.int64) + 1, 0, n_frames)
+
+        speech_mask = np.zeros(n_frames, dtype=bool)
+        masks = {}
+        for tag in speakers.tolist():
+            selected = table['speaker'] == tag
+            marks = np.zeros(n_frames + 1, dtype=np.int64)
+            np.add.at(marks, first[selected], 1)
+            np.add.at(marks, last[selected], -1)
+            masks[tag] = np.cumsum(marks[:-1]) > 0
+            speech_mask |= masks[tag]
+
+        if not speech_mask.any():
+            return {}
+
+        chunk_mean = mfcc[:, speech_mask].mean(axis=1)
+        embeddings = {}
+        for tag, mask in masks.items():
+            count = int(mask.sum())
+            if count:
+                embeddings[tag] = (mfcc[:, mask].mean(axis=1) - chunk_mean, float(count))
+        return embeddings
+
+    def _overlap_scores(self, table: Dict[str, Any], chunk: AudioChunk) -> Dict[Any, float]:
+        """겹침 구간에서 (지역 화자, 전체 화자)가 동시에 발화한 시간 (초)"""
+        if self._previous is None or chunk.start == chunk.core_start:
+            return {}
+
+        window_start = chunk.start / self.sample_rate
+        window_end = chunk.core_start / self.sample_rate
+
+        local = table['start'] < window_end
+        previous = self._previous['end'] > window_start
+        if not local.any() or not previous.any():
+            return {}
+
+        start_a, end_a = table['start'][local], table['end'][local]
+        start_b, end_b = self._previous['start'][previous], self._previous['end'][previous]
+        shared = np.clip(
+            np.minimum(end_a[:, None], end_b[None, :]) - np.maximum(start_a[:, None], start_b[None, :]),
+            0, None
+        )
+
+        scores: Dict[Any, float] = {}
+        for i, tag in enumerate(table['speaker'][local].tolist()):
+            for j, speaker_id in enumerate(self._previous['speaker'][previous].tolist()):
+                if shared[i, j] > 0:
+                    key = (tag, speaker_id)
+                    scores[key] = scores.get(key, 0.0) + float(shared[i, j])
+        return scores
+
+    def _assign(self, table: Dict[str, Any], embeddings: Dict[int, Any],
+                chunk: AudioChunk) -> Dict[int, int]:
+        """겹침 일치 시간 + 임베딩 코사인 유사도 합이 최대인 일대일 매핑"""
+        local_speakers = np.unique(table['speaker']).tolist()
+        global_speakers = sorted(self.speaker_ids)
+
+        if not global_speakers:
+            # 첫 청크: 지역 태그를 그대로 전체 ID로 사용
+            return {tag: tag for tag in local_speakers}
+
+        overlap = self._overlap_scores(table, chunk)
+
+        def score(local: int, speaker_id: int) -> float:
+            value = overlap.get((local, speaker_id), 0.0)
+            if local in embeddings and speaker_id in self.centroids:
+                value += self.embedding_weight * _cosine(embeddings[local][0], self.centroids[speaker_id])
+            return value
+
+        new_slots = max(self.max_speakers - len(global_speakers), len(local_speakers) - len(global_speakers), 0)
+        options = global_speakers + [None] * min(new_slots, len(local_speakers))
+
+        best_mapping, best_score = None, -np.inf
+        for candidate in itertools.permutations(options, len(local_speakers)):
+            total = sum(
+                self.new_speaker_score if speaker_id is None else score(local, speaker_id)
+                for local, speaker_id in zip(local_speakers, candidate)
+            )
+            if total > best_score:
+                best_mapping, best_score = candidate, total
+
+        mapping = {}
+        next_id = max(global_speakers) + 1
+        for local, speaker_id in zip(local_speakers, best_mapping):
+            if speaker_id is None:
+                speaker_id = next_id
+                next_id += 1
+            mapping[local] = speaker_id
+        return mapping
+
+    def _update_centroid(self, speaker_id: int, vector: np.ndarray, weight: float):
+        """프레임 수 가중 누적 평균"""
+        if speaker_id not in self.centroids:
+            self.centroids[speaker_id] = vector.copy()
+            self.centroid_weights[speaker_id] = weight
+            return
+
+        total = self.centroid_weights[speaker_id] + weight
+        self.centroids[speaker_id] += (vector - self.centroids[speaker_id]) * (weight / total)
+        self.centroid_weights[speaker_id] = total
+
+
+def _cosine(a: np.ndarray, b: np.ndarray) -> float:
+    """코사인 유사도 (영벡터면 0)"""
+    denominator = np.linalg.norm(a) * np.linalg.norm(b)
+    return float(np.dot(a, b) / denominator) if denominator > 0 else 0.0
@@ -0,0 +1,190 @@
+"""
+요청 단위 오디오 버퍼
+한 번 디코딩한 PCM 데이터를 STT, 화자 구간 추출, 음성 특징, SincNet 단계가 공유
+"""
+
+import os
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class DecodedAudio:
+    """한 번만 디코딩된 모노 float32 PCM 버퍼 (샘플레이트별 리샘플 뷰 캐싱)"""
+
+    def __init__(
+        self,
+        samples: np.ndarray,
+        sample_rate: int,
+        source_path: Optional[str] = None
+    ):
+        """
+        Args:
+            samples: 모노 PCM 샘플 (-1.0 ~ 1.0)
+            sample_rate: 원본 샘플레이트
+            source_path: 디코딩한 원본 파일 경로 (선택적)
+        """
+        self.samples = np.ascontiguousarray(samples, dtype=np.float32)
+        self.sample_rate = int(sample_rate)
+        self.source_path = str(source_path) if source_path else None
+
+        # 샘플레이트별 리샘플 결과 캐시 (원본 포함)
+        self._views: Dict[int, np.ndarray] = {self.sample_rate: self.samples}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, audio_path: str) -> 'DecodedAudio':
+        """오디오 파일을 원본 샘플레이트로 한 번 디코딩"""
+        import librosa
+
+        y, sr = librosa.load(audio_path, sr=None, mono=True)
+        logger.info(f"오디오 디코딩 완료: {len(y) / sr:.1f}초, {sr}Hz ({audio_path})")
+        return cls(y, sr, source_path=audio_path)
+
+    @property
+    def duration(self) -> float:
+        """오디오 길이 (초)"""
+        return len(self.samples) / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def num_samples(self) -> int:
+        """원본 샘플 수"""
+        return len(self.samples)
+
+    @property
+    def file_size_mb(self) -> Optional[float]:
+        """원본 파일 크기 (MB), 파일이 없으면 None"""
+        if self.source_path and os.path.exists(self.source_path):
+            return os.path.getsize(self.source_path) / (1024 * 1024)
+        return None
+
+    def resample(self, target_sr: Optional[int] = None) -> np.ndarray:
+        """
+        지정한 샘플레이트의 PCM 뷰 반환 (최초 요청 시에만 리샘플링)
+
+        Args:
+            target_sr: 목표 샘플레이트 (None이면 원본)
+
+        Returns:
+            float32 PCM 배열 (읽기 전용으로 취급할 것)
+        """
+        target_sr = int(target_sr or self.sample_rate)
+
+        with self._lock:
+            view = self._views.get(target_sr)
+            if view is None:
+                import librosa
+
+                view = librosa.resample(
+                    self.samples, orig_sr=self.sample_rate, target_sr=target_sr
+                ).astype(np.float32, copy=False)
+                self._views[target_sr] = view
+                logger.debug(f"리샘플 뷰 생성: {self.sample_rate}Hz -> {target_sr}Hz")
+            return view
+
+    def to_linear16(self, target_sr: int = 16000) -> np.ndarray:
+        """LINEAR16 (int16) PCM으로 변환"""
+        audio = self.resample(target_sr)
+        return (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+class AudioSegmentView(DecodedAudio):
+    """
+    원본 버퍼 위의 구간 뷰 (복사 없이 (start, end) 샘플 인덱스만 보관)
+
+    DecodedAudio와 같은 인터페이스를 제공하며, 실제 배열은 요청 시점에만
+    원본(또는 원본의 리샘플 뷰)에서 잘라 이어붙인다.
+    """
+
+    def __init__(self, source: DecodedAudio, ranges: Sequence[Tuple[int, int]]):
+        """
+        Args:
+            source: 원본 오디오 버퍼
+            ranges: 원본 샘플레이트 기준 (start, end) 인덱스 목록
+        """
+        self.source = source
+        self.ranges: List[Tuple[int, int]] = [(int(s), int(e)) for s, e in ranges]
+        self.sample_rate = source.sample_rate
+        self.source_path = None
+
+        self._views: Dict[int, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def samples(self) -> np.ndarray:
+        """원본 샘플레이트로 이어붙인 연속 배열"""
+        return self.materialize()
+
+    @property
+    def num_samples(self) -> int:
+        return sum(end - start for start, end in self.ranges)
+
+    @property
+    def duration(self) -> float:
+        return self.num_samples / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def file_size_mb(self) -> Optional[float]:
+        return None
+
+    def materialize(self, target_sr: Optional[int] = None) -> np.ndarray:
+        """
+        구간들을 연속 배열로 생성 (샘플레이트별 캐싱)
+
+        Args:
+            target_sr: 목표 샘플레이트 (None이면 원본)
+
+        Returns:
+            float32 PCM 배열
+        """
+        target_sr = int(target_sr or self.sample_rate)
+
+        with self._lock:
+            view = self._views.get(target_sr)
+            if view is not None:
+                return view
+
+        # 원본의 리샘플 뷰를 재사용하고 인덱스만 환산
+        base = self.source.resample(target_sr)
+        scale = target_sr / self.sample_rate
+        slices = [
+            base[int(start * scale):int(end * scale)]
+            for start, end in self.ranges
+        ]
+        if len(slices) == 1:
+            view = slices[0]  # 단일 구간은 복사 없이 슬라이스 그대로 사용
+        elif slices:
+            view = np.concatenate(slices)
+        else:
+            view = np.zeros(0, dtype=np.float32)
+
+        with self._lock:
+            self._views[target_sr] = view
+        return view
+
+    def resample(self, target_sr: Optional[int] = None) -> np.ndarray:
+        return self.materialize(target_sr)
+
+
+def as_decoded_audio(
+    audio: Union[str, os.PathLike, DecodedAudio, np.ndarray],
+    sample_rate: Optional[int] = None
+) -> DecodedAudio:
+    """
+    파일 경로, 배열 또는 DecodedAudio를 DecodedAudio로 정규화
+
+    Args:
+        audio: 오디오 파일 경로, PCM 배열 또는 디코딩된 버퍼
+        sample_rate: audio가 배열일 때의 샘플레이트 (필수)
+    """
+    if isinstance(audio, DecodedAudio):
+        return audio
+    if isinstance(audio, np.ndarray):
+        if not sample_rate:
+            raise ValueError("배열 입력에는 sample_rate가 필요합니다")
+        return DecodedAudio(audio, sample_rate)
+    return DecodedAudio.from_file(str(audio))
@@ -5,7 +5,7 @@ GCP 운영 환경에서 과거 분석 결과 조회 및 저장
 
 import os
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from google.cloud import firestore
 from google.oauth2 import service_account
@@ -413,10 +413,75 @@ class FirestoreConnector:
             
             logger.info(f"사용자 프로필 업데이트 완료: {user_id}")
             return True
-            
+
         except Exception as e:
             logger.error(f"사용자 프로필 업데이트 실패: {e}")
             return False
+
+    def get_trend_state(self, user_id: str, senior_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        증분 추세 상태 조회 (users/{user_id}/trendStates/{senior_id})
+
+        Args:
+            user_id: 사용자 ID
+            senior_id: 시니어 ID (없으면 'default')
+
+        Returns:
+            저장된 상태 dict 또는 None
+        """
+        try:
+            doc = (self.db.collection(self.users_collection).document(user_id)
+                   .collection('trendStates').document(senior_id or 'default').get())
+            if doc.exists:
+                return doc.to_dict()
+            return None
+
+        except Exception as e:
+            logger.error(f"추세 상태 조회 실패: {e}")
+            return None
+
+    def update_trend_state(
+        self,
+        user_id: str,
+        update_fn: Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]],
+        senior_id: Optional[str] = None
+    ) -> bool:
+        """
+        증분 추세 상태 갱신 (트랜잭션 안에서 읽기-수정-쓰기)
+
+        동시 요청이 같은 상태를 갱신해도 한쪽 갱신이 유실되지 않도록, 충돌 시
+        Firestore가 트랜잭션을 재시도하며 update_fn을 최신 문서로 다시 호출합니다.
+
+        Args:
+            user_id: 사용자 ID
+            update_fn: 저장된 상태 dict(없으면 None) -> 새 상태 dict (None이면 저장하지 않음)
+            senior_id: 시니어 ID (없으면 'default')
+
+        Returns:
+            갱신 성공 여부 (갱신할 내용이 없는 경우 포함)
+        """
+        doc_ref = (self.db.collection(self.users_collection).document(user_id)
+                   .collection('trendStates').document(senior_id or 'default'))
+
+        @firestore.transactional
+        def apply(transaction):
+            doc = doc_ref.get(transaction=transaction)
+            state = update_fn(doc.to_dict() if doc.exists else None)
+            if state is None:
+                return False
+            doc_data = state.copy()
+            doc_data['updated_at'] = firestore.SERVER_TIMESTAMP
+            transaction.set(doc_ref, doc_data)
+            return True
+
+        try:
+            if apply(self.db.transaction()):
+                logger.info(f"추세 상태 저장 완료: {user_id}/{senior_id or 'default'}")
+            return True
+
+        except Exception as e:
+            logger.error(f"추세 상태 저장 실패: {e}")
+            return False
     
     def get_analysis_statistics(
         self,
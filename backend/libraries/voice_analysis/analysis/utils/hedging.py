@@ -0,0 +1,213 @@
+"""
+LLM 요청 헤징
+1순위 제공자가 최근 지연 시간 분위수 안에 응답하지 않으면 다음 제공자를 동시에 시작하고,
+먼저 도착한 유효한 응답을 사용한 뒤 나머지 요청은 취소한다.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .monitoring import MetricsCollector, global_monitor
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """
+    로그 간격 버킷 지연 시간 히스토그램
+
+    관측마다 기존 카운트에 decay를 곱해 최근 요청의 비중을 높인다.
+    """
+
+    def __init__(self, min_seconds: float = 0.05, max_seconds: float = 300.0,
+                 buckets: int = 64, decay: float = 0.99):
+        """
+        Args:
+            min_seconds: 첫 버킷 상한 (초)
+            max_seconds: 마지막 버킷 상한 (초, 초과 값은 마지막 버킷)
+            buckets: 버킷 수
+            decay: 관측마다 기존 카운트에 곱하는 감쇠 계수
+        """
+        self.bounds = np.geomspace(min_seconds, max_seconds, buckets)
+        self.decay = decay
+        self._counts = np.zeros(buckets)
+        self._observations = 0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        """누적 관측 수 (감쇠 전)"""
+        return self._observations
+
+    def observe(self, seconds: float):
+        """지연 시간 기록"""
+        index = min(int(np.searchsorted(self.bounds, seconds)), len(self.bounds) - 1)
+        with self._lock:
+            self._counts *= self.decay
+            self._counts[index] += 1.0
+            self._observations += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        q 분위수 (0-1) 지연 시간 추정 (버킷 내 로그 선형 보간, 관측이 없으면 None)
+        """
+        with self._lock:
+            total = self._counts.sum()
+            if self._observations == 0 or total <= 0:
+                return None
+            cumulative = np.cumsum(self._counts) / total
+
+        index = int(np.searchsorted(cumulative, q))
+        index = min(index, len(self.bounds) - 1)
+        upper = self.bounds[index]
+        lower = self.bounds[index - 1] if index else upper / (self.bounds[1] / self.bounds[0])
+        below = cumulative[index - 1] if index else 0.0
+        share = cumulative[index] - below
+        fraction = (q - below) / share if share > 0 else 1.0
+        return float(math.exp(math.log(lower) + fraction * (math.log(upper) - math.log(lower))))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """주요 분위수"""
+        return {
+            'count': self._observations,
+            'p50': self.percentile(0.5),
+            'p90': self.percentile(0.9),
+            'p95': self.percentile(0.95),
+            'p99': self.percentile(0.99)
+        }
+
+
+@dataclass
+class HedgePolicy:
+    """
+    헤지 지연 정책
+
+    다음 제공자 시작 지연 = 현재 제공자 지연 히스토그램의 percentile 분위수를
+    [min_delay, max_delay]로 제한한 값 (관측이 min_samples 미만이면 default_delay)
+    """
+    percentile: float = 0.95
+    min_delay: float = 1.0
+    max_delay: float = 30.0
+    default_delay: float = 10.0
+    min_samples: int = 20
+
+    def delay(self, histogram: Optional[LatencyHistogram]) -> float:
+        """히스토그램에서 헤지 지연 계산 (초)"""
+        if histogram is None or histogram.count < self.min_samples:
+            return self.default_delay
+        value = histogram.percentile(self.percentile)
+        if value is None:
+            return self.default_delay
+        return float(min(max(value, self.min_delay), self.max_delay))
+
+
+@dataclass
+class HedgeOutcome:
+    """헤지 경쟁 결과"""
+    result: Any
+    provider: str
+    index: int
+    launched: List[str]
+    errors: Dict[str, str]
+    hedged: bool
+
+
+async def hedged_race(
+    attempts: Sequence[Tuple[str, Callable[[], Awaitable[Any]]]],
+    delays: Sequence[float],
+    is_valid: Callable[[Any], bool] = lambda result: result is not None,
+    metrics: Optional[MetricsCollector] = None
+) -> HedgeOutcome:
+    """
+    우선순위 순서로 요청을 헤징해 실행
+
+    i번째 요청은 (i-1)번째 요청 시작 후 delays[i-1]초가 지나거나, 진행 중인 요청이
+    모두 실패하면 즉시 시작된다. 먼저 도착한 유효한 결과를 반환하고 나머지는 취소한다.
+
+    Args:
+        attempts: (제공자 이름, 코루틴 생성 함수) 목록 (우선순위 순)
+        delays: 각 요청 시작 후 다음 요청을 시작하기까지의 대기 시간 (초)
+        is_valid: 결과 유효성 판단 함수 (False이면 실패로 간주)
+        metrics: 메트릭 수집기 (기본값: 전역 모니터)
+
+    Raises:
+        RuntimeError: 모든 요청이 실패한 경우
+    """
+    if not attempts:
+        raise ValueError("attempts must not be empty")
+
+    metrics = metrics or global_monitor.metrics
+    pending: Dict[asyncio.Task, int] = {}
+    launched: List[str] = []
+    errors: Dict[str, str] = {}
+    hedged = False
+    next_index = 0
+    next_launch_at = 0.0
+
+    def launch():
+        nonlocal next_index, next_launch_at
+        name, factory = attempts[next_index]
+        task = asyncio.ensure_future(factory())
+        pending[task] = next_index
+        launched.append(name)
+        delay = delays[next_index] if next_index < len(delays) else 0.0
+        next_launch_at = time.monotonic() + delay
+        next_index += 1
+
+    try:
+        launch()
+        while pending:
+            timeout = None
+            if next_index < len(attempts) and math.isfinite(next_launch_at):
+                timeout = max(0.0, next_launch_at - time.monotonic())
+
+            done, _ = await asyncio.wait(
+                pending.keys(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if not done:
+                # 지연 초과: 다음 제공자 헤지 시작
+                hedged = True
+                metrics.increment_counter('llm_hedge_launched')
+                logger.info(f"{launched[-1]} 응답 지연, {attempts[next_index][0]} 헤지 요청 시작")
+                launch()
+                continue
+
+            for task in done:
+                index = pending.pop(task)
+                name = attempts[index][0]
+                try:
+                    result = task.result()
+                except Exception as e:
+                    errors[name] = str(e)
+                    logger.warning(f"{name} 요청 실패: {e}")
+                    continue
+
+                if not is_valid(result):
+                    errors[name] = 'invalid response'
+                    logger.warning(f"{name} 응답이 유효하지 않음")
+                    continue
+
+                metrics.increment_counter(f'llm_hedge_wins_{name}')
+                return HedgeOutcome(result, name, index, list(launched), errors, hedged)
+
+            # 진행 중인 요청이 모두 실패하면 다음 제공자를 바로 시작
+            if not pending and next_index < len(attempts):
+                launch()
+
+        raise RuntimeError(
+            "모든 LLM 요청 실패: " + ", ".join(f"{name}: {error}" for name, error in errors.items())
+        )
+
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending.keys(), return_exceptions=True)
@@ -0,0 +1,196 @@
+"""
+LINEAR16 스트리밍 인코딩 및 업로드
+16kHz 모노 PCM을 블록 단위로 인코딩해 임시 파일 없이 resumable 업로드로 흘려보낸다.
+녹음 길이와 무관하게 추가 메모리는 (블록 크기 x 선행 버퍼 수) + 업로드 청크 크기로 제한된다.
+"""
+
+import logging
+import queue
+import shutil
+import struct
+import subprocess
+import threading
+from tempfile import SpooledTemporaryFile
+from typing import Any, Iterable, Iterator, NamedTuple
+
+import numpy as np
+
+from .decoded_audio import DecodedAudio
+
+logger = logging.getLogger(__name__)
+
+# resumable 업로드 청크 (256KB 배수)
+DEFAULT_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# blob.open()이 없는 클라이언트용 스풀 버퍼 메모리 상한
+DEFAULT_SPOOL_THRESHOLD = 32 * 1024 * 1024
+
+
+class Linear16Stream(NamedTuple):
+    """인코딩 블록 스트림과 업로드 메타데이터"""
+    blocks: Iterator[bytes]
+    extension: str
+    content_type: str
+
+
+def wav_header(num_samples: int, sample_rate: int = 16000) -> bytes:
+    """16-bit 모노 PCM WAV 헤더 (44 bytes)"""
+    data_size = num_samples * 2
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b'data', data_size
+    )
+
+
+def iter_linear16_blocks(audio: DecodedAudio, target_sr: int = 16000,
+                         block_seconds: float = 10.0) -> Iterator[bytes]:
+    """
+    디코딩된 버퍼를 WAV(LINEAR16) 바이트 블록으로 변환
+
+    DecodedAudio.to_linear16()과 같은 값을 만들지만 전체 int16 배열을 한 번에 만들지 않는다.
+    """
+    samples = audio.resample(target_sr)
+    block_samples = max(1, int(block_seconds * target_sr))
+
+    yield wav_header(len(samples), target_sr)
+    for start in range(0, len(samples), block_samples):
+        block = samples[start:start + block_samples]
+        yield (np.clip(block, -1.0, 1.0) * 32767).astype('<i2').tobytes()
+
+
+def iter_ffmpeg_linear16(audio_path: str, target_sr: int = 16000,
+                         block_bytes: int = 320000) -> Iterator[bytes]:
+    """
+    FFmpeg 파이프로 디코딩/리샘플링하며 헤더 없는 LINEAR16 블록 생성
+
+    디코딩은 별도 프로세스에서 진행되므로 소비(업로드)와 겹쳐 실행된다.
+    """
+    cmd = [
+        'ffmpeg', '-nostdin', '-loglevel', 'error',
+        '-i', str(audio_path),
+        '-f', 's16le', '-acodec', 'pcm_s16le',
+        '-ac', '1', '-ar', str(target_sr),
+        'pipe:1'
+    ]
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    completed = False
+    try:
+        while True:
+            block = process.stdout.read(block_bytes)
+            if not block:
+                break
+            yield block
+
+        stderr = process.stderr.read().decode('utf-8', errors='replace')
+        if process.wait() != 0:
+            raise RuntimeError(f"FFmpeg 변환 실패: {stderr.strip()}")
+        completed = True
+    finally:
+        if not completed and process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.stderr.close()
+        process.wait()
+
+
+def open_linear16_stream(audio_path: str, decoded_audio: DecodedAudio = None,
+                         target_sr: int = 16000) -> Linear16Stream:
+    """
+    업로드할 LINEAR16 스트림 선택
+
+    디코딩된 버퍼가 있으면 길이를 알 수 있으므로 WAV로, 없으면 FFmpeg 파이프의
+    헤더 없는 PCM으로 스트리밍한다. FFmpeg도 없으면 한 번 디코딩 후 WAV로 변환한다.
+    """
+    if decoded_audio is None and shutil.which('ffmpeg'):
+        return Linear16Stream(
+            iter_ffmpeg_linear16(audio_path, target_sr),
+            extension='pcm',
+            content_type=f'audio/l16; rate={target_sr}; channels=1'
+        )
+
+    if decoded_audio is None:
+        decoded_audio = DecodedAudio.from_file(audio_path)
+
+    return Linear16Stream(
+        iter_linear16_blocks(decoded_audio, target_sr),
+        extension='wav',
+        content_type='audio/wav'
+    )
+
+
+def prefetch(blocks: Iterable[bytes], depth: int = 4) -> Iterator[bytes]:
+    """
+    생산(디코딩/인코딩)을 백그라운드 스레드에서 최대 depth 블록 앞서 실행
+
+    업로드 네트워크 대기와 인코딩이 겹치며, 대기 중인 블록 수로 메모리가 제한된다.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for block in blocks:
+                if not put(block):
+                    return
+            put(done)
+        except BaseException as e:
+            put(e)
+        finally:
+            # 소비자가 중단한 경우 생성기 정리 (FFmpeg 프로세스 종료 등)
+            close = getattr(blocks, 'close', None)
+            if stop.is_set() and callable(close):
+                close()
+
+    producer = threading.Thread(target=produce, name='linear16-encoder', daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def upload_blocks(blob: Any, blocks: Iterable[bytes], content_type: str,
+                  chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+                  spool_threshold: int = DEFAULT_SPOOL_THRESHOLD) -> int:
+    """
+    바이트 블록을 blob에 resumable 업로드
+
+    blob.open('wb')를 지원하면 chunk_size 단위로 바로 전송하고, 지원하지 않으면
+    SpooledTemporaryFile(spool_threshold 초과분만 디스크)에 모은 뒤 업로드한다.
+
+    Returns:
+        업로드한 바이트 수
+    """
+    total = 0
+    if callable(getattr(blob, 'open', None)):
+        with blob.open('wb', chunk_size=chunk_size, content_type=content_type) as writer:
+            for block in blocks:
+                writer.write(block)
+                total += len(block)
+        return total
+
+    with SpooledTemporaryFile(max_size=spool_threshold) as spool:
+        for block in blocks:
+            spool.write(block)
+            total += len(block)
+        spool.seek(0)
+        blob.upload_from_file(spool, size=total, content_type=content_type)
+    return total
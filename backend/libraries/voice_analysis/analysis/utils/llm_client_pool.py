@@ -0,0 +1,337 @@
+"""
+LLM 비동기 클라이언트 풀
+제공자(Gemini/OpenAI/XAI)별로 keep-alive 연결을 공유하는 비동기 클라이언트를 하나씩 두고,
+동시 호출 수(세마포어), 분당 요청 수(토큰 버킷), 요청 시간 제한을 적용한다.
+asyncio 동기화 객체는 처음 사용한 이벤트 루프에 묶이므로 클라이언트와 같이 루프별로 만든다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from .hedging import LatencyHistogram
+from .monitoring import MetricsCollector, global_monitor
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# 제공자별 기본 설정 (환경 변수 LLM_{PROVIDER}_*로 재정의)
+DEFAULT_PROVIDER_LIMITS = {
+    'openai': {'max_concurrency': 8, 'requests_per_minute': 300, 'timeout': 60.0},
+    'gemini': {'max_concurrency': 8, 'requests_per_minute': 300, 'timeout': 60.0},
+    'xai': {'max_concurrency': 4, 'requests_per_minute': 60, 'timeout': 90.0},
+}
+
+XAI_BASE_URL = "https://api.x.ai/v1"
+
+
+class _PerLoop:
+    """이벤트 루프별로 한 번만 만드는 객체 (루프가 사라지면 함께 정리)"""
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._items: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]' = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        """현재 실행 중인 루프의 객체"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            item = self._items.get(loop)
+            if item is None:
+                item = self._factory()
+                self._items[loop] = item
+            return item
+
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷 (rate개/초로 채워지고 최대 capacity개까지 누적)
+
+    토큰 수는 프로세스 전체에서 공유하고, 대기 순서를 지키는 잠금만 루프별로 둔다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: 초당 토큰 보충 수
+            capacity: 버킷 크기 (순간 허용량)
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError(f"rate and capacity must be positive: {rate}, {capacity}")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._state_lock = threading.Lock()
+        self._locks = _PerLoop(asyncio.Lock)
+
+    def _try_take(self, tokens: float) -> float:
+        """토큰 보충 후 차감 시도 (성공하면 0, 부족하면 더 기다릴 초)"""
+        with self._state_lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    async def acquire(self, tokens: float = 1.0):
+        """토큰이 찰 때까지 대기 후 차감 (같은 루프 안에서는 대기 순서대로 처리)"""
+        async with self._locks.get():
+            wait = self._try_take(tokens)
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self._try_take(tokens)
+
+
+class ProviderLimiter:
+    """제공자별 동시 호출 수, 요청 속도, 시간 제한"""
+
+    def __init__(
+        self,
+        provider: str,
+        max_concurrency: int = 8,
+        requests_per_minute: float = 300,
+        timeout: float = 60.0,
+        metrics: Optional[MetricsCollector] = None
+    ):
+        """
+        Args:
+            provider: 제공자 이름 (메트릭 접두사)
+            max_concurrency: 동시에 진행할 수 있는 호출 수 (이벤트 루프별)
+            requests_per_minute: 분당 최대 요청 수 (0 이하이면 제한 없음)
+            timeout: 호출당 최대 시간 (초, 대기 시간 제외)
+            metrics: 메트릭 수집기 (기본값: 전역 모니터)
+        """
+        if max_concurrency <= 0:
+            raise ValueError(f"max_concurrency must be positive: {max_concurrency}")
+
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.metrics = metrics or global_monitor.metrics
+
+        self._semaphores = _PerLoop(lambda: asyncio.Semaphore(max_concurrency))
+        # 분당 한도를 1초 단위로 나눠 순간 폭주를 막되, 최소 1건은 즉시 허용
+        self._bucket = None
+        if requests_per_minute and requests_per_minute > 0:
+            rate = requests_per_minute / 60.0
+            self._bucket = TokenBucket(rate, capacity=max(1.0, min(rate, float(max_concurrency))))
+
+        # 성공 또는 취소된 호출의 지연 시간 (헤지 지연 계산에 사용, 취소는 하한값)
+        self.latency = LatencyHistogram()
+
+        self._waiting = 0
+        self._in_flight = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """슬롯 또는 토큰을 기다리는 호출 수"""
+        return self._waiting
+
+    @property
+    def in_flight(self) -> int:
+        """진행 중인 호출 수"""
+        return self._in_flight
+
+    async def call(self, factory: Callable[[], Awaitable[T]], timeout: Optional[float] = None) -> T:
+        """
+        제한을 적용해 비동기 호출 실행
+
+        Args:
+            factory: 호출 코루틴을 만드는 함수 (슬롯 확보 후에 생성)
+            timeout: 호출 시간 제한 (초, 기본값: 생성 시 설정)
+
+        Raises:
+            TimeoutError: 시간 제한 초과
+        """
+        timeout = self.timeout if timeout is None else timeout
+        prefix = f'llm_{self.provider}'
+
+        self._waiting += 1
+        self.metrics.record_metric(f'{prefix}_queue_depth', self._waiting)
+        queued = time.perf_counter()
+        semaphore = self._semaphores.get()
+        try:
+            await semaphore.acquire()
+            try:
+                if self._bucket is not None:
+                    await self._bucket.acquire()
+            except BaseException:
+                semaphore.release()
+                raise
+        finally:
+            self._waiting -= 1
+
+        started = time.perf_counter()
+        self.metrics.record_metric(f'{prefix}_queue_seconds', started - queued)
+
+        self._in_flight += 1
+        self.metrics.record_metric(f'{prefix}_in_flight', self._in_flight)
+        try:
+            result = await asyncio.wait_for(factory(), timeout=timeout)
+            self.latency.observe(time.perf_counter() - started)
+            return result
+        except asyncio.TimeoutError:
+            self.metrics.increment_counter(f'{prefix}_timeouts')
+            raise TimeoutError(f"{self.provider} API 호출 시간 초과 ({timeout:.0f}초)")
+        except asyncio.CancelledError:
+            # 헤지에서 진 호출도 최소한 이만큼은 걸렸으므로 하한 표본으로 기록
+            # (성공한 호출만 기록하면 헤지 지연으로 쓰는 p95가 낮게 치우침)
+            self.latency.observe(time.perf_counter() - started)
+            raise
+        except Exception:
+            self.metrics.increment_counter(f'{prefix}_errors')
+            raise
+        finally:
+            self._in_flight -= 1
+            semaphore.release()
+            # 기존 API 응답 시간 모니터(openai_api_duration 등)와 같은 이름으로 기록
+            self.metrics.record_metric(f'{self.provider}_api_duration', time.perf_counter() - started)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """현재 상태와 최근 5분 대기/응답 시간 통계"""
+        return {
+            'max_concurrency': self.max_concurrency,
+            'in_flight': self._in_flight,
+            'queue_depth': self._waiting,
+            'queue_seconds': self.metrics.get_metric_stats(f'llm_{self.provider}_queue_seconds'),
+            'api_duration': self.metrics.get_metric_stats(f'{self.provider}_api_duration'),
+            'latency': self.latency.snapshot(),
+            'timeouts': self.metrics.counters.get(f'llm_{self.provider}_timeouts', 0),
+            'errors': self.metrics.counters.get(f'llm_{self.provider}_errors', 0)
+        }
+
+
+class LLMClientPool:
+    """
+    제공자별 공유 비동기 클라이언트와 호출 제한
+
+    httpx 연결 풀은 이벤트 루프에 묶이므로 클라이언트는 루프별로 한 번만 만든다.
+    """
+
+    def __init__(self, metrics: Optional[MetricsCollector] = None):
+        self.metrics = metrics or global_monitor.metrics
+        self.limiters: Dict[str, ProviderLimiter] = {
+            provider: ProviderLimiter(provider, metrics=self.metrics, **_provider_settings(provider))
+            for provider in DEFAULT_PROVIDER_LIMITS
+        }
+        self.max_connections = int(os.getenv('LLM_HTTP_MAX_CONNECTIONS', '32'))
+        self.keepalive_seconds = float(os.getenv('LLM_HTTP_KEEPALIVE_SECONDS', '60'))
+
+        self._clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Any, Any]]' = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def limiter(self, provider: str) -> ProviderLimiter:
+        """제공자 제한기 (등록되지 않은 제공자는 기본값으로 생성)"""
+        if provider not in self.limiters:
+            self.limiters[provider] = ProviderLimiter(
+                provider, metrics=self.metrics, **_provider_settings(provider)
+            )
+        return self.limiters[provider]
+
+    async def call(self, provider: str, factory: Callable[[], Awaitable[T]],
+                   timeout: Optional[float] = None) -> T:
+        """제공자 제한을 적용해 호출"""
+        return await self.limiter(provider).call(factory, timeout=timeout)
+
+    def _loop_clients(self) -> Dict[Any, Any]:
+        loop = asyncio.get_running_loop()
+        clients = self._clients.get(loop)
+        if clients is None:
+            clients = {}
+            self._clients[loop] = clients
+        return clients
+
+    def _http_client(self):
+        """keep-alive 연결을 재사용하는 httpx 비동기 클라이언트"""
+        import httpx
+
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=self.keepalive_seconds
+            ),
+            timeout=httpx.Timeout(None, connect=10.0)
+        )
+
+    def openai_client(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+        """
+        OpenAI 호환 비동기 클라이언트 (키와 base_url 조합별로 공유)
+
+        시간 제한과 재시도는 ProviderLimiter.call과 상위 fallback에서 처리한다.
+        """
+        from openai import AsyncOpenAI
+
+        api_key = api_key or os.getenv('OPENAI_API_KEY')
+        if not api_key:
+            return None
+
+        clients = self._loop_clients()
+        key = ('openai', api_key, base_url)
+        if key not in clients:
+            clients[key] = AsyncOpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=self._http_client(),
+                max_retries=2
+            )
+        return clients[key]
+
+    def xai_client(self, api_key: Optional[str] = None):
+        """XAI (Grok) 비동기 클라이언트"""
+        return self.openai_client(api_key or os.getenv('XAI_API_KEY'), base_url=XAI_BASE_URL)
+
+    async def aclose(self):
+        """현재 루프의 클라이언트 연결 정리"""
+        loop = asyncio.get_running_loop()
+        clients = self._clients.pop(loop, {})
+        for client in clients.values():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"LLM 클라이언트 종료 실패: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """제공자별 상태"""
+        return {provider: limiter.get_stats() for provider, limiter in self.limiters.items()}
+
+
+def _provider_settings(provider: str) -> Dict[str, Any]:
+    """환경 변수 LLM_{PROVIDER}_MAX_CONCURRENCY / _RPM / _TIMEOUT 반영"""
+    defaults = DEFAULT_PROVIDER_LIMITS.get(
+        provider, {'max_concurrency': 4, 'requests_per_minute': 60, 'timeout': 60.0}
+    )
+    name = provider.upper()
+    return {
+        'max_concurrency': int(os.getenv(f'LLM_{name}_MAX_CONCURRENCY', defaults['max_concurrency'])),
+        'requests_per_minute': float(os.getenv(f'LLM_{name}_RPM', defaults['requests_per_minute'])),
+        'timeout': float(os.getenv(f'LLM_{name}_TIMEOUT', defaults['timeout']))
+    }
+
+
+# 프로세스 전역 LLM 클라이언트 풀
+_llm_pool = None
+_llm_pool_lock = threading.Lock()
+
+
+def get_llm_client_pool() -> LLMClientPool:
+    """LLM 클라이언트 풀 싱글톤 반환"""
+    global _llm_pool
+    if _llm_pool is None:
+        with _llm_pool_lock:
+            if _llm_pool is None:
+                _llm_pool = LLMClientPool()
+    return _llm_pool
@@ -0,0 +1,191 @@
+"""
+Long Running 작업 비동기 대기
+operation.done()/result()는 내부적으로 블로킹 RPC이므로 스레드에서 호출하고,
+폴링 간격은 지수 백오프로 늘려 이벤트 루프를 점유하지 않도록 한다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from .monitoring import MetricsCollector, global_monitor
+
+logger = logging.getLogger(__name__)
+
+
+class OperationWaiter:
+    """동시 진행 작업 수 제한, 요청 단위 취소, 대기 메트릭을 갖춘 작업 대기기"""
+
+    def __init__(
+        self,
+        max_inflight: int = 4,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        multiplier: float = 1.5,
+        timeout: float = 1800.0,
+        metric_prefix: str = 'stt',
+        metrics: Optional[MetricsCollector] = None
+    ):
+        """
+        Args:
+            max_inflight: 이벤트 루프당 동시에 진행할 수 있는 작업 수
+            initial_interval: 첫 폴링 간격 (초)
+            max_interval: 최대 폴링 간격 (초)
+            multiplier: 폴링 간격 증가 배수
+            timeout: 작업 완료 최대 대기 시간 (초)
+            metric_prefix: 메트릭 이름 접두사
+            metrics: 메트릭 수집기 (기본값: 전역 모니터)
+        """
+        if max_inflight <= 0:
+            raise ValueError(f"max_inflight must be positive: {max_inflight}")
+
+        self.max_inflight = max_inflight
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.timeout = timeout
+        self.metric_prefix = metric_prefix
+        self.metrics = metrics or global_monitor.metrics
+
+        # asyncio.Semaphore는 처음 사용한 루프에 묶이므로 루프별로 생성
+        self._semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = (
+            weakref.WeakKeyDictionary()
+        )
+        self._semaphores_lock = threading.Lock()
+        self._waiting = 0
+        self._in_flight = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """슬롯을 기다리는 요청 수"""
+        return self._waiting
+
+    @property
+    def in_flight(self) -> int:
+        """진행 중인 작업 수"""
+        return self._in_flight
+
+    def _loop_semaphore(self) -> asyncio.Semaphore:
+        """현재 실행 중인 루프의 슬롯 세마포어"""
+        loop = asyncio.get_running_loop()
+        with self._semaphores_lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_inflight)
+                self._semaphores[loop] = semaphore
+            return semaphore
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """작업 슬롯 확보 (최대 max_inflight개까지 동시 진행)"""
+        semaphore = self._loop_semaphore()
+        self._waiting += 1
+        self.metrics.record_metric(f'{self.metric_prefix}_queue_depth', self._waiting)
+        started = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        self.metrics.record_metric(
+            f'{self.metric_prefix}_slot_wait_seconds', time.perf_counter() - started
+        )
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            semaphore.release()
+
+    async def wait(self, operation: Any, timeout: Optional[float] = None) -> Any:
+        """
+        작업 완료까지 비동기 대기 후 결과 반환
+
+        대기 중인 태스크가 취소되거나 시간이 초과되면 원격 작업도 취소 요청한다.
+
+        Args:
+            operation: done()/result()/cancel()을 제공하는 작업 객체
+            timeout: 최대 대기 시간 (초, 기본값: 생성 시 설정)
+
+        Raises:
+            TimeoutError: 제한 시간 내에 완료되지 않은 경우
+            asyncio.CancelledError: 요청이 취소된 경우
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.perf_counter()
+        deadline = started + timeout
+        interval = self.initial_interval
+        polls = 0
+
+        try:
+            while not await asyncio.to_thread(operation.done):
+                polls += 1
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self.metrics.increment_counter(f'{self.metric_prefix}_operation_timeouts')
+                    await self._cancel_operation(operation)
+                    raise TimeoutError(f"작업 처리 시간 초과 ({timeout:.0f}초)")
+
+                await asyncio.sleep(min(interval, remaining))
+                interval = min(interval * self.multiplier, self.max_interval)
+
+            result = await asyncio.to_thread(operation.result)
+
+        except asyncio.CancelledError:
+            self.metrics.increment_counter(f'{self.metric_prefix}_operation_cancellations')
+            self._cancel_in_background(operation)
+            raise
+
+        elapsed = time.perf_counter() - started
+        self.metrics.record_metric(f'{self.metric_prefix}_operation_wait_seconds', elapsed)
+        logger.info(f"Long Running 작업 완료 - 대기 {elapsed:.1f}초, 폴링 {polls}회")
+        return result
+
+    @staticmethod
+    async def _cancel_operation(operation: Any):
+        """원격 작업 취소 요청 (실패해도 무시)"""
+        cancel = getattr(operation, 'cancel', None)
+        if not callable(cancel):
+            return
+        try:
+            await asyncio.to_thread(cancel)
+        except Exception as e:
+            logger.warning(f"작업 취소 요청 실패: {e}")
+
+    @staticmethod
+    def _cancel_in_background(operation: Any):
+        """취소된 태스크에서는 await할 수 없으므로 스레드에서 취소 요청"""
+        cancel = getattr(operation, 'cancel', None)
+        if not callable(cancel):
+            return
+
+        def run():
+            try:
+                cancel()
+            except Exception as e:
+                logger.warning(f"작업 취소 요청 실패: {e}")
+
+        threading.Thread(target=run, name='operation-cancel', daemon=True).start()
+
+
+# 프로세스 전역 STT 작업 대기기
+_stt_waiter = None
+_stt_waiter_lock = threading.Lock()
+
+
+def get_stt_operation_waiter() -> OperationWaiter:
+    """STT 작업 대기기 싱글톤 반환 (STT_MAX_INFLIGHT_OPERATIONS로 동시 작업 수 설정)"""
+    global _stt_waiter
+    if _stt_waiter is None:
+        with _stt_waiter_lock:
+            if _stt_waiter is None:
+                _stt_waiter = OperationWaiter(
+                    max_inflight=int(os.getenv('STT_MAX_INFLIGHT_OPERATIONS', '4')),
+                    metric_prefix='stt'
+                )
+    return _stt_waiter
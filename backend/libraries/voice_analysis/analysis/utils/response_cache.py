@@ -0,0 +1,261 @@
+"""
+LLM 응답 캐시
+(모델, 시스템 프롬프트, 사용자 프롬프트, temperature)를 정규화 해시로 묶어
+같은 전사 재처리나 같은 지표 값의 종합 해석 요청에서 LLM 호출을 생략한다.
+메모리 LRU+TTL 1단계와 선택적인 SQLite 디스크 2단계로 구성된다.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .transcript_cache import SQLiteTranscriptCache
+
+logger = logging.getLogger(__name__)
+
+# 캐시 항목 형식이 바뀌면 올려서 기존 항목을 무효화
+RESPONSE_CACHE_VERSION = 1
+
+_NUMBER_PATTERN = re.compile(r'-?\d+\.\d+')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_prompt(text: str, float_precision: int = 3) -> str:
+    """
+    프롬프트 정규화 (공백 정리, 소수 반올림)
+
+    들여쓰기나 줄바꿈만 다른 프롬프트, 유효 자릿수 이하로만 다른 지표 값을 같은 키로 본다.
+    """
+    text = _NUMBER_PATTERN.sub(
+        lambda match: f"{round(float(match.group()), float_precision):.{float_precision}f}", text
+    )
+    return _WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def make_response_key(
+    namespace: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    exact: bool = False,
+    float_precision: int = 3
+) -> str:
+    """
+    응답 캐시 키 생성
+
+    Args:
+        namespace: 호출 위치 구분 (예: 'text_analysis')
+        model: 모델 이름
+        system_prompt: 시스템 프롬프트
+        user_prompt: 사용자 프롬프트
+        temperature: 샘플링 temperature
+        exact: True면 정규화 없이 원문 그대로 해시 (임상 재현성 모드)
+        float_precision: 정규화 시 소수 자릿수
+    """
+    if not exact:
+        system_prompt = normalize_prompt(system_prompt, float_precision)
+        user_prompt = normalize_prompt(user_prompt, float_precision)
+
+    material = json.dumps(
+        [RESPONSE_CACHE_VERSION, 'exact' if exact else 'normalized', namespace,
+         model, system_prompt, user_prompt, float(temperature)],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """메모리 LRU+TTL과 디스크 계층을 갖춘 LLM 응답 캐시"""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 7 * 24 * 3600,
+        disk_path: Optional[str] = None,
+        disk_max_bytes: int = 256 * 1024 * 1024,
+        exact_match: bool = False,
+        float_precision: int = 3
+    ):
+        """
+        Args:
+            max_entries: 메모리 계층 최대 항목 수
+            ttl_seconds: 항목 유효 기간 (초)
+            disk_path: 디스크 계층 SQLite 경로 (None이면 메모리만 사용)
+            disk_max_bytes: 디스크 계층 최대 크기 (바이트)
+            exact_match: 정규화 없이 원문 일치만 적중 (임상 재현성 모드)
+            float_precision: 정규화 시 소수 자릿수
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.exact_match = exact_match
+        self.float_precision = float_precision
+
+        self._memory: 'OrderedDict[str, Tuple[float, Any, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.disk = None
+        if disk_path:
+            try:
+                self.disk = SQLiteTranscriptCache(disk_path, ttl_seconds=ttl_seconds,
+                                                  max_bytes=disk_max_bytes)
+            except Exception as e:
+                logger.warning(f"LLM 응답 디스크 캐시 초기화 실패, 메모리만 사용: {e}")
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.saved_tokens = 0
+
+    def make_key(self, namespace: str, model: str, system_prompt: str,
+                 user_prompt: str, temperature: float) -> str:
+        """현재 모드(정규화/원문 일치)의 캐시 키"""
+        return make_response_key(
+            namespace, model, system_prompt, user_prompt, temperature,
+            exact=self.exact_match, float_precision=self.float_precision
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 조회 (호출자가 수정해도 캐시가 바뀌지 않도록 복사본 반환)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value, tokens = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    self.saved_tokens += tokens
+                    return copy.deepcopy(value)
+                del self._memory[key]
+
+        if self.disk is not None:
+            try:
+                data = self.disk.get(key)
+            except Exception as e:
+                logger.warning(f"LLM 응답 디스크 캐시 조회 실패: {e}")
+                data = None
+
+            if data is not None:
+                try:
+                    payload = json.loads(data.decode('utf-8'))
+                except ValueError:
+                    payload = None
+
+                if payload is not None:
+                    value, tokens = payload['value'], int(payload.get('tokens', 0))
+                    with self._lock:
+                        self._put_memory(key, value, tokens, now)
+                        self.disk_hits += 1
+                        self.saved_tokens += tokens
+                    return copy.deepcopy(value)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any, tokens: int = 0):
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: JSON 직렬화 가능한 응답
+            tokens: 응답 생성에 사용된 토큰 수 (적중 시 절약 토큰으로 집계)
+        """
+        # 디스크 계층과 같은 형태로 맞춰 메모리/디스크 적중 결과를 동일하게 유지
+        try:
+            data = json.dumps({'value': value, 'tokens': int(tokens)},
+                              ensure_ascii=False, default=str)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"LLM 응답 직렬화 실패, 캐시 저장 생략: {e}")
+            return
+        value = json.loads(data)['value']
+
+        with self._lock:
+            self._put_memory(key, value, int(tokens), time.time())
+
+        if self.disk is not None:
+            try:
+                self.disk.set(key, data.encode('utf-8'))
+            except Exception as e:
+                logger.warning(f"LLM 응답 디스크 캐시 저장 실패: {e}")
+
+    def _put_memory(self, key: str, value: Any, tokens: int, now: float):
+        self._memory[key] = (now + self.ttl_seconds, value, tokens)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self):
+        """메모리 계층 비우기"""
+        with self._lock:
+            self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중/미스, 절약 토큰 수"""
+        hits = self.memory_hits + self.disk_hits
+        total = hits + self.misses
+        stats = {
+            'mode': 'exact' if self.exact_match else 'normalized',
+            'entries': len(self._memory),
+            'max_entries': self.max_entries,
+            'hits': hits,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': hits / total if total else 0.0,
+            'saved_tokens': self.saved_tokens
+        }
+        if self.disk is not None:
+            try:
+                stats['disk'] = self.disk.get_stats()
+            except Exception as e:
+                stats['disk'] = {'error': str(e)}
+        return stats
+
+
+# 프로세스 전역 LLM 응답 캐시
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """
+    환경 변수 설정으로 LLM 응답 캐시 싱글톤 반환 (비활성화 시 None)
+
+    LLM_CACHE_MODE: 'normalized'(기본), 'exact', 'none'
+    LLM_CACHE_TTL_HOURS: 유효 기간 (시간)
+    LLM_CACHE_MAX_ENTRIES: 메모리 계층 최대 항목 수
+    LLM_CACHE_PATH: 디스크 계층 SQLite 경로 (기본 빈 값: 메모리만 사용, 지정할 때만 디스크에 저장)
+    LLM_CACHE_MAX_MB: 디스크 계층 최대 크기 (MB)
+    """
+    global _response_cache
+    mode = os.getenv('LLM_CACHE_MODE', 'normalized').lower()
+    if mode in ('none', 'off', 'disabled'):
+        return None
+
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = LLMResponseCache(
+                    max_entries=int(os.getenv('LLM_CACHE_MAX_ENTRIES', '1024')),
+                    ttl_seconds=float(os.getenv('LLM_CACHE_TTL_HOURS', '168')) * 3600,
+                    disk_path=os.getenv('LLM_CACHE_PATH', '') or None,
+                    disk_max_bytes=int(float(os.getenv('LLM_CACHE_MAX_MB', '256')) * 1024 * 1024),
+                    exact_match=mode == 'exact'
+                )
+                logger.info(
+                    f"LLM 응답 캐시 활성화: {mode} "
+                    f"(디스크 계층: {'사용' if _response_cache.disk else '없음'})"
+                )
+    return _response_cache
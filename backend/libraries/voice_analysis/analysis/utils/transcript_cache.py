@@ -0,0 +1,276 @@
+"""
+STT 전사 결과 캐시
+(오디오 해시, 언어, 인식 설정)을 키로 Speech API 원본 응답을 저장해
+같은 녹음을 재분석할 때 업로드와 Long Running 인식을 생략한다.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 캐시 항목 형식이 바뀌면 올려서 기존 항목을 무효화
+CACHE_FORMAT_VERSION = 1
+
+
+def make_cache_key(audio_hash: str, language_code: str, config_digest: str) -> str:
+    """캐시 키 생성 (오디오 내용, 언어, 인식 설정이 모두 같을 때만 일치)"""
+    material = f"v{CACHE_FORMAT_VERSION}|{audio_hash}|{language_code}|{config_digest}"
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class TranscriptCacheBackend:
+    """전사 캐시 저장소 인터페이스"""
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes):
+        """캐시 저장"""
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 상태"""
+        return {}
+
+
+class SQLiteTranscriptCache(TranscriptCacheBackend):
+    """로컬 SQLite 캐시 (TTL 만료 + 전체 크기 초과 시 오래 사용되지 않은 항목부터 제거)"""
+
+    def __init__(self, path: str, ttl_seconds: float = 30 * 24 * 3600,
+                 max_bytes: int = 512 * 1024 * 1024):
+        """
+        Args:
+            path: SQLite 파일 경로
+            ttl_seconds: 항목 유효 기간 (초)
+            max_bytes: 저장 값 총 크기 상한 (바이트)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS transcripts ('
+            ' key TEXT PRIMARY KEY,'
+            ' value BLOB NOT NULL,'
+            ' size INTEGER NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' accessed_at REAL NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_transcripts_accessed ON transcripts (accessed_at)'
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value, created_at FROM transcripts WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute('DELETE FROM transcripts WHERE key = ?', (key,))
+                self._conn.commit()
+                return None
+
+            self._conn.execute(
+                'UPDATE transcripts SET accessed_at = ? WHERE key = ?', (now, key)
+            )
+            self._conn.commit()
+            return bytes(value)
+
+    def set(self, key: str, value: bytes):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO transcripts (key, value, size, created_at, accessed_at)'
+                ' VALUES (?, ?, ?, ?, ?)',
+                (key, sqlite3.Binary(value), len(value), now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float):
+        """만료 항목 삭제 후 크기 상한까지 LRU 순으로 삭제"""
+        self._conn.execute(
+            'DELETE FROM transcripts WHERE created_at < ?', (now - self.ttl_seconds,)
+        )
+
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM transcripts').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, size in self._conn.execute(
+            'SELECT key, size FROM transcripts ORDER BY accessed_at ASC'
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute('DELETE FROM transcripts WHERE key = ?', (key,))
+            total -= size
+            evicted += 1
+
+        logger.info(f"STT 캐시 크기 초과로 {evicted}개 항목 제거")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count, total = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM transcripts'
+            ).fetchone()
+        return {
+            'backend': 'sqlite',
+            'path': str(self.path),
+            'entries': count,
+            'size_bytes': total,
+            'max_bytes': self.max_bytes,
+            'ttl_seconds': self.ttl_seconds
+        }
+
+
+class FirestoreTranscriptCache(TranscriptCacheBackend):
+    """
+    Firestore 캐시 (여러 인스턴스가 공유)
+
+    만료는 조회 시 expires_at으로 판단하며, 실제 문서 삭제와 용량 관리는
+    컬렉션의 expires_at 필드에 설정한 Firestore TTL 정책에 맡긴다.
+    """
+
+    # Firestore 문서 크기 제한 (1 MiB)에서 메타데이터 여유분 제외
+    MAX_VALUE_BYTES = 1000 * 1000
+
+    def __init__(self, collection: str = 'stt_transcript_cache',
+                 ttl_seconds: float = 30 * 24 * 3600,
+                 project_id: Optional[str] = None):
+        """
+        Args:
+            collection: 캐시 컬렉션 이름
+            ttl_seconds: 항목 유효 기간 (초)
+            project_id: GCP 프로젝트 ID
+        """
+        from google.cloud import firestore
+
+        self.db = firestore.Client(project=project_id or os.getenv('GCP_PROJECT_ID'))
+        self.collection = self.db.collection(collection)
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key: str) -> Optional[bytes]:
+        snapshot = self.collection.document(key).get()
+        if not snapshot.exists:
+            return None
+
+        data = snapshot.to_dict()
+        expires_at = data.get('expires_at')
+        if expires_at and expires_at < datetime.now(timezone.utc):
+            return None
+        return data.get('value')
+
+    def set(self, key: str, value: bytes):
+        if len(value) > self.MAX_VALUE_BYTES:
+            logger.warning(f"STT 캐시 항목이 Firestore 문서 크기 제한 초과 ({len(value)} bytes) - 저장 생략")
+            return
+
+        now = datetime.now(timezone.utc)
+        self.collection.document(key).set({
+            'value': value,
+            'size': len(value),
+            'created_at': now,
+            'expires_at': now + timedelta(seconds=self.ttl_seconds)
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'backend': 'firestore',
+            'collection': self.collection.id,
+            'ttl_seconds': self.ttl_seconds
+        }
+
+
+class TranscriptCache:
+    """전사 캐시 (백엔드 오류가 STT 처리를 막지 않도록 감싼 프론트)"""
+
+    def __init__(self, backend: TranscriptCacheBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시 조회 (백엔드 오류 시 미스로 처리)"""
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"STT 캐시 조회 실패: {e}")
+            value = None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes):
+        """캐시 저장 (실패해도 무시)"""
+        try:
+            self.backend.set(key, value)
+        except Exception as e:
+            logger.warning(f"STT 캐시 저장 실패: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중률 포함 캐시 상태"""
+        total = self.hits + self.misses
+        try:
+            stats = dict(self.backend.get_stats())
+        except Exception as e:
+            stats = {'error': str(e)}
+        stats.update({
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        })
+        return stats
+
+
+def create_transcript_cache() -> Optional[TranscriptCache]:
+    """
+    환경 변수 설정으로 전사 캐시 생성
+
+    STT_CACHE_BACKEND: 'sqlite'(기본), 'firestore', 'none'
+    STT_CACHE_PATH: SQLite 파일 경로
+    STT_CACHE_TTL_HOURS: 유효 기간 (시간)
+    STT_CACHE_MAX_MB: SQLite 최대 크기 (MB)
+    """
+    backend_name = os.getenv('STT_CACHE_BACKEND', 'sqlite').lower()
+    ttl_seconds = float(os.getenv('STT_CACHE_TTL_HOURS', '720')) * 3600
+
+    try:
+        if backend_name in ('none', 'off', 'disabled'):
+            return None
+        if backend_name == 'firestore':
+            backend = FirestoreTranscriptCache(ttl_seconds=ttl_seconds)
+        else:
+            backend = SQLiteTranscriptCache(
+                path=os.getenv('STT_CACHE_PATH', '/tmp/stt_cache/transcripts.sqlite3'),
+                ttl_seconds=ttl_seconds,
+                max_bytes=int(float(os.getenv('STT_CACHE_MAX_MB', '512')) * 1024 * 1024)
+            )
+    except Exception as e:
+        logger.warning(f"STT 캐시 초기화 실패, 캐시 없이 진행: {e}")
+        return None
+
+    logger.info(f"STT 전사 캐시 활성화: {backend_name}")
+    return TranscriptCache(backend)
@@ -0,0 +1,171 @@
+"""
+시계열 전처리 파이프라인 시간의 기록 수별 비교
+
+기존 구현(지표별 점수 리스트 반복 추출, 레코드별 값 쓰기, iterrows 변환,
+원소별 이동 평균/IQR 루프)과 열 단위 프레임 기반 DataPreprocessor를
+같은 합성 기록으로 비교하고, 결과 점수가 일치하는지 확인한다.
+
+사용법:
+    python benchmarks/bench_preprocessor.py --records 1000 10000
+    python benchmarks/bench_preprocessor.py --records 10000 --legacy-max 0
+"""
+
+import argparse
+import copy
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import signal
+from scipy.stats import mstats
+from sklearn.preprocessing import StandardScaler
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.timeseries.utils.data_preprocessor import DataPreprocessor
+
+METRICS = ['depression', 'cognitive']
+
+OPTIONS = {
+    'handle_missing': 'interpolate',
+    'outlier_treatment': 'winsorize',
+    'smoothing': True,
+    'detrend': True,
+    'difference': True,
+    'normalization': 'standardize'
+}
+
+
+def make_history(n: int, rng) -> list:
+    """결측치 5%, 이상치 3%가 섞인 합성 분석 기록"""
+    t = np.arange(n)
+    depression = 0.5 + 0.0001 * t + 0.05 * rng.standard_normal(n)
+    cognitive = 0.6 - 0.00005 * t + 0.05 * rng.standard_normal(n)
+    for series in (depression, cognitive):
+        spikes = rng.random(n) < 0.03
+        series[spikes] += rng.choice([-0.6, 0.6], spikes.sum())
+    missing = rng.random(n) < 0.05
+
+    start = pd.Timestamp('2020-01-01')
+    return [
+        {
+            'analysis_timestamp': (start + pd.Timedelta(hours=i)).isoformat(),
+            'mentalHealthAnalysis': {
+                'depression': {'score': None if missing[i] else float(depression[i])},
+                'cognitive': {'score': float(cognitive[i])}
+            }
+        }
+        for i in range(n)
+    ]
+
+
+def legacy_scores(data, metric):
+    return [d['mentalHealthAnalysis'][metric]['score'] for d in data]
+
+
+def legacy_write(data, metric, values):
+    for i, value in enumerate(values):
+        data[i]['mentalHealthAnalysis'][metric]['score'] = float(value)
+
+
+def legacy_moving_average(values, window):
+    smoothed = []
+    for i in range(len(values)):
+        start_idx = max(0, i - window // 2)
+        end_idx = min(len(values), i + window // 2 + 1)
+        smoothed.append(np.mean(values[start_idx:end_idx]))
+    return np.array(smoothed)
+
+
+def legacy_outliers(values):
+    q1, q3 = np.percentile(values, [25, 75])
+    iqr = q3 - q1
+    lower_bound, upper_bound = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    return [i for i, value in enumerate(values) if value < lower_bound or value > upper_bound]
+
+
+def legacy_pipeline(data):
+    """기존 구현의 단계별 처리 방식 (OPTIONS 경로만)"""
+    # 결측치: DataFrame 구성 -> 보간 -> iterrows로 되돌리기
+    df = pd.DataFrame([
+        {metric: item['mentalHealthAnalysis'][metric]['score'] for metric in METRICS}
+        for item in data
+    ])
+    if df.isnull().any(axis=1).any():
+        df = df.interpolate(method='linear', limit_direction='both')
+        result = []
+        for i, row in df.iterrows():
+            item = data[i].copy()
+            for metric in METRICS:
+                item['mentalHealthAnalysis'][metric]['score'] = float(row[metric])
+            result.append(item)
+        data = result
+
+    for metric in METRICS:
+        values = legacy_scores(data, metric)
+        if legacy_outliers(values):
+            legacy_write(data, metric, mstats.winsorize(np.asarray(values), limits=(0.05, 0.05)))
+    for metric in METRICS:
+        legacy_write(data, metric, legacy_moving_average(legacy_scores(data, metric), 3))
+    for metric in METRICS:
+        values = np.array(legacy_scores(data, metric))
+        legacy_write(data, metric, signal.detrend(values, type='linear') + np.mean(values))
+
+    differenced = data[1:].copy()
+    for metric in METRICS:
+        legacy_write(differenced, metric, np.diff(legacy_scores(data, metric)))
+    data = differenced
+
+    for metric in METRICS:
+        values = np.array(legacy_scores(data, metric)).reshape(-1, 1)
+        legacy_write(data, metric, StandardScaler().fit_transform(values).flatten())
+    return data
+
+
+def timed(func, make_input, repeat: int):
+    """(최소 실행 시간 ms, 마지막 결과), 입력 준비 시간은 제외"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        data = make_input()
+        started = time.perf_counter()
+        result = func(data)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--legacy-max', type=int, default=10000,
+                        help='이 기록 수까지만 기존 구현 측정 (0이면 생략)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    preprocessor = DataPreprocessor()
+
+    print(f"{'records':>8} {'columnar ms':>12} {'legacy ms':>10} {'speedup':>8} {'max |diff|':>11}")
+    for n in args.records:
+        history = make_history(n, rng)
+        new_ms, (processed, _) = timed(
+            lambda data: preprocessor.preprocess_pipeline(data, OPTIONS), lambda: history, args.repeat
+        )
+
+        if n > args.legacy_max:
+            print(f"{n:8d} {new_ms:12.1f} {'-':>10} {'-':>8} {'-':>11}")
+            continue
+
+        legacy_ms, legacy_processed = timed(legacy_pipeline, lambda: copy.deepcopy(history), args.repeat)
+        diff = max(
+            np.max(np.abs(np.array(legacy_scores(processed, metric))
+                          - np.array(legacy_scores(legacy_processed, metric))))
+            for metric in METRICS
+        )
+        print(f"{n:8d} {new_ms:12.1f} {legacy_ms:10.1f} {legacy_ms / new_ms:7.1f}x {diff:11.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Sinc 필터 고정(freeze) 전후 추론 처리량 비교
+
+사용법:
+    python benchmarks/bench_sinc_filters.py --batch-size 64 --iterations 50
+    python benchmarks/bench_sinc_filters.py --export /tmp/sincnet.pt
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import torch
+
+from analysis.sincnet.original_sincnet_analyzer import OriginalSincNetAnalyzer
+from analysis.sincnet.original_sincnet_model import OriginalSincNetModel, export_inference_model
+
+
+def measure(model, batch: torch.Tensor, iterations: int, warmup: int) -> float:
+    """초당 처리 윈도우 수 측정"""
+    with torch.no_grad():
+        for _ in range(warmup):
+            model(batch)
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            model(batch)
+        elapsed = time.perf_counter() - started
+
+    return batch.shape[0] * iterations / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sinc 필터 고정 전후 windows/sec 비교')
+    parser.add_argument('--model-type', default='depression', choices=['depression', 'insomnia'])
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--threads', type=int, default=None, help='torch intra-op 스레드 수')
+    parser.add_argument('--export', default=None, help='고정 모델 내보내기 경로 (.pt 또는 .onnx)')
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    config = OriginalSincNetAnalyzer.MODEL_CONFIGS[args.model_type]
+    model = OriginalSincNetModel(config)
+    model.eval()
+
+    batch = torch.randn(args.batch_size, config['input_dim'])
+
+    unfrozen = measure(model, batch, args.iterations, args.warmup)
+    with torch.no_grad():
+        reference = model(batch)
+
+    model.freeze()
+    frozen = measure(model, batch, args.iterations, args.warmup)
+    with torch.no_grad():
+        max_diff = (model(batch) - reference).abs().max().item()
+
+    print(f"model={args.model_type} batch={args.batch_size} iterations={args.iterations}")
+    print(f"unfrozen: {unfrozen:10.1f} windows/sec")
+    print(f"frozen:   {frozen:10.1f} windows/sec ({frozen / unfrozen:.2f}x)")
+    print(f"max |frozen - unfrozen| = {max_diff:.2e}")
+
+    if args.export:
+        fmt = 'onnx' if args.export.endswith('.onnx') else 'torchscript'
+        path = export_inference_model(model, args.export, fmt=fmt, input_dim=config['input_dim'])
+        print(f"exported ({fmt}): {path}")
+
+
+if __name__ == '__main__':
+    main()
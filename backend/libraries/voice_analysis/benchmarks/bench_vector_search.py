@@ -0,0 +1,137 @@
+"""
+벡터스토어 유사도 검색 시간의 문서 수별 비교
+
+기존 구현(문서별 순수 Python 코사인 유사도 + 정렬)과 EmbeddingMatrix
+(정규화 행렬-벡터 곱 + argpartition 상위 k)를 같은 합성 임베딩으로 비교하고,
+상위 k 결과가 일치하는지 확인한다.
+--nprobe를 주면 IVF-flat ANN 인덱스의 nprobe별 검색 시간과 recall@k도 측정한다.
+
+사용법:
+    python benchmarks/bench_vector_search.py --docs 10000 100000
+    python benchmarks/bench_vector_search.py --docs 100000 --legacy-max 100000
+    python benchmarks/bench_vector_search.py --docs 100000 --nprobe 4 8 16 32
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from rag.core.embedding_index import EmbeddingMatrix, IVFFlatIndex, recall_at_k
+
+
+def legacy_cosine(vec1, vec2) -> float:
+    """기존 구현: 순수 Python 코사인 유사도"""
+    dot_product = sum(a * b for a, b in zip(vec1, vec2))
+    norm1 = sum(a * a for a in vec1) ** 0.5
+    norm2 = sum(b * b for b in vec2) ** 0.5
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+    return dot_product / (norm1 * norm2)
+
+
+def legacy_search(documents, query, max_results: int, threshold: float):
+    """기존 구현: 전체 문서 루프 + 임계값 통과 문서 복사 + 정렬"""
+    similarities = []
+    for doc in documents:
+        similarity = legacy_cosine(query, doc['embedding'])
+        if similarity >= threshold:
+            doc_with_similarity = doc.copy()
+            doc_with_similarity['similarity'] = similarity
+            similarities.append(doc_with_similarity)
+    similarities.sort(key=lambda x: x['similarity'], reverse=True)
+    return similarities[:max_results]
+
+
+def timed(func, *args, repeat: int = 3):
+    """(최소 실행 시간 ms, 마지막 결과)"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def bench_ann(index: EmbeddingMatrix, vectors: np.ndarray, args, rng):
+    """IVF-flat 인덱스의 nprobe별 검색 시간, recall@k (문서 근처 쿼리 사용)"""
+    started = time.perf_counter()
+    index.ann = IVFFlatIndex.build(index.matrix)
+    build = (time.perf_counter() - started) * 1000
+
+    queries = vectors[rng.integers(len(vectors), size=args.queries)]
+    queries = queries + 0.5 * rng.standard_normal(queries.shape).astype(np.float32)
+    exact = [index.nearest(query, args.top_k, exact=True)[0] for query in queries]
+    exact_ms, _ = timed(lambda: [index.nearest(q, args.top_k, exact=True) for q in queries],
+                        repeat=args.repeat)
+
+    print(f"{'':>8}   ivf-flat: {index.ann.n_lists} lists, build {build:.0f} ms, "
+          f"exact {exact_ms / len(queries):.2f} ms/query")
+    for nprobe in args.nprobe:
+        index.ann.nprobe = nprobe
+        ann_ms, found = timed(lambda: [index.nearest(q, args.top_k)[0] for q in queries],
+                              repeat=args.repeat)
+        recall = np.mean([recall_at_k(a, e) for a, e in zip(found, exact)])
+        print(f"{'':>8}   nprobe {nprobe:4d}: {ann_ms / len(queries):7.2f} ms/query, "
+              f"recall@{args.top_k} {recall:.3f}")
+    index.ann = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='벡터 유사도 검색 시간 비교')
+    parser.add_argument('--docs', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--dim', type=int, default=1536)
+    parser.add_argument('--top-k', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=0.0)
+    parser.add_argument('--legacy-max', type=int, default=10000,
+                        help='기존 구현을 측정할 최대 문서 수 (그 이상은 생략)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--nprobe', type=int, nargs='*', default=[],
+                        help='IVF-flat ANN 인덱스를 만들어 측정할 nprobe 값')
+    parser.add_argument('--queries', type=int, default=50, help='ANN 측정 쿼리 수')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    query = rng.standard_normal(args.dim).astype(np.float32)
+
+    print(f"{'docs':>8} | {'build':>9} {'matrix':>9} | {'legacy':>10} {'speedup':>8} {'top-k match':>11}  (ms)")
+    for n_docs in args.docs:
+        vectors = rng.standard_normal((n_docs, args.dim)).astype(np.float32)
+        # 상위 결과가 분명하도록 일부 문서를 쿼리 근처에 배치
+        vectors[:args.top_k * 4] += 2.0 * query
+
+        started = time.perf_counter()
+        index = EmbeddingMatrix(
+            EmbeddingMatrix.normalize(vectors.copy()),
+            [{'id': i, 'content': f'doc {i}'} for i in range(n_docs)]
+        )
+        build = (time.perf_counter() - started) * 1000
+
+        matrix_ms, fast = timed(index.search, query, args.top_k, args.threshold, repeat=args.repeat)
+
+        if n_docs <= args.legacy_max:
+            documents = [
+                {'id': i, 'content': f'doc {i}', 'embedding': vectors[i].tolist()}
+                for i in range(n_docs)
+            ]
+            legacy_ms, slow = timed(legacy_search, documents, query.tolist(), args.top_k,
+                                    args.threshold, repeat=1)
+            match = [doc['id'] for doc in slow] == [doc['id'] for doc in fast]
+            legacy = f"{legacy_ms:10.1f}"
+            speedup = f"{legacy_ms / matrix_ms:7.0f}x"
+            match = f"{str(match):>11}"
+        else:
+            legacy, speedup, match = f"{'-':>10}", f"{'-':>8}", f"{'-':>11}"
+
+        print(f"{n_docs:8d} | {build:9.1f} {matrix_ms:9.2f} | {legacy} {speedup} {match}")
+
+        if args.nprobe:
+            bench_ann(index, vectors, args, rng)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+VoiceAnalyzer HNR/떨림 계산 시간의 오디오 길이별 증가 추이
+
+기존 직접 계산(np.correlate 전체 자기상관, 프레임 루프 에너지)과
+FFT/누적합 구현을 같은 합성 신호로 비교한다.
+
+사용법:
+    python benchmarks/bench_voice_features.py --durations 5 10 30 60
+    python benchmarks/bench_voice_features.py --durations 60 600 --legacy-max 60
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.core.voice_analysis import VoiceAnalyzer
+
+
+def legacy_hnr_autocorr(y: np.ndarray, sr: int) -> np.ndarray:
+    """기존 구현: 전체 신호 자기상관 (O(n²))"""
+    autocorr = np.correlate(y, y, mode='full')
+    return autocorr[len(autocorr)//2:]
+
+
+def legacy_frame_energy(y: np.ndarray, frame_length: int, hop_length: int) -> np.ndarray:
+    """기존 구현: 프레임 루프 에너지"""
+    energy = []
+    for i in range(0, len(y) - frame_length, hop_length):
+        energy.append(np.sum(y[i:i + frame_length] ** 2))
+    return np.array(energy)
+
+
+def timed(func, *args, repeat: int = 3) -> float:
+    """최소 실행 시간 (ms)"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HNR/떨림 계산 시간 비교')
+    parser.add_argument('--durations', type=float, nargs='+', default=[5, 10, 30, 60])
+    parser.add_argument('--sample-rate', type=int, default=16000)
+    parser.add_argument('--legacy-max', type=float, default=20,
+                        help='기존 구현을 측정할 최대 길이 (초, 그 이상은 생략)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    sr = args.sample_rate
+    frame_length, hop_length = int(0.025 * sr), int(0.010 * sr)
+    max_lag = int(sr / 50)
+    rng = np.random.default_rng(0)
+
+    print(f"{'duration(s)':>11} | {'hnr legacy':>11} {'hnr fft':>9} | {'energy loop':>11} {'energy cumsum':>13}  (ms)")
+    for duration in args.durations:
+        y = (0.1 * rng.standard_normal(int(duration * sr))).astype(np.float32)
+
+        hnr_fft = timed(VoiceAnalyzer._lag_autocorrelation, y, max_lag, repeat=args.repeat)
+        energy_fast = timed(VoiceAnalyzer._frame_energy, y, frame_length, hop_length, repeat=args.repeat)
+
+        if duration <= args.legacy_max:
+            hnr_legacy = f"{timed(legacy_hnr_autocorr, y, sr, repeat=1):11.1f}"
+            energy_legacy = f"{timed(legacy_frame_energy, y, frame_length, hop_length, repeat=1):11.1f}"
+        else:
+            hnr_legacy = energy_legacy = f"{'-':>11}"
+
+        print(f"{duration:11.0f} | {hnr_legacy} {hnr_fft:9.1f} | {energy_legacy} {energy_fast:13.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,9 +5,10 @@ FastAPI 기반 REST API 서비스
 """
 
 import os
+import hmac
 import logging
 import asyncio
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, UploadFile, File, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
@@ -60,6 +61,12 @@ async def startup_event():
     """앱 시작 시 파이프라인 초기화"""
     initialize_pipeline()
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """앱 종료 시 LLM 클라이언트 연결과 파이프라인 실행기 정리"""
+    if pipeline:
+        await pipeline.aclose()
+
 # 요청 모델
 class AnalysisRequest(BaseModel):
     audio_url: Optional[str] = None
@@ -91,7 +98,8 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "ai-analysis-service",
-        "timestamp": "2025-08-15T14:30:00Z"
+        "timestamp": "2025-08-15T14:30:00Z",
+        "sincnet": pipeline.sincnet_analyzer.health() if pipeline else None
     }
 
 @app.post("/analyze", response_model=AnalysisResponse)
@@ -357,6 +365,41 @@ async def upload_audio(file: UploadFile = File(...)):
         logger.error(f"파일 업로드 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail="파일 업로드 중 오류가 발생했습니다")
 
+def verify_admin_token(authorization: Optional[str] = Header(None)) -> None:
+    """모델 관리 엔드포인트 인증 (Authorization: Bearer <MODEL_ADMIN_TOKEN>)"""
+    admin_token = os.getenv('MODEL_ADMIN_TOKEN')
+    if not admin_token:
+        # 토큰이 설정되지 않은 환경에서는 관리 엔드포인트 비활성화
+        raise HTTPException(status_code=403, detail="모델 관리 토큰이 설정되지 않았습니다")
+    
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="인증 토큰이 필요합니다")
+    
+    if not hmac.compare_digest(authorization[len("Bearer "):].encode(), admin_token.encode()):
+        raise HTTPException(status_code=401, detail="유효하지 않은 인증 토큰입니다")
+
+@app.post("/models/sincnet/reload", dependencies=[Depends(verify_admin_token)])
+async def reload_sincnet_models(model_type: Optional[str] = None):
+    """Storage에 새 SincNet 체크포인트가 올라온 뒤 모델 재로드 (프로세스 풀 워커 포함)"""
+    if not pipeline:
+        raise HTTPException(status_code=503, detail="분석 파이프라인이 초기화되지 않았습니다")
+    
+    loop = asyncio.get_event_loop()
+    result = await loop.run_in_executor(
+        None, pipeline.reload_sincnet_models, model_type
+    )
+    if not result['success']:
+        # 다운로드/구성 실패 (기존 모델로 계속 추론)
+        raise HTTPException(status_code=502, detail={
+            "message": "SincNet 모델 재로드 실패",
+            "reloaded": result['reloaded'],
+            "workers_recycled": result['workers_recycled']
+        })
+    return {
+        **result,
+        "sincnet": pipeline.sincnet_analyzer.health()
+    }
+
 @app.get("/status/{analysis_id}")
 async def get_analysis_status(analysis_id: str):
     """분석 상태 조회 엔드포인트"""
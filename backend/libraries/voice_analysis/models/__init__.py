@@ -4,13 +4,14 @@ AI 모델 구현 모듈
 SincNet, CNN 등 음성 분석 모델 제공
 """
 
-from .sincnet_model import SincNet, SincConv1d, EmotionSincNet
+from .sincnet_model import SincNet, SincConv1d, EmotionSincNet, freeze_sinc_layers
 from .model_optimizer import ModelOptimizer, ModelPruner
 
 __all__ = [
     'SincNet', 
     'SincConv1d', 
     'EmotionSincNet',
+    'freeze_sinc_layers',
     'ModelOptimizer', 
     'ModelPruner'
 ]
\ No newline at end of file
@@ -209,7 +209,10 @@ class ModelOptimizer:
     
     def _apply_torchscript(self, model: nn.Module, sample_input: torch.Tensor) -> ScriptModule:
         """TorchScript 컴파일"""
-        model.eval()
+        from .sincnet_model import freeze_sinc_layers
+        
+        # Sinc 필터를 상수 버퍼로 고정해 일반 Conv 그래프로 컴파일
+        model = freeze_sinc_layers(self._copy_model(model))
         try:
             # Trace 방식 시도
             scripted_model = torch.jit.trace(model, sample_input)
@@ -77,6 +77,9 @@ class SincConv1d(nn.Module):
             torch.arange(kernel_size).float().view(1, -1) - kernel_size // 2
         )
         
+        # 추론용 고정 필터 뱅크 (freeze() 호출 시 생성)
+        self.register_buffer('frozen_filters', None, persistent=False)
+        
         logger.debug(f"SincConv1d 초기화: {out_channels}개 필터, 커널 크기 {kernel_size}")
         
     def forward(self, x: torch.Tensor) -> torch.Tensor:
@@ -89,18 +92,41 @@ class SincConv1d(nn.Module):
         Returns:
             filtered: 필터링된 신호 [batch, out_channels, time]
         """
+        # 고정된 필터가 있으면 재계산 없이 사용
+        if self.frozen_filters is not None:
+            filters = self.frozen_filters
+        else:
+            filters = self.compute_filters()
+        
+        # Convolution 수행
+        return F.conv1d(x, filters, stride=self.stride, padding=self.padding)
+    
+    def compute_filters(self) -> torch.Tensor:
+        """현재 주파수 파라미터로 필터 뱅크 생성 [out_channels, 1, kernel_size]"""
         # 주파수 대역 제약 적용
         low = self.min_low_hz + torch.abs(self.low_hz)
         high = torch.clamp(
             low + self.min_band_hz + torch.abs(self.band_hz),
-            min_low_hz, self.nyquist
+            self.min_low_hz, self.nyquist
         )
         
         # Sinc 필터 생성
-        filters = self._create_sinc_filters(low, high)
-        
-        # Convolution 수행
-        return F.conv1d(x, filters, stride=self.stride, padding=self.padding)
+        return self._create_sinc_filters(low, high)
+    
+    @property
+    def is_frozen(self) -> bool:
+        return self.frozen_filters is not None
+    
+    def freeze(self) -> 'SincConv1d':
+        """추론 모드: 필터 뱅크를 한 번만 계산해 버퍼로 고정"""
+        with torch.no_grad():
+            self.frozen_filters = self.compute_filters().detach().clone()
+        return self
+    
+    def unfreeze(self) -> 'SincConv1d':
+        """학습 모드: 매 forward마다 필터 재계산"""
+        self.frozen_filters = None
+        return self
     
     def _create_sinc_filters(
         self,
@@ -606,6 +632,26 @@ class AdvancedSincNet(nn.Module):
         
         return logits
 
+def freeze_sinc_layers(model: nn.Module) -> nn.Module:
+    """
+    모델 내 모든 SincConv1d 필터를 고정하고 추론 모드로 전환
+    
+    고정 후에는 일반 Conv1d 모델과 같으므로 TorchScript/ONNX로 내보낼 수 있다.
+    
+    Args:
+        model: SincConv1d를 포함한 모델
+        
+    Returns:
+        같은 모델 (eval 모드, 그래디언트 비활성화)
+    """
+    model.eval()
+    model.requires_grad_(False)
+    for module in model.modules():
+        if isinstance(module, SincConv1d):
+            module.freeze()
+    return model
+
+
 def create_model(
     model_type: str = 'basic',
     **kwargs
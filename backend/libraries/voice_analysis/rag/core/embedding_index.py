@@ -0,0 +1,405 @@
+"""
+임베딩 행렬 인덱스
+JSONL 임베딩을 한 번만 읽어 정규화된 float32 연속 행렬로 보관하고,
+검색은 행렬-벡터 곱 한 번과 argpartition 상위 k 선택으로 처리한다.
+지식 베이스가 커지면 오프라인으로 만든 근사 최근접 이웃(ANN) 인덱스를 붙여
+후보 문서만 계산하고, 전수 검색은 정확한 fallback으로 유지한다.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# .npy 사이드카 형식이 바뀌면 올려서 기존 파일을 무시
+SIDECAR_VERSION = 1
+
+# ANN 인덱스 파일 형식 버전
+ANN_INDEX_VERSION = 1
+
+
+def sidecar_paths(jsonl_path: str) -> Tuple[str, str]:
+    """임베딩 JSONL에 대응하는 (행렬 .npy, 문서 메타데이터 .json) 경로"""
+    base = os.path.splitext(jsonl_path)[0]
+    return f"{base}.matrix.npy", f"{base}.docs.json"
+
+
+class EmbeddingMatrix:
+    """정규화된 임베딩 행렬과 문서 메타데이터"""
+
+    def __init__(self, matrix: np.ndarray, documents: List[Dict[str, Any]]):
+        """
+        Args:
+            matrix: (N, d) 행 단위 L2 정규화된 float32 행렬 (영벡터 행은 0)
+            documents: 행 순서와 같은 문서 메타데이터 (embedding 필드 제외)
+        """
+        if len(matrix) != len(documents):
+            raise ValueError(f"matrix rows ({len(matrix)}) != documents ({len(documents)})")
+        self.matrix = matrix
+        self.documents = documents
+        # 근사 검색 백엔드 (None이면 전수 검색)
+        self.ann: Optional['IVFFlatIndex'] = None
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    @property
+    def dimension(self) -> int:
+        return int(self.matrix.shape[1]) if self.matrix.ndim == 2 else 0
+
+    @staticmethod
+    def normalize(vectors: np.ndarray) -> np.ndarray:
+        """행 단위 L2 정규화 (float32, 영벡터는 그대로 0, float32 배열 입력은 제자리 정규화)"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+    @classmethod
+    def from_documents(cls, documents: Sequence[Dict[str, Any]]) -> 'EmbeddingMatrix':
+        """embedding 필드를 가진 문서 목록에서 생성 (차원이 다른 문서는 제외)"""
+        dimension = next((len(doc['embedding']) for doc in documents if doc.get('embedding')), 0)
+
+        rows, metadata = [], []
+        skipped = 0
+        for doc in documents:
+            embedding = doc.get('embedding')
+            if not embedding or len(embedding) != dimension:
+                skipped += 1
+                continue
+            rows.append(embedding)
+            metadata.append({key: value for key, value in doc.items() if key != 'embedding'})
+
+        if skipped:
+            logger.warning(f"임베딩이 없거나 차원({dimension})이 다른 문서 {skipped}개 제외")
+
+        matrix = np.array(rows, dtype=np.float32).reshape(len(rows), dimension)
+        return cls(np.ascontiguousarray(cls.normalize(matrix)), metadata)
+
+    @classmethod
+    def from_jsonl(cls, path: str, use_sidecar: bool = True, mmap: bool = True) -> 'EmbeddingMatrix':
+        """
+        JSONL 임베딩 파일에서 생성
+
+        use_sidecar이면 JSONL보다 새로운 .npy/.json 사이드카를 우선 읽고(mmap이면 메모리 맵),
+        없으면 JSONL을 파싱한 뒤 사이드카를 기록한다 (쓰기 실패는 무시).
+        """
+        if use_sidecar:
+            index = cls._load_sidecar(path, mmap)
+            if index is not None:
+                return index
+
+        documents = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    documents.append(json.loads(line))
+
+        index = cls.from_documents(documents)
+        if use_sidecar:
+            index._save_sidecar(path)
+        return index
+
+    @classmethod
+    def _load_sidecar(cls, path: str, mmap: bool) -> Optional['EmbeddingMatrix']:
+        matrix_path, docs_path = sidecar_paths(path)
+        try:
+            source_mtime = os.path.getmtime(path)
+            if (os.path.getmtime(matrix_path) < source_mtime
+                    or os.path.getmtime(docs_path) < source_mtime):
+                return None
+
+            with open(docs_path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if payload.get('version') != SIDECAR_VERSION:
+                return None
+
+            matrix = np.load(matrix_path, mmap_mode='r' if mmap else None)
+            if matrix.dtype != np.float32 or len(matrix) != len(payload['documents']):
+                return None
+        except (OSError, ValueError, KeyError):
+            return None
+
+        logger.info(f"임베딩 행렬 사이드카 로드: {matrix_path} ({len(matrix)}개)")
+        return cls(matrix, payload['documents'])
+
+    def _save_sidecar(self, path: str):
+        matrix_path, docs_path = sidecar_paths(path)
+        try:
+            # 다른 프로세스가 절반만 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+            with open(matrix_path + '.tmp', 'wb') as f:
+                np.save(f, np.ascontiguousarray(self.matrix))
+            with open(docs_path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump({'version': SIDECAR_VERSION, 'documents': self.documents}, f, ensure_ascii=False)
+            os.replace(matrix_path + '.tmp', matrix_path)
+            os.replace(docs_path + '.tmp', docs_path)
+        except OSError as e:
+            logger.info(f"임베딩 행렬 사이드카 저장 생략: {e}")
+
+    def scores(self, query: Sequence[float]) -> np.ndarray:
+        """모든 문서와의 코사인 유사도"""
+        query = self.normalize(np.array(query, dtype=np.float32))
+        if query.shape != (self.dimension,):
+            raise ValueError(f"query dimension {query.shape} != index dimension {self.dimension}")
+        return self.matrix @ query
+
+    @staticmethod
+    def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """점수 상위 k개 인덱스 (내림차순)"""
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64)
+        if k < len(scores):
+            candidates = np.argpartition(scores, -k)[-k:]
+        else:
+            candidates = np.arange(len(scores))
+        return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+    def nearest(self, query: Sequence[float], k: int, exact: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        상위 k개 (문서 인덱스, 유사도) - 유사도 내림차순
+
+        ANN 백엔드가 있고 exact가 아니면 근사 검색, 아니면 전수 검색
+        """
+        if self.ann is not None and not exact:
+            query = self.normalize(np.array(query, dtype=np.float32))
+            if query.shape != (self.dimension,):
+                raise ValueError(f"query dimension {query.shape} != index dimension {self.dimension}")
+            return self.ann.nearest(self.matrix, query, k)
+
+        scores = self.scores(query)
+        indices = self.top_k(scores, k)
+        return indices, scores[indices]
+
+    def search(
+        self,
+        query: Sequence[float],
+        max_results: int = 5,
+        similarity_threshold: float = 0.0,
+        keywords: Optional[Sequence[str]] = None,
+        keyword_pool: int = 2,
+        exact: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        유사 문서 검색
+
+        Args:
+            query: 쿼리 임베딩
+            max_results: 최대 반환 수
+            similarity_threshold: 최소 유사도
+            keywords: 키워드 필터 (상위 max_results * keyword_pool개 후보에만 적용)
+            keyword_pool: 키워드 필터 전 후보 배수
+            exact: ANN 인덱스가 있어도 전수 검색
+
+        Returns:
+            similarity 필드가 추가된 문서 사본 목록 (유사도 내림차순)
+        """
+        if len(self) == 0 or max_results <= 0:
+            return []
+
+        pool = max_results * keyword_pool if keywords else max_results
+        indices, scores = self.nearest(query, pool, exact=exact)
+        keep = scores >= similarity_threshold
+        indices, scores = indices[keep], scores[keep]
+
+        results = []
+        for index, score in zip(indices.tolist(), scores.tolist()):
+            doc = self.documents[index]
+            if keywords:
+                doc_text = doc.get('content', doc.get('text', ''))
+                if not any(keyword in doc_text for keyword in keywords):
+                    continue
+            results.append({**doc, 'similarity': float(score)})
+            if len(results) >= max_results:
+                break
+        return results
+
+
+def recall_at_k(approximate: np.ndarray, exact: np.ndarray) -> float:
+    """근사 검색 상위 k가 정확한 상위 k를 포함하는 비율"""
+    if len(exact) == 0:
+        return 1.0
+    return len(np.intersect1d(approximate, exact)) / len(exact)
+
+
+class IVFFlatIndex:
+    """
+    IVF-flat 근사 검색 인덱스 (구면 k-means 역색인)
+
+    문서를 가장 가까운 중심점 리스트에 배정해 두고, 검색 시 쿼리와 가까운
+    nprobe개 리스트의 문서만 정확한 내적으로 계산한다.
+    """
+
+    backend = 'ivf_flat'
+
+    def __init__(self, centroids: np.ndarray, list_offsets: np.ndarray,
+                 list_ids: np.ndarray, nprobe: int = 16):
+        """
+        Args:
+            centroids: (n_lists, d) 정규화된 중심점
+            list_offsets: (n_lists + 1,) 리스트별 list_ids 시작 위치
+            list_ids: (N,) 리스트 순서로 정렬된 문서 인덱스
+            nprobe: 검색할 리스트 수 (클수록 정확하고 느림)
+        """
+        self.centroids = centroids
+        self.list_offsets = list_offsets
+        self.list_ids = list_ids
+        self.nprobe = nprobe
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    @property
+    def num_vectors(self) -> int:
+        return len(self.list_ids)
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        """튜닝 파라미터 (모니터링 기록용)"""
+        return {'backend': self.backend, 'n_lists': self.n_lists, 'nprobe': self.nprobe}
+
+    @classmethod
+    def build(cls, matrix: np.ndarray, n_lists: Optional[int] = None, nprobe: int = 16,
+              iterations: int = 10, sample_size: Optional[int] = None,
+              seed: int = 0, batch_size: int = 16384) -> 'IVFFlatIndex':
+        """
+        정규화된 임베딩 행렬로 인덱스 생성 (오프라인)
+
+        Args:
+            matrix: (N, d) 정규화된 임베딩
+            n_lists: 리스트 수 (기본값: 4 * sqrt(N))
+            nprobe: 기본 검색 리스트 수
+            iterations: k-means 반복 횟수
+            sample_size: 중심점 학습 표본 수 (기본값: n_lists * 64)
+            seed: 난수 시드
+            batch_size: 배정 계산 배치 크기
+        """
+        n = len(matrix)
+        if n == 0:
+            raise ValueError("cannot build IVF index on an empty matrix")
+
+        n_lists = n_lists or max(1, int(4 * np.sqrt(n)))
+        n_lists = min(n_lists, n)
+        rng = np.random.default_rng(seed)
+
+        sample_size = min(n, sample_size or n_lists * 64)
+        sample = np.asarray(matrix[np.sort(rng.choice(n, sample_size, replace=False))], dtype=np.float32)
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignment = cls._assign(sample, centroids, batch_size)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            counts = np.bincount(assignment, minlength=n_lists)
+
+            # 빈 리스트는 표본 중 임의 벡터로 다시 시작
+            empty = counts == 0
+            if empty.any():
+                sums[empty] = sample[rng.choice(sample_size, int(empty.sum()), replace=False)]
+            centroids = EmbeddingMatrix.normalize(sums)
+
+        assignment = cls._assign(matrix, centroids, batch_size)
+        list_ids = np.argsort(assignment, kind='stable').astype(np.int64)
+        list_offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignment, minlength=n_lists), out=list_offsets[1:])
+
+        logger.info(f"IVF-flat 인덱스 생성: {n}개 벡터, {n_lists}개 리스트")
+        return cls(centroids, list_offsets, list_ids, nprobe=nprobe)
+
+    @staticmethod
+    def _assign(vectors: np.ndarray, centroids: np.ndarray, batch_size: int) -> np.ndarray:
+        """가장 가까운(내적 최대) 중심점 인덱스"""
+        assignment = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), batch_size):
+            block = np.asarray(vectors[start:start + batch_size], dtype=np.float32)
+            assignment[start:start + batch_size] = np.argmax(block @ centroids.T, axis=1)
+        return assignment
+
+    def nearest(self, matrix: np.ndarray, query: np.ndarray, k: int,
+                nprobe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        근사 상위 k개 (문서 인덱스, 유사도)
+
+        Args:
+            matrix: 인덱스를 만든 정규화 행렬
+            query: 정규화된 쿼리
+            k: 반환 수
+            nprobe: 검색할 리스트 수 (기본값: 인덱스 설정)
+        """
+        query = np.asarray(query, dtype=np.float32)
+        if query.shape != (self.centroids.shape[1],):
+            raise ValueError(
+                f"query dimension {query.shape} != ANN index dimension {self.centroids.shape[1]}"
+            )
+
+        nprobe = min(nprobe or self.nprobe, self.n_lists)
+        probes = EmbeddingMatrix.top_k(self.centroids @ query, nprobe)
+
+        candidates = np.concatenate([
+            self.list_ids[self.list_offsets[probe]:self.list_offsets[probe + 1]]
+            for probe in probes.tolist()
+        ])
+        if len(candidates) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        scores = matrix[candidates] @ query
+        order = EmbeddingMatrix.top_k(scores, k)
+        return candidates[order], scores[order]
+
+    def save(self, path: str):
+        """npz 파일로 저장"""
+        with open(path, 'wb') as f:
+            np.savez(
+                f,
+                version=np.int64(ANN_INDEX_VERSION),
+                backend=np.array(self.backend),
+                centroids=self.centroids,
+                list_offsets=self.list_offsets,
+                list_ids=self.list_ids,
+                nprobe=np.int64(self.nprobe)
+            )
+
+    @classmethod
+    def load(cls, path: str) -> 'IVFFlatIndex':
+        """npz 파일에서 로드"""
+        with np.load(path) as data:
+            if int(data['version']) != ANN_INDEX_VERSION or str(data['backend']) != cls.backend:
+                raise ValueError(f"unsupported ANN index file: {path}")
+            return cls(
+                data['centroids'],
+                data['list_offsets'],
+                data['list_ids'],
+                nprobe=int(data['nprobe'])
+            )
+
+
+# 설정 이름 -> ANN 백엔드
+ANN_BACKENDS = {
+    IVFFlatIndex.backend: IVFFlatIndex,
+}
+
+
+def load_ann_index(path: str, index: EmbeddingMatrix) -> Optional[IVFFlatIndex]:
+    """
+    ANN 인덱스 파일을 읽어 임베딩 행렬과 맞는지 확인 (맞지 않거나 실패하면 None)
+    """
+    try:
+        with np.load(path) as data:
+            backend = str(data['backend'])
+        ann = ANN_BACKENDS[backend].load(path)
+    except (OSError, KeyError, ValueError) as e:
+        logger.warning(f"ANN 인덱스 로드 실패, 전수 검색 사용: {e}")
+        return None
+
+    if ann.num_vectors != len(index) or ann.centroids.shape[1] != index.dimension:
+        logger.warning(
+            f"ANN 인덱스({ann.num_vectors}x{ann.centroids.shape[1]})가 임베딩"
+            f"({len(index)}x{index.dimension})과 맞지 않아 전수 검색 사용"
+        )
+        return None
+    return ann
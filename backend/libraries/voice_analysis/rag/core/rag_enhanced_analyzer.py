@@ -54,6 +54,8 @@ class RAGEnhancedTextAnalyzer(TextAnalyzer):
                 
                 # RAG 성능 모니터링
                 self.rag_monitor = RAGPerformanceMonitor()
+                # ANN 검색 recall@k 표본을 모니터로 보고
+                self.vector_store.monitor = self.rag_monitor
                 
                 logger.info("RAG 벡터스토어 초기화 성공")
                 
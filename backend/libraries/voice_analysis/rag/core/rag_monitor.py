@@ -31,11 +31,13 @@ class RAGMetrics:
 class RAGPerformanceMonitor:
     """RAG 성능 모니터링 시스템"""
     
-    def __init__(self, cache_size: int = 100, metrics_file: Optional[str] = None):
+    def __init__(self, cache_size: int = 100, metrics_file: Optional[str] = None,
+                 recall_target: float = 0.9):
         """
         Args:
             cache_size: 캐시 크기
             metrics_file: 메트릭 저장 파일 경로
+            recall_target: ANN 검색 목표 recall@k (미달 시 nprobe 증가 제안)
         """
         self.cache_size = cache_size
         self.metrics_file = metrics_file or "ai/analysis/logs/rag_metrics.jsonl"
@@ -46,6 +48,10 @@ class RAGPerformanceMonitor:
         self.cache_hits = 0
         self.cache_misses = 0
         
+        # ANN 검색의 정확 검색 대비 recall@k 표본
+        self.recall_target = recall_target
+        self.recall_samples: deque = deque(maxlen=500)
+        
         # 통계 데이터
         self.stats = {
             'total_queries': 0,
@@ -108,6 +114,44 @@ class RAGPerformanceMonitor:
             self.cache_misses += 1
             return None
     
+    def record_recall(self, k: int, recall: float, params: Optional[Dict[str, Any]] = None) -> None:
+        """
+        ANN 검색 recall@k 표본 기록
+        
+        Args:
+            k: 비교한 상위 결과 수
+            recall: 근사 상위 k 중 정확 상위 k에 포함된 비율
+            params: ANN 인덱스 파라미터 (backend, n_lists, nprobe 등)
+        """
+        self.recall_samples.append({
+            'k': k,
+            'recall': recall,
+            'params': dict(params or {}),
+            'timestamp': datetime.now().isoformat()
+        })
+    
+    def get_recall_stats(self) -> Dict[str, Any]:
+        """ANN recall@k 통계 (nprobe별 평균 포함)"""
+        if not self.recall_samples:
+            return {}
+        
+        by_nprobe = defaultdict(list)
+        for sample in self.recall_samples:
+            by_nprobe[sample['params'].get('nprobe')].append(sample['recall'])
+        
+        latest = self.recall_samples[-1]
+        recalls = [sample['recall'] for sample in self.recall_samples]
+        return {
+            'samples': len(recalls),
+            'avg_recall': sum(recalls) / len(recalls),
+            'min_recall': min(recalls),
+            'latest_params': latest['params'],
+            'by_nprobe': {
+                str(nprobe): {'samples': len(values), 'avg_recall': sum(values) / len(values)}
+                for nprobe, values in by_nprobe.items()
+            }
+        }
+    
     def _add_metrics(self, metrics: RAGMetrics) -> None:
         """메트릭 추가"""
         self.metrics.append(metrics)
@@ -143,9 +187,11 @@ class RAGPerformanceMonitor:
     def get_performance_report(self) -> Dict[str, Any]:
         """성능 리포트 생성"""
         recent_metrics = list(self.metrics)[-100:]  # 최근 100개
+        recall_stats = self.get_recall_stats()
+        ann_stats = {'ann_recall_at_k': recall_stats} if recall_stats else {}
         
         if not recent_metrics:
-            return self.stats
+            return {**self.stats, **ann_stats}
         
         # 최근 성능 분석
         recent_stats = {
@@ -156,7 +202,7 @@ class RAGPerformanceMonitor:
             'large_context_count': sum(1 for m in recent_metrics if m.context_length > 2000)
         }
         
-        return {**self.stats, **recent_stats}
+        return {**self.stats, **recent_stats, **ann_stats}
     
     def get_optimization_suggestions(self) -> List[str]:
         """최적화 제안사항 생성"""
@@ -179,6 +225,15 @@ class RAGPerformanceMonitor:
         if report.get('slow_queries_count', 0) > 10:
             suggestions.append("느린 쿼리가 많습니다. 검색 알고리즘 최적화를 고려하세요.")
         
+        # ANN 검색 정확도
+        recall_stats = report.get('ann_recall_at_k')
+        if recall_stats and recall_stats['avg_recall'] < self.recall_target:
+            nprobe = recall_stats['latest_params'].get('nprobe')
+            suggestions.append(
+                f"ANN 검색 recall@k({recall_stats['avg_recall']:.2f})가 목표({self.recall_target:.2f})보다 낮습니다. "
+                f"RAG_ANN_NPROBE(현재 {nprobe})를 늘리세요."
+            )
+        
         return suggestions
 
 class RAGOptimizer:
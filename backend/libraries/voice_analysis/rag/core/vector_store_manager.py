@@ -8,11 +8,14 @@ import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import asyncio
+import random
 import tempfile
 import firebase_admin
 from firebase_admin import credentials, storage
 from firebase_admin.exceptions import FirebaseError
 
+from .embedding_index import ANN_BACKENDS, EmbeddingMatrix, load_ann_index, recall_at_k
+
 logger = logging.getLogger(__name__)
 
 class FirebaseStorageVectorStore:
@@ -48,6 +51,7 @@ class FirebaseStorageVectorStore:
         # 파일 경로 설정
         self.embeddings_blob_name = "vector_store/embeddings.jsonl"
         self.manifest_blob_name = "vector_store/manifest.json"
+        self.ann_index_blob_name = "vector_store/ann_index.npz"
         
         logger.info(f"Firebase Storage 벡터스토어 초기화: {self.bucket_name}")
         
@@ -57,13 +61,26 @@ class FirebaseStorageVectorStore:
             "analysis", "vector_store"
         )
         self.local_embeddings_path = os.path.join(self.local_vector_store_dir, "embeddings.jsonl")
+        self.local_ann_index_path = os.path.join(self.local_vector_store_dir, "ann_index.npz")
         
-        # 임베딩 검색을 위한 캐시
+        # 임베딩 검색을 위한 캐시 (문서 메타데이터 목록과 정규화된 임베딩 행렬)
         self._embedding_cache = None
+        self._embedding_index: Optional[EmbeddingMatrix] = None
         self._cache_loaded = False
+        
+        # ANN 검색 설정: 사용 여부(기본 전수 검색), 검색 리스트 수(비우면 인덱스 기본값),
+        # 정확 검색 대비 recall 측정 비율
+        self.ann_enabled = os.getenv('RAG_ANN_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+        nprobe = os.getenv('RAG_ANN_NPROBE')
+        self.ann_nprobe = int(nprobe) if nprobe else None
+        self.recall_sample_rate = float(os.getenv('RAG_RECALL_SAMPLE_RATE', '0.05'))
+        
+        # recall@k를 보고할 RAGPerformanceMonitor (RAGEnhancedAnalyzer가 연결)
+        self.monitor = None
     
-    async def upload_vector_store(self, local_embeddings_path: str, local_manifest_path: str) -> bool:
-        """로컬 벡터스토어를 Firebase Storage에 업로드"""
+    async def upload_vector_store(self, local_embeddings_path: str, local_manifest_path: str,
+                                  local_ann_index_path: Optional[str] = None) -> bool:
+        """로컬 벡터스토어를 Firebase Storage에 업로드 (ANN 인덱스는 있으면 함께)"""
         try:
             # 임베딩 파일 업로드
             embeddings_blob = self.bucket.blob(self.embeddings_blob_name)
@@ -73,6 +90,13 @@ class FirebaseStorageVectorStore:
             manifest_blob = self.bucket.blob(self.manifest_blob_name)
             manifest_blob.upload_from_filename(local_manifest_path)
             
+            # ANN 인덱스는 매니페스트 옆에 업로드하고, 없으면 이전 인덱스를 지워 불일치를 막음
+            ann_blob = self.bucket.blob(self.ann_index_blob_name)
+            if local_ann_index_path:
+                ann_blob.upload_from_filename(local_ann_index_path)
+            elif ann_blob.exists():
+                ann_blob.delete()
+            
             logger.info(f"벡터스토어 업로드 완료: {self.bucket_name}")
             return True
             
@@ -98,6 +122,11 @@ class FirebaseStorageVectorStore:
             local_manifest_path = os.path.join(local_dir, "manifest.json")
             manifest_blob.download_to_filename(local_manifest_path)
             
+            # ANN 인덱스 다운로드 (선택)
+            ann_blob = self.bucket.blob(self.ann_index_blob_name)
+            if ann_blob.exists():
+                ann_blob.download_to_filename(os.path.join(local_dir, "ann_index.npz"))
+            
             logger.info(f"벡터스토어 다운로드 완료: {local_dir}")
             return True
             
@@ -112,7 +141,8 @@ class FirebaseStorageVectorStore:
                                      query_text: str, 
                                      keywords: List[str] = None, 
                                      max_results: int = 5, 
-                                     similarity_threshold: float = 0.7) -> List[Dict]:
+                                     similarity_threshold: float = 0.7,
+                                     exact: bool = False) -> List[Dict]:
         """
         유사한 문서 검색
         
@@ -121,6 +151,7 @@ class FirebaseStorageVectorStore:
             keywords: 추가 키워드 필터
             max_results: 최대 반환 결과 수
             similarity_threshold: 유사도 임계값
+            exact: ANN 인덱스가 있어도 전수 검색
             
         Returns:
             유사한 문서 리스트
@@ -139,35 +170,51 @@ class FirebaseStorageVectorStore:
             if query_embedding is None:
                 return []
             
-            # 유사도 계산 및 정렬
-            similarities = []
-            for doc in self._embedding_cache:
-                similarity = self._calculate_cosine_similarity(query_embedding, doc.get('embedding', []))
-                if similarity >= similarity_threshold:
-                    doc_with_similarity = doc.copy()
-                    doc_with_similarity['similarity'] = similarity
-                    similarities.append(doc_with_similarity)
-            
-            # 유사도 순으로 정렬
-            similarities.sort(key=lambda x: x['similarity'], reverse=True)
-            
-            # 키워드 필터링 (선택적)
-            if keywords:
-                filtered_results = []
-                for doc in similarities[:max_results * 2]:  # 더 많이 검색해서 필터링
-                    doc_text = doc.get('content', doc.get('text', ''))
-                    if any(keyword in doc_text for keyword in keywords):
-                        filtered_results.append(doc)
-                        if len(filtered_results) >= max_results:
-                            break
-                return filtered_results
-            
-            return similarities[:max_results]
+            # 행렬-벡터 곱 한 번으로 유사도 계산 후 상위 k 선택, ANN 인덱스가 있으면 후보만 계산
+            # (키워드 필터는 상위 max_results * 2개 후보에만 적용)
+            index = self._embedding_index
+            if index.ann is not None and not exact and random.random() < self.recall_sample_rate:
+                self._sample_recall(query_embedding, max_results)
+            
+            return index.search(
+                query_embedding,
+                max_results=max_results,
+                similarity_threshold=similarity_threshold,
+                keywords=keywords,
+                exact=exact
+            )
             
         except Exception as e:
             logger.error(f"문서 검색 실패: {e}")
             return []
     
+    def _sample_recall(self, query_embedding: List[float], k: int):
+        """근사 검색 상위 k의 정확 검색 대비 recall@k를 모니터에 기록 (nprobe 튜닝용)"""
+        try:
+            index = self._embedding_index
+            approximate, _ = index.nearest(query_embedding, k)
+            exact, _ = index.nearest(query_embedding, k, exact=True)
+            recall = recall_at_k(approximate, exact)
+            
+            if self.monitor is not None:
+                self.monitor.record_recall(k, recall, index.ann.params)
+            logger.debug(f"ANN recall@{k}: {recall:.3f} ({index.ann.params})")
+        except Exception as e:
+            logger.warning(f"ANN recall 측정 실패: {e}")
+    
+    def _attach_ann_index(self, index: EmbeddingMatrix, ann_index_path: str):
+        """
+        RAG_ANN_ENABLED가 켜져 있고 ANN 인덱스 파일이 임베딩과 맞으면 연결
+        (그 외에는 전수 검색, 인덱스 파일이 배포되어 있어도 자동으로 근사 검색으로 바뀌지 않음)
+        """
+        if not self.ann_enabled or not os.path.exists(ann_index_path):
+            return
+        index.ann = load_ann_index(ann_index_path, index)
+        if index.ann is not None:
+            if self.ann_nprobe:
+                index.ann.nprobe = self.ann_nprobe
+            logger.info(f"ANN 인덱스 연결: {index.ann.params}")
+    
     async def _load_local_embeddings(self):
         """로컬 임베딩 파일 로드"""
         try:
@@ -175,16 +222,14 @@ class FirebaseStorageVectorStore:
                 logger.warning(f"로컬 임베딩 파일이 없음: {self.local_embeddings_path}")
                 return
             
-            embeddings = []
-            with open(self.local_embeddings_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip():
-                        doc = json.loads(line.strip())
-                        embeddings.append(doc)
+            # JSONL은 한 번만 파싱하고 이후에는 .npy 사이드카를 메모리 맵으로 읽음
+            index = await asyncio.to_thread(EmbeddingMatrix.from_jsonl, self.local_embeddings_path)
+            await asyncio.to_thread(self._attach_ann_index, index, self.local_ann_index_path)
             
-            self._embedding_cache = embeddings
+            self._embedding_index = index
+            self._embedding_cache = index.documents
             self._cache_loaded = True
-            logger.info(f"로컬 임베딩 {len(embeddings)}개 로드 완료")
+            logger.info(f"로컬 임베딩 {len(index)}개 로드 완료 (차원: {index.dimension})")
             
         except Exception as e:
             logger.error(f"로컬 임베딩 로드 실패: {e}")
@@ -193,17 +238,21 @@ class FirebaseStorageVectorStore:
     async def _generate_query_embedding(self, text: str) -> Optional[List[float]]:
         """쿼리 텍스트의 임베딩 생성"""
         try:
-            # OpenAI 임베딩 API 사용 (기존 임베딩과 동일한 모델)
-            from openai import AsyncOpenAI
+            # OpenAI 임베딩 API 사용 (프로세스 공유 클라이언트, 쿼리마다 새로 만들지 않음)
+            from analysis.utils.llm_client_pool import get_llm_client_pool
             
-            client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+            pool = get_llm_client_pool()
+            client = pool.openai_client()
             if not client:
                 logger.error("OpenAI API 키가 설정되지 않음")
                 return None
             
-            response = await client.embeddings.create(
-                model="text-embedding-3-small",  # 기존 임베딩과 동일한 모델
-                input=text
+            response = await pool.call(
+                'openai',
+                lambda: client.embeddings.create(
+                    model="text-embedding-3-small",  # 기존 임베딩과 동일한 모델
+                    input=text
+                )
             )
             
             return response.data[0].embedding
@@ -293,11 +342,9 @@ class FirebaseStorageVectorStore:
             logger.error(f"벡터스토어 정보 조회 실패: {e}")
             return {'error': str(e)}
     
-    async def load_index(self):
-        """Firebase Storage에서 임베딩 인덱스 로드"""
+    async def load_index(self) -> Optional[EmbeddingMatrix]:
+        """Firebase Storage에서 임베딩 인덱스 로드 (ANN 인덱스가 배포되어 있으면 함께 연결)"""
         try:
-            from .text_analysis import EmbeddingIndex
-            
             # 임시 디렉토리에 다운로드
             temp_dir = tempfile.mkdtemp(prefix="vector_store_temp_")
             success = await self.download_vector_store(temp_dir)
@@ -305,7 +352,15 @@ class FirebaseStorageVectorStore:
             if success:
                 embeddings_path = os.path.join(temp_dir, "embeddings.jsonl")
                 if os.path.exists(embeddings_path):
-                    return EmbeddingIndex(embeddings_path)
+                    index = await asyncio.to_thread(EmbeddingMatrix.from_jsonl, embeddings_path)
+                    await asyncio.to_thread(
+                        self._attach_ann_index, index, os.path.join(temp_dir, "ann_index.npz")
+                    )
+                    
+                    self._embedding_index = index
+                    self._embedding_cache = index.documents
+                    self._cache_loaded = True
+                    return index
             
             return None
             
@@ -319,8 +374,20 @@ class VectorStoreDeployer:
     def __init__(self, bucket_name: Optional[str] = None, project_id: Optional[str] = None):
         self.firebase_store = FirebaseStorageVectorStore(bucket_name, project_id)
     
-    async def deploy_vector_store(self, local_vector_store_dir: str) -> bool:
-        """벡터스토어 배포"""
+    async def deploy_vector_store(self, local_vector_store_dir: str,
+                                  ann_backend: Optional[str] = None,
+                                  n_lists: Optional[int] = None,
+                                  nprobe: int = 16) -> bool:
+        """
+        벡터스토어 배포
+        
+        Args:
+            local_vector_store_dir: embeddings.jsonl, manifest.json이 있는 디렉토리
+            ann_backend: 오프라인으로 생성할 ANN 인덱스 종류 (예: 'ivf_flat', 기본값 None은
+                전수 검색만 사용, 생성해도 검색 시 RAG_ANN_ENABLED가 켜져 있어야 사용)
+            n_lists: IVF 리스트 수 (기본값: 4 * sqrt(문서 수))
+            nprobe: 검색 시 기본 리스트 수
+        """
         try:
             local_embeddings_path = os.path.join(local_vector_store_dir, "embeddings.jsonl")
             local_manifest_path = os.path.join(local_vector_store_dir, "manifest.json")
@@ -333,10 +400,17 @@ class VectorStoreDeployer:
                 logger.error(f"매니페스트 파일이 없습니다: {local_manifest_path}")
                 return False
             
+            local_ann_index_path = None
+            if ann_backend:
+                local_ann_index_path = await asyncio.to_thread(
+                    self.build_ann_index, local_vector_store_dir, ann_backend, n_lists, nprobe
+                )
+            
             # Firebase Storage에 업로드
             success = await self.firebase_store.upload_vector_store(
                 local_embeddings_path, 
-                local_manifest_path
+                local_manifest_path,
+                local_ann_index_path
             )
             
             if success:
@@ -350,6 +424,26 @@ class VectorStoreDeployer:
             logger.error(f"벡터스토어 배포 중 오류: {e}")
             return False
     
+    @staticmethod
+    def build_ann_index(local_vector_store_dir: str, ann_backend: str = 'ivf_flat',
+                        n_lists: Optional[int] = None, nprobe: int = 16) -> str:
+        """
+        embeddings.jsonl로 ANN 인덱스를 만들어 ann_index.npz로 저장
+        
+        Returns:
+            저장된 인덱스 파일 경로
+        """
+        if ann_backend not in ANN_BACKENDS:
+            raise ValueError(f"지원하지 않는 ANN 백엔드: {ann_backend} (지원: {', '.join(ANN_BACKENDS)})")
+        
+        index = EmbeddingMatrix.from_jsonl(os.path.join(local_vector_store_dir, "embeddings.jsonl"))
+        ann = ANN_BACKENDS[ann_backend].build(index.matrix, n_lists=n_lists, nprobe=nprobe)
+        
+        ann_index_path = os.path.join(local_vector_store_dir, "ann_index.npz")
+        ann.save(ann_index_path)
+        logger.info(f"ANN 인덱스 저장: {ann_index_path} ({ann.params})")
+        return ann_index_path
+    
     async def verify_deployment(self) -> Dict[str, Any]:
         """배포 검증"""
         return await self.firebase_store.get_vector_store_info()
@@ -0,0 +1,190 @@
+"""
+일괄 추세 분석 테스트
+BatchTrendAnalyzer의 시니어-지표별 결과가 TrendAnalyzer.analyze_trends / ChangeDetector의
+시니어별 결과와 같은지 확인 (길이가 다른 시계열 혼합, 최소 데이터 수 필터링 포함)
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.timeseries.batch_trend_analyzer import BatchTrendAnalyzer
+from analysis.timeseries.change_detector import ChangeDetector
+from analysis.timeseries.trend_analyzer import TrendAnalyzer
+
+METRICS = ('depression', 'cognitive')
+START = datetime(2026, 1, 1, 9, 0)
+
+# 시니어별 기록 수 (min_points=5 미만인 시니어 포함)
+SERIES_LENGTHS = {'s_short': 3, 's_min': 5, 's_mid': 9, 's_long': 24, 's_steps': 14}
+
+
+def make_records(n, seed, kind='random'):
+    """mentalHealthAnalysis 형식 기록 (불규칙 간격, 0~100 점수)"""
+    rng = np.random.default_rng(seed)
+    day = 0.0
+    records = []
+    for i in range(n):
+        day += float(rng.uniform(0.5, 3.0))
+        if kind == 'steps':
+            # 수준이 급변해 CUSUM 변화점이 생기는 시계열
+            depression = 30.0 + (25.0 if i >= n // 2 else 0.0) + float(rng.normal(0, 2))
+            cognitive = 70.0 - 1.5 * i + float(rng.normal(0, 1))
+        else:
+            depression = 40.0 + 0.8 * i + float(rng.normal(0, 4))
+            # 동점 포함 (Mann-Kendall 동점 보정)
+            cognitive = float(np.round(rng.uniform(55, 65)))
+        records.append({
+            'analysis_timestamp': (START + timedelta(days=day)).isoformat(),
+            'mentalHealthAnalysis': {
+                'depression': {'score': depression},
+                'cognitive': {'score': cognitive}
+            }
+        })
+    # 입력 순서와 무관하게 시간순 정렬되는지 확인
+    rng.shuffle(records)
+    return records
+
+
+class TestBatchTrendParity(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = {
+            senior_id: make_records(n, seed, 'steps' if senior_id == 's_steps' else 'random')
+            for seed, (senior_id, n) in enumerate(SERIES_LENGTHS.items())
+        }
+        cls.baselines = {
+            senior_id: {
+                'mental_health': {
+                    'depression': {'mean': 45.0 + seed, 'std': 5.0},
+                    'cognitive': {'mean': 60.0 - seed, 'std': 0.0 if seed == 1 else 3.0}
+                }
+            }
+            for seed, senior_id in enumerate(SERIES_LENGTHS)
+        }
+        baseline_table = pd.DataFrame([
+            (senior_id, metric, stats['mean'], stats['std'])
+            for senior_id, baseline in cls.baselines.items()
+            for metric, stats in baseline['mental_health'].items()
+        ], columns=['senior_id', 'indicator', 'mean', 'std'])
+
+        analyzer = BatchTrendAnalyzer()
+        cls.table = BatchTrendAnalyzer.to_long_table(cls.data)
+        result = analyzer.analyze(cls.table, baseline=baseline_table)
+        cls.result = result.set_index(['senior_id', 'indicator'])
+
+        cls.expected_trends = {
+            senior_id: TrendAnalyzer().analyze_trends(records, cls.baselines[senior_id])
+            for senior_id, records in cls.data.items()
+        }
+        cls.expected_changes = {
+            senior_id: ChangeDetector().detect_changes(records, cls.baselines[senior_id])
+            for senior_id, records in cls.data.items()
+        }
+
+    def rows(self):
+        for senior_id, n in SERIES_LENGTHS.items():
+            if n < 5:
+                continue
+            for metric in METRICS:
+                with self.subTest(senior=senior_id, metric=metric):
+                    yield senior_id, metric, self.result.loc[(senior_id, metric)]
+
+    def test_min_points_filtering(self):
+        seniors = set(self.result.index.get_level_values('senior_id'))
+        self.assertEqual(seniors, {s for s, n in SERIES_LENGTHS.items() if n >= 5})
+        self.assertEqual(len(self.result), 2 * len(seniors))
+        for senior_id, _, row in self.rows():
+            self.assertEqual(row['data_points'], SERIES_LENGTHS[senior_id])
+
+        # 최소 데이터 수를 낮추면 짧은 시계열도 포함
+        result = BatchTrendAnalyzer().analyze(self.table, min_points=3)
+        self.assertIn('s_short', set(result['senior_id']))
+        empty = BatchTrendAnalyzer().analyze(self.table, min_points=100)
+        self.assertTrue(empty.empty)
+
+    def test_mann_kendall_and_sens_slope(self):
+        for senior_id, metric, row in self.rows():
+            expected = self.expected_trends[senior_id]['trends'][metric]
+            mk = expected['mann_kendall']
+            self.assertEqual(row['mann_kendall_statistic'], mk['statistic'])
+            self.assertAlmostEqual(row['mann_kendall_z_score'], mk['z_score'])
+            self.assertAlmostEqual(row['mann_kendall_p_value'], mk['p_value'])
+            self.assertEqual(row['mann_kendall_trend'], mk['trend'])
+            self.assertAlmostEqual(row['mann_kendall_tau'], mk['tau'])
+
+            slope = expected['sens_slope']
+            self.assertAlmostEqual(row['sens_slope'], slope['slope'])
+            self.assertAlmostEqual(row['sens_slope_ci_lower'], slope['confidence_interval'][0])
+            self.assertAlmostEqual(row['sens_slope_ci_upper'], slope['confidence_interval'][1])
+            self.assertEqual(row['sens_slope_interpretation'], slope['interpretation'])
+
+            self.assertEqual(row['trend_strength'], expected['trend_strength'])
+            self.assertEqual(row['confidence_level'], expected['confidence_level'])
+
+    def test_volatility(self):
+        for senior_id, metric, row in self.rows():
+            expected = self.expected_trends[senior_id]['trends'][metric]['volatility']
+            self.assertAlmostEqual(row['volatility'], expected['volatility'])
+            self.assertAlmostEqual(row['coefficient_of_variation'], expected['coefficient_of_variation'])
+            self.assertEqual(row['volatility_trend'], expected['volatility_trend'])
+            self.assertEqual(row['stability'], expected['stability'])
+
+    def test_baseline_deviation(self):
+        for senior_id, metric, row in self.rows():
+            expected = self.expected_trends[senior_id]['trends'][metric]['baseline_comparison']
+            self.assertAlmostEqual(row['current_mean'], expected['current_mean'])
+            self.assertAlmostEqual(row['difference'], expected['difference'])
+            self.assertAlmostEqual(row['z_score'], expected['z_score'])
+            self.assertEqual(row['deviation_level'], expected['deviation_level'])
+            self.assertEqual(row['direction'], expected['direction'])
+
+            tests = self.expected_changes[senior_id]['statistical_tests'][metric]
+            self.assertAlmostEqual(row['t_statistic'], tests['t_statistic'])
+            self.assertAlmostEqual(row['baseline_p_value'], tests['p_value'])
+            self.assertEqual(row['significant_change'], tests['significant_change'])
+
+    def test_linear_trend(self):
+        for senior_id, metric, row in self.rows():
+            expected = self.expected_changes[senior_id]['trend_analysis'][metric]
+            self.assertEqual(row['linear_trend'], expected['trend'])
+            self.assertAlmostEqual(row['linear_slope'], expected['slope'])
+            self.assertAlmostEqual(row['linear_r_squared'], expected['r_squared'])
+            self.assertAlmostEqual(row['linear_p_value'], expected['p_value'])
+
+    def test_cusum_change_points(self):
+        detected = 0
+        for senior_id, metric, row in self.rows():
+            expected = [
+                change['index'] for change in self.expected_changes[senior_id]['change_points']
+                if change['metric'] == metric
+            ]
+            self.assertEqual(list(row['change_points']), expected)
+            self.assertEqual(row['change_point_count'], len(expected))
+            detected += len(expected)
+        # 변화점이 실제로 존재하는 데이터로 비교했는지 확인
+        self.assertGreater(detected, 0)
+
+    def test_baseline_from_leading_points(self):
+        # 베이스라인 표가 없으면 앞쪽 baseline_points개로 평균/모표준편차 계산
+        result = BatchTrendAnalyzer().analyze(self.table, baseline_points=4)
+        result = result.set_index(['senior_id', 'indicator'])
+        for senior_id, n in SERIES_LENGTHS.items():
+            if n < 5:
+                continue
+            records = sorted(self.data[senior_id], key=lambda r: r['analysis_timestamp'])
+            for metric in METRICS:
+                values = [r['mentalHealthAnalysis'][metric]['score'] for r in records[:4]]
+                row = result.loc[(senior_id, metric)]
+                self.assertAlmostEqual(row['baseline_mean'], np.mean(values))
+                self.assertAlmostEqual(row['baseline_std'], np.std(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
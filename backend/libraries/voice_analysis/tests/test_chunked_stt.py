@@ -0,0 +1,357 @@
+"""
+청크 STT 테스트
+합성 2인 대화와 가짜 인식기로 청크 경계, 겹침 구간 중복 제거, 청크 간 화자 ID 일관성 확인
+청크 인식 실패 시 남은 인식 취소/회수와 단일 인식 대체 여부 확인
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.utils.chunked_stt import (
+    AudioChunk,
+    SpeakerStitcher,
+    concat_word_tables,
+    plan_chunks
+)
+from analysis.utils.decoded_audio import DecodedAudio
+from analysis.utils.operation_waiter import OperationWaiter
+
+try:
+    from analysis.utils.api_connectors import GoogleCloudSpeechConnector
+    CONNECTOR_AVAILABLE = True
+except ImportError:
+    CONNECTOR_AVAILABLE = False
+
+SR = 16000
+WORD_SECONDS = 0.3
+WORD_GAP = 0.1
+TURN_GAP = 0.8
+
+
+def voiced(f0: float, seconds: float, tilt: float) -> np.ndarray:
+    """기본 주파수 f0의 하모닉 합성음 (tilt가 클수록 고역이 약함)"""
+    t = np.arange(int(seconds * SR)) / SR
+    harmonics = np.arange(1, int(4000 // f0) + 1)
+    wave = (np.sin(2 * np.pi * f0 * harmonics[:, None] * t) / harmonics[:, None] ** tilt).sum(axis=0)
+    return 0.3 * wave / np.max(np.abs(wave))
+
+
+# 음색이 뚜렷이 다른 두 화자 (전체 화자 ID 1, 2)
+SPEAKER_VOICES = {
+    1: dict(f0=110.0, tilt=2.0),
+    2: dict(f0=260.0, tilt=0.3),
+}
+
+
+def make_conversation(n_turns: int, seed: int = 0):
+    """
+    화자가 번갈아 말하는 합성 대화
+
+    Returns:
+        (PCM, [(단어, 시작 초, 종료 초, 전체 화자 ID), ...])
+    """
+    rng = np.random.default_rng(seed)
+    words = {
+        speaker: voiced(seconds=WORD_SECONDS, **voice) for speaker, voice in SPEAKER_VOICES.items()
+    }
+    pieces, script = [], []
+    t = 0.0
+    for turn in range(n_turns):
+        speaker = 1 if turn % 2 == 0 else 2
+        for w in range(int(rng.integers(3, 8))):
+            pieces.append(words[speaker])
+            script.append((f"t{turn}w{w}", t, t + WORD_SECONDS, speaker))
+            pieces.append(np.zeros(int(WORD_GAP * SR)))
+            t += WORD_SECONDS + WORD_GAP
+        pieces.append(np.zeros(int(TURN_GAP * SR)))
+        t += TURN_GAP
+    return np.concatenate(pieces).astype(np.float32), script
+
+
+class FakeRecognizer:
+    """
+    청크 오디오 구간 안에 완전히 들어간 단어를 청크 기준 시간으로 반환
+
+    실제 Speech API처럼 청크마다 지역 화자 태그가 달라질 수 있도록 tag_maps를 순환 적용한다.
+    """
+
+    def __init__(self, script, tag_maps=({1: 1, 2: 2}, {1: 2, 2: 1})):
+        self.script = script
+        self.tag_maps = tag_maps
+        self.calls = []
+
+    def recognize(self, chunk: AudioChunk):
+        self.calls.append(chunk.index)
+        start_time, end_time = chunk.start / SR, chunk.end / SR
+        tags = self.tag_maps[chunk.index % len(self.tag_maps)]
+        rows = [
+            (word, start - start_time, end - start_time, tags[speaker])
+            for word, start, end, speaker in self.script
+            if start >= start_time and end <= end_time
+        ]
+        return {
+            'word': [row[0] for row in rows],
+            'start': np.asarray([row[1] for row in rows], dtype=np.float64),
+            'end': np.asarray([row[2] for row in rows], dtype=np.float64),
+            'speaker': np.asarray([row[3] for row in rows], dtype=np.int64),
+            'confidence': np.full(len(rows), 0.9),
+            'result': np.zeros(len(rows), dtype=np.int64)
+        }
+
+
+def stitch(samples, chunks, recognizer, **stitcher_kwargs):
+    """청크별 인식 -> 화자 매핑 -> 연결 (iter_chunked_transcription과 같은 순서)"""
+    stitcher = SpeakerStitcher(sample_rate=SR, **stitcher_kwargs)
+    tables = [stitcher.add_chunk(recognizer.recognize(chunk), chunk, samples) for chunk in chunks]
+    return concat_word_tables(tables), tables
+
+
+def word_table(rows):
+    """[(단어, 시작, 종료, 화자), ...] -> 단어 테이블"""
+    return {
+        'word': [row[0] for row in rows],
+        'start': np.asarray([row[1] for row in rows], dtype=np.float64),
+        'end': np.asarray([row[2] for row in rows], dtype=np.float64),
+        'speaker': np.asarray([row[3] for row in rows], dtype=np.int64),
+        'confidence': np.full(len(rows), 0.9),
+        'result': np.zeros(len(rows), dtype=np.int64)
+    }
+
+
+class TestPlanChunks(unittest.TestCase):
+    CHUNK_ARGS = dict(target_duration=20.0, min_duration=10.0, max_duration=30.0, overlap=2.0)
+
+    def test_short_audio_is_single_chunk(self):
+        samples = np.zeros(25 * SR, dtype=np.float32)
+        chunks = plan_chunks(samples, SR, **self.CHUNK_ARGS)
+        self.assertEqual(chunks, [AudioChunk(index=0, start=0, end=len(samples), core_start=0)])
+
+    def test_boundaries_on_silence_within_limits(self):
+        samples, _ = make_conversation(n_turns=40)
+        chunks = plan_chunks(samples, SR, **self.CHUNK_ARGS)
+
+        self.assertGreater(len(chunks), 2)
+        self.assertEqual([chunk.index for chunk in chunks], list(range(len(chunks))))
+        self.assertEqual(chunks[0].start, 0)
+        self.assertEqual(chunks[0].core_start, 0)
+        self.assertEqual(chunks[-1].end, len(samples))
+
+        for previous, chunk in zip(chunks, chunks[1:]):
+            # 핵심 구간은 빈틈없이 이어지고 겹침은 overlap 길이만큼
+            self.assertEqual(chunk.core_start, previous.end)
+            self.assertEqual(chunk.core_start - chunk.start, 2 * SR)
+
+            # 경계는 무음 구간 안
+            cut = chunk.core_start
+            self.assertFalse(np.any(samples[cut - SR // 100:cut + SR // 100]))
+
+        for chunk in chunks:
+            core = (chunk.end - chunk.core_start) / SR
+            self.assertGreaterEqual(core, 10.0)
+            self.assertLessEqual(core, 30.0)
+
+    def test_no_silence_cuts_at_max_duration(self):
+        rng = np.random.default_rng(0)
+        samples = (0.1 * rng.standard_normal(70 * SR)).astype(np.float32)
+        chunks = plan_chunks(samples, SR, **self.CHUNK_ARGS)
+
+        self.assertEqual([chunk.core_start for chunk in chunks], [0, 30 * SR, 60 * SR])
+        self.assertEqual([chunk.start for chunk in chunks], [0, 28 * SR, 58 * SR])
+        # 마지막 청크도 최소 길이 이상
+        self.assertGreaterEqual((chunks[-1].end - chunks[-1].core_start) / SR, 10.0)
+
+
+class TestSpeakerStitcher(unittest.TestCase):
+    def setUp(self):
+        self.samples, self.script = make_conversation(n_turns=40)
+        self.chunks = plan_chunks(
+            self.samples, SR, target_duration=20.0, min_duration=10.0, max_duration=30.0, overlap=2.0
+        )
+
+    def test_overlap_words_are_not_duplicated(self):
+        recognizer = FakeRecognizer(self.script)
+        merged, tables = stitch(self.samples, self.chunks, recognizer)
+
+        self.assertEqual(recognizer.calls, list(range(len(self.chunks))))
+        # 겹침 구간 단어가 실제로 두 청크에서 인식되었는지 확인
+        recognized = sum(len(recognizer.recognize(chunk)['word']) for chunk in self.chunks)
+        self.assertGreater(recognized, len(self.script))
+
+        self.assertEqual(merged['word'], [row[0] for row in self.script])
+        np.testing.assert_allclose(merged['start'], [row[1] for row in self.script], atol=1e-9)
+        np.testing.assert_allclose(merged['end'], [row[2] for row in self.script], atol=1e-9)
+
+        # 청크별 결과는 각자의 핵심 구간 단어만 포함
+        for chunk, table in zip(self.chunks, tables):
+            self.assertTrue(np.all(table['start'] >= chunk.core_start / SR))
+            self.assertTrue(np.all(table['end'] <= chunk.end / SR))
+
+    def test_speaker_ids_consistent_across_chunks(self):
+        # 청크마다 지역 태그가 뒤바뀌어도 전체 ID는 첫 청크 기준으로 유지
+        merged, tables = stitch(self.samples, self.chunks, FakeRecognizer(self.script))
+
+        self.assertEqual(merged['speaker'].tolist(), [row[3] for row in self.script])
+        self.assertEqual(merged['result'].tolist(), [0] * len(self.script))
+        for table in tables:
+            self.assertTrue(set(table['speaker'].tolist()) <= {1, 2})
+
+    def test_speaker_ids_consistent_without_embeddings(self):
+        # 임베딩 없이 겹침 구간 일치 시간만으로도 매핑 유지
+        merged, _ = stitch(
+            self.samples, self.chunks, FakeRecognizer(self.script), embedding_weight=0.0
+        )
+        self.assertEqual(merged['speaker'].tolist(), [row[3] for row in self.script])
+
+    def test_speaker_without_embedding_keeps_its_id(self):
+        stitcher = SpeakerStitcher(sample_rate=SR, max_speakers=3, embedding_weight=0.0)
+        samples = np.concatenate([
+            voiced(seconds=4.0, **SPEAKER_VOICES[1]), np.zeros(SR)
+        ]).astype(np.float32)
+
+        # 화자 2의 단어는 오디오 범위 밖이라 임베딩이 만들어지지 않음
+        first = AudioChunk(index=0, start=0, end=10 * SR, core_start=0)
+        stitcher.add_chunk(word_table([
+            ('a', 0.5, 3.9, 1),
+            ('b', 7.0, 8.0, 2),
+        ]), first, samples)
+        self.assertEqual(set(stitcher.centroids), {1})
+        self.assertEqual(stitcher.speaker_ids, {1, 2})
+
+        # 겹침 구간에서 화자 1과 일치하는 지역 태그 1, 처음 보는 지역 태그 7
+        second = AudioChunk(index=1, start=6 * SR, end=16 * SR, core_start=10 * SR)
+        table = stitcher.add_chunk(word_table([
+            ('b', 1.0, 2.0, 1),
+            ('c', 5.0, 6.0, 1),
+            ('d', 7.0, 8.0, 7),
+        ]), second, samples)
+
+        mapped = dict(zip(table['word'], table['speaker'].tolist()))
+        self.assertEqual(mapped['c'], 2)
+        self.assertNotIn(mapped['d'], {1, 2})
+        self.assertEqual(stitcher.speaker_ids, {1, 2, mapped['d']})
+
+
+@unittest.skipUnless(CONNECTOR_AVAILABLE, "google-cloud-speech 미설치")
+class TestChunkedTranscriptionFailure(unittest.TestCase):
+    """청크 인식 실패 시 남은 인식 정리와 단일 인식 대체 여부"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # 무음 없는 70초 -> 최대 길이(30초)로 잘린 청크 3개
+        self.audio = DecodedAudio(rng.uniform(-0.3, 0.3, 70 * SR).astype(np.float32), SR)
+        self.cancelled = []
+        self.finished = []
+        self.single_calls = []
+
+    def make_connector(self, behaviours):
+        """
+        청크별 동작이 behaviours[index] = (지연 초, 예외 또는 None)인 커넥터
+        """
+        connector = GoogleCloudSpeechConnector.__new__(GoogleCloudSpeechConnector)
+        connector.chunked_mode = True
+        connector.chunked_min_duration = 0
+        connector.chunk_duration = 20.0
+        connector.chunk_concurrency = 4
+        connector.operation_waiter = OperationWaiter(max_inflight=4)
+
+        pcm = self.audio.to_linear16(SR)
+        chunks = plan_chunks(self.audio.resample(SR), SR, target_duration=20.0,
+                             min_duration=10.0, max_duration=30.0)
+        self.assertEqual(len(chunks), 3)
+        index_of = {pcm[chunk.start:chunk.end].tobytes(): chunk.index for chunk in chunks}
+
+        class FakeClient:
+            def long_running_recognize(self, config, audio, retry):
+                return index_of[audio.content]
+
+        async def wait_for_operation(index):
+            delay, error = behaviours[index]
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(index)
+                raise
+            if error is not None:
+                raise error
+            self.finished.append(index)
+            return SimpleNamespace(results=index)
+
+        def build_word_table(index):
+            return word_table([(f'c{index}', 10.0, 10.3, 1)]), None
+
+        async def transcribe_single(*args, **kwargs):
+            self.single_calls.append(args)
+            return {'status': 'success', 'segments': [], 'transcript': 'single'}, 'long_running'
+
+        connector.client = FakeClient()
+        connector._wait_for_operation = wait_for_operation
+        connector._build_word_table = build_word_table
+        connector._transcribe_single = transcribe_single
+        return connector
+
+    def transcribe(self, connector, on_chunk=None):
+        async def run():
+            result = await connector.transcribe_with_diarization(
+                'call.wav', decoded_audio=self.audio, on_chunk=on_chunk
+            )
+            # 취소된 청크 인식이 루프에 남아 있지 않아야 함
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            return result, pending
+
+        return asyncio.run(run())
+
+    def test_pending_chunks_cancelled_and_awaited(self):
+        connector = self.make_connector({
+            0: (0.0, RuntimeError('chunk 0 failed')),
+            1: (5.0, None),
+            2: (5.0, None)
+        })
+        result, pending = self.transcribe(connector)
+
+        self.assertEqual(pending, [])
+        self.assertIn(1, self.cancelled)
+        self.assertEqual(self.finished, [])
+        # 전달된 청크가 없으므로 단일 인식으로 대체
+        self.assertEqual(len(self.single_calls), 1)
+        self.assertEqual(result['transcript'], 'single')
+        self.assertEqual(result['metadata']['api_type'], 'long_running')
+
+    def test_no_fallback_after_chunks_delivered(self):
+        connector = self.make_connector({
+            0: (0.0, None),
+            1: (0.1, RuntimeError('chunk 1 failed')),
+            2: (5.0, None)
+        })
+        received = []
+        result, pending = self.transcribe(connector, on_chunk=lambda c: received.append(c['index']))
+
+        self.assertEqual(received, [0])
+        self.assertEqual(result['status'], 'error')
+        self.assertIn('chunk 1 failed', result['error'])
+        self.assertEqual(self.single_calls, [])
+        self.assertEqual(pending, [])
+        self.assertEqual(self.finished, [0])
+
+    def test_success_streams_all_chunks(self):
+        connector = self.make_connector({0: (0.05, None), 1: (0.0, None), 2: (0.0, None)})
+        received = []
+
+        async def on_chunk(chunk_result):
+            received.append(chunk_result['index'])
+
+        result, pending = self.transcribe(connector, on_chunk=on_chunk)
+        self.assertEqual(received, [0, 1, 2])
+        self.assertEqual(result['metadata']['api_type'], 'chunked')
+        self.assertEqual(result['metadata']['chunk_count'], 3)
+        self.assertEqual(self.single_calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,339 @@
+"""
+시계열 전처리 테스트
+열 단위 프레임 기반 DataPreprocessor 단계별 결과가 기존 레코드별 구현과 같은지 확인
+(이상치 'interpolate'의 연속 이상치 보간 기준, 'drop'/'remove' 후 원본 레코드 대응 포함)
+"""
+
+import copy
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from scipy import signal
+from scipy.stats import mstats
+from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.timeseries.utils.data_preprocessor import DataPreprocessor
+
+METRICS = ('depression', 'cognitive')
+START = datetime(2026, 1, 1, 9, 0)
+
+# 단계 하나만 적용하는 옵션 (기본값은 결측치 보간 + winsorize)
+NO_STEPS = {'handle_missing': None, 'outlier_treatment': None}
+
+
+def make_records(depression, cognitive):
+    """점수 리스트 -> mentalHealthAnalysis 형식 기록 (None은 결측치)"""
+    return [
+        {
+            'analysis_timestamp': (START + timedelta(hours=i)).isoformat(),
+            'mentalHealthAnalysis': {
+                'depression': {'score': d, 'level': 'mid'},
+                'cognitive': {'score': c, 'level': 'mid'}
+            }
+        }
+        for i, (d, c) in enumerate(zip(depression, cognitive))
+    ]
+
+
+def random_scores(n, seed):
+    rng = np.random.default_rng(seed)
+    return (0.5 + 0.05 * rng.standard_normal(n)).tolist(), (0.6 + 0.05 * rng.standard_normal(n)).tolist()
+
+
+def scores(records, metric):
+    return [r['mentalHealthAnalysis'][metric]['score'] for r in records]
+
+
+def timestamps(records):
+    return [r['analysis_timestamp'] for r in records]
+
+
+def legacy_outlier_indices(values):
+    """기존 _detect_outliers_iqr"""
+    q1, q3 = np.percentile(values, [25, 75])
+    iqr = q3 - q1
+    lower_bound, upper_bound = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    return [i for i, value in enumerate(values) if value < lower_bound or value > upper_bound]
+
+
+def legacy_interpolate_outliers(values):
+    """기존 이상치 'interpolate' (앞에서부터 양옆 값 평균, 앞쪽 값은 이미 바뀐 값 사용)"""
+    treated = list(values)
+    for idx in legacy_outlier_indices(values):
+        if 0 < idx < len(values) - 1:
+            treated[idx] = (treated[idx - 1] + treated[idx + 1]) / 2
+        elif idx == 0:
+            treated[idx] = treated[1]
+        else:
+            treated[idx] = treated[-2]
+    return treated
+
+
+def legacy_remove_outliers(records):
+    """기존 이상치 'remove' (지표별로 줄어든 기록에서 다시 탐지/제거)"""
+    processed = list(records)
+    detected = {}
+    for metric in METRICS:
+        outliers = legacy_outlier_indices(scores(processed, metric))
+        detected[metric] = outliers
+        processed = [item for i, item in enumerate(processed) if i not in set(outliers)]
+    return processed, detected
+
+
+def legacy_moving_average(values, window):
+    """기존 _moving_average"""
+    return [
+        np.mean(values[max(0, i - window // 2):min(len(values), i + window // 2 + 1)])
+        for i in range(len(values))
+    ]
+
+
+def legacy_exponential_smoothing(values, alpha):
+    """기존 _exponential_smoothing"""
+    result = [values[0]]
+    for value in values[1:]:
+        result.append(alpha * value + (1 - alpha) * result[-1])
+    return result
+
+
+class TestMissingValues(unittest.TestCase):
+    def setUp(self):
+        depression, cognitive = random_scores(12, 0)
+        for i in (0, 4, 5, 11):
+            depression[i] = None
+        cognitive[7] = None
+        self.records = make_records(depression, cognitive)
+        self.frame = pd.DataFrame({metric: scores(self.records, metric) for metric in METRICS},
+                                  dtype=np.float64)
+
+    def run_method(self, method):
+        return DataPreprocessor().preprocess_pipeline(
+            self.records, {'handle_missing': method, 'outlier_treatment': None}
+        )
+
+    def test_fill_methods_match_pandas(self):
+        expected_frames = {
+            'interpolate': self.frame.interpolate(method='linear', limit_direction='both'),
+            'forward_fill': self.frame.ffill(),
+            'backward_fill': self.frame.bfill(),
+            'mean': self.frame.fillna(self.frame.mean()),
+            'median': self.frame.fillna(self.frame.median())
+        }
+        for method, expected in expected_frames.items():
+            with self.subTest(method=method):
+                processed, info = self.run_method(method)
+                self.assertEqual(info['missing_treatment']['missing_points'], [0, 4, 5, 7, 11])
+                self.assertEqual(timestamps(processed), timestamps(self.records))
+                for metric in METRICS:
+                    np.testing.assert_allclose(
+                        np.array(scores(processed, metric), dtype=np.float64),
+                        expected[metric].to_numpy(), equal_nan=True
+                    )
+
+    def test_drop_keeps_original_records(self):
+        processed, info = self.run_method('drop')
+        kept = [i for i in range(len(self.records)) if i not in (0, 4, 5, 7, 11)]
+        self.assertEqual(info['missing_treatment']['dropped_indices'], [0, 4, 5, 7, 11])
+        self.assertEqual(timestamps(processed), [self.records[i]['analysis_timestamp'] for i in kept])
+        for metric in METRICS:
+            self.assertEqual(scores(processed, metric),
+                             [self.records[i]['mentalHealthAnalysis'][metric]['score'] for i in kept])
+
+    def test_drop_then_remove_maps_to_original_records(self):
+        depression, cognitive = random_scores(30, 1)
+        depression[3] = None
+        depression[10] = 5.0
+        cognitive[20] = -4.0
+        records = make_records(depression, cognitive)
+
+        processed, info = DataPreprocessor().preprocess_pipeline(
+            records, {'handle_missing': 'drop', 'outlier_treatment': 'remove'}
+        )
+        remaining = [records[i] for i in range(30) if i != 3]
+        expected, detected = legacy_remove_outliers(remaining)
+        self.assertEqual(info['outlier_treatment']['outliers_detected'], detected)
+        self.assertEqual(timestamps(processed), timestamps(expected))
+        self.assertNotIn(records[10]['analysis_timestamp'], timestamps(processed))
+        self.assertNotIn(records[20]['analysis_timestamp'], timestamps(processed))
+
+
+class TestOutliers(unittest.TestCase):
+    def run_method(self, records, method):
+        return DataPreprocessor().preprocess_pipeline(
+            records, {'handle_missing': None, 'outlier_treatment': method}
+        )
+
+    def test_winsorize_and_clip_match_legacy(self):
+        depression, cognitive = random_scores(41, 2)
+        depression[5], depression[30] = 3.0, -2.0
+        cognitive[12] = 4.0
+        records = make_records(depression, cognitive)
+
+        winsorized, _ = self.run_method(records, 'winsorize')
+        clipped, info = self.run_method(records, 'clip')
+        for metric in METRICS:
+            values = np.array(scores(records, metric))
+            np.testing.assert_allclose(scores(winsorized, metric),
+                                       mstats.winsorize(values, limits=(0.05, 0.05)))
+            q1, q3 = np.percentile(values, [25, 75])
+            np.testing.assert_allclose(scores(clipped, metric),
+                                       np.clip(values, q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)))
+            self.assertEqual(info['outlier_treatment']['outliers_detected'][metric],
+                             legacy_outlier_indices(values))
+
+    def test_interpolate_isolated_outliers_match_legacy(self):
+        depression = [0.5 + 0.01 * ((3 * i) % 7) for i in range(20)]
+        cognitive = [0.6 - 0.01 * ((5 * i) % 7) for i in range(20)]
+        # 양 끝과 중간의 서로 떨어진 이상치
+        for i in (0, 7, 19):
+            depression[i] = 5.0
+        cognitive[12] = -3.0
+        records = make_records(depression, cognitive)
+
+        processed, info = self.run_method(records, 'interpolate')
+        self.assertEqual(info['outlier_treatment']['outliers_detected']['depression'], [0, 7, 19])
+        for metric in METRICS:
+            np.testing.assert_allclose(scores(processed, metric),
+                                       legacy_interpolate_outliers(scores(records, metric)))
+
+    def test_interpolate_consecutive_outliers_uses_clean_neighbours(self):
+        depression = [0.50, 0.52, 0.48, 0.51, 5.0, 6.0, 7.0, 0.60, 0.49, 0.50, 0.47, 0.53,
+                      0.50, 0.52, 0.51, 0.49, 0.50, 0.48, 4.0, 4.5]
+        cognitive = [0.6] * len(depression)
+        records = make_records(depression, cognitive)
+
+        processed, info = self.run_method(records, 'interpolate')
+        self.assertEqual(info['outlier_treatment']['outliers_detected']['depression'], [4, 5, 6, 18, 19])
+        expected = list(depression)
+        # 4~6은 3(0.51)과 7(0.60) 사이 직선, 끝쪽 18~19는 가장 가까운 정상값 17(0.48)
+        expected[4:7] = [0.51 + 0.09 * k / 4 for k in (1, 2, 3)]
+        expected[18:20] = [0.48, 0.48]
+        np.testing.assert_allclose(scores(processed, 'depression'), expected)
+        # 기존 구현은 뒤쪽 이상치 값을 그대로 평균에 써서 보간값이 이상치 쪽으로 끌려감
+        self.assertGreater(legacy_interpolate_outliers(depression)[6], 1.0)
+        self.assertEqual(scores(processed, 'cognitive'), cognitive)
+
+    def test_remove_matches_legacy_index_mapping(self):
+        depression, cognitive = random_scores(40, 4)
+        depression[2], depression[25] = 5.0, -4.0
+        # depression 제거 후 위치가 당겨지는 cognitive 이상치
+        cognitive[30], cognitive[31] = 4.0, 4.2
+        records = make_records(depression, cognitive)
+
+        processed, info = self.run_method(records, 'remove')
+        expected, detected = legacy_remove_outliers(records)
+        self.assertEqual(info['outlier_treatment']['outliers_detected'], detected)
+        self.assertEqual(detected['cognitive'][:2], [28, 29])
+        self.assertEqual(info['outlier_treatment']['outliers_treated'],
+                         {'depression': 'removed', 'cognitive': 'removed'})
+        self.assertEqual(timestamps(processed), timestamps(expected))
+        for metric in METRICS:
+            self.assertEqual(scores(processed, metric), scores(expected, metric))
+
+
+class TestTransforms(unittest.TestCase):
+    def setUp(self):
+        self.records = make_records(*random_scores(25, 5))
+        self.values = {metric: np.array(scores(self.records, metric)) for metric in METRICS}
+
+    def test_smoothing_matches_legacy(self):
+        preprocessor = DataPreprocessor()
+        frame = preprocessor._convert_to_dataframe(self.records)
+        for method, window in (('moving_average', 3), ('moving_average', 4), ('moving_average', 1),
+                               ('exponential', 3), ('savgol', 5)):
+            with self.subTest(method=method, window=window):
+                smoothed, info = preprocessor._apply_smoothing(frame, method=method, window=window)
+                self.assertEqual(info['smoothed_metrics'], list(METRICS))
+                for metric in METRICS:
+                    values = self.values[metric].tolist()
+                    if method == 'moving_average':
+                        expected = legacy_moving_average(values, window) if window > 1 else values
+                    elif method == 'exponential':
+                        expected = legacy_exponential_smoothing(values, 0.3)
+                    else:
+                        expected = signal.savgol_filter(values, window, 2)
+                    np.testing.assert_allclose(smoothed[metric].to_numpy(), expected, atol=1e-12)
+
+        processed, info = preprocessor.preprocess_pipeline(self.records, {**NO_STEPS, 'smoothing': True})
+        self.assertIn('smoothing_applied', info['steps_applied'])
+        np.testing.assert_allclose(scores(processed, 'depression'),
+                                   legacy_moving_average(self.values['depression'].tolist(), 3))
+
+    def test_detrend_and_differencing_match_legacy(self):
+        detrended, _ = DataPreprocessor().preprocess_pipeline(self.records, {**NO_STEPS, 'detrend': True})
+        differenced, info = DataPreprocessor().preprocess_pipeline(
+            self.records, {**NO_STEPS, 'difference': True}
+        )
+        self.assertEqual(info['final_length'], 24)
+        self.assertEqual(timestamps(differenced), timestamps(self.records[1:]))
+        for metric in METRICS:
+            values = self.values[metric]
+            np.testing.assert_allclose(scores(detrended, metric),
+                                       signal.detrend(values, type='linear') + np.mean(values))
+            np.testing.assert_allclose(scores(differenced, metric), np.diff(values))
+
+        short, info = DataPreprocessor().preprocess_pipeline(self.records[:1], {**NO_STEPS, 'difference': True})
+        self.assertEqual(info['differencing'], {'error': 'insufficient_data_for_differencing'})
+        self.assertEqual(len(short), 1)
+
+    def test_normalization_matches_per_metric_scalers(self):
+        for method, scaler_class in (('standardize', StandardScaler), ('minmax', MinMaxScaler),
+                                     ('robust', RobustScaler)):
+            with self.subTest(method=method):
+                processed, info = DataPreprocessor().preprocess_pipeline(
+                    self.records, {**NO_STEPS, 'normalization': method}
+                )
+                norm_info = info['normalization']
+                self.assertEqual(norm_info['normalized_metrics'], list(METRICS))
+                for metric in METRICS:
+                    scaler = scaler_class()
+                    expected = scaler.fit_transform(self.values[metric].reshape(-1, 1)).flatten()
+                    np.testing.assert_allclose(scores(processed, metric), expected)
+                    for key, attribute in (('mean', 'mean_'), ('scale', 'scale_'),
+                                           ('min', 'data_min_'), ('max', 'data_max_')):
+                        self.assertEqual(norm_info['scalers'][metric][key],
+                                         getattr(scaler, attribute, [None])[0])
+
+                if method in ('standardize', 'minmax'):
+                    restored = DataPreprocessor().reverse_normalization(processed, norm_info)
+                    for metric in METRICS:
+                        np.testing.assert_allclose(scores(restored, metric), self.values[metric])
+
+
+class TestPipeline(unittest.TestCase):
+    def test_input_records_not_mutated(self):
+        depression, cognitive = random_scores(30, 6)
+        depression[4] = None
+        depression[9] = 5.0
+        records = make_records(depression, cognitive)
+        original = copy.deepcopy(records)
+
+        processed, info = DataPreprocessor().preprocess_pipeline(records, {
+            'smoothing': True, 'detrend': True, 'difference': True, 'normalization': 'standardize'
+        })
+        self.assertEqual(records, original)
+        self.assertEqual(len(processed), 29)
+        self.assertEqual(info['steps_applied'], [
+            'missing_values_handled', 'outliers_handled', 'smoothing_applied',
+            'detrending_applied', 'differencing_applied', 'normalization_applied'
+        ])
+        # 점수 외 필드는 원본 그대로
+        self.assertEqual(processed[0]['mentalHealthAnalysis']['depression']['level'], 'mid')
+        for metric in METRICS:
+            self.assertAlmostEqual(info['final_statistics'][metric]['mean'], 0.0)
+
+    def test_invalid_data_returned_unchanged(self):
+        records = [{'analysis_timestamp': 'not-a-date', 'mentalHealthAnalysis': {}}]
+        processed, info = DataPreprocessor().preprocess_pipeline(records)
+        self.assertFalse(info['validation']['is_valid'])
+        self.assertEqual(processed, records)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,239 @@
+"""
+화자 분리 결과 처리 테스트
+단어 테이블 기반 세그먼트/화자 통계가 기존 단어별 루프 구현과 같은 결과를 내는지 확인
+"""
+
+import os
+import sys
+import unittest
+from datetime import timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    from analysis.utils.api_connectors import GoogleCloudSpeechConnector
+    CONNECTOR_AVAILABLE = True
+except ImportError:
+    CONNECTOR_AVAILABLE = False
+
+
+class FakeWord:
+    """Speech API WordInfo 흉내 (speaker_tag=None이면 속성 자체가 없음)"""
+
+    def __init__(self, word, start, end, speaker_tag=None, confidence=0.9):
+        self.word = word
+        self.start_time = timedelta(seconds=start)
+        self.end_time = timedelta(seconds=end)
+        self.confidence = confidence
+        if speaker_tag is not None:
+            self.speaker_tag = speaker_tag
+
+
+class FakeAlternative:
+    def __init__(self, words, transcript=None):
+        self.words = words
+        self.transcript = transcript if transcript is not None else ' '.join(w.word for w in words)
+
+
+class FakeResult:
+    def __init__(self, alternatives):
+        self.alternatives = alternatives
+
+
+class FakeResponse:
+    def __init__(self, results):
+        self.results = results
+
+
+def words_from(spec, start=0.0):
+    """[(단어, 화자), ...] -> 0.4초 간격 FakeWord 목록"""
+    words = []
+    for i, (word, speaker) in enumerate(spec):
+        t = start + 0.4 * i
+        words.append(FakeWord(word, t, t + 0.3, speaker, confidence=0.5 + 0.05 * (i % 8)))
+    return words
+
+
+def baseline_process(result):
+    """기존 _process_diarization_result의 단어별 루프 구현 (로그 제외)"""
+    segments = []
+    full_transcript = []
+    speaker_stats = {}
+
+    if not hasattr(result, 'results') or not result.results:
+        return {
+            'status': 'error',
+            'segments': [],
+            'speakers': {},
+            'transcript': '',
+            'error': 'API 결과에 results 속성이 없음'
+        }
+
+    for result_item in result.results:
+        alternative = result_item.alternatives[0] if result_item.alternatives else None
+        if not alternative:
+            continue
+
+        current_speaker = None
+        current_segment = None
+
+        if not alternative.words:
+            continue
+
+        for word_info in alternative.words:
+            speaker_tag = getattr(word_info, 'speaker_tag', None)
+            if speaker_tag is None:
+                continue
+
+            if speaker_tag != current_speaker:
+                if current_segment:
+                    segments.append(current_segment)
+
+                current_speaker = speaker_tag
+                current_segment = {
+                    'speaker_id': speaker_tag,
+                    'text': word_info.word,
+                    'start_time': word_info.start_time.total_seconds(),
+                    'end_time': word_info.end_time.total_seconds(),
+                    'confidence': word_info.confidence if hasattr(word_info, 'confidence') else 1.0,
+                    'words': [word_info.word]
+                }
+
+                if speaker_tag not in speaker_stats:
+                    speaker_stats[speaker_tag] = {
+                        'total_duration': 0,
+                        'word_count': 0,
+                        'segment_count': 0,
+                        'avg_confidence': []
+                    }
+                speaker_stats[speaker_tag]['segment_count'] += 1
+
+            else:
+                if current_segment:
+                    current_segment['text'] += ' ' + word_info.word
+                    current_segment['words'].append(word_info.word)
+                    current_segment['end_time'] = word_info.end_time.total_seconds()
+
+            if speaker_tag in speaker_stats:
+                speaker_stats[speaker_tag]['word_count'] += 1
+                if hasattr(word_info, 'confidence'):
+                    speaker_stats[speaker_tag]['avg_confidence'].append(word_info.confidence)
+
+        if current_segment:
+            segments.append(current_segment)
+
+        full_transcript.append(alternative.transcript)
+
+    for segment in segments:
+        segment['duration'] = segment['end_time'] - segment['start_time']
+
+    for speaker_id, stats in speaker_stats.items():
+        stats['total_duration'] = sum(
+            seg['duration'] for seg in segments if seg['speaker_id'] == speaker_id
+        )
+        stats['avg_confidence'] = np.mean(stats['avg_confidence']) if stats['avg_confidence'] else 1.0
+        stats['speaking_rate'] = stats['word_count'] / max(stats['total_duration'], 1)
+
+    return {
+        'status': 'success',
+        'segments': segments,
+        'transcript': ' '.join(full_transcript),
+        'speaker_stats': speaker_stats,
+        'total_segments': len(segments),
+        'total_speakers': len(speaker_stats)
+    }
+
+
+@unittest.skipUnless(CONNECTOR_AVAILABLE, "google-cloud-speech 미설치")
+class TestDiarizationWordTable(unittest.TestCase):
+    def setUp(self):
+        # 클라이언트 초기화 없이 결과 처리 메서드만 사용
+        self.connector = GoogleCloudSpeechConnector.__new__(GoogleCloudSpeechConnector)
+
+    def assert_parity(self, response):
+        expected = baseline_process(response)
+        actual = self.connector._process_diarization_result(response, {})
+
+        self.assertEqual(actual['status'], expected['status'])
+        self.assertEqual(actual['transcript'], expected['transcript'])
+        self.assertEqual(actual['segments'], expected['segments'])
+        self.assertEqual(actual.get('total_segments'), expected.get('total_segments'))
+        self.assertEqual(actual.get('total_speakers'), expected.get('total_speakers'))
+
+        expected_stats = expected.get('speaker_stats', {})
+        actual_stats = actual.get('speaker_stats', {})
+        # 화자 등장 순서까지 일치
+        self.assertEqual(list(actual_stats), list(expected_stats))
+        for speaker_id, stats in expected_stats.items():
+            self.assertEqual(actual_stats[speaker_id].keys(), stats.keys())
+            for key, value in stats.items():
+                self.assertAlmostEqual(actual_stats[speaker_id][key], value, places=9,
+                                       msg=f"speaker {speaker_id} {key}")
+        return actual
+
+    def test_single_result_alternating_speakers(self):
+        spec = [('안녕', 1), ('하세요', 1), ('네', 2), ('오늘', 1), ('기분', 1),
+                ('어떠세요', 1), ('좋아요', 2), ('감사', 2), ('합니다', 2)]
+        response = FakeResponse([FakeResult([FakeAlternative(words_from(spec))])])
+
+        actual = self.assert_parity(response)
+        self.assertEqual([s['speaker_id'] for s in actual['segments']], [1, 2, 1, 2])
+        self.assertEqual(list(actual['speaker_stats']), [1, 2])
+
+    def test_missing_speaker_tags_are_skipped(self):
+        spec = [('음', None), ('안녕', 1), ('어', None), ('하세요', 1),
+                ('네', 2), ('그', None), ('래요', 2), ('끝', None)]
+        response = FakeResponse([FakeResult([FakeAlternative(words_from(spec))])])
+
+        actual = self.assert_parity(response)
+        # 태그 없는 단어가 사이에 있어도 같은 화자 세그먼트는 이어짐
+        self.assertEqual([s['words'] for s in actual['segments']],
+                         [['안녕', '하세요'], ['네', '래요']])
+
+    def test_all_tags_missing(self):
+        spec = [('안녕', None), ('하세요', None)]
+        response = FakeResponse([FakeResult([FakeAlternative(words_from(spec))])])
+
+        actual = self.assert_parity(response)
+        self.assertEqual(actual['segments'], [])
+        self.assertEqual(actual['speaker_stats'], {})
+
+    def test_multiple_results_split_segments(self):
+        first = words_from([('안녕', 1), ('하세요', 1), ('네', 2)])
+        # 같은 화자로 이어지는 다음 결과도 결과 경계에서 새 세그먼트
+        second = words_from([('반가워요', 2), ('오늘은', 1), ('어때요', 1)], start=5.0)
+        third = words_from([('좋아요', 1), ('네', 3)], start=10.0)
+        response = FakeResponse([
+            FakeResult([FakeAlternative(first)]),
+            FakeResult([]),                                   # alternative 없음
+            FakeResult([FakeAlternative([], transcript='')]),  # 단어 없음
+            FakeResult([FakeAlternative(second)]),
+            FakeResult([FakeAlternative(third)])
+        ])
+
+        actual = self.assert_parity(response)
+        self.assertEqual([s['speaker_id'] for s in actual['segments']], [1, 2, 2, 1, 1, 3])
+        self.assertEqual(actual['speaker_stats'][2]['segment_count'], 2)
+
+    def test_empty_response(self):
+        for response in (FakeResponse([]), FakeResponse(None), object()):
+            actual = self.assert_parity(response)
+            self.assertEqual(actual['status'], 'error')
+            self.assertEqual(actual['segments'], [])
+
+    def test_randomized_parity(self):
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            results = []
+            for r in range(rng.integers(1, 5)):
+                n = int(rng.integers(0, 30))
+                speakers = rng.integers(0, 4, size=n)
+                spec = [(f"w{r}_{i}", None if s == 0 else int(s)) for i, s in enumerate(speakers)]
+                results.append(FakeResult([FakeAlternative(words_from(spec, start=10.0 * r))]))
+            self.assert_parity(FakeResponse(results))
+
+
+if __name__ == '__main__':
+    unittest.main()
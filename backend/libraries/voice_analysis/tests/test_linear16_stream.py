@@ -0,0 +1,209 @@
+"""
+LINEAR16 스트리밍 업로드 테스트
+로컬 가짜 Storage 클라이언트로 임시 파일 없는 변환/업로드 결과와 메모리 상한 확인
+"""
+
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.utils.decoded_audio import DecodedAudio
+from analysis.utils.linear16_stream import (
+    iter_linear16_blocks,
+    open_linear16_stream,
+    prefetch,
+    upload_blocks,
+    wav_header
+)
+
+
+class FakeWriter(io.RawIOBase):
+    """blob.open('wb')가 반환하는 resumable 업로드 writer 흉내"""
+
+    def __init__(self, blob, chunk_size: int):
+        self.blob = blob
+        self.chunk_size = chunk_size
+        self.pending = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.pending.extend(data)
+        self.blob.max_buffered = max(self.blob.max_buffered, len(self.pending))
+        while len(self.pending) >= self.chunk_size:
+            self.blob.chunks.append(bytes(self.pending[:self.chunk_size]))
+            del self.pending[:self.chunk_size]
+        return len(data)
+
+    def close(self):
+        if not self.closed and self.pending:
+            self.blob.chunks.append(bytes(self.pending))
+            self.pending.clear()
+        super().close()
+
+
+class FakeResumableBlob:
+    """blob.open()을 지원하는 가짜 blob"""
+
+    def __init__(self):
+        self.chunks = []
+        self.max_buffered = 0
+        self.content_type = None
+
+    def open(self, mode: str, chunk_size: int, content_type: str):
+        assert mode == 'wb'
+        self.content_type = content_type
+        return FakeWriter(self, chunk_size)
+
+    @property
+    def data(self) -> bytes:
+        return b''.join(self.chunks)
+
+
+class FakeSimpleBlob:
+    """upload_from_file()만 지원하는 가짜 blob"""
+
+    def __init__(self):
+        self.data = None
+        self.size = None
+        self.content_type = None
+
+    def upload_from_file(self, file_obj, size: int, content_type: str):
+        self.data = file_obj.read()
+        self.size = size
+        self.content_type = content_type
+
+
+class TestLinear16Encoding(unittest.TestCase):
+    """블록 인코딩 결과가 전체 변환과 동일한지 확인"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # 클리핑 경계 포함 (1.0 초과 샘플)
+        self.audio = DecodedAudio(
+            (rng.standard_normal(44100 * 3) * 0.4).astype(np.float32), 44100
+        )
+
+    def test_blocks_match_full_conversion(self):
+        blocks = list(iter_linear16_blocks(self.audio, 16000, block_seconds=0.25))
+        expected = self.audio.to_linear16(16000)
+
+        self.assertEqual(blocks[0], wav_header(len(expected), 16000))
+        self.assertEqual(b''.join(blocks[1:]), expected.astype('<i2').tobytes())
+
+    def test_block_size_is_bounded(self):
+        blocks = list(iter_linear16_blocks(self.audio, 16000, block_seconds=0.5))
+        self.assertLessEqual(max(len(block) for block in blocks[1:]), 16000)
+
+    def test_wav_is_readable(self):
+        data = b''.join(iter_linear16_blocks(self.audio, 16000))
+        samples, sr = sf.read(io.BytesIO(data), dtype='int16')
+
+        self.assertEqual(sr, 16000)
+        np.testing.assert_array_equal(samples, self.audio.to_linear16(16000))
+
+    def test_decoded_audio_selects_wav_stream(self):
+        stream = open_linear16_stream('/nonexistent/input.m4a', self.audio)
+        self.assertEqual(stream.extension, 'wav')
+        self.assertEqual(stream.content_type, 'audio/wav')
+
+    def test_no_files_written_next_to_source(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'input.wav')
+            sf.write(path, self.audio.samples, 44100)
+            os.chmod(directory, 0o555)
+            try:
+                stream = open_linear16_stream(path, self.audio)
+                upload_blocks(FakeResumableBlob(), prefetch(stream.blocks), stream.content_type)
+                self.assertEqual(os.listdir(directory), ['input.wav'])
+            finally:
+                os.chmod(directory, 0o755)
+
+
+class TestUploadBlocks(unittest.TestCase):
+    """가짜 Storage 클라이언트로 업로드 경로 확인"""
+
+    def setUp(self):
+        self.blocks = [bytes([i]) * 1000 for i in range(20)]
+        self.payload = b''.join(self.blocks)
+
+    def test_resumable_writer(self):
+        blob = FakeResumableBlob()
+        total = upload_blocks(blob, iter(self.blocks), 'audio/wav', chunk_size=4096)
+
+        self.assertEqual(total, len(self.payload))
+        self.assertEqual(blob.data, self.payload)
+        self.assertEqual(blob.content_type, 'audio/wav')
+        # writer는 청크 하나 + 블록 하나 이상을 쌓지 않음
+        self.assertLess(blob.max_buffered, 4096 + 1000)
+        self.assertTrue(all(len(chunk) == 4096 for chunk in blob.chunks[:-1]))
+
+    def test_spooled_fallback(self):
+        blob = FakeSimpleBlob()
+        total = upload_blocks(blob, iter(self.blocks), 'audio/wav', spool_threshold=2048)
+
+        self.assertEqual(total, len(self.payload))
+        self.assertEqual(blob.size, len(self.payload))
+        self.assertEqual(blob.data, self.payload)
+
+
+class TestPrefetch(unittest.TestCase):
+    """인코딩 선행 버퍼 확인"""
+
+    def test_order_preserved(self):
+        blocks = [bytes([i]) for i in range(50)]
+        self.assertEqual(list(prefetch(iter(blocks), depth=3)), blocks)
+
+    def test_producer_runs_at_most_depth_ahead(self):
+        produced = []
+
+        def source():
+            for i in range(100):
+                produced.append(i)
+                yield bytes([i])
+
+        stream = prefetch(source(), depth=2)
+        next(stream)
+        time.sleep(0.2)
+        # 소비 1개 + 큐 2개 + 큐 대기 중인 1개
+        self.assertLessEqual(len(produced), 4)
+        stream.close()
+
+    def test_errors_propagate(self):
+        def source():
+            yield b'a'
+            raise RuntimeError('encode failed')
+
+        stream = prefetch(source())
+        self.assertEqual(next(stream), b'a')
+        with self.assertRaises(RuntimeError):
+            next(stream)
+
+    def test_close_stops_producer(self):
+        closed = threading.Event()
+
+        def source():
+            try:
+                while True:
+                    yield b'x'
+            finally:
+                closed.set()
+
+        stream = prefetch(source(), depth=1)
+        next(stream)
+        stream.close()
+        self.assertTrue(closed.wait(1.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+LLM 클라이언트 풀 테스트
+호출 제한기가 여러 이벤트 루프(asyncio.run 반복)에서 동작하는지, 동시 호출 수 제한,
+취소된(헤지에서 진) 호출의 지연 시간 기록 확인
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.utils.llm_client_pool import ProviderLimiter, TokenBucket
+from analysis.utils.monitoring import MetricsCollector
+
+
+class TestProviderLimiter(unittest.TestCase):
+    def make_limiter(self, **kwargs) -> ProviderLimiter:
+        return ProviderLimiter('test', metrics=MetricsCollector(), **kwargs)
+
+    def test_reused_across_event_loops(self):
+        limiter = self.make_limiter(max_concurrency=1, requests_per_minute=6000)
+
+        async def run_batch():
+            async def call():
+                await asyncio.sleep(0.01)
+                return 1
+            return await asyncio.gather(*(limiter.call(call) for _ in range(3)))
+
+        # 첫 루프에 묶인 세마포어/잠금을 다음 루프에서 쓰면 RuntimeError
+        for _ in range(3):
+            self.assertEqual(asyncio.run(run_batch()), [1, 1, 1])
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertEqual(limiter.queue_depth, 0)
+
+    def test_concurrency_limit(self):
+        limiter = self.make_limiter(max_concurrency=2, requests_per_minute=0)
+        active = []
+        peak = []
+
+        async def call():
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+
+        async def run_batch():
+            await asyncio.gather(*(limiter.call(call) for _ in range(6)))
+
+        asyncio.run(run_batch())
+        self.assertEqual(max(peak), 2)
+
+    def test_cancelled_call_recorded_as_latency(self):
+        limiter = self.make_limiter(requests_per_minute=0)
+
+        async def run():
+            task = asyncio.ensure_future(limiter.call(lambda: asyncio.sleep(10)))
+            await asyncio.sleep(0.3)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        self.assertEqual(limiter.latency.count, 1)
+        self.assertGreater(limiter.latency.percentile(0.5), 0.1)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_token_bucket_shared_across_loops(self):
+        bucket = TokenBucket(rate=1000.0, capacity=2)
+        asyncio.run(bucket.acquire(2))
+        # 다른 루프에서도 같은 토큰 수를 사용 (남은 토큰이 없으므로 보충될 때까지 대기)
+        asyncio.run(bucket.acquire(1))
+        self.assertLess(bucket._tokens, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+OperationWaiter 테스트
+로컬 가짜 Long Running 작업으로 비동기 대기, 취소, 동시 작업 수 제한 확인
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.utils.monitoring import MetricsCollector
+from analysis.utils.operation_waiter import OperationWaiter
+
+
+class FakeOperation:
+    """done()이 지정 횟수 이후 True가 되는 가짜 작업 (블로킹 RPC 흉내)"""
+
+    def __init__(self, polls_until_done: int = 3, result=None, rpc_delay: float = 0.0,
+                 error: Exception = None):
+        self.polls_until_done = polls_until_done
+        self._result = result
+        self.rpc_delay = rpc_delay
+        self.error = error
+        self.done_calls = 0
+        self.cancelled = threading.Event()
+
+    def done(self) -> bool:
+        time.sleep(self.rpc_delay)
+        self.done_calls += 1
+        return self.done_calls > self.polls_until_done
+
+    def result(self):
+        if self.error:
+            raise self.error
+        return self._result
+
+    def cancel(self):
+        self.cancelled.set()
+        return True
+
+
+def make_waiter(**kwargs) -> OperationWaiter:
+    options = dict(initial_interval=0.001, max_interval=0.01, metrics=MetricsCollector())
+    options.update(kwargs)
+    return OperationWaiter(**options)
+
+
+class TestOperationWaiter(unittest.TestCase):
+    """비동기 작업 대기"""
+
+    def test_returns_result_after_polling(self):
+        waiter = make_waiter()
+        operation = FakeOperation(polls_until_done=3, result={'transcript': '안녕하세요'})
+
+        result = asyncio.run(waiter.wait(operation))
+
+        self.assertEqual(result, {'transcript': '안녕하세요'})
+        self.assertEqual(operation.done_calls, 4)
+        self.assertEqual(waiter.metrics.get_metric_stats('stt_operation_wait_seconds')['count'], 1)
+
+    def test_does_not_block_event_loop(self):
+        waiter = make_waiter()
+        operation = FakeOperation(polls_until_done=5, rpc_delay=0.05)
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.005)
+
+        async def main():
+            task = asyncio.create_task(ticker())
+            await waiter.wait(operation)
+            task.cancel()
+
+        asyncio.run(main())
+
+        # done() 호출이 루프를 막으면 틱 간격이 RPC 지연(50ms) 이상으로 벌어짐
+        gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+        self.assertGreater(len(ticks), 5)
+        self.assertLess(max(gaps), 0.04)
+
+    def test_backoff_grows_to_max_interval(self):
+        waiter = make_waiter(initial_interval=0.01, multiplier=2.0, max_interval=0.04)
+        sleeps = []
+        original_sleep = asyncio.sleep
+
+        async def recording_sleep(delay, *args, **kwargs):
+            sleeps.append(delay)
+            await original_sleep(0)
+
+        async def main():
+            asyncio.sleep = recording_sleep
+            try:
+                await waiter.wait(FakeOperation(polls_until_done=5))
+            finally:
+                asyncio.sleep = original_sleep
+
+        asyncio.run(main())
+
+        self.assertEqual([round(s, 3) for s in sleeps], [0.01, 0.02, 0.04, 0.04, 0.04])
+
+    def test_timeout_cancels_operation(self):
+        waiter = make_waiter()
+        operation = FakeOperation(polls_until_done=10 ** 6)
+
+        with self.assertRaises(TimeoutError):
+            asyncio.run(waiter.wait(operation, timeout=0.05))
+
+        self.assertTrue(operation.cancelled.is_set())
+        self.assertEqual(waiter.metrics.counters['stt_operation_timeouts'], 1)
+
+    def test_task_cancellation_cancels_operation(self):
+        waiter = make_waiter()
+        operation = FakeOperation(polls_until_done=10 ** 6)
+
+        async def main():
+            task = asyncio.create_task(waiter.wait(operation))
+            await asyncio.sleep(0.02)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+
+        self.assertTrue(operation.cancelled.wait(1.0))
+        self.assertEqual(waiter.metrics.counters['stt_operation_cancellations'], 1)
+
+    def test_operation_error_propagates(self):
+        waiter = make_waiter()
+        operation = FakeOperation(polls_until_done=0, error=RuntimeError('recognition failed'))
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(waiter.wait(operation))
+
+    def test_inflight_operations_are_bounded(self):
+        waiter = make_waiter(max_inflight=2)
+        peak = {'in_flight': 0, 'queue_depth': 0}
+
+        async def request():
+            async with waiter.slot():
+                peak['in_flight'] = max(peak['in_flight'], waiter.in_flight)
+                await waiter.wait(FakeOperation(polls_until_done=2))
+
+        async def main():
+            tasks = [asyncio.create_task(request()) for _ in range(5)]
+            await asyncio.sleep(0)
+            peak['queue_depth'] = waiter.queue_depth
+            await asyncio.gather(*tasks)
+
+        asyncio.run(main())
+
+        self.assertEqual(peak['in_flight'], 2)
+        self.assertEqual(peak['queue_depth'], 3)
+        self.assertEqual(waiter.in_flight, 0)
+        self.assertEqual(waiter.queue_depth, 0)
+        self.assertEqual(waiter.metrics.get_metric_stats('stt_slot_wait_seconds')['count'], 5)
+
+    def test_slots_work_across_event_loops(self):
+        # 싱글톤 대기기를 여러 asyncio.run에서 재사용해도 세마포어가 이전 루프에 묶이지 않음
+        waiter = make_waiter(max_inflight=1)
+
+        async def main():
+            async def request():
+                async with waiter.slot():
+                    await asyncio.sleep(0.001)
+            await asyncio.gather(*(request() for _ in range(3)))
+
+        for _ in range(3):
+            asyncio.run(main())
+        self.assertEqual(waiter.in_flight, 0)
+        self.assertEqual(waiter.queue_depth, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+정신건강 지표 예측기 테스트
+닫힌 형태 다중 출력 학습/윈도우 특징이 기존 StandardScaler + LinearRegression /
+np.polyfit 경로와 같은 예측을 내는지 확인
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.timeseries.predictor import MentalHealthPredictor
+
+INDICATORS = ('DRI', 'SDI', 'CFL', 'ES', 'OV')
+
+
+def legacy_features(window):
+    """기존 _extract_features (np.polyfit 기울기)"""
+    return np.array([
+        np.mean(window),
+        np.std(window),
+        window[-1],
+        window[-1] - window[0],
+        np.max(window),
+        np.min(window),
+        np.polyfit(np.arange(len(window)), window, 1)[0]
+    ])
+
+
+def legacy_predict(series, horizon, window_size=3):
+    """기존 _predict_indicator (지표별 StandardScaler + LinearRegression)"""
+    values = np.asarray(series, dtype=np.float64)
+    X = np.array([legacy_features(values[i - window_size:i]) for i in range(window_size, len(values))])
+    y = values[window_size:]
+
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+    model = LinearRegression().fit(X_scaled, y)
+
+    predictions = []
+    last_values = values[-window_size:]
+    for _ in range(horizon):
+        next_value = model.predict(scaler.transform([legacy_features(last_values)]))[0]
+        next_value = float(np.clip(next_value, 0, 1))
+        predictions.append(next_value)
+        last_values = np.append(last_values[1:], next_value)
+    return predictions, float(model.score(X_scaled, y))
+
+
+def make_history(n, seed=0):
+    """지표별 추세/노이즈가 다른 기록 (일부 결측, 상수 지표 포함)"""
+    rng = np.random.default_rng(seed)
+    start = datetime(2026, 1, 1)
+    history = []
+    for i in range(n):
+        indicators = {
+            'DRI': 0.4 + 0.02 * i + float(rng.normal(0, 0.03)),
+            'SDI': 0.5 + 0.1 * np.sin(i / 2) + float(rng.normal(0, 0.02)),
+            'CFL': 0.8 - 0.01 * i + float(rng.normal(0, 0.01)),
+            'ES': float(rng.uniform(0.3, 0.7)),
+            'OV': 0.6
+        }
+        if i % 4 == 2:
+            indicators.pop('ES')
+        history.append({
+            'timestamp': (start + timedelta(days=i, hours=int(rng.integers(0, 12)))).isoformat(),
+            'indicators': indicators
+        })
+    # 입력 순서와 무관하게 시간순 정렬되는지 확인
+    rng.shuffle(history)
+    return history
+
+
+class TestPredictorParity(unittest.TestCase):
+    def assert_parity(self, history, horizon=7):
+        predictor = MentalHealthPredictor()
+        result = predictor.predict(history, prediction_horizon=horizon)
+        self.assertEqual(result['status'], 'success')
+
+        df = predictor._prepare_data(history)
+        for indicator in INDICATORS:
+            with self.subTest(indicator=indicator, n=len(history)):
+                expected, score = legacy_predict(df[indicator], horizon)
+                actual = result['predictions'][indicator]
+                self.assertEqual(actual['status'], 'success')
+                np.testing.assert_allclose(actual['predictions'], expected, atol=1e-8)
+                self.assertAlmostEqual(actual['model_score'], score, places=8)
+                self.assertEqual(actual['current_value'], float(df[indicator].iloc[-1]))
+        return result
+
+    def test_matches_legacy_regression(self):
+        for n, seed in ((6, 1), (12, 2), (40, 3)):
+            self.assert_parity(make_history(n, seed))
+
+    def test_single_indicator(self):
+        history = make_history(15, 4)
+        result = MentalHealthPredictor().predict(history, prediction_horizon=3, indicator='CFL')
+        self.assertEqual(list(result['predictions']), ['CFL'])
+
+        full = MentalHealthPredictor().predict(history, prediction_horizon=3)
+        self.assertEqual(result['predictions']['CFL']['predictions'],
+                         full['predictions']['CFL']['predictions'])
+
+    def test_window_features_match_legacy(self):
+        rng = np.random.default_rng(5)
+        values = rng.uniform(0, 1, size=(3, 20))
+        predictor = MentalHealthPredictor()
+        features = predictor._window_features(values)
+        for k in range(values.shape[0]):
+            for i in range(values.shape[1] - 2):
+                np.testing.assert_allclose(
+                    features[k, i], legacy_features(values[k, i:i + 3]), atol=1e-12
+                )
+
+    def test_too_short_for_windows(self):
+        predictor = MentalHealthPredictor()
+        df = predictor._prepare_data(make_history(5, 6))
+        predictions = predictor._predict_indicators(df, list(INDICATORS), 7)
+        for indicator in INDICATORS:
+            self.assertEqual(predictions[indicator]['status'], 'insufficient_data')
+            self.assertEqual(predictions[indicator]['current_value'], float(df[indicator].iloc[-1]))
+
+        self.assertEqual(MentalHealthPredictor().predict(make_history(4, 7))['status'],
+                         'insufficient_data')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+LLM 응답 캐시 설정 테스트
+디스크 계층은 LLM_CACHE_PATH를 지정할 때만 사용되고, 기본값은 메모리만 사용하는지 확인
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.utils import response_cache
+from analysis.utils.response_cache import get_llm_response_cache
+
+
+class TestGetLLMResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        response_cache._response_cache = None
+
+    def tearDown(self):
+        response_cache._response_cache = None
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def env(self, **values):
+        environ = {k: v for k, v in os.environ.items() if not k.startswith('LLM_CACHE_')}
+        environ.update(values)
+        return mock.patch.dict(os.environ, environ, clear=True)
+
+    def test_memory_only_by_default(self):
+        with self.env():
+            cache = get_llm_response_cache()
+        self.assertIsNotNone(cache)
+        self.assertIsNone(cache.disk)
+
+        key = cache.make_key('test', 'model', 'system', 'user', 0.0)
+        cache.set(key, {'answer': 1})
+        self.assertEqual(cache.get(key), {'answer': 1})
+
+    def test_disk_tier_when_path_set(self):
+        path = os.path.join(self.tmpdir, 'responses.sqlite3')
+        with self.env(LLM_CACHE_PATH=path):
+            cache = get_llm_response_cache()
+        self.assertIsNotNone(cache.disk)
+
+        key = cache.make_key('test', 'model', 'system', 'user', 0.0)
+        cache.set(key, {'answer': 2})
+        self.assertTrue(os.path.exists(path))
+
+    def test_disabled_mode(self):
+        with self.env(LLM_CACHE_MODE='none'):
+            self.assertIsNone(get_llm_response_cache())
+
+
+if __name__ == '__main__':
+    unittest.main()
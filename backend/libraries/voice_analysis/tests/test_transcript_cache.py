@@ -0,0 +1,236 @@
+"""
+전사 캐시 테스트
+SQLite/Firestore 백엔드의 TTL 만료, 크기 초과 시 LRU 제거, 백엔드 오류 처리 확인
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.utils import transcript_cache
+from analysis.utils.transcript_cache import (
+    FirestoreTranscriptCache,
+    SQLiteTranscriptCache,
+    TranscriptCache,
+    TranscriptCacheBackend,
+    make_cache_key
+)
+
+
+class FakeClock:
+    """transcript_cache.time.time 대체용 수동 시계"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class FakeSnapshot:
+    def __init__(self, data):
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeDocument:
+    def __init__(self, store, key):
+        self.store = store
+        self.key = key
+
+    def get(self):
+        return FakeSnapshot(self.store.get(self.key))
+
+    def set(self, data):
+        self.store[self.key] = data
+
+
+class FakeCollection:
+    """Firestore 컬렉션의 document().get()/set()만 흉내"""
+
+    id = 'stt_transcript_cache'
+
+    def __init__(self):
+        self.store = {}
+
+    def document(self, key):
+        return FakeDocument(self.store, key)
+
+
+class FailingBackend(TranscriptCacheBackend):
+    def get(self, key):
+        raise RuntimeError("backend down")
+
+    def set(self, key, value):
+        raise RuntimeError("backend down")
+
+
+class TestCacheKey(unittest.TestCase):
+    def test_key_changes_with_each_part(self):
+        base = make_cache_key('audio', 'ko-KR', 'config')
+        self.assertEqual(base, make_cache_key('audio', 'ko-KR', 'config'))
+        self.assertNotEqual(base, make_cache_key('other', 'ko-KR', 'config'))
+        self.assertNotEqual(base, make_cache_key('audio', 'en-US', 'config'))
+        self.assertNotEqual(base, make_cache_key('audio', 'ko-KR', 'changed'))
+
+
+class TestSQLiteTranscriptCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'cache', 'transcripts.sqlite3')
+        self.clock = FakeClock()
+        patcher = mock.patch.object(transcript_cache.time, 'time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_cache(self, **kwargs) -> SQLiteTranscriptCache:
+        cache = SQLiteTranscriptCache(self.path, **kwargs)
+        self.addCleanup(cache._conn.close)
+        return cache
+
+    def test_round_trip(self):
+        cache = self.make_cache()
+        self.assertIsNone(cache.get('missing'))
+        cache.set('key', b'\x00response\xff')
+        self.assertEqual(cache.get('key'), b'\x00response\xff')
+
+    def test_entry_expires_after_ttl(self):
+        cache = self.make_cache(ttl_seconds=60)
+        cache.set('key', b'value')
+
+        self.clock.advance(59)
+        self.assertEqual(cache.get('key'), b'value')
+
+        self.clock.advance(2)
+        self.assertIsNone(cache.get('key'))
+        # 만료 항목은 조회 시 삭제됨
+        self.assertEqual(cache.get_stats()['entries'], 0)
+
+    def test_ttl_counts_from_creation_not_access(self):
+        cache = self.make_cache(ttl_seconds=60)
+        cache.set('key', b'value')
+        for _ in range(3):
+            self.clock.advance(25)
+            cache.get('key')
+        self.assertIsNone(cache.get('key'))
+
+    def test_expired_entries_purged_on_write(self):
+        cache = self.make_cache(ttl_seconds=60)
+        cache.set('old', b'x' * 10)
+        self.clock.advance(61)
+        cache.set('new', b'y' * 10)
+
+        stats = cache.get_stats()
+        self.assertEqual(stats['entries'], 1)
+        self.assertEqual(stats['size_bytes'], 10)
+
+    def test_size_cap_evicts_least_recently_used(self):
+        cache = self.make_cache(max_bytes=250)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, key.encode() * 100)
+            self.clock.advance(1)
+
+        # c 저장 시 300 bytes > 250 이므로 가장 오래 사용되지 않은 a 제거
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+
+        # b를 최근에 조회했으므로 다음 제거 대상은 c
+        self.clock.advance(1)
+        cache.get('b')
+        self.clock.advance(1)
+        cache.set('d', b'd' * 100)
+
+        self.assertIsNotNone(cache.get('b'))
+        self.assertIsNone(cache.get('c'))
+        self.assertIsNotNone(cache.get('d'))
+        self.assertLessEqual(cache.get_stats()['size_bytes'], 250)
+
+    def test_replacing_entry_does_not_double_count_size(self):
+        cache = self.make_cache(max_bytes=150)
+        cache.set('key', b'x' * 100)
+        cache.set('key', b'y' * 100)
+        self.assertEqual(cache.get('key'), b'y' * 100)
+        self.assertEqual(cache.get_stats()['size_bytes'], 100)
+
+    def test_entries_persist_across_instances(self):
+        self.make_cache().set('key', b'value')
+        self.assertEqual(self.make_cache().get('key'), b'value')
+
+
+class TestFirestoreTranscriptCache(unittest.TestCase):
+    def make_cache(self, ttl_seconds: float = 60) -> FirestoreTranscriptCache:
+        # google-cloud-firestore 클라이언트 없이 컬렉션만 교체
+        cache = FirestoreTranscriptCache.__new__(FirestoreTranscriptCache)
+        cache.collection = FakeCollection()
+        cache.ttl_seconds = ttl_seconds
+        return cache
+
+    def test_round_trip_sets_expiry(self):
+        cache = self.make_cache(ttl_seconds=3600)
+        cache.set('key', b'value')
+        self.assertEqual(cache.get('key'), b'value')
+
+        doc = cache.collection.store['key']
+        self.assertEqual(doc['size'], 5)
+        self.assertAlmostEqual(
+            (doc['expires_at'] - doc['created_at']).total_seconds(), 3600
+        )
+
+    def test_expired_entry_is_miss(self):
+        cache = self.make_cache()
+        cache.set('key', b'value')
+        cache.collection.store['key']['expires_at'] = datetime.now(timezone.utc) - timedelta(seconds=1)
+        self.assertIsNone(cache.get('key'))
+
+    def test_oversized_value_not_stored(self):
+        cache = self.make_cache()
+        cache.set('big', b'x' * (FirestoreTranscriptCache.MAX_VALUE_BYTES + 1))
+        self.assertNotIn('big', cache.collection.store)
+        self.assertIsNone(cache.get('big'))
+
+
+class TestTranscriptCache(unittest.TestCase):
+    def test_backend_errors_are_misses(self):
+        cache = TranscriptCache(FailingBackend())
+        cache.set('key', b'value')
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(cache.get_stats()['misses'], 1)
+
+    def test_hit_rate(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        backend = SQLiteTranscriptCache(os.path.join(tmpdir.name, 'cache.sqlite3'))
+        self.addCleanup(backend._conn.close)
+
+        cache = TranscriptCache(backend)
+        cache.get('key')
+        cache.set('key', b'value')
+        cache.get('key')
+
+        stats = cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+        self.assertEqual(stats['entries'], 1)
+
+    def test_disabled_backend(self):
+        with mock.patch.dict(os.environ, {'STT_CACHE_BACKEND': 'none'}):
+            self.assertIsNone(transcript_cache.create_transcript_cache())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+증분 추세 상태 테스트
+snapshot 결과가 TrendAnalyzer.analyze_trends와 같은 형식/기준인지, 30일 윈도우,
+분석 ID 기준 중복 반영 방지, 지표 없는 기록 무시 확인
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.timeseries.trend_analyzer import TrendAnalyzer
+from analysis.timeseries.trend_state import INDICATORS, SeniorTrendState
+
+START = datetime(2026, 1, 1, 9, 0)
+
+
+def make_records(n, start=START, step_days=1.0, seed=0):
+    """하루 간격 분석 기록 (DRI는 증가 추세)"""
+    rng = np.random.default_rng(seed)
+    records = []
+    for i in range(n):
+        indicators = {name: float(rng.uniform(0.3, 0.7)) for name in INDICATORS}
+        indicators['DRI'] = 0.2 + 0.03 * i
+        records.append({
+            'analysis_timestamp': (start + timedelta(days=step_days * i)).isoformat(),
+            'indicators': indicators
+        })
+    return records
+
+
+class TestSnapshotCompatibility(unittest.TestCase):
+    def test_matches_analyze_trends(self):
+        records = make_records(12)
+        analyzer = TrendAnalyzer()
+        expected = analyzer.analyze_trends(records)
+        actual = SeniorTrendState.rebuild('senior', records).snapshot(analyzer)
+
+        self.assertEqual(actual['data_points'], expected['data_points'])
+        self.assertEqual(actual['time_span_days'], expected['time_span_days'])
+        self.assertEqual(set(actual['trends']), set(expected['trends']))
+        self.assertEqual(actual['summary'], expected['summary'])
+
+        for name in INDICATORS:
+            exp, act = expected['trends'][name], actual['trends'][name]
+            # 해석기/보고서가 읽는 키는 모두 유지
+            self.assertTrue(set(exp) <= set(act), name)
+            self.assertEqual(act['mann_kendall']['trend'], exp['mann_kendall']['trend'])
+            self.assertEqual(act['mann_kendall']['statistic'], exp['mann_kendall']['statistic'])
+            self.assertAlmostEqual(act['mann_kendall']['p_value'], exp['mann_kendall']['p_value'])
+            self.assertAlmostEqual(act['sens_slope']['slope'], exp['sens_slope']['slope'])
+            self.assertAlmostEqual(act['linear_trend']['slope_per_day'],
+                                   exp['linear_trend']['slope_per_day'])
+            self.assertEqual(act['trend_strength'], exp['trend_strength'])
+            self.assertEqual(act['confidence_level'], exp['confidence_level'])
+            self.assertIn('cusum', act)
+
+        self.assertEqual(actual['indicator_trends']['DRI']['trend'], 'increasing')
+        self.assertIn('removed_patterns', actual['trends'])
+        self.assertTrue(actual['baseline_established'])
+
+    def test_fewer_than_five_points_is_insufficient(self):
+        state = SeniorTrendState.rebuild('senior', make_records(4))
+        self.assertEqual(state.snapshot()['status'], 'insufficient_data')
+        self.assertEqual(TrendAnalyzer().analyze_trends(make_records(4))['status'],
+                         'insufficient_data')
+
+
+class TestWindow(unittest.TestCase):
+    def test_window_keeps_last_30_days(self):
+        # 3일 간격 40건 -> 마지막 기록 기준 30일 이내는 11건
+        records = make_records(40, step_days=3)
+        state = SeniorTrendState.rebuild('senior', records)
+
+        self.assertEqual(state.count, 40)
+        self.assertEqual(len(state.recent_times), 11)
+        self.assertEqual(state.recent_times, [r['analysis_timestamp'] for r in records[-11:]])
+        for indicator in state.indicators.values():
+            self.assertEqual(indicator.window_times, state.recent_times)
+
+        expected = TrendAnalyzer().analyze_trends(records[-11:])
+        actual = state.snapshot()
+        self.assertEqual(actual['data_points'], 11)
+        for name in INDICATORS:
+            self.assertEqual(actual['trends'][name]['mann_kendall']['statistic'],
+                             expected['trends'][name]['mann_kendall']['statistic'])
+
+    def test_sparse_recent_history_is_insufficient(self):
+        # 누적 기록은 많아도 최근 30일 안에 5건 미만이면 데이터 부족
+        records = make_records(20) + make_records(3, start=START + timedelta(days=90))
+        state = SeniorTrendState.rebuild('senior', records)
+        self.assertEqual(state.count, 23)
+        self.assertEqual(state.snapshot()['status'], 'insufficient_data')
+
+    def test_expire_without_update(self):
+        state = SeniorTrendState.rebuild('senior', make_records(10))
+        state.expire((START + timedelta(days=35)).isoformat())
+        self.assertEqual(len(state.recent_times), 5)
+
+    def test_unbounded_window(self):
+        records = make_records(40, step_days=3)
+        state = SeniorTrendState.rebuild('local', records, window_days=None)
+        self.assertEqual(len(state.recent_times), 40)
+
+    def test_round_trip_and_merge(self):
+        records = make_records(40, step_days=2)
+        full = SeniorTrendState.rebuild('senior', records)
+        restored = SeniorTrendState.from_dict(full.to_dict())
+        self.assertEqual(restored, full)
+
+        merged = SeniorTrendState.rebuild('senior', records[:25]).merge(
+            SeniorTrendState.rebuild('senior', records[25:])
+        )
+        self.assertEqual(merged.recent_times, full.recent_times)
+        for name in INDICATORS:
+            self.assertEqual(merged.indicators[name].window_s, full.indicators[name].window_s)
+            self.assertAlmostEqual(merged.indicators[name].mean, full.indicators[name].mean)
+
+    def test_old_version_is_rebuilt(self):
+        data = SeniorTrendState.rebuild('senior', make_records(5)).to_dict()
+        data['version'] = 1
+        self.assertIsNone(SeniorTrendState.from_dict(data))
+
+
+class TestUpdate(unittest.TestCase):
+    def test_same_analysis_id_applied_once(self):
+        state = SeniorTrendState.rebuild('senior', make_records(5))
+        record = make_records(6)[-1]
+
+        state.update(record, analysis_id='call-1')
+        snapshot = state.to_dict()
+        # 재시도로 같은 분석이 다시 들어와도 상태는 그대로
+        state.update(record, analysis_id='call-1')
+        self.assertEqual(state.to_dict(), snapshot)
+        self.assertTrue(state.is_applied('call-1'))
+        self.assertEqual(state.count, 6)
+
+    def test_history_ids_are_recorded(self):
+        records = [dict(r, analysisId=f'call-{i}') for i, r in enumerate(make_records(5))]
+        state = SeniorTrendState.rebuild('senior', records)
+        self.assertTrue(state.is_applied('call-4'))
+        state.update(records[2])
+        self.assertEqual(state.count, 5)
+
+    def test_record_without_indicators_is_skipped(self):
+        state = SeniorTrendState.rebuild('senior', make_records(5))
+        before = state.to_dict()
+        for indicators in (None, {}, {'DRI': None}):
+            state.update({
+                'analysis_timestamp': (START + timedelta(days=10)).isoformat(),
+                'indicators': indicators
+            }, analysis_id='call-x')
+        self.assertEqual(state.to_dict(), before)
+        self.assertFalse(state.is_applied('call-x'))
+
+
+if __name__ == '__main__':
+    unittest.main()
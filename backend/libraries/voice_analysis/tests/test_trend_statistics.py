@@ -0,0 +1,179 @@
+"""
+Mann-Kendall / Sen's slope 수치 동등성 테스트
+기존 이중 루프 구현과 O(n log n) S 계산, 벡터화/표본 선택 Sen's slope 결과 비교
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+from scipy import stats
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from analysis.timeseries.trend_analyzer import TrendAnalyzer
+from analysis.timeseries.utils.trend_statistics import (
+    mann_kendall_s,
+    mann_kendall_variance,
+    pairwise_slopes,
+    sens_slope
+)
+
+
+def legacy_mann_kendall(values, significance_level=0.05):
+    """기존 TrendAnalyzer._mann_kendall_test (이중 루프)"""
+    n = len(values)
+    s = 0
+    for i in range(n - 1):
+        for j in range(i + 1, n):
+            s += np.sign(values[j] - values[i])
+
+    unique_values, counts = np.unique(values, return_counts=True)
+    tie_correction = sum(c * (c - 1) * (2 * c + 5) for c in counts if c > 1)
+    var_s = (n * (n - 1) * (2 * n + 5) - tie_correction) / 18
+
+    if s > 0:
+        z = (s - 1) / np.sqrt(var_s) if var_s > 0 else 0
+    elif s < 0:
+        z = (s + 1) / np.sqrt(var_s) if var_s > 0 else 0
+    else:
+        z = 0
+
+    p_value = 2 * (1 - stats.norm.cdf(abs(z)))
+    if p_value < significance_level:
+        trend = 'increasing' if s > 0 else 'decreasing'
+    else:
+        trend = 'no_trend'
+
+    return {
+        'statistic': s,
+        'z_score': z,
+        'p_value': p_value,
+        'trend': trend,
+        'significant': p_value < significance_level,
+        'tau': s / (n * (n - 1) / 2)
+    }
+
+
+def legacy_sens_slope(values):
+    """기존 TrendAnalyzer._calculate_sens_slope (이중 루프)"""
+    n = len(values)
+    slopes = []
+    for i in range(n - 1):
+        for j in range(i + 1, n):
+            slopes.append((values[j] - values[i]) / (j - i))
+
+    if not slopes:
+        return {'slope': 0, 'confidence_interval': (0, 0)}
+
+    slopes_sorted = np.sort(slopes)
+    n_slopes = len(slopes_sorted)
+    rank_lower = int(np.floor((n_slopes - 1.96 * np.sqrt(n_slopes)) / 2))
+    rank_upper = int(np.ceil((n_slopes + 1.96 * np.sqrt(n_slopes)) / 2))
+    rank_lower = max(0, rank_lower)
+    rank_upper = min(n_slopes - 1, rank_upper)
+
+    return {
+        'slope': np.median(slopes),
+        'confidence_interval': (slopes_sorted[rank_lower], slopes_sorted[rank_upper])
+    }
+
+
+def sample_series(rng, n, kind):
+    """검사용 시계열: 연속값, 타이가 많은 정수 점수, 추세 포함, 상수"""
+    t = np.arange(n)
+    if kind == 'continuous':
+        return (rng.standard_normal(n) + 0.01 * t).tolist()
+    if kind == 'ties':
+        return rng.integers(0, 5, n).tolist()
+    if kind == 'rounded':
+        return np.round(0.5 + 0.002 * t + 0.05 * rng.standard_normal(n), 2).tolist()
+    if kind == 'constant':
+        return [0.3] * n
+    raise ValueError(kind)
+
+
+class TestMannKendall(unittest.TestCase):
+    """S 통계량과 검정 결과 동등성"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(42)
+        self.analyzer = TrendAnalyzer()
+
+    def test_s_matches_pairwise_sum(self):
+        for n in (2, 3, 5, 7, 16, 33, 128, 257):
+            for kind in ('continuous', 'ties', 'rounded', 'constant'):
+                values = sample_series(self.rng, n, kind)
+                expected = legacy_mann_kendall(values)['statistic']
+                self.assertEqual(mann_kendall_s(values), int(expected), (n, kind))
+
+    def test_short_series(self):
+        self.assertEqual(mann_kendall_s([]), 0)
+        self.assertEqual(mann_kendall_s([1.0]), 0)
+        self.assertEqual(mann_kendall_s([2.0, 1.0]), -1)
+
+    def test_variance_tie_correction(self):
+        values = [1, 1, 2, 2, 2, 3, 4, 4, 5, 5, 5, 5]
+        n = len(values)
+        expected = (n * (n - 1) * (2 * n + 5) - (2 * 1 * 9 * 2 + 3 * 2 * 11 + 4 * 3 * 13)) / 18
+        self.assertAlmostEqual(mann_kendall_variance(values), expected)
+
+    def test_test_result_parity(self):
+        for n in (5, 12, 60, 700):
+            for kind in ('continuous', 'ties', 'rounded', 'constant'):
+                values = sample_series(self.rng, n, kind)
+                expected = legacy_mann_kendall(values)
+                actual = self.analyzer._mann_kendall_test(values)
+                self.assertEqual(actual['statistic'], expected['statistic'])
+                self.assertEqual(actual['trend'], expected['trend'])
+                self.assertEqual(actual['significant'], expected['significant'])
+                for key in ('z_score', 'p_value', 'tau'):
+                    self.assertAlmostEqual(actual[key], expected[key], places=12, msg=(n, kind, key))
+
+
+class TestSensSlope(unittest.TestCase):
+    """기울기 중앙값과 신뢰구간 동등성"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(7)
+        self.analyzer = TrendAnalyzer()
+
+    def test_pairwise_slopes_are_all_pairs(self):
+        values = sample_series(self.rng, 20, 'continuous')
+        expected = sorted((values[j] - values[i]) / (j - i)
+                          for i in range(19) for j in range(i + 1, 20))
+        np.testing.assert_array_equal(np.sort(pairwise_slopes(values)), expected)
+
+    def test_dense_parity(self):
+        for n in (2, 3, 5, 6, 31, 200):
+            for kind in ('continuous', 'ties', 'rounded', 'constant'):
+                values = sample_series(self.rng, n, kind)
+                expected = legacy_sens_slope(values)
+                actual = self.analyzer._calculate_sens_slope(values)
+                self.assertEqual(actual['slope'], expected['slope'], (n, kind))
+                self.assertEqual(tuple(actual['confidence_interval']),
+                                 tuple(expected['confidence_interval']), (n, kind))
+
+    def test_selection_path_matches_dense(self):
+        # 표본 기반 순위 선택(큰 n 경로)을 작은 n에 강제 적용해 전체 정렬 결과와 비교
+        for n in (40, 301, 900):
+            for kind in ('continuous', 'ties', 'rounded', 'constant'):
+                values = sample_series(self.rng, n, kind)
+                dense = sens_slope(values)
+                selected = sens_slope(values, dense_max_n=0, sample_size=500, seed=n)
+                self.assertEqual(selected, dense, (n, kind))
+
+    def test_selection_recovers_from_bad_bracket(self):
+        # 표본이 아주 작으면 구간 추정이 빗나갈 수 있으나 재탐색으로 같은 결과
+        values = sample_series(self.rng, 400, 'continuous')
+        self.assertEqual(sens_slope(values, dense_max_n=0, sample_size=3, seed=1), sens_slope(values))
+
+    def test_single_value(self):
+        result = self.analyzer._calculate_sens_slope([1.0])
+        self.assertEqual(result['slope'], 0)
+        self.assertEqual(result['confidence_interval'], (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()